@@ -247,6 +247,17 @@ def setup_agent(
     )
 
 
+def _maybe_wrap_with_cassette(driver):
+    """Swap in a record/replay CassetteDriver when --record-cassette/--replay-cassette is active."""
+    from janito.config import config
+
+    if not config.get("cassette"):
+        return driver
+    from janito.drivers.cassette.driver import wrap_with_cassette
+
+    return wrap_with_cassette(driver)
+
+
 def create_configured_agent(
     *,
     provider_instance=None,
@@ -281,6 +292,7 @@ def create_configured_agent(
     driver = None
     if hasattr(provider_instance, "create_driver"):
         driver = provider_instance.create_driver()
+        driver = _maybe_wrap_with_cassette(driver)
         # Ensure no tools are passed to the driver when --no-tools flag is active
         if no_tools_mode:
             driver.tools_adapter = None
@@ -306,3 +318,19 @@ def create_configured_agent(
     if driver is not None:
         agent.driver = driver  # Attach driver to agent for thread management
     return agent
+
+
+def create_configured_async_agent(**kwargs):
+    """
+    Asyncio variant of create_configured_agent: accepts the same keyword
+    arguments and returns an AsyncLLMAgent backed by the provider's async driver.
+    """
+    from janito.llm.async_agent import AsyncLLMAgent
+
+    provider_instance = kwargs.get("provider_instance")
+    driver = provider_instance.create_async_driver()
+    if kwargs.get("no_tools_mode"):
+        driver.tools_adapter = None
+    driver.start()
+    agent = setup_agent(**kwargs)
+    return AsyncLLMAgent.from_agent(agent, driver=driver)
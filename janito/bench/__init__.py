@@ -0,0 +1,3 @@
+"""
+Benchmark helpers: a local OpenAI-compatible mock server and the ``janito bench`` suite.
+"""
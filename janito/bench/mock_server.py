@@ -0,0 +1,232 @@
+"""
+Local stand-in for an OpenAI-compatible chat completions API.
+
+``OpenAIModelDriver`` can target it through ``base_url``, which lets benchmarks
+and tests run the full client stack (SDK, HTTP, JSON, streaming) without a
+live provider. Endpoints:
+
+``GET /v1/models``
+    A single model, ``janito-mock``.
+``POST /v1/chat/completions``
+    Returns the next scripted response, after ``latency`` seconds. With
+    ``"stream": true`` the response is sent as server-sent events.
+
+A script is a list of responses served in turn (cycling when exhausted).
+Each response is a dict with either ``content`` (assistant text) or
+``tool_calls`` (a list of ``{"name": ..., "arguments": {...}}``), or a
+callable ``responder(request_body) -> response dict``.
+"""
+
+import itertools
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+MODEL_NAME = "janito-mock"
+MAX_BODY_BYTES = 64 * 1024 * 1024
+
+# One tool round trip per prompt: list files, then answer
+DEFAULT_SCRIPT = [
+    {"tool_calls": [{"name": "find_files", "arguments": {"paths": ".", "pattern": "*.py"}}]},
+    {"content": "The project contains the Python files listed above."},
+]
+
+
+def _estimate_tokens(text):
+    return max(1, len(text) // 4)
+
+
+class MockOpenAIHandler(BaseHTTPRequestHandler):
+    server_version = "janito-mock-openai"
+    protocol_version = "HTTP/1.1"
+    # Headers and body are separate writes; avoid Nagle/delayed-ACK stalls on keep-alive
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        if self._route() == "models":
+            return self._send_json(
+                200,
+                {
+                    "object": "list",
+                    "data": [{"id": MODEL_NAME, "object": "model", "owned_by": "janito"}],
+                },
+            )
+        self._send_json(404, {"error": {"message": f"Not found: {self.path}"}})
+
+    def do_POST(self):
+        if self._route() != "chat/completions":
+            return self._send_json(404, {"error": {"message": f"Not found: {self.path}"}})
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > MAX_BODY_BYTES:
+            return self._send_json(413, {"error": {"message": "Request body too large"}})
+        body = json.loads(self.rfile.read(length) or b"{}")
+        number, response = self.server.next_response(body)
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        completion = self.server.build_completion(number, body, response)
+        if body.get("stream"):
+            return self._send_stream(completion)
+        self._send_json(200, completion)
+
+    def _route(self):
+        path = self.path.split("?", 1)[0].strip("/")
+        if path.startswith("v1/"):
+            path = path[3:]
+        return path
+
+    def _send_json(self, status, payload):
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_stream(self, completion):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        for chunk in _stream_chunks(completion):
+            self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode("utf-8"))
+        self.wfile.write(b"data: [DONE]\n\n")
+        self.wfile.flush()
+        self.close_connection = True
+
+    def log_message(self, format, *args):
+        if getattr(self.server, "verbose", False):
+            super().log_message(format, *args)
+
+
+def _stream_chunks(completion):
+    """Split a completion into chat.completion.chunk dicts (text in a few pieces, then usage)."""
+    base = {
+        "id": completion["id"],
+        "object": "chat.completion.chunk",
+        "created": completion["created"],
+        "model": completion["model"],
+    }
+    choice = completion["choices"][0]
+    message = choice["message"]
+    content = message.get("content") or ""
+    step = max(1, len(content) // 4)
+    for start in range(0, len(content), step):
+        yield {
+            **base,
+            "choices": [
+                {
+                    "index": 0,
+                    "delta": {"content": content[start : start + step]},
+                    "finish_reason": None,
+                }
+            ],
+        }
+    for index, call in enumerate(message.get("tool_calls") or []):
+        yield {
+            **base,
+            "choices": [
+                {
+                    "index": 0,
+                    "delta": {"tool_calls": [{"index": index, **call}]},
+                    "finish_reason": None,
+                }
+            ],
+        }
+    yield {
+        **base,
+        "choices": [{"index": 0, "delta": {}, "finish_reason": choice["finish_reason"]}],
+    }
+    yield {**base, "choices": [], "usage": completion["usage"]}
+
+
+class MockOpenAIServer(ThreadingHTTPServer):
+    """
+    Threaded HTTP server answering chat completions from a script.
+
+    Use :meth:`start` / :meth:`stop` (or a ``with`` block) to run it on a
+    background thread; :attr:`base_url` is the value to pass as ``base_url``.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, script=None, latency=0.0, host="127.0.0.1", port=0):
+        super().__init__((host, port), MockOpenAIHandler)
+        self.latency = latency
+        self.verbose = False
+        self.request_count = 0
+        self._lock = threading.Lock()
+        self._responder = script if callable(script) else None
+        self._script = None
+        if self._responder is None:
+            self._script = itertools.cycle(script or DEFAULT_SCRIPT)
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def next_response(self, body):
+        """Return (request number, scripted response) for a chat completion request."""
+        with self._lock:
+            self.request_count += 1
+            number = self.request_count
+            if self._responder is None:
+                return number, next(self._script)
+        return number, self._responder(body)
+
+    def build_completion(self, number, body, response):
+        content = response.get("content")
+        tool_calls = [
+            {
+                "id": f"call_{number}_{index}",
+                "type": "function",
+                "function": {
+                    "name": call["name"],
+                    "arguments": json.dumps(call.get("arguments", {})),
+                },
+            }
+            for index, call in enumerate(response.get("tool_calls") or [])
+        ]
+        message = {"role": "assistant", "content": content}
+        if tool_calls:
+            message["tool_calls"] = tool_calls
+        prompt_tokens = _estimate_tokens(json.dumps(body.get("messages", [])))
+        completion_tokens = _estimate_tokens((content or "") + json.dumps(tool_calls))
+        return {
+            "id": f"chatcmpl-mock-{number}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model") or MODEL_NAME,
+            "choices": [
+                {
+                    "index": 0,
+                    "message": message,
+                    "finish_reason": "tool_calls" if tool_calls else "stop",
+                }
+            ],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        }
+
+    def start(self):
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
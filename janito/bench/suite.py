@@ -0,0 +1,277 @@
+"""
+``janito bench``: measure janito's own per-turn overhead without a live provider.
+
+Each scenario drives a real :class:`LLMAgent` (agent loop, tool dispatch,
+event bus, history conversion) for a number of turns; every turn is one
+prompt that triggers a ``find_files`` tool call followed by a text answer.
+
+``http``
+    ``OpenAIModelDriver`` against the bundled :class:`MockOpenAIServer`, so the
+    SDK, HTTP and JSON layers are included. The interactions are recorded to a
+    cassette.
+``replay``
+    :class:`CassetteDriver` replaying that cassette (or ``--bench-cassette``):
+    no HTTP at all, only janito's overhead plus the synthetic latency.
+
+Per-turn overhead is the turn's wall time minus the synthetic latency of its
+requests. Tool latency comes from ``ToolCallFinished`` durations and memory
+is the peak of ``tracemalloc`` over an extra replay pass plus the process's
+maximum RSS.
+"""
+
+import os
+import statistics
+import tempfile
+import time
+import tracemalloc
+
+from janito.llm.driver_config import LLMDriverConfig
+
+SCENARIOS = ("http", "replay")
+MODEL = "janito-mock"
+SYSTEM_PROMPT = "You are a benchmark agent. Use the tools to answer."
+
+
+class _BenchProvider:
+    """Minimal provider stand-in: the agent only needs a driver config and model info."""
+
+    name = "bench"
+
+    def __init__(self, driver_config):
+        self.driver_config = driver_config
+
+    def get_model_info(self, model_name=None):
+        return None
+
+
+def _summary(values):
+    if not values:
+        return {"mean": 0.0, "p50": 0.0, "p95": 0.0, "max": 0.0}
+    ordered = sorted(values)
+    p95_index = min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))
+    return {
+        "mean": statistics.fmean(ordered),
+        "p50": statistics.median(ordered),
+        "p95": ordered[p95_index],
+        "max": ordered[-1],
+    }
+
+
+def create_bench_workdir(path=None, files=40):
+    """Create (or reuse) a small source tree for the benchmark's tool calls."""
+    path = path or tempfile.mkdtemp(prefix="janito-bench-")
+    package = os.path.join(path, "pkg")
+    os.makedirs(package, exist_ok=True)
+    for index in range(files):
+        with open(os.path.join(package, f"module_{index}.py"), "w", encoding="utf-8") as f:
+            f.write(f'"""Module {index}."""\n\n\ndef func_{index}():\n    return {index}\n')
+    return path
+
+
+def _run_turns(driver, turns, latency, workdir):
+    """Drive an agent through ``turns`` prompts; returns per-turn timings and request counts."""
+    from janito.event_bus import event_bus
+    from janito.llm.agent import LLMAgent
+    from janito.perf_singleton import performance_collector
+    from janito.tools import local_tools_adapter
+    from janito.tools.tool_base import ToolPermissions
+    from janito.tools.tool_context import ToolContext, use_tool_context
+    from janito.tools.tool_events import ToolCallFinished
+
+    agent = LLMAgent(
+        _BenchProvider(driver.config),
+        local_tools_adapter,
+        system_prompt=SYSTEM_PROMPT,
+        input_queue=driver.input_queue,
+        output_queue=driver.output_queue,
+    )
+    agent.driver = driver
+    driver.start()
+    context = ToolContext(workdir, ToolPermissions(read=True))
+    tool_seconds = {}
+
+    def on_tool_finished(event):
+        if event.duration is not None:
+            tool_seconds.setdefault(event.tool_name, []).append(event.duration)
+
+    event_bus.subscribe(ToolCallFinished, on_tool_finished)
+    turn_seconds, overhead_seconds, requests = [], [], 0
+    try:
+        with use_tool_context(context):
+            for turn in range(turns):
+                before = performance_collector.get_total_requests()
+                started = time.perf_counter()
+                agent.chat(f"Which Python files are in the project? (turn {turn + 1})")
+                elapsed = time.perf_counter() - started
+                turn_requests = performance_collector.get_total_requests() - before
+                requests += turn_requests
+                turn_seconds.append(elapsed)
+                overhead_seconds.append(max(0.0, elapsed - turn_requests * latency))
+    finally:
+        driver.input_queue.put(None)
+        event_bus.unsubscribe(ToolCallFinished, on_tool_finished)
+    return {
+        "turns": turns,
+        "requests": requests,
+        "turn_ms": _summary([s * 1e3 for s in turn_seconds]),
+        "overhead_ms": _summary([s * 1e3 for s in overhead_seconds]),
+        "tool_ms": {
+            name: _summary([s * 1e3 for s in values])
+            for name, values in tool_seconds.items()
+        },
+    }
+
+
+def _driver_config(base_url=None, stream=False):
+    return LLMDriverConfig(
+        model=MODEL, api_key="janito-bench", base_url=base_url, stream=stream
+    )
+
+
+def _http_scenario(turns, latency, stream, workdir, record_path):
+    from janito.bench.mock_server import MockOpenAIServer
+    from janito.drivers.cassette.driver import Cassette, CassetteDriver
+    from janito.drivers.openai.driver import OpenAIModelDriver
+    from janito.tools import local_tools_adapter
+
+    with MockOpenAIServer(latency=latency) as server:
+        config = _driver_config(base_url=server.base_url, stream=stream)
+        if record_path:
+            driver = CassetteDriver(
+                Cassette(record_path, mode="record"),
+                tools_adapter=local_tools_adapter,
+                provider_name="bench",
+            )
+        else:
+            driver = OpenAIModelDriver(
+                tools_adapter=local_tools_adapter, provider_name="bench"
+            )
+        driver.config = config
+        return _run_turns(driver, turns, latency, workdir)
+
+
+def _replay_driver(cassette_path, latency, stream):
+    from janito.drivers.cassette.driver import Cassette, CassetteDriver
+    from janito.tools import local_tools_adapter
+
+    driver = CassetteDriver(
+        Cassette(cassette_path, mode="replay", latency=latency, match="sequence"),
+        tools_adapter=local_tools_adapter,
+        provider_name="bench",
+    )
+    driver.config = _driver_config(stream=stream)
+    return driver
+
+
+def _replay_scenario(turns, latency, stream, workdir, cassette_path):
+    return _run_turns(_replay_driver(cassette_path, latency, stream), turns, latency, workdir)
+
+
+def _replay_memory(turns, stream, workdir, cassette_path):
+    """Peak traced allocations (KiB) over a replay pass without latency."""
+    tracemalloc.start()
+    try:
+        _run_turns(_replay_driver(cassette_path, 0.0, stream), turns, 0.0, workdir)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / 1024
+
+
+def _max_rss_kib():
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in KiB on Linux and in bytes on macOS
+    return rss / 1024 if os.uname().sysname == "Darwin" else rss
+
+
+def run_bench(
+    turns=10,
+    latency=0.0,
+    stream=False,
+    scenarios=SCENARIOS,
+    cassette=None,
+    workdir=None,
+    memory=True,
+):
+    """
+    Run the benchmark scenarios and return a report dict.
+
+    ``cassette`` replays an existing cassette instead of the one recorded by the
+    ``http`` scenario (which then records nothing).
+    """
+    from janito.tools.permissions import (
+        get_global_allowed_permissions,
+        set_global_allowed_permissions,
+    )
+    from janito.tools.tool_base import ToolPermissions
+
+    unknown = [name for name in scenarios if name not in SCENARIOS]
+    if unknown:
+        raise ValueError(f"Unknown bench scenario(s): {', '.join(unknown)}")
+    workdir = create_bench_workdir(workdir)
+    scratch = tempfile.mkdtemp(prefix="janito-bench-cassette-")
+    cassette_path = cassette or os.path.join(scratch, "bench.jsonl")
+    previous_permissions = get_global_allowed_permissions()
+    # The driver thread builds the tools payload from the global permission mask
+    set_global_allowed_permissions(ToolPermissions(read=True))
+    report = {
+        "turns": turns,
+        "latency_ms": latency * 1e3,
+        "stream": stream,
+        "workdir": workdir,
+        "scenarios": {},
+    }
+    try:
+        if "http" in scenarios or (cassette is None and "replay" in scenarios):
+            result = _http_scenario(
+                turns, latency, stream, workdir, None if cassette else cassette_path
+            )
+            if "http" in scenarios:
+                report["scenarios"]["http"] = result
+        if "replay" in scenarios:
+            report["scenarios"]["replay"] = _replay_scenario(
+                turns, latency, stream, workdir, cassette_path
+            )
+            if memory:
+                report["memory"] = {
+                    "replay_peak_kib": _replay_memory(
+                        turns, stream, workdir, cassette_path
+                    )
+                }
+        report.setdefault("memory", {})["max_rss_kib"] = _max_rss_kib()
+    finally:
+        set_global_allowed_permissions(previous_permissions)
+    return report
+
+
+def format_report(report):
+    """Render a bench report as plain text."""
+    lines = [
+        f"janito bench: {report['turns']} turns, synthetic latency "
+        f"{report['latency_ms']:.0f} ms/request, stream={report['stream']}",
+        "",
+        f"{'scenario':<10}{'requests':>9}{'turn p50':>11}{'turn p95':>11}"
+        f"{'overhead p50':>15}{'overhead p95':>15}{'overhead mean':>15}",
+    ]
+    for name, result in report["scenarios"].items():
+        turn, overhead = result["turn_ms"], result["overhead_ms"]
+        lines.append(
+            f"{name:<10}{result['requests']:>9}{turn['p50']:>9.1f}ms{turn['p95']:>9.1f}ms"
+            f"{overhead['p50']:>13.1f}ms{overhead['p95']:>13.1f}ms{overhead['mean']:>13.1f}ms"
+        )
+    for name, result in report["scenarios"].items():
+        for tool, stats in sorted(result["tool_ms"].items()):
+            lines.append(
+                f"tool {tool} ({name}): mean {stats['mean']:.2f} ms, "
+                f"p95 {stats['p95']:.2f} ms"
+            )
+    memory = report.get("memory", {})
+    if memory.get("replay_peak_kib") is not None:
+        lines.append(f"memory: replay peak traced {memory['replay_peak_kib']:.0f} KiB")
+    if memory.get("max_rss_kib") is not None:
+        lines.append(f"memory: process max RSS {memory['max_rss_kib'] / 1024:.1f} MiB")
+    return "\n".join(lines)
@@ -40,6 +40,9 @@ COMMAND_HANDLERS = {
     "/tools": ToolsShellHandler,
     "/model": ModelShellHandler,
     "/multi": MultiShellHandler,
+    "/stats": __import__(
+        "janito.cli.chat_mode.shell.commands.stats", fromlist=["StatsShellHandler"]
+    ).StatsShellHandler,
     "/help": HelpShellHandler,
 }
 
@@ -0,0 +1,67 @@
+from janito.cli.chat_mode.shell.commands.base import ShellCmdHandler
+from janito.cli.console import shared_console
+
+
+class StatsShellHandler(ShellCmdHandler):
+    help_text = "Show session performance stats: latency percentiles, tokens, tools and caches (/stats json|prometheus for raw output)"
+
+    def run(self):
+        from janito.cli.perf_report import render_perf_report
+        from janito.perf_singleton import performance_collector
+
+        fmt = (self.after_cmd_line or "").strip().lower()
+        if fmt in ("json", "prometheus"):
+            shared_console.print(
+                render_perf_report(performance_collector, fmt),
+                markup=False,
+                highlight=False,
+            )
+            return
+        if fmt:
+            shared_console.print("[red]Usage: /stats [json|prometheus][/red]")
+            return
+        self._print_tables(performance_collector.snapshot())
+
+    def _print_tables(self, snapshot):
+        from rich.table import Table
+
+        latency = snapshot["latency"]
+        table = Table(title="Latency")
+        table.add_column("Metric", style="cyan", no_wrap=True)
+        for column in ("count", "p50", "p95", "p99", "max"):
+            table.add_column(column, justify="right")
+
+        def add(name, summary, unit, scale=1.0):
+            if not summary["count"]:
+                return
+            table.add_row(
+                name,
+                str(summary["count"]),
+                *(
+                    f"{summary[key] * scale:.1f}{unit}"
+                    for key in ("p50", "p95", "p99", "max")
+                ),
+            )
+
+        add("request", latency["request_duration"], " ms", 1e3)
+        add("time to first token", latency["time_to_first_token"], " ms", 1e3)
+        add("tokens/sec", latency["tokens_per_second"], "")
+        for name, summary in latency["tools"].items():
+            add(f"tool {name}", summary, " ms", 1e3)
+        if table.row_count:
+            shared_console.print(table)
+        else:
+            shared_console.print("[yellow]No requests recorded yet.[/yellow]")
+
+        requests = snapshot["requests"]
+        usage = snapshot["token_usage"]
+        shared_console.print(
+            f"Requests: {requests['total']} ({requests['errors']} errors)  |  "
+            f"Tokens: {usage.get('prompt_tokens', 0)} in / "
+            f"{usage.get('completion_tokens', 0)} out"
+        )
+        for name, stats in snapshot["caches"].items():
+            shared_console.print(
+                f"Cache {name}: {stats['hits']} hits, {stats['misses']} misses "
+                f"({stats['hit_ratio']:.0%})"
+            )
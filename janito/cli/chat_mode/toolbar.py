@@ -68,6 +68,20 @@ def _get_permissions():
         return None
 
 
+def assemble_context_info(agent):
+    """Return ' | Context: used/limit' plus compaction stats, or '' when unknown."""
+    compactor = getattr(agent, "history_compactor", None)
+    if compactor is None:
+        return ""
+    stats = compactor.stats()
+    if not stats.get("limit") or stats.get("last_estimate") is None:
+        return ""
+    info = f" | Context: {format_tokens(stats['last_estimate'], 'tokens_in')}/{format_tokens(stats['limit'])}"
+    if stats.get("runs"):
+        info += f" (compacted {stats['runs']}x, -{format_tokens(stats['tokens_saved'])})"
+    return info
+
+
 def get_toolbar_func(perf: PerformanceCollector, msg_count: int, shell_state):
     from prompt_toolkit.application.current import get_app
 
@@ -80,6 +94,8 @@ def get_toolbar_func(perf: PerformanceCollector, msg_count: int, shell_state):
         )
         usage = perf.get_last_request_usage()
         first_line = assemble_first_line(provider_name, model_name, role, agent=agent)
+        if agent is not None:
+            first_line += assemble_context_info(agent)
         permissions = _get_permissions()
         bindings_line = assemble_bindings_line(width, permissions)
         toolbar_text = first_line + "\n" + bindings_line
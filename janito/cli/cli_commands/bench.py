@@ -0,0 +1,42 @@
+"""
+CLI command to run ``janito bench``: measure per-turn overhead, tool latency
+and memory against the bundled mock API (see ``janito.bench``).
+"""
+
+import json
+import os
+import sys
+
+
+def handle_bench(args):
+    from janito.bench.suite import SCENARIOS, format_report, run_bench
+    from janito.cli.console import shared_console
+
+    turns = getattr(args, "bench_turns", None) or 10
+    latency_ms = getattr(args, "bench_latency", None) or 0.0
+    if turns < 1 or latency_ms < 0:
+        print("Error: --bench-turns must be >= 1 and --bench-latency >= 0.")
+        sys.exit(1)
+    # Turns are still rendered (and timed); without --verbose the output is discarded
+    console_file = shared_console.file
+    devnull = None
+    if not getattr(args, "verbose", False):
+        devnull = open(os.devnull, "w", encoding="utf-8")
+        shared_console.file = devnull
+    try:
+        report = run_bench(
+            turns=turns,
+            latency=latency_ms / 1000.0,
+            stream=bool(getattr(args, "stream", False)),
+            scenarios=tuple(getattr(args, "bench_scenario", None) or SCENARIOS),
+            cassette=getattr(args, "bench_cassette", None),
+            workdir=getattr(args, "workdir", None),
+        )
+    finally:
+        shared_console.file = console_file
+        if devnull is not None:
+            devnull.close()
+    if getattr(args, "bench_json", False):
+        print(json.dumps(report, indent=2))
+    else:
+        print(format_report(report))
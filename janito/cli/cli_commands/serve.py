@@ -0,0 +1,82 @@
+"""
+CLI command to run ``janito serve``: a long-running multi-session agent server.
+"""
+
+import sys
+
+from janito.cli.verbose_output import print_verbose_info
+
+
+def handle_serve(args, provider, llm_driver_config, agent_role):
+    from janito.config import config
+    from janito.provider_registry import ProviderRegistry
+    from janito.agent.setup_agent import create_configured_async_agent
+    from janito.server import SessionManager, create_server
+    from janito.tools.disabled_tools import load_disabled_tools_from_config
+    from janito.tools.tool_base import ToolPermissions
+    import janito.tools
+
+    # -r/-w/-x set the most a session may request
+    max_permissions = ToolPermissions(
+        read=bool(getattr(args, "read", False)),
+        write=bool(getattr(args, "write", False)),
+        execute=bool(getattr(args, "exec", False)),
+    )
+    load_disabled_tools_from_config()
+    adapter = janito.tools.get_local_tools_adapter()
+    adapter.set_verbose_tools(bool(getattr(args, "verbose_tools", False)))
+    if getattr(args, "unrestricted_paths", False):
+        setattr(adapter, "unrestricted_paths", True)
+
+    provider_instance = ProviderRegistry().get_instance(provider, llm_driver_config)
+    if provider_instance is None:
+        return
+    try:
+        provider_instance.create_async_driver()
+    except NotImplementedError as e:
+        print(f"Error: {e} 'janito serve' requires an OpenAI-compatible provider.")
+        sys.exit(1)
+
+    def agent_factory(profile=None, role=None, allowed_permissions=None):
+        return create_configured_async_agent(
+            provider_instance=provider_instance,
+            llm_driver_config=llm_driver_config,
+            role=role,
+            profile=profile,
+            allowed_permissions=allowed_permissions,
+            verbose_agent=bool(getattr(args, "verbose_agent", False)),
+        )
+
+    manager = SessionManager(
+        agent_factory,
+        max_permissions=max_permissions,
+        default_profile=getattr(args, "profile", None) or "developer",
+        default_role=agent_role,
+    )
+    unix_socket = getattr(args, "socket", None)
+    host = getattr(args, "host", None) or "127.0.0.1"
+    port = getattr(args, "port", None) or 8765
+    token = config.get("serve_token") or None
+    server = create_server(
+        manager, host=host, port=port, unix_socket=unix_socket, token=token
+    )
+    server.verbose = bool(getattr(args, "verbose", False))
+    address = unix_socket or f"http://{host}:{port}"
+    if getattr(args, "verbose", False):
+        print_verbose_info(
+            "Max session permissions",
+            f"read={max_permissions.read}, write={max_permissions.write}, execute={max_permissions.execute}",
+            style="yellow",
+        )
+    print(f"Janito server listening on {address} (Ctrl+C to stop)", flush=True)
+    if token is None:
+        print(f"Authorization: Bearer {server.auth_token}", flush=True)
+    else:
+        print("Authorization: Bearer <serve_token from config>", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        manager.shutdown()
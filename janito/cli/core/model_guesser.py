@@ -22,28 +22,15 @@ def guess_provider_from_model(model_name: str) -> str:
     
     # Check each provider's models
     for provider_name in LLMProviderRegistry.list_providers():
-        provider_class = LLMProviderRegistry.get(provider_name)
-        if not provider_class:
-            continue
-            
-        # Get model specs for this provider
+        # Get model specs for this provider (from the manifest, no SDK import)
         try:
-            if hasattr(provider_class, 'MODEL_SPECS'):
-                model_specs = provider_class.MODEL_SPECS
-                for spec_model_name in model_specs.keys():
-                    if spec_model_name.lower() == model_name:
-                        return provider_name
-            
-            # Handle special cases like moonshotai
-            if provider_name == "moonshotai":
-                try:
-                    from janito.providers.moonshotai.model_info import MOONSHOTAI_MODEL_SPECS
-                    for spec_model_name in MOONSHOTAI_MODEL_SPECS.keys():
-                        if spec_model_name.lower() == model_name:
-                            return "moonshotai"
-                except ImportError:
-                    pass
-                    
+            model_specs = LLMProviderRegistry.get_model_specs(provider_name)
+            if not model_specs:
+                continue
+            for spec_model_name in model_specs.keys():
+                if spec_model_name.lower() == model_name:
+                    return provider_name
+
         except Exception:
             # Skip providers that have issues accessing model specs
             continue
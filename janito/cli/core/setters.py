@@ -5,6 +5,36 @@ from janito.config import config as global_config
 from janito.provider_registry import ProviderRegistry
 from janito.cli.cli_commands.set_api_key import handle_set_api_key
 
+# Numeric config keys accepted by --set, mapped to their value type
+NUMERIC_CONFIG_KEYS = {
+    "http_max_connections": int,
+    "http_max_keepalive_connections": int,
+    "http_keepalive_expiry": float,
+    "http_client_idle_timeout": float,
+    "tool_max_workers": int,
+    "compaction_threshold": float,
+    "compaction_target": float,
+    "compaction_keep_recent": int,
+    "scan_workers": int,
+    "response_cache_ttl": float,
+    "response_cache_max_mb": float,
+    "file_cache_max_mb": float,
+    "python_workers": int,
+    "python_worker_max_runs": int,
+    "python_worker_max_growth_mb": float,
+    "output_head_lines": int,
+    "output_tail_lines": int,
+    "max_background_jobs": int,
+}
+
+# Boolean config keys accepted by --set (true/false, yes/no, on/off, 1/0)
+BOOLEAN_CONFIG_KEYS = (
+    "search_index",
+    "response_cache",
+    "async_reporter",
+    "persistent_shell",
+)
+
 
 def handle_api_key_set(args):
     if getattr(args, "set_api_key", None):
@@ -41,37 +71,111 @@ def _parse_set_arg(set_arg):
 
 
 def _dispatch_set_key(key, value):
-    if key == "provider":
-        return _handle_set_config_provider(value)
-    if key == "model":
-        return _handle_set_global_model(value)
-    if key == "max_tokens":
-        return _handle_set_max_tokens(value)
-    if key == "base_url":
-        return _handle_set_base_url(value)
-    if key in ["azure_deployment_name", "azure-deployment-name"]:
-        global_config.file_set("azure_deployment_name", value)
-        print(f"Azure deployment name set to '{value}'.")
+    handler = SPECIAL_CONFIG_KEYS.get(key)
+    if handler is not None:
+        return handler(value)
+    if key in NUMERIC_CONFIG_KEYS:
+        return _handle_set_numeric(key, value)
+    if key in BOOLEAN_CONFIG_KEYS:
+        return _handle_set_boolean(key, value)
+    print(
+        f"Error: Unknown config key '{key}'. Supported: "
+        + ", ".join([*SPECIAL_CONFIG_KEYS, *NUMERIC_CONFIG_KEYS, *BOOLEAN_CONFIG_KEYS])
+    )
+    return True
+
+
+def _handle_set_azure_deployment_name(value):
+    global_config.file_set("azure_deployment_name", value)
+    print(f"Azure deployment name set to '{value}'.")
+    return True
+
+
+def _handle_set_tool_permissions(value):
+    from janito.tools.permissions_parse import parse_permissions_string
+    from janito.tools.permissions import set_global_allowed_permissions
+
+    perms = parse_permissions_string(value)
+    global_config.file_set("tool_permissions", value)
+    set_global_allowed_permissions(perms)
+    print(f"Tool permissions set to '{value}' (parsed: {perms})")
+    return True
+
+
+def _handle_set_disabled_tools(value):
+    from janito.tools.disabled_tools import set_disabled_tools
+
+    set_disabled_tools(value)
+    global_config.file_set("disabled_tools", value)
+    print(f"Disabled tools set to '{value}'")
+    return True
+
+
+def _handle_set_compaction_strategies(value):
+    from janito.llm.compaction import STRATEGIES
+
+    names = [name.strip() for name in value.split(",") if name.strip()]
+    unknown = [name for name in names if name not in STRATEGIES]
+    if unknown:
+        print(
+            f"Error: Unknown compaction strategy '{', '.join(unknown)}'. Supported: "
+            + ", ".join(STRATEGIES)
+        )
         return True
-    if key == "tool_permissions":
-        from janito.tools.permissions_parse import parse_permissions_string
-        from janito.tools.permissions import set_global_allowed_permissions
-
-        perms = parse_permissions_string(value)
-        global_config.file_set("tool_permissions", value)
-        set_global_allowed_permissions(perms)
-        print(f"Tool permissions set to '{value}' (parsed: {perms})")
+    global_config.file_set("compaction_strategies", ",".join(names))
+    print(f"Compaction strategies set to '{','.join(names)}'")
+    return True
+
+
+def _handle_set_scan_pool(value):
+    kind = value.strip().lower()
+    if kind not in ("process", "thread"):
+        print("Error: scan_pool must be set to 'process' or 'thread'.")
         return True
-    if key == "disabled_tools":
-        from janito.tools.disabled_tools import set_disabled_tools
+    global_config.file_set("scan_pool", kind)
+    print(f"scan_pool set to '{kind}'.")
+    return True
+
+
+def _handle_set_response_cache_path(value):
+    import os
+
+    path = os.path.abspath(os.path.expanduser(value))
+    global_config.file_set("response_cache_path", path)
+    print(f"response_cache_path set to '{path}'.")
+    return True
 
-        set_disabled_tools(value)
-        global_config.file_set("disabled_tools", value)
-        print(f"Disabled tools set to '{value}'")
+
+def _handle_set_python_preload(value):
+    names = [name.strip() for name in value.split(",") if name.strip()]
+    global_config.file_set("python_preload", ",".join(names))
+    print(f"python_preload set to '{','.join(names)}'.")
+    return True
+
+
+def _handle_set_numeric(key, value):
+    cast = NUMERIC_CONFIG_KEYS[key]
+    try:
+        parsed = cast(value)
+    except Exception:
+        print(f"Error: {key} must be set to a {cast.__name__} value.")
         return True
-    print(
-        f"Error: Unknown config key '{key}'. Supported: provider, model, max_tokens, base_url, azure_deployment_name, tool_permissions, disabled_tools"
-    )
+    global_config.file_set(key, parsed)
+    print(f"{key} set to {parsed}.")
+    return True
+
+
+def _handle_set_boolean(key, value):
+    lowered = value.strip().lower()
+    if lowered in ("1", "true", "yes", "on"):
+        parsed = True
+    elif lowered in ("0", "false", "no", "off"):
+        parsed = False
+    else:
+        print(f"Error: {key} must be set to true or false.")
+        return True
+    global_config.file_set(key, parsed)
+    print(f"{key} set to {parsed}.")
     return True
 
 
@@ -131,3 +235,20 @@ def _handle_set_global_model(value):
     global_config.file_set("model", value)
     print(f"Global default model set to '{value}'.")
     return True
+
+
+# Config keys accepted by --set that need their own handler, mapped to it
+SPECIAL_CONFIG_KEYS = {
+    "provider": _handle_set_config_provider,
+    "model": _handle_set_global_model,
+    "max_tokens": _handle_set_max_tokens,
+    "base_url": _handle_set_base_url,
+    "azure_deployment_name": _handle_set_azure_deployment_name,
+    "azure-deployment-name": _handle_set_azure_deployment_name,
+    "tool_permissions": _handle_set_tool_permissions,
+    "disabled_tools": _handle_set_disabled_tools,
+    "compaction_strategies": _handle_set_compaction_strategies,
+    "scan_pool": _handle_set_scan_pool,
+    "response_cache_path": _handle_set_response_cache_path,
+    "python_preload": _handle_set_python_preload,
+}
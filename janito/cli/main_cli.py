@@ -2,17 +2,14 @@ import argparse
 import sys
 import enum
 from janito.cli.core.setters import handle_api_key_set, handle_set
-from janito.cli.core.getters import handle_getter
-from janito.cli.core.runner import (
-    prepare_llm_driver_config,
-    handle_runner,
-    get_prompt_mode,
-)
 from janito.cli.core.event_logger import (
     setup_event_logger_if_needed,
     inject_debug_event_bus_if_needed,
 )
 
+# Getter and runner modules (rich, tools, provider SDKs) are imported on use,
+# so that --version, --list-providers and --show-config start quickly.
+
 definition = [
     (
         ["-u", "--unrestricted-paths"],
@@ -147,6 +144,13 @@ definition = [
             "help": "Print the raw JSON response from the OpenAI API (if applicable)",
         },
     ),
+    (
+        ["--stream"],
+        {
+            "action": "store_true",
+            "help": "Stream the model response token by token as it is generated",
+        },
+    ),
     (
         ["--effort"],
         {
@@ -167,6 +171,128 @@ definition = [
             "help": "Print debug info on event subscribe/submit methods",
         },
     ),
+    (
+        ["--serve"],
+        {
+            "action": "store_true",
+            "help": "Run a multi-session agent server (HTTP/JSON API); also available as 'janito serve'",
+        },
+    ),
+    (
+        ["--host"],
+        {
+            "metavar": "HOST",
+            "default": None,
+            "help": "Address for --serve to bind to (default: 127.0.0.1)",
+        },
+    ),
+    (
+        ["--port"],
+        {
+            "type": int,
+            "metavar": "PORT",
+            "default": None,
+            "help": "TCP port for --serve (default: 8765)",
+        },
+    ),
+    (
+        ["--socket"],
+        {
+            "metavar": "PATH",
+            "default": None,
+            "help": "Serve on a Unix domain socket at PATH instead of TCP",
+        },
+    ),
+    (
+        ["--bench"],
+        {
+            "action": "store_true",
+            "help": "Benchmark janito's per-turn overhead against a local mock API; also available as 'janito bench'",
+        },
+    ),
+    (
+        ["--bench-turns"],
+        {
+            "type": int,
+            "metavar": "N",
+            "default": None,
+            "help": "Turns per --bench scenario (default: 10)",
+        },
+    ),
+    (
+        ["--bench-latency"],
+        {
+            "type": float,
+            "metavar": "MS",
+            "default": None,
+            "help": "Synthetic API latency per request for --bench, in milliseconds (default: 0)",
+        },
+    ),
+    (
+        ["--bench-scenario"],
+        {
+            "choices": ["http", "replay"],
+            "action": "append",
+            "default": None,
+            "help": "Run only this --bench scenario (repeatable; default: http and replay)",
+        },
+    ),
+    (
+        ["--bench-cassette"],
+        {
+            "metavar": "PATH",
+            "default": None,
+            "help": "Cassette replayed by the --bench replay scenario (default: recorded from the http scenario)",
+        },
+    ),
+    (
+        ["--bench-json"],
+        {
+            "action": "store_true",
+            "help": "Print the --bench report as JSON",
+        },
+    ),
+    (
+        ["--record-cassette"],
+        {
+            "metavar": "PATH",
+            "default": None,
+            "help": "Record every LLM request/response pair to a cassette file (JSON Lines)",
+        },
+    ),
+    (
+        ["--replay-cassette"],
+        {
+            "metavar": "PATH",
+            "default": None,
+            "help": "Replay LLM responses from a recorded cassette instead of calling the API",
+        },
+    ),
+    (
+        ["--cassette-latency"],
+        {
+            "type": float,
+            "metavar": "SECONDS",
+            "default": None,
+            "help": "Synthetic latency per replayed response (default: the recorded latency)",
+        },
+    ),
+    (
+        ["--perf-report"],
+        {
+            "metavar": "PATH",
+            "default": None,
+            "help": "At exit, write request/tool latency percentiles, token and cache stats to PATH (JSON, or Prometheus text for .prom/.txt)",
+        },
+    ),
+    (
+        ["--perf-report-format"],
+        {
+            "choices": ["json", "prometheus"],
+            "default": None,
+            "help": "Format of the --perf-report file (default: from its extension)",
+        },
+    ),
     (
         ["-c", "--config"],
         {
@@ -187,6 +313,7 @@ MODIFIER_KEYS = [
     "raw",
     "verbose_api",
     "verbose_tools",
+    "stream",
     "exec",
     "read",
     "write",
@@ -202,23 +329,27 @@ GETTER_KEYS = [
 ]
 
 
+# Words accepted as commands in place of their flag ('janito serve' = 'janito --serve')
+COMMAND_WORDS = ("serve", "bench")
+
+
 class RunMode(enum.Enum):
     GET = "get"
     SET = "set"
     RUN = "run"
+    SERVE = "serve"
+    BENCH = "bench"
 
 
 class JanitoCLI:
     def __init__(self):
-        import janito.tools
-
         self.parser = argparse.ArgumentParser(
             description="Janito CLI - A tool for running LLM-powered workflows from the command line."
             "\n\nExample usage: janito -p moonshotai -m kimi-k1-8k 'Your prompt here'\n\n"
             "Use -m or --model to set the model for the session."
         )
         self._define_args()
-        self.args = self.parser.parse_args()
+        self.args = self._parse_args()
         self._set_all_arg_defaults()
         # Support custom config file via -c/--config
         if getattr(self.args, "config", None):
@@ -255,9 +386,30 @@ class JanitoCLI:
                     self.args.user_prompt = [combined]
                 else:
                     self.args.user_prompt = [stdin_input]
-        from janito.cli.rich_terminal_reporter import RichTerminalReporter
+        self.rich_reporter = None
+
+    def _parse_args(self, argv=None):
+        """
+        Parse ``argv`` (the command line by default). A leading command word ('janito serve -r', 'janito bench')
+        stands for its flag when no prompt words follow; otherwise the words are
+        the prompt ('janito serve the static files').
+        """
+        argv = sys.argv[1:] if argv is None else argv
+        if argv and argv[0] in COMMAND_WORDS:
+            args = self.parser.parse_args(["--" + argv[0], *argv[1:]])
+            if not args.user_prompt:
+                return args
+        return self.parser.parse_args(argv)
+
+    def _start_reporter(self):
+        from janito.cli.rich_terminal_reporter import (
+            RichTerminalReporter,
+            async_reporter_enabled,
+        )
 
-        self.rich_reporter = RichTerminalReporter(raw_mode=self.args.raw)
+        self.rich_reporter = RichTerminalReporter(
+            raw_mode=self.args.raw, asynchronous=async_reporter_enabled()
+        )
 
     def _define_args(self):
         for argnames, argkwargs in definition:
@@ -299,32 +451,72 @@ class JanitoCLI:
             return RunMode.SET
         if any(getattr(self.args, k, None) for k in GETTER_KEYS):
             return RunMode.GET
+        if getattr(self.args, "serve", False):
+            return RunMode.SERVE
+        if getattr(self.args, "bench", False):
+            return RunMode.BENCH
         return RunMode.RUN
 
     def run(self):
-        # Handle --show-system/-S before anything else
-        if getattr(self.args, "show_system", False):
-            from janito.cli.cli_commands.show_system_prompt import (
-                handle_show_system_prompt,
-            )
-
-            handle_show_system_prompt(self.args)
-            return
         run_mode = self.classify()
-        if run_mode == RunMode.SET:
-            if self._run_set_mode():
-                return
         # Special handling: provider is not required for list_providers, list_tools, show_config
-        if run_mode == RunMode.GET and (
-            self.args.list_providers
-            or self.args.list_tools
-            or self.args.list_profiles
-            or self.args.show_config
-            or self.args.list_config
-        ):
-            self._maybe_print_verbose_provider_model()
-            handle_getter(self.args)
-            return
+        metadata_query = run_mode == RunMode.GET and any(
+            getattr(self.args, key, None)
+            for key in (
+                "list_providers",
+                "list_tools",
+                "list_profiles",
+                "show_config",
+                "list_config",
+            )
+        )
+        show_system = getattr(self.args, "show_system", False)
+        if not metadata_query or show_system:
+            self._start_reporter()
+        self._register_perf_report()
+        # Commands that need no provider, in order; --show-system/-S comes first.
+        # A handler returning False lets the run continue.
+        early_exit_commands = (
+            (show_system, self._handle_show_system),
+            (run_mode == RunMode.SET, self._run_set_mode),
+            (run_mode == RunMode.BENCH, self._handle_bench),
+            (metadata_query, self._handle_metadata_query),
+        )
+        for applies, handler in early_exit_commands:
+            if applies and handler() is not False:
+                return
+        self._run_with_provider(run_mode)
+
+    def _register_perf_report(self):
+        if getattr(self.args, "perf_report", None):
+            from janito.cli.perf_report import register_perf_report
+
+            register_perf_report(
+                self.args.perf_report, getattr(self.args, "perf_report_format", None)
+            )
+
+    def _handle_show_system(self):
+        from janito.cli.cli_commands.show_system_prompt import (
+            handle_show_system_prompt,
+        )
+
+        handle_show_system_prompt(self.args)
+
+    def _handle_bench(self):
+        from janito.cli.cli_commands.bench import handle_bench
+
+        handle_bench(self.args)
+
+    def _handle_metadata_query(self):
+        from janito.cli.core.getters import handle_getter
+
+        self._maybe_print_verbose_provider_model()
+        handle_getter(self.args)
+
+    def _run_with_provider(self, run_mode):
+        import janito.tools  # registers the local tools
+        from janito.cli.core.runner import prepare_llm_driver_config, get_prompt_mode
+
         # If running in single shot mode and --profile is not provided, default to 'developer' profile
         if get_prompt_mode(self.args) == "single_shot" and not getattr(
             self.args, "profile", None
@@ -340,25 +532,59 @@ class JanitoCLI:
         self._maybe_print_verbose_modifiers(modifiers)
         setup_event_logger_if_needed(self.args)
         inject_debug_event_bus_if_needed(self.args)
+        self._apply_cassette_args()
         provider, llm_driver_config, agent_role = prepare_llm_driver_config(
             self.args, modifiers
         )
         if provider is None or llm_driver_config is None:
             return
         self._maybe_print_verbose_llm_config(llm_driver_config, run_mode)
-        if run_mode == RunMode.RUN:
-            self._maybe_print_verbose_run_mode()
-            # DEBUG: Print exec_enabled propagation at main_cli
-
-            handle_runner(
-                self.args,
-                provider,
-                llm_driver_config,
-                agent_role,
-                verbose_tools=self.args.verbose_tools,
-            )
-        elif run_mode == RunMode.GET:
-            handle_getter(self.args)
+        handlers = {
+            RunMode.SERVE: self._handle_serve,
+            RunMode.RUN: self._handle_runner,
+            RunMode.GET: self._handle_getter,
+        }
+        handler = handlers.get(run_mode)
+        if handler is not None:
+            handler(provider, llm_driver_config, agent_role)
+
+    def _handle_serve(self, provider, llm_driver_config, agent_role):
+        from janito.cli.cli_commands.serve import handle_serve
+
+        handle_serve(self.args, provider, llm_driver_config, agent_role)
+
+    def _handle_runner(self, provider, llm_driver_config, agent_role):
+        from janito.cli.core.runner import handle_runner
+
+        self._maybe_print_verbose_run_mode()
+        handle_runner(
+            self.args,
+            provider,
+            llm_driver_config,
+            agent_role,
+            verbose_tools=self.args.verbose_tools,
+        )
+
+    def _handle_getter(self, provider, llm_driver_config, agent_role):
+        from janito.cli.core.getters import handle_getter
+
+        handle_getter(self.args)
+
+    def _apply_cassette_args(self):
+        """Select a record/replay cassette for the drivers created in this run."""
+        record = getattr(self.args, "record_cassette", None)
+        replay = getattr(self.args, "replay_cassette", None)
+        if not record and not replay:
+            return
+        if record and replay:
+            print("Error: --record-cassette and --replay-cassette are mutually exclusive.")
+            sys.exit(1)
+        from janito.config import config
+
+        config.runtime_set("cassette", record or replay)
+        config.runtime_set("cassette_mode", "record" if record else "replay")
+        if getattr(self.args, "cassette_latency", None) is not None:
+            config.runtime_set("cassette_latency", self.args.cassette_latency)
 
     def _run_set_mode(self):
         if handle_api_key_set(self.args):
@@ -406,6 +632,7 @@ class JanitoCLI:
 
     def _maybe_print_verbose_run_mode(self):
         if self.args.verbose:
+            from janito.cli.core.runner import get_prompt_mode
             from janito.cli.verbose_output import print_verbose_info
 
             print_verbose_info(
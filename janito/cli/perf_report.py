@@ -0,0 +1,47 @@
+"""``--perf-report``: write the PerformanceCollector statistics to a file at exit."""
+
+import atexit
+import json
+import os
+
+FORMATS = ("json", "prometheus")
+
+
+def report_format(path, fmt=None):
+    """Return the report format for ``path``: ``fmt`` if given, else from the extension."""
+    if fmt:
+        return fmt
+    extension = os.path.splitext(path)[1].lower()
+    return "prometheus" if extension in (".prom", ".txt") else "json"
+
+
+def render_perf_report(collector, fmt="json"):
+    if fmt == "prometheus":
+        return collector.to_prometheus()
+    return json.dumps(collector.snapshot(), indent=2, default=str) + "\n"
+
+
+def write_perf_report(path, fmt=None, collector=None):
+    """Write a snapshot of ``collector`` (the global one by default) to ``path``."""
+    if collector is None:
+        from janito.perf_singleton import performance_collector as collector
+    from janito.event_bus import event_bus
+
+    # Asynchronous subscribers may still be processing events
+    event_bus.flush(timeout=5)
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(render_perf_report(collector, report_format(path, fmt)))
+
+
+def register_perf_report(path, fmt=None):
+    """Arrange for the report to be written when the process exits."""
+
+    def _write():
+        try:
+            write_perf_report(path, fmt)
+        except OSError as e:
+            print(f"Error: could not write performance report to {path}: {e}")
+
+    atexit.register(_write)
@@ -235,6 +235,9 @@ class PromptHandler:
             except Exception:
                 # Do not fail on cleanup – this hook is best-effort only.
                 pass
+        finally:
+            # Let an asynchronous reporter finish rendering before the next prompt
+            global_event_bus.flush()
 
     def _print_verbose_debug(self, message):
         if hasattr(self.args, "verbose_agent") and self.args.verbose_agent:
@@ -13,6 +13,19 @@ from janito.llm import message_parts
 import sys
 
 
+def async_reporter_enabled():
+    """True when the ``async_reporter`` config key asks for rendering on the event bus thread."""
+    try:
+        from janito.config import config
+
+        value = config.get("async_reporter")
+    except Exception:
+        return False
+    if isinstance(value, str):
+        return value.strip().lower() in ("1", "true", "yes", "on")
+    return bool(value)
+
+
 class RichTerminalReporter(EventHandlerBase):
     """
     Handles UI rendering for janito events using Rich.
@@ -22,9 +35,11 @@ class RichTerminalReporter(EventHandlerBase):
         - Other MessageParts: displayed using Pretty or a suitable Rich representation
     - For RequestFinished events, output is printed only if raw mode is enabled (using Pretty formatting).
     - Report events (info, success, error, etc.) are always printed with appropriate styling.
+    - With asynchronous=True rendering happens on the event bus consumer thread, so tools
+      and drivers are not slowed down by the terminal; call event_bus.flush() before prompting.
     """
 
-    def __init__(self, raw_mode=False):
+    def __init__(self, raw_mode=False, asynchronous=False):
         from janito.cli.console import shared_console
 
         self.console = shared_console
@@ -33,8 +48,12 @@ class RichTerminalReporter(EventHandlerBase):
 
         import janito.tools.tool_events as tool_events
 
-        super().__init__(driver_events, report_events, tool_events)
+        super().__init__(
+            driver_events, report_events, tool_events, asynchronous=asynchronous
+        )
         self._waiting_printed = False
+        self._streaming = False  # True while streamed text is being printed
+        self._streamed_text = False  # Text of the pending response was already shown
 
     def on_RequestStarted(self, event):
         # Print waiting message with provider and model name
@@ -59,12 +78,31 @@ class RichTerminalReporter(EventHandlerBase):
             f"[bold cyan]Waiting for {provider} (model: {model})...[/bold cyan]", end=""
         )
 
+    def on_ResponseDelta(self, event):
+        content = getattr(event, "content", None)
+        if not content:
+            return
+        if not self._streaming:
+            # Replace the "Waiting for ..." line with the streamed text
+            self.delete_current_line()
+            self._streaming = True
+        self._streamed_text = True
+        self.console.print(
+            content, end="", markup=False, highlight=False, soft_wrap=True
+        )
+        self.console.file.flush()
+
     def on_ResponseReceived(self, event):
         parts = event.parts if hasattr(event, "parts") else None
+        streamed_text = self._streamed_text
+        self._streamed_text = False
         if not parts:
             self.console.print("[No response parts to display]")
             self.console.file.flush()
             return
+        if streamed_text:
+            # Text parts were already rendered progressively from ResponseDelta events
+            return
         for part in parts:
             if isinstance(part, message_parts.TextMessagePart):
                 self.console.print(Markdown(part.content))
@@ -74,11 +112,16 @@ class RichTerminalReporter(EventHandlerBase):
         """
         Clears the entire current line in the terminal and returns the cursor to column 1.
         """
-        sys.stdout.write("\033[2K\r")
-        sys.stdout.flush()
+        self.console.file.write("\033[2K\r")
+        self.console.file.flush()
 
     def on_RequestFinished(self, event):
-        self.delete_current_line()
+        if self._streaming:
+            # Keep the streamed text, just terminate its last line
+            self.console.print()
+            self._streaming = False
+        else:
+            self.delete_current_line()
         self._waiting_printed = False
         response = getattr(event, "response", None)
         error = getattr(event, "error", None)
@@ -132,6 +132,15 @@ def print_performance(start_time, end_time, performance_collector, args):
         right.append(
             ("[bold]Errors[/bold]", f"{error_count}" if error_count > 0 else "-")
         )
+        response_cache = performance_collector.get_cache_stats().get("llm_response")
+        if response_cache:
+            left.append(
+                (
+                    "[bold]Response Cache[/bold]",
+                    f"{response_cache['hits']}/{response_cache['hits'] + response_cache['misses']} hits, "
+                    f"saved {response_cache.get('saved_seconds', 0.0):.2f}s",
+                )
+            )
 
         total_tool_events = performance_collector.get_total_tool_events()
         tool_names_counter = performance_collector.get_tool_names_counter()
@@ -1,30 +1,72 @@
 import json
-from typing import List, Dict, Optional
+from typing import Any, List, Dict, Optional
 
 
 class LLMConversationHistory:
     """
     Stores the conversation history between user and LLM (assistant/system).
     Each message is a dict with keys: 'role', 'content', and optional 'metadata'.
+
+    The history is append-only: ``add_message`` bumps ``version``, while any
+    other mutation (``clear``, ``import_json``, ``insert_system_message``,
+    ``replace_messages``) also bumps ``generation``. Drivers use the pair to
+    convert only the messages appended since their last conversion (see
+    ``get_messages_since``).
+
+    ``tool_calls`` and ``tool_results`` messages store their content as lists
+    of dicts; JSON strings (e.g. from older exports) are still accepted.
     """
 
     def __init__(self):
         self._history: List[Dict] = []
+        self._version = 0
+        self._generation = 0
+
+    @property
+    def version(self) -> int:
+        """Incremented on every mutation."""
+        return self._version
+
+    @property
+    def generation(self) -> int:
+        """Incremented on every mutation that is not a plain append."""
+        return self._generation
 
-    def add_message(self, role: str, content: str, metadata: Optional[Dict] = None):
+    def add_message(self, role: str, content: Any, metadata: Optional[Dict] = None):
         message = {"role": role, "content": content}
         if metadata:
             message["metadata"] = metadata
         self._history.append(message)
+        self._version += 1
+
+    def insert_system_message(self, content: str):
+        """Prepend a system message (invalidates incremental conversions)."""
+        self._history.insert(0, {"role": "system", "content": content})
+        self._rewritten()
+
+    def replace_messages(self, messages: List[Dict]):
+        """Replace the whole history, e.g. after compaction (invalidates incremental conversions)."""
+        self._history = list(messages)
+        self._rewritten()
 
     def get_history(self) -> List[Dict]:
         return list(self._history)
 
+    def get_messages_since(self, start: int) -> List[Dict]:
+        """Return the messages appended at or after position ``start``."""
+        return self._history[start:]
+
     def clear(self):
         self._history.clear()
+        self._rewritten()
 
     def export_json(self) -> str:
         return json.dumps(self._history, indent=2)
 
     def import_json(self, json_str: str):
         self._history = json.loads(json_str)
+        self._rewritten()
+
+    def _rewritten(self):
+        self._version += 1
+        self._generation += 1
@@ -2,16 +2,32 @@ import os
 from .gitignore_utils import GitignoreFilter
 
 
-def walk_dir_with_gitignore(root_dir, max_depth=None, include_gitignored=False):
+def walk_dir_with_gitignore(
+    root_dir, max_depth=None, include_gitignored=False, workers=1
+):
     """
     Walks the directory tree starting at root_dir, yielding (root, dirs, files) tuples,
-    with .gitignore rules applied.
+    with the .gitignore rules of every directory above and below root_dir applied
+    (see janito.gitignore_utils).
     - If max_depth is None, unlimited recursion.
     - If max_depth=0, only the top-level directory (flat, no recursion).
     - If max_depth=1, only the root directory (matches 'find . -maxdepth 1').
     - If max_depth=N (N>1), yields files in root and up to N-1 levels below root (matches 'find . -maxdepth N').
+    - If workers > 1, directories are listed concurrently by a thread pool and
+      yielded in sorted path order once the walk completes.
     """
-    gitignore = GitignoreFilter()
+    gitignore = None if include_gitignored else GitignoreFilter(root_dir)
+    if workers > 1:
+        from .parallel_scan import threaded_walk
+
+        def on_dir(root, dirs, files):
+            if gitignore is None:
+                return None
+            return gitignore.filter_ignored(root, dirs, files)[1]
+
+        depth_limit = None if max_depth is None else max(max_depth, 1)
+        yield from threaded_walk(root_dir, workers, on_dir, depth_limit)
+        return
     for root, dirs, files in os.walk(root_dir):
         rel_path = os.path.relpath(root, root_dir)
         depth = 0 if rel_path == "." else rel_path.count(os.sep) + 1
@@ -20,6 +36,6 @@ def walk_dir_with_gitignore(root_dir, max_depth=None, include_gitignored=False):
                 # For max_depth=1, only root (depth=0). For max_depth=2, root and one level below (depth=0,1).
                 if depth > 0:
                     continue
-        if not include_gitignored:
+        if gitignore is not None:
             dirs, files = gitignore.filter_ignored(root, dirs, files)
         yield root, dirs, files
@@ -104,6 +104,18 @@ class RateLimitRetry(DriverEvent):
     details: dict = None  # Additional details extracted from the provider response
 
 
+@attr.s(auto_attribs=True, kw_only=True)
+class ResponseDelta(DriverEvent):
+    """Emitted by a driver in streaming mode for each incremental chunk of a response.
+    content holds the text fragment (if any); tool_calls holds partial tool call
+    updates as dicts with index, id, name and arguments (fragment) keys.
+    The complete response is still delivered as a ResponseReceived event.
+    """
+
+    content: str = None
+    tool_calls: list = None
+
+
 @attr.s(auto_attribs=True, kw_only=True)
 class ResponseReceived(DriverEvent):
     parts: list = None
@@ -81,8 +81,21 @@ class AzureOpenAIModelDriver(OpenAIModelDriver):
                 "api_version": config.extra.get("api_version", "2023-05-15"),
             }
             # Do NOT pass azure_deployment; deployment name is used as the 'model' param in API calls
-            client = AzureOpenAI(**client_kwargs)
-            return client
+            from janito.drivers.client_pool import client_pool
+
+            key = client_pool.make_key(
+                self.provider_name or "azure_openai",
+                client_kwargs["azure_endpoint"],
+                config.api_key,
+                client_kwargs["api_version"],
+            )
+            return client_pool.get(
+                key,
+                lambda http_client: AzureOpenAI(
+                    **client_kwargs,
+                    **({"http_client": http_client} if http_client else {}),
+                ),
+            )
         except Exception as e:
             print(
                 f"[ERROR] Exception during AzureOpenAI client instantiation: {e}",
@@ -0,0 +1,214 @@
+"""
+Record/replay ("cassette") driver for OpenAI-compatible providers.
+
+In ``record`` mode the driver talks to the real API like
+:class:`OpenAIModelDriver` and appends every request/response pair to a
+cassette file (JSON Lines, one interaction per line). In ``replay`` mode no
+client is created and no network call is made: responses are served from the
+cassette, optionally after a synthetic latency, so the agent loop, tool
+dispatch, event bus and rendering can be exercised and timed deterministically.
+
+Interactions are matched by the hash of the request payload (``match="request"``,
+see ``ResponseCache.make_key``) or simply replayed in recorded order
+(``match="sequence"``), which tolerates requests whose content varies between
+runs (temporary paths, timestamps in tool output).
+"""
+
+import json
+import os
+import threading
+import time
+
+from janito.driver_events import ResponseDelta
+from janito.drivers.openai.driver import OpenAIModelDriver
+from janito.llm.response_cache import (
+    ResponseCache,
+    completion_from_dict,
+    completion_to_dict,
+)
+
+MODES = ("record", "replay")
+MATCH_MODES = ("request", "sequence")
+
+
+class CassetteError(Exception):
+    """Raised when a replayed request has no recorded interaction."""
+
+
+class Cassette:
+    """
+    Request/response pairs stored in a JSON Lines file.
+
+    ``latency`` is the synthetic delay (seconds) applied to replayed responses;
+    None replays the latency measured when the interaction was recorded.
+    """
+
+    def __init__(self, path, mode="replay", latency=None, match="request"):
+        if mode not in MODES:
+            raise ValueError(f"Unknown cassette mode '{mode}' (expected one of {MODES})")
+        if match not in MATCH_MODES:
+            raise ValueError(
+                f"Unknown cassette match mode '{match}' (expected one of {MATCH_MODES})"
+            )
+        self.path = path
+        self.mode = mode
+        self.latency = latency
+        self.match = match
+        self._lock = threading.Lock()
+        self._interactions = []
+        self._used = set()
+        self._next_index = 0
+        if mode == "replay":
+            self._interactions = self.load(path)
+        else:
+            directory = os.path.dirname(os.path.abspath(path))
+            os.makedirs(directory, exist_ok=True)
+            # Recording starts a fresh cassette
+            open(path, "w", encoding="utf-8").close()
+
+    @staticmethod
+    def load(path):
+        interactions = []
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    interactions.append(json.loads(line))
+        return interactions
+
+    @staticmethod
+    def request_key(api_kwargs):
+        # Provider and base URL are left out so a cassette replays against any endpoint
+        return ResponseCache.make_key(None, None, api_kwargs)
+
+    def __len__(self):
+        return len(self._interactions)
+
+    def record(self, api_kwargs, result, latency):
+        request = {k: v for k, v in api_kwargs.items() if k not in ("stream_options",)}
+        interaction = {
+            "key": self.request_key(api_kwargs),
+            "request": completion_to_dict(request),
+            "response": completion_to_dict(result),
+            "latency": latency,
+        }
+        with self._lock:
+            self._interactions.append(interaction)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(interaction, ensure_ascii=False) + "\n")
+
+    def next_response(self, api_kwargs):
+        """Return (completion, latency) for the next interaction matching ``api_kwargs``."""
+        with self._lock:
+            index = self._find(api_kwargs)
+            self._used.add(index)
+            self._next_index = index + 1
+            interaction = self._interactions[index]
+        latency = self.latency
+        if latency is None:
+            latency = interaction.get("latency") or 0.0
+        return completion_from_dict(interaction["response"]), latency
+
+    def _find(self, api_kwargs):
+        if self.match == "sequence":
+            if self._next_index >= len(self._interactions):
+                raise CassetteError(
+                    f"Cassette {self.path} has no interaction left to replay "
+                    f"({len(self._interactions)} recorded)"
+                )
+            return self._next_index
+        key = self.request_key(api_kwargs)
+        for index, interaction in enumerate(self._interactions):
+            if index not in self._used and interaction["key"] == key:
+                return index
+        raise CassetteError(
+            f"No recorded interaction in {self.path} matches the request "
+            f"(key {key[:12]}); re-record the cassette or replay with match='sequence'"
+        )
+
+
+class CassetteDriver(OpenAIModelDriver):
+    """OpenAIModelDriver that records to, or replays from, a :class:`Cassette`."""
+
+    def __init__(self, cassette, tools_adapter=None, provider_name=None):
+        super().__init__(tools_adapter=tools_adapter, provider_name=provider_name)
+        self.cassette = cassette
+
+    @classmethod
+    def from_driver(cls, driver, cassette):
+        """Return a CassetteDriver with the tools adapter, provider and config of ``driver``."""
+        cassette_driver = cls(
+            cassette,
+            tools_adapter=driver.tools_adapter,
+            provider_name=driver.provider_name,
+        )
+        cassette_driver.config = getattr(driver, "config", None)
+        return cassette_driver
+
+    def _instantiate_openai_client(self, config):
+        if self.cassette.mode == "replay":
+            return None
+        return super()._instantiate_openai_client(config)
+
+    def _create_completion(self, client, api_kwargs, request_id, cancel_event):
+        if self.cassette.mode == "record":
+            started = time.monotonic()
+            result = super()._create_completion(
+                client, api_kwargs, request_id, cancel_event
+            )
+            if result is not None:
+                self.cassette.record(api_kwargs, result, time.monotonic() - started)
+            return result
+        result, latency = self.cassette.next_response(api_kwargs)
+        if latency > 0:
+            if cancel_event is not None:
+                if cancel_event.wait(latency):
+                    return result  # _call_api reports the cancellation
+            else:
+                time.sleep(latency)
+        if api_kwargs.get("stream"):
+            self._emit_replayed_deltas(result, request_id)
+        return result
+
+    def _emit_replayed_deltas(self, result, request_id):
+        message = self._get_message_from_result(result)
+        content = getattr(message, "content", None) if message else None
+        if content:
+            self.output_queue.put(
+                ResponseDelta(
+                    driver_name=self.__class__.__name__,
+                    request_id=request_id,
+                    content=content,
+                )
+            )
+
+
+def cassette_from_config():
+    """Return the Cassette selected by the ``cassette``/``cassette_mode`` config keys, or None."""
+    from janito.config import config
+
+    path = config.get("cassette")
+    if not path:
+        return None
+    latency = config.get("cassette_latency")
+    return Cassette(
+        path,
+        mode=config.get("cassette_mode") or "replay",
+        latency=float(latency) if latency not in (None, "") else None,
+        match=config.get("cassette_match") or "request",
+    )
+
+
+def wrap_with_cassette(driver):
+    """
+    Return ``driver`` replaced by a CassetteDriver when a cassette is configured.
+    Only plain OpenAIModelDriver instances (OpenAI-compatible providers) can be wrapped.
+    """
+    cassette = cassette_from_config()
+    if cassette is None:
+        return driver
+    if type(driver) is not OpenAIModelDriver:
+        raise NotImplementedError(
+            f"Cassettes are not supported by {type(driver).__name__}; "
+            "use an OpenAI-compatible provider."
+        )
+    return CassetteDriver.from_driver(driver, cassette)
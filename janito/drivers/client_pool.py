@@ -0,0 +1,281 @@
+"""
+ClientPool: process-wide cache of long-lived OpenAI-compatible SDK clients.
+
+Creating an ``openai.OpenAI`` client per request throws away the underlying
+HTTP connection pool, so every agent turn pays a fresh TLS handshake. Drivers
+obtain their client from the shared pool instead; clients are keyed by
+(provider, base_url, api key hash) and evicted after a configurable idle time.
+
+A client handed out by :meth:`ClientPool.get` is leased until the caller
+passes it to :meth:`ClientPool.release`: leased clients are never evicted as
+idle, and a leased client that is discarded is closed only once released.
+"""
+
+import hashlib
+import threading
+import time
+import weakref
+
+# Defaults used when the corresponding config key is not set.
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_KEEPALIVE_EXPIRY = 60.0
+DEFAULT_IDLE_TIMEOUT = 600.0
+
+
+def _hash_api_key(api_key):
+    if not api_key:
+        return None
+    return hashlib.sha256(str(api_key).encode("utf-8")).hexdigest()
+
+
+def _config_number(key, default, cast=float):
+    try:
+        from janito.config import config
+
+        value = config.get(key)
+        return cast(value) if value is not None else default
+    except Exception:
+        return default
+
+
+class _PooledClient:
+    __slots__ = ("client", "last_used", "users", "retired")
+
+    def __init__(self, client, now):
+        self.client = client
+        self.last_used = now
+        self.users = 0
+        self.retired = False
+
+
+class ClientPool:
+    """
+    Thread-safe cache of SDK clients shared by all drivers in the process.
+
+    Each entry keeps the client together with its last-used timestamp and the
+    number of callers using it. Entries nobody uses and idle for longer than
+    ``idle_timeout`` seconds are closed on the next lookup. Clients are built
+    outside the pool lock, so a slow construction does not block other drivers.
+    Cache hits and misses are reported to the global PerformanceCollector.
+    """
+
+    def __init__(
+        self,
+        max_connections=None,
+        max_keepalive_connections=None,
+        keepalive_expiry=None,
+        idle_timeout=None,
+    ):
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.idle_timeout = idle_timeout
+        self._clients = {}  # key -> _PooledClient
+        self._leased = {}  # id(client) -> _PooledClient, while in use
+        # Async clients are bound to the event loop that uses them
+        self._async_clients = weakref.WeakKeyDictionary()  # loop -> {key: client}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(provider_name, base_url, api_key, *extra):
+        """Build the cache key; the API key itself is never stored."""
+        return (provider_name, base_url or None, _hash_api_key(api_key)) + tuple(
+            extra
+        )
+
+    def get(self, key, factory):
+        """
+        Lease the cached client for ``key``, creating it with ``factory`` on a miss.
+
+        ``factory`` is called with a single ``http_client`` argument (possibly
+        None) that should be forwarded to the SDK client constructor. Pass the
+        client to :meth:`release` once the request using it is done.
+        """
+        with self._lock:
+            expired = self._evict_idle_locked(time.monotonic())
+            entry = self._clients.get(key)
+            if entry is not None:
+                self._lease_locked(entry)
+                self.hits += 1
+        self._close_all(expired)
+        if entry is not None:
+            self._report(True)
+            return entry.client
+
+        client = factory(self._build_http_client())
+        with self._lock:
+            entry = self._clients.get(key)
+            if entry is None:
+                entry = self._clients[key] = _PooledClient(client, time.monotonic())
+                client = None
+            self._lease_locked(entry)
+            self.misses += 1
+        if client is not None:
+            # Another thread built a client for the same key first
+            self._close(client)
+        self._report(False)
+        return entry.client
+
+    def release(self, client):
+        """End a lease taken with :meth:`get`; unknown clients are ignored."""
+        with self._lock:
+            entry = self._leased.get(id(client))
+            if entry is None or entry.client is not client:
+                return
+            entry.users -= 1
+            entry.last_used = time.monotonic()
+            if entry.users > 0:
+                return
+            del self._leased[id(client)]
+            if not entry.retired:
+                return
+        self._close(client)
+
+    def get_async(self, key, factory):
+        """
+        Like ``get`` for asyncio SDK clients (e.g. ``openai.AsyncOpenAI``).
+
+        Async clients are cached per running event loop and released together
+        with it; ``factory`` receives an async httpx client (or None).
+        """
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            clients = self._async_clients.setdefault(loop, {})
+            client = clients.get(key)
+            hit = client is not None
+            if hit:
+                self.hits += 1
+        if not hit:
+            created = factory(self._build_http_client(async_client=True))
+            with self._lock:
+                client = clients.setdefault(key, created)
+                self.misses += 1
+            if client is not created:
+                self._close(created)
+        self._report(hit)
+        return client
+
+    def discard(self, key):
+        """Drop a single cached client, e.g. after a fatal connection error.
+
+        The client is closed at once, or when its last lease is released.
+        """
+        with self._lock:
+            entry = self._clients.pop(key, None)
+            closing = self._retire_locked([entry] if entry is not None else [])
+        self._close_all(closing)
+
+    def evict_idle(self):
+        with self._lock:
+            expired = self._evict_idle_locked(time.monotonic())
+        self._close_all(expired)
+
+    def clear(self):
+        with self._lock:
+            entries = list(self._clients.values())
+            self._clients.clear()
+            self._async_clients.clear()
+            closing = self._retire_locked(entries)
+        self._close_all(closing)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "size": len(self._clients),
+                "async_size": sum(len(c) for c in self._async_clients.values()),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    def _lease_locked(self, entry):
+        entry.users += 1
+        entry.last_used = time.monotonic()
+        self._leased[id(entry.client)] = entry
+
+    def _retire_locked(self, entries):
+        """Mark ``entries`` as dropped; return the clients that can be closed now."""
+        closing = []
+        for entry in entries:
+            entry.retired = True
+            if not entry.users:
+                closing.append(entry.client)
+        return closing
+
+    def _evict_idle_locked(self, now):
+        """Drop the unused clients idle for longer than the timeout; return them for closing."""
+        idle_timeout = self._setting(
+            self.idle_timeout, "http_client_idle_timeout", DEFAULT_IDLE_TIMEOUT
+        )
+        if not idle_timeout or idle_timeout <= 0:
+            return []
+        expired = [
+            key
+            for key, entry in self._clients.items()
+            if not entry.users and now - entry.last_used > idle_timeout
+        ]
+        return self._retire_locked([self._clients.pop(key) for key in expired])
+
+    def _setting(self, explicit, config_key, default, cast=float):
+        if explicit is not None:
+            return explicit
+        return _config_number(config_key, default, cast)
+
+    def _build_http_client(self, async_client=False):
+        """Create an httpx client with the configured connection limits, or None if unsupported."""
+        try:
+            import httpx
+            import openai
+        except ImportError:
+            return None
+        factory = getattr(
+            openai, "DefaultAsyncHttpxClient" if async_client else "DefaultHttpxClient", None
+        )
+        if factory is None:
+            return None
+        limits = httpx.Limits(
+            max_connections=self._setting(
+                self.max_connections,
+                "http_max_connections",
+                DEFAULT_MAX_CONNECTIONS,
+                int,
+            ),
+            max_keepalive_connections=self._setting(
+                self.max_keepalive_connections,
+                "http_max_keepalive_connections",
+                DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+                int,
+            ),
+            keepalive_expiry=self._setting(
+                self.keepalive_expiry, "http_keepalive_expiry", DEFAULT_KEEPALIVE_EXPIRY
+            ),
+        )
+        return factory(limits=limits)
+
+    def _close_all(self, clients):
+        for client in clients:
+            self._close(client)
+
+    @staticmethod
+    def _close(client):
+        try:
+            client.close()
+        except Exception:
+            pass
+
+    @staticmethod
+    def _report(hit):
+        try:
+            from janito.perf_singleton import performance_collector
+
+            performance_collector.record_cache_access("http_client", hit)
+        except Exception:
+            pass
+
+
+# Singleton instance shared by all OpenAI-compatible drivers
+client_pool = ClientPool()
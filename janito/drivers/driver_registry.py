@@ -1,22 +1,24 @@
 # janito/drivers/driver_registry.py
 """
 DriverRegistry: Maps driver string names to class objects for use by providers.
+
+Built-in drivers are imported on first lookup (see ``janito.providers.manifest``),
+so resolving a provider's metadata never pulls in the LLM SDKs.
 """
 
+from importlib import import_module
 from typing import Dict, Type
 
-# --- Import driver classes ---
-from janito.drivers.azure_openai.driver import AzureOpenAIModelDriver
-from janito.drivers.openai.driver import OpenAIModelDriver
+from janito.providers.manifest import DRIVER_MANIFEST
 
-_DRIVER_REGISTRY: Dict[str, Type] = {
-    "AzureOpenAIModelDriver": AzureOpenAIModelDriver,
-    "OpenAIModelDriver": OpenAIModelDriver,
-}
+_DRIVER_REGISTRY: Dict[str, Type] = {}
 
 
 def get_driver_class(name: str):
     """Get the driver class by string name."""
+    if name not in _DRIVER_REGISTRY and name in DRIVER_MANIFEST:
+        module_name, class_name = DRIVER_MANIFEST[name].split(":")
+        _DRIVER_REGISTRY[name] = getattr(import_module(module_name), class_name)
     try:
         return _DRIVER_REGISTRY[name]
     except KeyError:
@@ -0,0 +1,127 @@
+import asyncio
+import time
+import traceback
+
+from janito.llm.async_driver import AsyncLLMDriver
+from janito.llm.driver_input import DriverInput
+from janito.driver_events import ResponseDelta
+from janito.drivers.client_pool import client_pool
+from janito.drivers.openai.driver import OpenAIModelDriver
+from janito.drivers.openai.streaming import StreamAccumulator
+
+import openai
+
+
+class AsyncOpenAIModelDriver(AsyncLLMDriver, OpenAIModelDriver):
+    """
+    OpenAI-compatible driver built on ``openai.AsyncOpenAI``.
+
+    Request preparation, history conversion, usage extraction and error
+    classification are inherited from :class:`OpenAIModelDriver`; only the
+    network calls, streaming and rate-limit waits are awaited instead of blocking.
+    """
+
+    async def _call_api_async(self, driver_input: DriverInput):
+        """Await the chat completion endpoint with retry and error handling."""
+        cancel_event = getattr(driver_input, "cancel_event", None)
+        config = driver_input.config
+        conversation = self.convert_history_to_api_messages(
+            driver_input.conversation_history
+        )
+        request_id = getattr(config, "request_id", None)
+        self._print_api_call_start(config)
+        client = self._instantiate_async_openai_client(config)
+        api_kwargs = self._prepare_api_kwargs(config, conversation)
+        cache_key, cached = self._lookup_cached_response(config, api_kwargs)
+        if cached is not None:
+            self._emit_cached_response(cached, request_id)
+            return cached.result
+        started = time.monotonic()
+        max_retries = getattr(config, "max_retries", 3)
+        attempt = 1
+        while True:
+            try:
+                self._print_api_attempt(config, attempt, max_retries, api_kwargs)
+                if self._check_cancel(cancel_event, request_id, before_call=True):
+                    return None
+                result = await client.chat.completions.create(**api_kwargs)
+                if api_kwargs.get("stream"):
+                    result = await self._consume_stream_async(
+                        result, request_id, cancel_event
+                    )
+                    if result is None:
+                        return None
+                if self._check_cancel(cancel_event, request_id, before_call=False):
+                    return None
+                self._handle_api_success(config, result, request_id)
+                self._store_cached_response(
+                    cache_key, result, time.monotonic() - started
+                )
+                return result
+            except Exception as e:
+                retry_delay = self._prepare_rate_limit_retry(
+                    e, config, api_kwargs, attempt, max_retries, request_id
+                )
+                if not await self._wait_for_retry(
+                    retry_delay, cancel_event, request_id
+                ):
+                    raise
+                attempt += 1
+
+    async def _wait_for_retry(self, retry_delay, cancel_event, request_id):
+        start_wait = time.monotonic()
+        while time.monotonic() - start_wait < retry_delay:
+            if self._check_cancel(cancel_event, request_id, before_call=False):
+                return False
+            await asyncio.sleep(min(0.1, retry_delay))
+        return True
+
+    async def _consume_stream_async(self, stream, request_id, cancel_event):
+        """Emit a ResponseDelta per streamed chunk and return the assembled completion (None if cancelled)."""
+        accumulator = StreamAccumulator()
+        try:
+            async for chunk in stream:
+                if self._check_cancel(cancel_event, request_id, before_call=False):
+                    return None
+                text_delta, tool_call_deltas = accumulator.add_chunk(chunk)
+                if text_delta or tool_call_deltas:
+                    self.output_queue.put(
+                        ResponseDelta(
+                            driver_name=self.__class__.__name__,
+                            request_id=request_id,
+                            content=text_delta,
+                            tool_calls=tool_call_deltas or None,
+                        )
+                    )
+        finally:
+            close = getattr(stream, "close", None)
+            if callable(close):
+                try:
+                    await close()
+                except Exception:
+                    pass
+        return accumulator.to_completion()
+
+    def _instantiate_async_openai_client(self, config):
+        try:
+            if not config.api_key:
+                provider_name = getattr(self, "provider_name", "OpenAI-compatible")
+                raise ValueError(f"API key is required for provider '{provider_name}'")
+            client_kwargs = self._build_client_kwargs(config)
+            key = client_pool.make_key(
+                self.provider_name, client_kwargs.get("base_url"), config.api_key
+            )
+            return client_pool.get_async(
+                key,
+                lambda http_client: openai.AsyncOpenAI(
+                    **client_kwargs,
+                    **({"http_client": http_client} if http_client else {}),
+                ),
+            )
+        except Exception as e:
+            print(
+                f"[ERROR] Exception during AsyncOpenAI client instantiation: {e}",
+                flush=True,
+            )
+            print(traceback.format_exc(), flush=True)
+            raise
@@ -6,11 +6,19 @@ import math
 import time
 import os
 import logging
+import weakref
 from rich import pretty
 from janito.llm.driver import LLMDriver
 from janito.llm.driver_input import DriverInput
-from janito.driver_events import RequestFinished, RequestStatus, RateLimitRetry
+from janito.driver_events import (
+    RequestFinished,
+    RequestStatus,
+    RateLimitRetry,
+    ResponseDelta,
+)
 from janito.llm.message_parts import TextMessagePart, FunctionCallMessagePart
+from janito.drivers.client_pool import client_pool
+from janito.drivers.openai.streaming import StreamAccumulator
 
 import openai
 
@@ -28,6 +36,8 @@ class OpenAIModelDriver(LLMDriver):
 
     def __init__(self, tools_adapter=None, provider_name=None):
         super().__init__(tools_adapter=tools_adapter, provider_name=provider_name)
+        # history -> (generation, converted message count, API messages)
+        self._converted_history = weakref.WeakKeyDictionary()
 
     def _prepare_api_kwargs(self, config, conversation):
         """
@@ -35,21 +45,7 @@ class OpenAIModelDriver(LLMDriver):
         and OpenAI-specific arguments (model, max_tokens, temperature, etc.).
         """
         api_kwargs = {}
-        # Tool schemas (moved from base)
-        if self.tools_adapter:
-            try:
-                from janito.providers.openai.schema_generator import (
-                    generate_tool_schemas,
-                )
-
-                tool_classes = self.tools_adapter.get_tool_classes()
-                tool_schemas = generate_tool_schemas(tool_classes)
-                if tool_schemas:  # Only add tools if we have actual schemas
-                    api_kwargs["tools"] = tool_schemas
-            except Exception as e:
-                # Don't add empty tools array - some providers reject it
-                if hasattr(config, "verbose_api") and config.verbose_api:
-                    print(f"[OpenAIModelDriver] Tool schema generation failed: {e}")
+        self._apply_tool_schemas(config, api_kwargs)
         # OpenAI-specific parameters
         if config.model:
             api_kwargs["model"] = config.model
@@ -74,12 +70,36 @@ class OpenAIModelDriver(LLMDriver):
             if v is not None:
                 api_kwargs[p] = v
         api_kwargs["messages"] = conversation
-        api_kwargs["stream"] = False
+        self._apply_stream_options(config, api_kwargs)
         # Always return the prepared kwargs, even if no tools are registered. The
         # OpenAI Python SDK expects a **mapping** – passing *None* will raise
         # ``TypeError: argument after ** must be a mapping, not NoneType``.
         return api_kwargs
 
+    def _apply_tool_schemas(self, config, api_kwargs):
+        """Add the ``tools`` array, unless there are no tools or ``config.use_tools`` is False."""
+        if not self.tools_adapter or getattr(config, "use_tools", None) is False:
+            return
+        try:
+            from janito.providers.openai.schema_generator import generate_tool_schemas
+
+            tool_classes = self.tools_adapter.get_tool_classes()
+            tool_schemas = generate_tool_schemas(tool_classes)
+            if tool_schemas:  # Only add tools if we have actual schemas
+                api_kwargs["tools"] = tool_schemas
+        except Exception as e:
+            # Don't add empty tools array - some providers reject it
+            if hasattr(config, "verbose_api") and config.verbose_api:
+                print(f"[OpenAIModelDriver] Tool schema generation failed: {e}")
+
+    @staticmethod
+    def _apply_stream_options(config, api_kwargs):
+        """Set ``stream`` (and ``stream_options`` when streaming) from ``config``."""
+        api_kwargs["stream"] = bool(getattr(config, "stream", False))
+        if api_kwargs["stream"]:
+            # Ask for a final usage chunk so token accounting works when streaming
+            api_kwargs["stream_options"] = {"include_usage": True}
+
     def _call_api(self, driver_input: DriverInput):
         """Call the OpenAI-compatible chat completion endpoint with retry and error handling."""
         cancel_event = getattr(driver_input, "cancel_event", None)
@@ -90,7 +110,22 @@ class OpenAIModelDriver(LLMDriver):
         request_id = getattr(config, "request_id", None)
         self._print_api_call_start(config)
         client = self._instantiate_openai_client(config)
+        try:
+            return self._request_completion(
+                client, config, conversation, request_id, cancel_event
+            )
+        finally:
+            # The pooled client may be evicted or closed once no request uses it
+            client_pool.release(client)
+
+    def _request_completion(self, client, config, conversation, request_id, cancel_event):
+        """Send the request with retries (or serve it from the response cache)."""
         api_kwargs = self._prepare_api_kwargs(config, conversation)
+        cache_key, cached = self._lookup_cached_response(config, api_kwargs)
+        if cached is not None:
+            self._emit_cached_response(cached, request_id)
+            return cached.result
+        started = time.monotonic()
         max_retries = getattr(config, "max_retries", 3)
         attempt = 1
         while True:
@@ -98,10 +133,17 @@ class OpenAIModelDriver(LLMDriver):
                 self._print_api_attempt(config, attempt, max_retries, api_kwargs)
                 if self._check_cancel(cancel_event, request_id, before_call=True):
                     return None
-                result = client.chat.completions.create(**api_kwargs)
+                result = self._create_completion(
+                    client, api_kwargs, request_id, cancel_event
+                )
+                if result is None:
+                    return None
                 if self._check_cancel(cancel_event, request_id, before_call=False):
                     return None
                 self._handle_api_success(config, result, request_id)
+                self._store_cached_response(
+                    cache_key, result, time.monotonic() - started
+                )
                 return result
             except Exception as e:
                 if self._handle_api_exception(
@@ -111,6 +153,39 @@ class OpenAIModelDriver(LLMDriver):
                     continue
                 raise
 
+    def _create_completion(self, client, api_kwargs, request_id, cancel_event):
+        """Send one chat completion request; returns the (assembled) completion, or None if cancelled while streaming."""
+        result = client.chat.completions.create(**api_kwargs)
+        if api_kwargs.get("stream"):
+            return self._consume_stream(result, request_id, cancel_event)
+        return result
+
+    def _consume_stream(self, stream, request_id, cancel_event):
+        """Emit a ResponseDelta per streamed chunk and return the assembled completion (None if cancelled)."""
+        accumulator = StreamAccumulator()
+        try:
+            for chunk in stream:
+                if self._check_cancel(cancel_event, request_id, before_call=False):
+                    return None
+                text_delta, tool_call_deltas = accumulator.add_chunk(chunk)
+                if text_delta or tool_call_deltas:
+                    self.output_queue.put(
+                        ResponseDelta(
+                            driver_name=self.__class__.__name__,
+                            request_id=request_id,
+                            content=text_delta,
+                            tool_calls=tool_call_deltas or None,
+                        )
+                    )
+        finally:
+            close = getattr(stream, "close", None)
+            if callable(close):
+                try:
+                    close()
+                except Exception:
+                    pass
+        return accumulator.to_completion()
+
     def _print_api_call_start(self, config):
         if getattr(config, "verbose_api", False):
             tool_adapter_name = (
@@ -159,6 +234,25 @@ class OpenAIModelDriver(LLMDriver):
     def _handle_api_exception(
         self, e, config, api_kwargs, attempt, max_retries, request_id
     ):
+        retry_delay = self._prepare_rate_limit_retry(
+            e, config, api_kwargs, attempt, max_retries, request_id
+        )
+        start_wait = time.time()
+        while time.time() - start_wait < retry_delay:
+            if self._check_cancel(
+                getattr(config, "cancel_event", None), request_id, before_call=False
+            ):
+                return False
+            time.sleep(0.1)
+        return True
+
+    def _prepare_rate_limit_retry(
+        self, e, config, api_kwargs, attempt, max_retries, request_id
+    ):
+        """
+        Re-raise ``e`` unless it is a retryable rate-limit error; otherwise emit
+        RateLimitRetry and return the delay (seconds) to wait before retrying.
+        """
         status_code = getattr(e, "status_code", None)
         err_str = str(e)
         lower_err = err_str.lower()
@@ -191,14 +285,7 @@ class OpenAIModelDriver(LLMDriver):
                 f"[OpenAI][RateLimit] Attempt {attempt}/{max_retries} failed with rate-limit. Waiting {retry_delay}s before retry.",
                 flush=True,
             )
-        start_wait = time.time()
-        while time.time() - start_wait < retry_delay:
-            if self._check_cancel(
-                getattr(config, "cancel_event", None), request_id, before_call=False
-            ):
-                return False
-            time.sleep(0.1)
-        return True
+        return retry_delay
 
     def _extract_retry_delay_seconds(self, exception) -> float | None:
         """Extract the retry delay in seconds from the provider error response.
@@ -254,30 +341,19 @@ class OpenAIModelDriver(LLMDriver):
                 print(f"Or set the {provider_name.upper()}_API_KEY environment variable.")
                 raise ValueError(f"API key is required for provider '{provider_name}'")
 
-            api_key_display = str(config.api_key)
-            if api_key_display and len(api_key_display) > 8:
-                api_key_display = api_key_display[:4] + "..." + api_key_display[-4:]
-            client_kwargs = {"api_key": config.api_key}
-            if getattr(config, "base_url", None):
-                client_kwargs["base_url"] = config.base_url
-
-            # HTTP debug wrapper
-            if os.environ.get("OPENAI_DEBUG_HTTP", "0") == "1":
-                from http.client import HTTPConnection
-
-                HTTPConnection.debuglevel = 1
-                logging.basicConfig()
-                logging.getLogger().setLevel(logging.DEBUG)
-                requests_log = logging.getLogger("http.client")
-                requests_log.setLevel(logging.DEBUG)
-                requests_log.propagate = True
-                print(
-                    "[OpenAIModelDriver] HTTP debug enabled via OPENAI_DEBUG_HTTP=1",
-                    flush=True,
-                )
+            client_kwargs = self._build_client_kwargs(config)
 
-            client = openai.OpenAI(**client_kwargs)
-            return client
+            # Reuse a pooled client (and its keep-alive connections) across requests
+            key = client_pool.make_key(
+                self.provider_name, client_kwargs.get("base_url"), config.api_key
+            )
+            return client_pool.get(
+                key,
+                lambda http_client: openai.OpenAI(
+                    **client_kwargs,
+                    **({"http_client": http_client} if http_client else {}),
+                ),
+            )
         except Exception as e:
             print(
                 f"[ERROR] Exception during OpenAI client instantiation: {e}", flush=True
@@ -285,6 +361,28 @@ class OpenAIModelDriver(LLMDriver):
             print(traceback.format_exc(), flush=True)
             raise
 
+    def _build_client_kwargs(self, config):
+        """Return the SDK client constructor kwargs (api_key, base_url) for ``config``."""
+        client_kwargs = {"api_key": config.api_key}
+        if getattr(config, "base_url", None):
+            client_kwargs["base_url"] = config.base_url
+
+        # HTTP debug wrapper
+        if os.environ.get("OPENAI_DEBUG_HTTP", "0") == "1":
+            from http.client import HTTPConnection
+
+            HTTPConnection.debuglevel = 1
+            logging.basicConfig()
+            logging.getLogger().setLevel(logging.DEBUG)
+            requests_log = logging.getLogger("http.client")
+            requests_log.setLevel(logging.DEBUG)
+            requests_log.propagate = True
+            print(
+                "[OpenAIModelDriver] HTTP debug enabled via OPENAI_DEBUG_HTTP=1",
+                flush=True,
+            )
+        return client_kwargs
+
     def _check_cancel(self, cancel_event, request_id, before_call=True):
         if cancel_event is not None and cancel_event.is_set():
             status = RequestStatus.CANCELLED
@@ -372,12 +470,35 @@ class OpenAIModelDriver(LLMDriver):
         """
         Convert LLMConversationHistory to the list of dicts required by OpenAI's API.
         Handles 'tool_results' and 'tool_calls' roles for compliance.
+
+        Converted messages are cached per history object; as long as the
+        history's generation is unchanged only newly appended messages are
+        converted.
         """
-        api_messages = []
-        for msg in conversation_history.get_history():
+        generation = getattr(conversation_history, "generation", None)
+        if generation is None:
+            api_messages = []
+            for msg in conversation_history.get_history():
+                self._append_api_message(api_messages, msg)
+            self._replace_none_content(api_messages)
+            return api_messages
+        cache = self._converted_history
+        cached = cache.get(conversation_history)
+        if cached is None or cached[0] != generation:
+            converted_count, api_messages = 0, []
+        else:
+            _, converted_count, api_messages = cached
+        new_messages = conversation_history.get_messages_since(converted_count)
+        first_new = len(api_messages)
+        for msg in new_messages:
             self._append_api_message(api_messages, msg)
-        self._replace_none_content(api_messages)
-        return api_messages
+        self._replace_none_content(api_messages[first_new:])
+        cache[conversation_history] = (
+            generation,
+            converted_count + len(new_messages),
+            api_messages,
+        )
+        return list(api_messages)
 
     def _append_api_message(self, api_messages, msg):
         role = msg.get("role")
@@ -431,7 +552,8 @@ class OpenAIModelDriver(LLMDriver):
                 name = metadata.get("name", "") if isinstance(metadata, dict) else ""
             api_messages.append({"role": "tool", "content": content, "name": name})
         else:
-            api_messages.append(msg)
+            # Copy so that cached API messages never alias history entries
+            api_messages.append(dict(msg))
 
     def _replace_none_content(self, api_messages):
         for m in api_messages:
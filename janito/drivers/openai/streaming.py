@@ -0,0 +1,105 @@
+"""
+Helpers for consuming streamed (stream=True) OpenAI-compatible chat completions.
+"""
+
+import time
+from types import SimpleNamespace
+
+
+class StreamAccumulator:
+    """
+    Assembles streamed chat completion chunks into an object shaped like a
+    non-streamed completion (``result.choices[0].message``, ``result.usage``,
+    ``result.created``), so the rest of the driver pipeline is unchanged.
+
+    Tool call argument fragments are appended per tool call index as they
+    arrive; each tool call exposes ``.id`` and ``.function.name/.arguments``
+    like the SDK objects that ``FunctionCallMessagePart`` wraps.
+    """
+
+    def __init__(self):
+        self._content = []
+        self._tool_calls = {}  # index -> SimpleNamespace(id, type, function)
+        self._arguments = {}  # index -> list of argument fragments
+        self.id = None
+        self.model = None
+        self.created = None
+        self.usage = None
+        self.finish_reason = None
+
+    def add_chunk(self, chunk):
+        """
+        Merge one chunk. Returns (text_delta, tool_call_deltas) where
+        tool_call_deltas is a list of dicts with index, id, name and arguments keys.
+        """
+        self.id = self.id or getattr(chunk, "id", None)
+        self.model = self.model or getattr(chunk, "model", None)
+        self.created = self.created or getattr(chunk, "created", None)
+        usage = getattr(chunk, "usage", None)
+        if usage is not None:
+            self.usage = usage
+        text_delta = None
+        tool_call_deltas = []
+        for choice in getattr(chunk, "choices", None) or []:
+            if getattr(choice, "finish_reason", None):
+                self.finish_reason = choice.finish_reason
+            delta = getattr(choice, "delta", None)
+            if delta is None:
+                continue
+            content = getattr(delta, "content", None)
+            if content:
+                self._content.append(content)
+                text_delta = (text_delta or "") + content
+            for position, tc in enumerate(getattr(delta, "tool_calls", None) or []):
+                tool_call_deltas.append(self._add_tool_call_delta(position, tc))
+        return text_delta, tool_call_deltas
+
+    def _add_tool_call_delta(self, position, tc):
+        index = getattr(tc, "index", None)
+        if index is None:
+            index = position
+        call = self._tool_calls.get(index)
+        if call is None:
+            call = SimpleNamespace(
+                id="",
+                type="function",
+                function=SimpleNamespace(name="", arguments=""),
+            )
+            self._tool_calls[index] = call
+            self._arguments[index] = []
+        if getattr(tc, "id", None):
+            call.id = tc.id
+        function = getattr(tc, "function", None)
+        name = getattr(function, "name", None) if function else None
+        fragment = getattr(function, "arguments", None) if function else None
+        if name:
+            call.function.name += name
+        if fragment:
+            self._arguments[index].append(fragment)
+        return {"index": index, "id": call.id, "name": name, "arguments": fragment}
+
+    def get_text(self):
+        return "".join(self._content)
+
+    def to_completion(self):
+        """Return the assembled completion-shaped object."""
+        tool_calls = []
+        for index in sorted(self._tool_calls):
+            call = self._tool_calls[index]
+            call.function.arguments = "".join(self._arguments[index])
+            tool_calls.append(call)
+        message = SimpleNamespace(
+            role="assistant",
+            content=self.get_text() or None,
+            tool_calls=tool_calls or None,
+        )
+        choice = SimpleNamespace(
+            index=0, message=message, finish_reason=self.finish_reason
+        )
+        return SimpleNamespace(
+            id=self.id,
+            model=self.model,
+            created=self.created or int(time.time()),
+            choices=[choice],
+            usage=self.usage,
+        )
@@ -1,8 +1,64 @@
 from collections import defaultdict
-from datetime import datetime
 from bisect import insort
 import itertools
+import queue
 import threading
+import traceback
+
+_EMPTY = ((), ())
+
+
+class _AsyncDelivery:
+    """
+    Consumer thread for asynchronous subscribers.
+
+    Events are delivered in publish order, each to its callbacks in priority
+    order; the thread is started on first use.
+    """
+
+    def __init__(self):
+        self._queue = queue.SimpleQueue()
+        self._pending = 0
+        self._idle = threading.Condition()
+        self._thread = None
+        self._start_lock = threading.Lock()
+
+    def put(self, event, callbacks):
+        with self._idle:
+            self._pending += 1
+        if self._thread is None:
+            self._start()
+        self._queue.put((event, callbacks))
+
+    def _start(self):
+        with self._start_lock:
+            if self._thread is None:
+                thread = threading.Thread(
+                    target=self._run, name="janito-event-bus", daemon=True
+                )
+                thread.start()
+                self._thread = thread
+
+    def _run(self):
+        while True:
+            event, callbacks = self._queue.get()
+            for callback in callbacks:
+                try:
+                    callback(event)
+                except Exception:
+                    # Nobody is waiting on the result; report and keep delivering
+                    traceback.print_exc()
+            with self._idle:
+                self._pending -= 1
+                if not self._pending:
+                    self._idle.notify_all()
+
+    def flush(self, timeout=None):
+        """Wait until every queued event was delivered; returns False on timeout."""
+        if threading.current_thread() is self._thread:
+            return True  # Called from a subscriber: waiting would deadlock
+        with self._idle:
+            return self._idle.wait_for(lambda: not self._pending, timeout)
 
 
 class EventBus:
@@ -11,25 +67,38 @@ class EventBus:
     Automatically injects a timestamp (event.timestamp) into each event when published.
     Handlers with lower priority numbers are called first (default priority=100).
     Thread-safe for concurrent subscribe, unsubscribe, and publish operations.
+
+    The handlers for each concrete event class are resolved once (a handler
+    subscribed to a base class receives its subclasses) and kept in a dispatch
+    table that subscribe/unsubscribe replace, so publish is a lock-free lookup.
+    Handlers subscribed with ``asynchronous=True`` run on a dedicated consumer
+    thread instead of the publisher's; use :meth:`flush` to wait for them.
     """
 
     def __init__(self):
-        # _subscribers[event_type] = list of (priority, seq, callback)
+        # _subscribers[event_type] = list of (priority, seq, callback, asynchronous)
         self._subscribers = defaultdict(list)
         self._seq_counter = itertools.count()
         self._lock = threading.Lock()
+        # _dispatch[event class] = (sync callbacks, async callbacks)
+        self._dispatch = {}
+        self._async = _AsyncDelivery()
 
-    def subscribe(self, event_type, callback, priority=100):
-        """Subscribe a callback to a specific event type with a given priority (lower is higher priority)."""
+    def subscribe(self, event_type, callback, priority=100, asynchronous=False):
+        """
+        Subscribe a callback to a specific event type with a given priority (lower is higher priority).
+        With ``asynchronous=True`` the callback runs on the bus's consumer thread.
+        """
         with self._lock:
             seq = next(self._seq_counter)
-            entry = (priority, seq, callback)
+            entry = (priority, seq, callback, asynchronous)
             callbacks = self._subscribers[event_type]
             # Prevent duplicate subscriptions of the same callback with the same priority
             if not any(
-                cb == callback and prio == priority for prio, _, cb in callbacks
+                cb == callback and prio == priority for prio, _, cb, _ in callbacks
             ):
                 insort(callbacks, entry)
+                self._dispatch = {}
 
     def unsubscribe(self, event_type, callback):
         """Unsubscribe a callback from a specific event type (all priorities)."""
@@ -38,31 +107,49 @@ class EventBus:
             self._subscribers[event_type] = [
                 entry for entry in callbacks if entry[2] != callback
             ]
+            self._dispatch = {}
+
+    def _resolve(self, event_class):
+        """Build (and cache) the dispatch entry for ``event_class``."""
+        with self._lock:
+            matching = []
+            for event_type, callbacks in self._subscribers.items():
+                if callbacks and issubclass(event_class, event_type):
+                    matching.extend(callbacks)
+            matching.sort()
+            seen = set()
+            sync, deferred = [], []
+            for _, _, callback, asynchronous in matching:
+                # The same callback is called once per event
+                if callback in seen:
+                    continue
+                seen.add(callback)
+                (deferred if asynchronous else sync).append(callback)
+            handlers = (tuple(sync), tuple(deferred)) if matching else _EMPTY
+            self._dispatch[event_class] = handlers
+        return handlers
 
     def publish(self, event):
         """
         Publish an event to all relevant subscribers in strict priority order.
-        Thread-safe: handlers are called outside the lock to avoid deadlocks.
+        Synchronous handlers are called on the publishing thread, outside any lock.
         """
-        with self._lock:
-            # Collect all matching handlers (priority, seq, callback) for this event
-            matching_handlers = []
-            for event_type, callbacks in self._subscribers.items():
-                if isinstance(event, event_type):
-                    matching_handlers.extend(callbacks)
-            # Remove duplicates (same callback for same event)
-            seen = set()
-            unique_handlers = []
-            for prio, seq, cb in matching_handlers:
-                if cb not in seen:
-                    unique_handlers.append((prio, seq, cb))
-                    seen.add(cb)
-            # Sort by priority, then sequence
-            unique_handlers.sort()
-        # Call handlers outside the lock to avoid deadlocks
-        for priority, seq, callback in unique_handlers:
+        handlers = self._dispatch.get(event.__class__)
+        if handlers is None:
+            handlers = self._resolve(event.__class__)
+        sync, deferred = handlers
+        if deferred:
+            self._async.put(event, deferred)
+        for callback in sync:
             callback(event)
 
+    def flush(self, timeout=None):
+        """
+        Wait until asynchronous handlers have processed every published event.
+        Returns False if ``timeout`` (seconds) expired first.
+        """
+        return self._async.flush(timeout)
+
 
 # Singleton instance for global use
 event_bus = EventBus()
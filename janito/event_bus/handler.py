@@ -8,9 +8,10 @@ class EventHandlerBase:
     Automatically subscribes methods named on_<EventClassName> to the event bus for the corresponding event type.
     Pass one or more event modules (e.g., janito.report_events, janito.driver_events) to the constructor.
     Raises an error if a handler method does not match any known event class.
+    With asynchronous=True the handlers run on the event bus consumer thread (see EventBus.flush).
     """
 
-    def __init__(self, *event_modules):
+    def __init__(self, *event_modules, asynchronous=False):
         unknown_event_methods = []
         for name, method in inspect.getmembers(self, predicate=inspect.ismethod):
             if name.startswith("on_"):
@@ -21,7 +22,7 @@ class EventHandlerBase:
                     if event_class:
                         break
                 if event_class:
-                    event_bus.subscribe(event_class, method)
+                    event_bus.subscribe(event_class, method, asynchronous=asynchronous)
                 else:
                     unknown_event_methods.append(name)
         if unknown_event_methods:
@@ -1,21 +1,168 @@
+"""
+Hierarchical .gitignore matching.
+
+Rules are taken from every ``.gitignore`` between the ignore root (the
+enclosing git repository, or the directory of the nearest ``.gitignore``
+outside a repository) and the directory being inspected, plus the
+repository's ``.git/info/exclude``. As in git, patterns are relative to the
+directory of the file that defines them, deeper files take precedence over
+shallower ones, the last matching pattern of a file wins (so ``!negations``
+re-include paths) and nothing below an ignored directory can be re-included.
+
+Each ignore file is compiled once into a single regular expression and
+cached by (path, mtime, size), so repeated walks only pay for a ``stat``.
+Walkers use :meth:`GitignoreFilter.filter_ignored` (or
+:meth:`GitignoreFilter.matcher_for`), which compose the rules of a directory
+from its parent's as the walk descends; matching an entry is then one regex
+call per ignore file that applies, without ``abspath``/``relpath``.
+"""
+
 import os
+import re
+import threading
+
 import pathspec
 
+GITIGNORE = ".gitignore"
+# Compiled ignore files kept across walks
+MAX_CACHED_RULES = 4096
+
+_GROUP_RE = re.compile(r"\(\?P<[A-Za-z_]\w*>")
+
+
+class IgnoreRules:
+    """The compiled patterns of one ignore file."""
+
+    __slots__ = ("path", "regex", "includes")
+
+    def __init__(self, path, lines):
+        self.path = path
+        patterns = [
+            p
+            for p in pathspec.PathSpec.from_lines("gitwildmatch", lines).patterns
+            if p.include is not None and p.regex is not None
+        ]
+        # Later patterns win: try them first and report which one matched
+        alternatives = []
+        self.includes = {}
+        for index in range(len(patterns) - 1, -1, -1):
+            pattern = patterns[index]
+            name = f"p{index}"
+            body = _GROUP_RE.sub("(?:", pattern.regex.pattern)
+            alternatives.append(f"(?P<{name}>{body})")
+            self.includes[name] = pattern.include
+        self.regex = re.compile("|".join(alternatives)) if alternatives else None
+
+    def check(self, rel_path, is_dir):
+        """
+        Return True (ignored), False (re-included by a negation) or None (no
+        pattern matches) for ``rel_path``, relative to the file's directory.
+        """
+        if self.regex is None:
+            return None
+        match = self.regex.match(rel_path + "/" if is_dir else rel_path)
+        if match is None:
+            return None
+        return self.includes[match.lastgroup]
+
+
+_rules_cache = {}
+_rules_lock = threading.Lock()
+
+
+def load_rules(path):
+    """Return the IgnoreRules of the ignore file ``path`` (None if missing or empty)."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    stamp = (st.st_mtime_ns, st.st_size)
+    with _rules_lock:
+        cached = _rules_cache.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    try:
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            rules = IgnoreRules(path, f.read().splitlines())
+    except OSError:
+        return None
+    if rules.regex is None:
+        rules = None
+    with _rules_lock:
+        if len(_rules_cache) >= MAX_CACHED_RULES:
+            _rules_cache.pop(next(iter(_rules_cache)))
+        _rules_cache[path] = (stamp, rules)
+    return rules
+
+
+def clear_rules_cache():
+    with _rules_lock:
+        _rules_cache.clear()
+
+
+class DirectoryMatcher:
+    """
+    The ignore rules in effect for the entries of one directory.
+
+    ``layers`` holds (prefix, rules) pairs from the deepest ignore file to
+    the shallowest, where ``prefix`` is this directory relative to the
+    directory of the ignore file ("" or ending with "/").
+    """
+
+    __slots__ = ("path", "layers", "excluded")
+
+    def __init__(self, path, layers, excluded=False):
+        self.path = path
+        self.layers = layers
+        self.excluded = excluded
+
+    def is_ignored(self, name, is_dir=False):
+        """Return True if the entry ``name`` of this directory is ignored."""
+        if self.excluded:
+            return True
+        if is_dir and name == ".git":
+            return True
+        for prefix, rules in self.layers:
+            result = rules.check(prefix + name, is_dir)
+            if result is not None:
+                return result
+        return False
+
+    def child(self, name, names=None):
+        """
+        Return the matcher of the subdirectory ``name``. ``names`` (its
+        listing, when known) avoids a ``stat`` for directories without a
+        .gitignore.
+        """
+        path = os.path.join(self.path, name)
+        excluded = self.is_ignored(name, True)
+        rules = None
+        if not excluded and (names is None or GITIGNORE in names):
+            rules = load_rules(os.path.join(path, GITIGNORE))
+        layers = tuple((prefix + name + "/", r) for prefix, r in self.layers)
+        if rules is not None:
+            layers = ((("", rules),) + layers)
+        return DirectoryMatcher(path, layers, excluded)
+
 
 class GitignoreFilter:
     """
-    Utility class for loading, interpreting, and applying .gitignore patterns to file and directory paths.
+    Applies the .gitignore rules of a tree to file and directory paths.
 
     Methods
     -------
     __init__(self, gitignore_path: str = ".gitignore")
-        Loads and parses .gitignore patterns from the specified path or finds the nearest .gitignore if a directory is given.
+        Anchors the rules at the ignore root above the given directory (or the
+        directory of the given .gitignore file).
 
-    is_ignored(self, path: str) -> bool
-        Returns True if the given path matches any of the loaded .gitignore patterns.
+    is_ignored(self, path: str, is_dir: bool = None) -> bool
+        Returns True if the given path is ignored.
 
     filter_ignored(self, root: str, dirs: list, files: list) -> tuple[list, list]
         Filters out ignored directories and files from the provided lists, returning only those not ignored.
+
+    matcher_for(self, directory: str, names=None) -> DirectoryMatcher | None
+        Returns the composed rules for the entries of ``directory``.
     """
 
     @staticmethod
@@ -28,65 +175,95 @@ class GitignoreFilter:
         if os.path.isfile(current_dir):
             current_dir = os.path.dirname(current_dir)
         while True:
-            candidate = os.path.join(current_dir, ".gitignore")
+            candidate = os.path.join(current_dir, GITIGNORE)
             if os.path.isfile(candidate):
                 return candidate
             parent = os.path.dirname(current_dir)
             if parent == current_dir:
                 # Reached filesystem root, return default .gitignore path (may not exist)
-                return os.path.join(start_path, ".gitignore")
+                return os.path.join(start_path, GITIGNORE)
             current_dir = parent
 
+    @staticmethod
+    def find_ignore_root(start_path):
+        """
+        Return the directory the rules for ``start_path`` are anchored at: the
+        enclosing git work tree, else the directory of the nearest .gitignore,
+        else ``start_path`` itself.
+        """
+        start = os.path.abspath(start_path)
+        if os.path.isfile(start):
+            start = os.path.dirname(start)
+        current = start
+        while True:
+            if os.path.exists(os.path.join(current, ".git")):
+                return current
+            parent = os.path.dirname(current)
+            if parent == current:
+                break
+            current = parent
+        return os.path.dirname(
+            os.path.abspath(GitignoreFilter.find_nearest_gitignore(start))
+        )
+
     def __init__(self, gitignore_path: str = ".gitignore"):
-        # If a directory is passed, find the nearest .gitignore up the tree
-        if os.path.isdir(gitignore_path):
-            self.gitignore_path = self.find_nearest_gitignore(gitignore_path)
-        else:
-            self.gitignore_path = os.path.abspath(gitignore_path)
-        self.base_dir = os.path.dirname(self.gitignore_path)
-        lines = []
-        if not os.path.exists(self.gitignore_path):
-            self._spec = pathspec.PathSpec.from_lines("gitwildmatch", [])
-        else:
-            with open(
-                self.gitignore_path, "r", encoding="utf-8", errors="replace"
-            ) as f:
-                lines = f.readlines()
-            self._spec = pathspec.PathSpec.from_lines("gitwildmatch", lines)
-        # Collect directory patterns (ending with /)
-        self.dir_patterns = [
-            line.strip() for line in lines if line.strip().endswith("/")
-        ]
+        # A .gitignore file path (existing or not) stands for its directory
+        start = gitignore_path
+        if not os.path.isdir(start):
+            start = os.path.dirname(os.path.abspath(start))
+        self.base_dir = self.find_ignore_root(start)
+        self.gitignore_path = os.path.join(self.base_dir, GITIGNORE)
+        layers = []
+        exclude = load_rules(os.path.join(self.base_dir, ".git", "info", "exclude"))
+        if exclude is not None:
+            layers.append(("", exclude))
+        rules = load_rules(self.gitignore_path)
+        if rules is not None:
+            layers.insert(0, ("", rules))
+        self._prefix = self.base_dir.rstrip(os.sep) + os.sep
+        self._matchers = {self.base_dir: DirectoryMatcher(self.base_dir, tuple(layers))}
 
-    def is_ignored(self, path: str) -> bool:
-        """Return True if the given path is ignored by the loaded .gitignore patterns."""
+    def matcher_for(self, directory, names=None):
+        """
+        Return the DirectoryMatcher for the entries of ``directory``, or None
+        if it is outside the ignore root. Matchers are composed from the
+        parent directory's and memoized for the lifetime of the filter.
+        """
+        directory = os.path.abspath(directory)
+        matcher = self._matchers.get(directory)
+        if matcher is not None:
+            return matcher
+        if not directory.startswith(self._prefix):
+            return None
+        parent = self.matcher_for(os.path.dirname(directory))
+        matcher = parent.child(os.path.basename(directory), names)
+        self._matchers[directory] = matcher
+        return matcher
+
+    def is_ignored(self, path: str, is_dir: bool = None) -> bool:
+        """
+        Return True if ``path`` is ignored. ``is_dir`` defaults to checking
+        the filesystem (directory-only patterns such as ``build/`` need it).
+        """
         abs_path = os.path.abspath(path)
-        rel_path = os.path.relpath(abs_path, self.base_dir).replace(os.sep, "/")
-        return self._spec.match_file(rel_path)
+        matcher = self.matcher_for(os.path.dirname(abs_path))
+        name = os.path.basename(abs_path)
+        if matcher is None:
+            return name == ".git" or f"{os.sep}.git{os.sep}" in abs_path
+        if is_dir is None:
+            is_dir = os.path.isdir(abs_path)
+        return matcher.is_ignored(name, is_dir)
 
     def filter_ignored(self, root: str, dirs: list, files: list) -> tuple[list, list]:
         """
         Filter out ignored directories and files from the provided lists.
-        Always ignores the .git directory (like git does).
+        ``dirs`` is pruned in place (for ``os.walk``). Always ignores the .git
+        directory (like git does).
         """
-
-        def dir_is_ignored(d):
-            abs_path = os.path.abspath(os.path.join(root, d))
-            rel_path = os.path.relpath(abs_path, self.base_dir).replace(os.sep, "/")
-            if rel_path == ".git" or rel_path.startswith(".git/"):
-                return True
-            # Remove directory if it matches a directory pattern
-            for pat in self.dir_patterns:
-                pat_clean = pat.rstrip("/")
-                if rel_path == pat_clean or rel_path.startswith(pat_clean + "/"):
-                    return True
-            return self._spec.match_file(rel_path)
-
-        def file_is_ignored(f):
-            abs_path = os.path.abspath(os.path.join(root, f))
-            rel_path = os.path.relpath(abs_path, self.base_dir).replace(os.sep, "/")
-            return self._spec.match_file(rel_path)
-
-        dirs[:] = [d for d in dirs if not dir_is_ignored(d)]
-        files = [f for f in files if not file_is_ignored(f)]
+        matcher = self.matcher_for(root, files)
+        if matcher is None:
+            dirs[:] = [d for d in dirs if d != ".git"]
+            return dirs, files
+        dirs[:] = [d for d in dirs if not matcher.is_ignored(d, True)]
+        files = [f for f in files if not matcher.is_ignored(f, False)]
         return dirs, files
@@ -53,6 +53,7 @@ class LLMAgent:
         self._latest_event = None
         self.verbose_agent = verbose_agent
         self.driver = None  # Will be set by setup_agent if available
+        self.history_compactor = None  # Created on first use, see _maybe_compact_history
 
     def get_provider_name(self):
         # Try to get provider name from driver, fallback to llm_provider, else '?'
@@ -95,10 +96,10 @@ class LLMAgent:
             )
             template = env.get_template(Path(self.system_prompt_template).name)
             # Refresh allowed_permissions in context before rendering
-            from janito.tools.permissions import get_global_allowed_permissions
+            from janito.tools.tool_context import get_allowed_permissions
             from janito.tools.tool_base import ToolPermissions
 
-            perms = get_global_allowed_permissions()
+            perms = get_allowed_permissions()
             if isinstance(perms, ToolPermissions):
                 perm_str = ""
                 if perms.read:
@@ -129,9 +130,7 @@ class LLMAgent:
             not self.conversation_history._history
             or self.conversation_history._history[0]["role"] != "system"
         ):
-            self.conversation_history._history.insert(
-                0, {"role": "system", "content": self.system_prompt}
-            )
+            self.conversation_history.insert_system_message(self.system_prompt)
 
     def _validate_and_update_history(
         self,
@@ -220,6 +219,19 @@ class LLMAgent:
         except Empty:
             return None
 
+    def _execute_tool_calls(self, tool_calls):
+        if not tool_calls:
+            return []
+        execute_many = getattr(
+            self.tools_adapter, "execute_function_call_message_parts", None
+        )
+        if execute_many is not None:
+            return execute_many(tool_calls)
+        return [
+            self.tools_adapter.execute_function_call_message_part(part)
+            for part in tool_calls
+        ]
+
     def _handle_response_received(self, event) -> bool:
         """
         Handle a ResponseReceived event: execute tool calls if present, update history.
@@ -227,10 +239,15 @@ class LLMAgent:
         """
         if getattr(self, "verbose_agent", False):
             print("[agent] [INFO] Handling ResponseReceived event.")
+        tool_calls = self._collect_tool_calls(event)
+        # Independent calls run concurrently; results keep the call order
+        tool_results = self._execute_tool_calls(tool_calls)
+        return self._record_tool_calls(tool_calls, tool_results)
+
+    def _collect_tool_calls(self, event):
         from janito.llm.message_parts import FunctionCallMessagePart
 
         tool_calls = []
-        tool_results = []
         for part in event.parts:
             if isinstance(part, FunctionCallMessagePart):
                 if getattr(self, "verbose_agent", False):
@@ -238,59 +255,53 @@ class LLMAgent:
                         f"[agent] [DEBUG] Tool call detected: {getattr(part, 'name', repr(part))} with arguments: {getattr(part, 'arguments', None)}"
                     )
                 tool_calls.append(part)
-                result = self.tools_adapter.execute_function_call_message_part(part)
-                tool_results.append(result)
-        if tool_calls:
-            # Prepare tool_calls message for assistant
-            tool_calls_list = []
-            tool_results_list = []
-            for call, result in zip(tool_calls, tool_results):
-                function_name = (
-                    getattr(call, "name", None)
-                    or (
-                        getattr(call, "function", None)
-                        and getattr(call.function, "name", None)
-                    )
-                    or "function"
-                )
-                arguments = getattr(call, "function", None) and getattr(
-                    call.function, "arguments", None
-                )
-                tool_call_id = getattr(call, "tool_call_id", None)
-                tool_calls_list.append(
-                    {
-                        "id": tool_call_id,
-                        "type": "function",
-                        "function": {
-                            "name": function_name,
-                            "arguments": (
-                                arguments
-                                if isinstance(arguments, str)
-                                else str(arguments) if arguments else ""
-                            ),
-                        },
-                    }
+        return tool_calls
+
+    def _record_tool_calls(self, tool_calls, tool_results) -> bool:
+        """Add the tool_calls/tool_results messages to the history; returns True if there were any."""
+        if not tool_calls:
+            return False  # No tool calls, return event
+        # Prepare tool_calls message for assistant
+        tool_calls_list = []
+        tool_results_list = []
+        for call, result in zip(tool_calls, tool_results):
+            function_name = (
+                getattr(call, "name", None)
+                or (
+                    getattr(call, "function", None)
+                    and getattr(call.function, "name", None)
                 )
-                tool_results_list.append(
-                    {
+                or "function"
+            )
+            arguments = getattr(call, "function", None) and getattr(
+                call.function, "arguments", None
+            )
+            tool_call_id = getattr(call, "tool_call_id", None)
+            tool_calls_list.append(
+                {
+                    "id": tool_call_id,
+                    "type": "function",
+                    "function": {
                         "name": function_name,
-                        "content": str(result),
-                        "tool_call_id": tool_call_id,
-                    }
-                )
-            # Add assistant tool_calls message
-            import json
-
-            self.conversation_history.add_message(
-                "tool_calls", json.dumps(tool_calls_list)
+                        "arguments": (
+                            arguments
+                            if isinstance(arguments, str)
+                            else str(arguments) if arguments else ""
+                        ),
+                    },
+                }
             )
-            # Add tool_results message
-            self.conversation_history.add_message(
-                "tool_results", json.dumps(tool_results_list)
+            tool_results_list.append(
+                {
+                    "name": function_name,
+                    "content": str(result),
+                    "tool_call_id": tool_call_id,
+                }
             )
-            return True  # Continue the loop
-        else:
-            return False  # No tool calls, return event
+        # Tool calls/results are stored as structured lists, not JSON strings
+        self.conversation_history.add_message("tool_calls", tool_calls_list)
+        self.conversation_history.add_message("tool_results", tool_results_list)
+        return True  # Continue the loop
 
     def chat(
         self,
@@ -310,6 +321,7 @@ class LLMAgent:
         cancel_event = threading.Event()
         while True:
             self._print_verbose_chat_loop(loop_count)
+            self._maybe_compact_history(config)
             driver_input = self._prepare_driver_input(config, cancel_event=cancel_event)
             self.input_queue.put(driver_input)
             try:
@@ -325,6 +337,60 @@ class LLMAgent:
                 return result
             loop_count += 1
 
+    def _maybe_compact_history(self, config):
+        """Compact the conversation history when it nears the model's context window."""
+        from janito.llm.compaction import HistoryCompactor, get_context_limit
+
+        model_name = getattr(config, "model", None) or self.get_model_name()
+        limit = get_context_limit(self.llm_provider, model_name)
+        if not limit:
+            return False
+        if self.history_compactor is None:
+            self.history_compactor = HistoryCompactor.from_config(
+                summarize=lambda text: self._summarize_for_compaction(text, config)
+            )
+        compacted = self.history_compactor.maybe_compact(
+            self.conversation_history, limit
+        )
+        if compacted and getattr(self, "verbose_agent", False):
+            print(
+                f"[agent] [INFO] Compacted conversation history: {self.history_compactor.stats()}"
+            )
+        return compacted
+
+    def _summarize_for_compaction(self, transcript, config, driver=None):
+        """
+        Ask the model for a summary of old turns (runs synchronously while the
+        driver is idle). The request carries no tool schemas and bypasses the
+        response cache.
+        """
+        import copy
+
+        driver = driver or self.driver
+        if driver is None or not hasattr(driver, "_call_api"):
+            return None
+        config = copy.copy(config)
+        config.stream = False
+        config.use_tools = False
+        config.use_response_cache = False
+        history = LLMConversationHistory()
+        history.add_message(
+            "system",
+            "Summarize the following conversation transcript for your own future reference. "
+            "Keep file paths, decisions, open tasks and key tool results; be concise. "
+            "Do not call any tools.",
+        )
+        history.add_message("user", transcript)
+        try:
+            result = driver._call_api(
+                DriverInput(config=config, conversation_history=history)
+            )
+        finally:
+            # Do not let the summary request's events reach the chat loop
+            driver.clear_output_queue()
+        message = driver._get_message_from_result(result) if result else None
+        return getattr(message, "content", None)
+
     def _clear_driver_queues(self):
         if hasattr(self, "driver") and self.driver:
             if hasattr(self.driver, "clear_output_queue"):
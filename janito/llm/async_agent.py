@@ -0,0 +1,144 @@
+import asyncio
+import threading
+from typing import Optional, List
+
+from janito.llm.agent import LLMAgent
+from janito.driver_events import RequestFinished, RequestStatus, ResponseReceived
+from janito.event_bus.bus import event_bus
+
+# RequestFinished statuses that end the chat loop (same as LLMAgent._poll_for_event)
+TERMINAL_STATUSES = (
+    RequestStatus.ERROR,
+    RequestStatus.EMPTY_RESPONSE,
+    RequestStatus.TIMEOUT,
+)
+
+
+class AsyncLLMAgent(LLMAgent):
+    """
+    Asyncio agent driven by an :class:`~janito.llm.async_driver.AsyncLLMDriver`.
+
+    ``await agent.chat(prompt)`` runs the same loop as :meth:`LLMAgent.chat`
+    (request, tool execution, follow-up request) without a driver thread or
+    queue polling, and ``async for event in agent.events(prompt)`` exposes every
+    driver event as it is produced. Tool calls run via
+    ``execute_function_call_message_parts_async`` so the event loop stays free.
+    System prompt, history and compaction handling are inherited from LLMAgent.
+    """
+
+    def __init__(self, llm_provider, tools_adapter, driver=None, **kwargs):
+        super().__init__(llm_provider, tools_adapter, **kwargs)
+        self.driver = driver
+        self.publish_events = True
+
+    @classmethod
+    def from_agent(cls, agent: LLMAgent, driver=None):
+        """Create an async agent with the provider, tools, prompt and history of ``agent``."""
+        if driver is None:
+            driver = agent.llm_provider.create_async_driver()
+            if agent.tools_adapter is None:
+                driver.tools_adapter = None
+            driver.start()
+        async_agent = cls(
+            agent.llm_provider,
+            agent.tools_adapter,
+            driver=driver,
+            agent_name=agent.agent_name,
+            system_prompt=agent.system_prompt,
+            temperature=agent.temperature,
+            conversation_history=agent.conversation_history,
+            verbose_agent=agent.verbose_agent,
+        )
+        for attr_name in (
+            "_template_vars",
+            "_original_template_vars",
+            "system_prompt_template",
+        ):
+            if hasattr(agent, attr_name):
+                setattr(async_agent, attr_name, getattr(agent, attr_name))
+        return async_agent
+
+    async def events(
+        self,
+        prompt: str = None,
+        messages: Optional[List[dict]] = None,
+        role: str = "user",
+        config=None,
+        cancel_event: threading.Event = None,
+    ):
+        """Run a chat turn (including tool round trips), yielding every driver event."""
+        self._validate_and_update_history(prompt, messages, role)
+        self._ensure_system_prompt()
+        if config is None:
+            config = self.llm_provider.driver_config
+        cancel_event = cancel_event or threading.Event()
+        try:
+            while True:
+                await asyncio.to_thread(self._maybe_compact_history, config)
+                driver_input = self._prepare_driver_input(
+                    config, cancel_event=cancel_event
+                )
+                final_event = None
+                async for event in self.driver.events(driver_input):
+                    if self.publish_events:
+                        event_bus.publish(event)
+                    yield event
+                    if self._is_final_event(event):
+                        final_event = event
+                if not isinstance(final_event, ResponseReceived):
+                    return
+                tool_calls = self._collect_tool_calls(final_event)
+                if not tool_calls:
+                    return
+                tool_results = await self._execute_tool_calls_async(tool_calls)
+                self._record_tool_calls(tool_calls, tool_results)
+        except asyncio.CancelledError:
+            cancel_event.set()
+            raise
+
+    async def chat(
+        self,
+        prompt: str = None,
+        messages: Optional[List[dict]] = None,
+        role: str = "user",
+        config=None,
+    ):
+        """
+        Async counterpart of LLMAgent.chat: returns the final ResponseReceived
+        event, the RequestFinished event that ended the turn, or None.
+        """
+        result = None
+        async for event in self.events(prompt, messages, role, config):
+            if self._is_final_event(event):
+                result = event
+        return result
+
+    async def _execute_tool_calls_async(self, tool_calls):
+        execute_async = getattr(
+            self.tools_adapter, "execute_function_call_message_parts_async", None
+        )
+        if execute_async is not None:
+            return await execute_async(tool_calls)
+        return await asyncio.to_thread(self._execute_tool_calls, tool_calls)
+
+    def _summarize_for_compaction(self, transcript, config, driver=None):
+        # Compaction runs in a worker thread: use a private threaded driver so
+        # the summary request never touches this agent's event queue.
+        from janito.drivers.openai.driver import OpenAIModelDriver
+
+        summarizer = OpenAIModelDriver(
+            provider_name=getattr(self.driver, "provider_name", None)
+        )
+        return super()._summarize_for_compaction(transcript, config, driver=summarizer)
+
+    def _clear_driver_queues(self):
+        if self.driver is not None:
+            self.driver.clear_output_queue()
+
+    @staticmethod
+    def _is_final_event(event):
+        if isinstance(event, ResponseReceived):
+            return True
+        return isinstance(event, RequestFinished) and (
+            getattr(event, "status", None) in TERMINAL_STATUSES
+        )
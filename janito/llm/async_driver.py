@@ -0,0 +1,118 @@
+import asyncio
+import queue
+from abc import abstractmethod
+
+from janito.llm.driver import LLMDriver
+from janito.llm.driver_input import DriverInput
+
+
+class AsyncEventQueue:
+    """
+    Event queue used by async drivers in place of ``queue.Queue``.
+
+    It exposes the ``put()``/``get_nowait()`` interface the shared driver helpers
+    use, backed by an ``asyncio.Queue`` bound to the running event loop.
+    ``put()`` may also be called from worker threads; items are then handed
+    over to the loop with ``call_soon_threadsafe``.
+    """
+
+    def __init__(self):
+        self._loop = None
+        self._queue = None
+
+    def _bind(self, loop):
+        if self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.Queue()
+
+    def put(self, item):
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is not None:
+            self._bind(running)
+            self._queue.put_nowait(item)
+        elif self._loop is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._queue.put_nowait, item)
+
+    async def get(self):
+        self._bind(asyncio.get_running_loop())
+        return await self._queue.get()
+
+    def get_nowait(self):
+        if self._queue is None:
+            raise queue.Empty
+        try:
+            return self._queue.get_nowait()
+        except asyncio.QueueEmpty:
+            raise queue.Empty
+
+
+class AsyncLLMDriver(LLMDriver):
+    """
+    Asyncio counterpart of :class:`LLMDriver`.
+
+    No background thread or input queue is used: callers ``await
+    process_driver_input_async(driver_input)`` or iterate ``events(driver_input)``
+    to receive the same driver events the threaded driver puts on its output
+    queue. The request lifecycle (RequestStarted, cancellation, ResponseReceived,
+    errors) is shared with the threaded driver.
+
+    Subclasses must implement ``_call_api_async`` in addition to the
+    conversion methods required by :class:`LLMDriver`.
+    """
+
+    def __init__(self, tools_adapter=None, provider_name=None):
+        super().__init__(tools_adapter=tools_adapter, provider_name=provider_name)
+        self.input_queue = None
+        self.output_queue = AsyncEventQueue()
+
+    def start(self):
+        """Validate tool schemas; there is no worker thread to start."""
+        self.validate_tool_schemas()
+
+    def clear_input_queue(self):
+        pass
+
+    async def process_driver_input_async(self, driver_input: DriverInput):
+        if not self._begin_request(driver_input):
+            return
+        try:
+            result = await self._call_api_async(driver_input)
+            self._complete_request(driver_input, result)
+        except Exception as ex:
+            self._fail_request(driver_input, ex)
+
+    async def events(self, driver_input: DriverInput):
+        """
+        Process ``driver_input`` and yield its driver events as they are emitted.
+        Iteration ends once the request has completed and all events were yielded.
+        """
+        task = asyncio.ensure_future(self.process_driver_input_async(driver_input))
+        try:
+            while True:
+                getter = asyncio.ensure_future(self.output_queue.get())
+                done, _ = await asyncio.wait(
+                    {getter, task}, return_when=asyncio.FIRST_COMPLETED
+                )
+                if getter in done:
+                    yield getter.result()
+                    continue
+                getter.cancel()
+                while True:
+                    try:
+                        yield self.output_queue.get_nowait()
+                    except queue.Empty:
+                        break
+                task.result()
+                return
+        finally:
+            if not task.done():
+                task.cancel()
+
+    @abstractmethod
+    async def _call_api_async(self, driver_input: DriverInput):
+        """Subclasses implement: await the provider API and return the result object."""
+        pass
+
@@ -0,0 +1,349 @@
+"""
+Context-window-aware compaction of LLMConversationHistory.
+
+``HistoryCompactor`` estimates the token size of the conversation before each
+request. Once it exceeds ``threshold`` (a fraction of the model's input
+limit from ``LLMModelInfo.max_input``/``context``), the configured strategies
+run in order until the estimate is back under the target:
+
+- ``drop_file_dumps``: replace old ``view_file``/``read_files`` results with a stub
+- ``truncate_tool_results``: keep only the head and tail of old, large tool results
+- ``summarize_turns``: replace the oldest turns with an LLM-written summary
+
+Strategies never touch the most recent ``keep_recent`` messages, and they keep
+``tool_calls``/``tool_results`` pairs intact so the API message sequence stays valid.
+"""
+
+import json
+import threading
+
+# Rough average for English text and code; good enough for budgeting
+CHARS_PER_TOKEN = 4
+# Per-message overhead (role, separators) added by chat templates
+MESSAGE_OVERHEAD_TOKENS = 4
+
+DEFAULT_THRESHOLD = 0.8
+DEFAULT_TARGET = 0.5
+DEFAULT_KEEP_RECENT = 6
+DEFAULT_STRATEGIES = ("drop_file_dumps", "truncate_tool_results", "summarize_turns")
+
+FILE_DUMP_TOOLS = ("view_file", "read_files")
+SUMMARY_PREFIX = "[Summary of earlier conversation]\n"
+
+
+def estimate_text_tokens(text):
+    if not text:
+        return 0
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def estimate_message_tokens(message):
+    """Estimate the tokens a history message will occupy in the request."""
+    content = message.get("content")
+    if content is None:
+        text = ""
+    elif isinstance(content, str):
+        text = content
+    else:
+        text = json.dumps(content, ensure_ascii=False)
+    return estimate_text_tokens(text) + MESSAGE_OVERHEAD_TOKENS
+
+
+class CompactionStrategy:
+    """Base class: ``apply`` returns a new message list (or the same one if nothing changed)."""
+
+    name = None
+
+    def apply(self, messages, compactor, target_tokens):
+        raise NotImplementedError()
+
+
+class DropFileDumpsStrategy(CompactionStrategy):
+    """Replace old file dumps (view_file/read_files results) with a short stub."""
+
+    name = "drop_file_dumps"
+
+    def __init__(self, tools=FILE_DUMP_TOOLS, min_chars=2000):
+        self.tools = tuple(tools)
+        self.min_chars = min_chars
+
+    def apply(self, messages, compactor, target_tokens):
+        return _rewrite_tool_results(
+            messages, compactor, target_tokens, self._rewrite_result
+        )
+
+    def _rewrite_result(self, result):
+        content = result.get("content")
+        if result.get("name") not in self.tools or not isinstance(content, str):
+            return None
+        if len(content) < self.min_chars:
+            return None
+        return (
+            f"[{result.get('name')} output removed by context compaction: "
+            f"{len(content)} characters; read the file again if needed]"
+        )
+
+
+class TruncateToolResultsStrategy(CompactionStrategy):
+    """Keep only the head and tail of old tool results larger than ``max_chars``."""
+
+    name = "truncate_tool_results"
+
+    def __init__(self, max_chars=1000):
+        self.max_chars = max_chars
+
+    def apply(self, messages, compactor, target_tokens):
+        return _rewrite_tool_results(
+            messages, compactor, target_tokens, self._rewrite_result
+        )
+
+    def _rewrite_result(self, result):
+        content = result.get("content")
+        if not isinstance(content, str) or len(content) <= self.max_chars:
+            return None
+        half = self.max_chars // 2
+        omitted = len(content) - 2 * half
+        return (
+            content[:half]
+            + f"\n... [{omitted} characters truncated by context compaction] ...\n"
+            + content[-half:]
+        )
+
+
+class SummarizeTurnsStrategy(CompactionStrategy):
+    """
+    Replace the oldest turns with a summary produced by ``summarize(text) -> str``.
+
+    The cut point is always placed before a ``user`` message so that no
+    tool call is separated from its result.
+    """
+
+    name = "summarize_turns"
+
+    def __init__(self, max_input_chars=60000):
+        self.max_input_chars = max_input_chars
+
+    def apply(self, messages, compactor, target_tokens):
+        summarize = compactor.summarize
+        if summarize is None:
+            return messages
+        start = 1 if messages and messages[0].get("role") == "system" else 0
+        protected = max(start, len(messages) - compactor.keep_recent)
+        cut = None
+        for index in range(protected, start, -1):
+            if messages[index].get("role") == "user":
+                cut = index
+                break
+        if cut is None or cut <= start:
+            return messages
+        transcript = _format_transcript(messages[start:cut])
+        if len(transcript) > self.max_input_chars:
+            transcript = transcript[-self.max_input_chars :]
+        try:
+            summary = summarize(transcript)
+        except Exception:
+            return messages
+        if not summary:
+            return messages
+        summary_message = {"role": "system", "content": SUMMARY_PREFIX + summary}
+        return messages[:start] + [summary_message] + messages[cut:]
+
+
+STRATEGIES = {
+    cls.name: cls
+    for cls in (DropFileDumpsStrategy, TruncateToolResultsStrategy, SummarizeTurnsStrategy)
+}
+
+
+class HistoryCompactor:
+    """
+    Checks a conversation history against a token budget and compacts it in place.
+
+    ``summarize`` is an optional callable used by the summarize_turns strategy;
+    without it that strategy is a no-op. Statistics are available via ``stats()``.
+    """
+
+    def __init__(
+        self,
+        threshold=DEFAULT_THRESHOLD,
+        target=DEFAULT_TARGET,
+        keep_recent=DEFAULT_KEEP_RECENT,
+        strategies=None,
+        summarize=None,
+    ):
+        self.threshold = threshold
+        self.target = target
+        self.keep_recent = keep_recent
+        self.strategies = [
+            STRATEGIES[s]() if isinstance(s, str) else s
+            for s in (strategies or DEFAULT_STRATEGIES)
+        ]
+        self.summarize = summarize
+        self._token_cache = {}  # id(message) -> (message, tokens)
+        self._lock = threading.Lock()
+        self.runs = 0
+        self.tokens_saved = 0
+        self.last_estimate = None
+        self.last_limit = None
+        self.strategy_counts = {}
+
+    @classmethod
+    def from_config(cls, summarize=None):
+        """Build a compactor from the compaction_* config keys."""
+        from janito.config import config
+
+        strategies = config.get("compaction_strategies")
+        if isinstance(strategies, str):
+            strategies = [s.strip() for s in strategies.split(",") if s.strip()]
+        strategies = [s for s in (strategies or DEFAULT_STRATEGIES) if s in STRATEGIES]
+        return cls(
+            threshold=_float_setting(config.get("compaction_threshold"), DEFAULT_THRESHOLD),
+            target=_float_setting(config.get("compaction_target"), DEFAULT_TARGET),
+            keep_recent=int(
+                _float_setting(config.get("compaction_keep_recent"), DEFAULT_KEEP_RECENT)
+            ),
+            strategies=strategies,
+            summarize=summarize,
+        )
+
+    def estimate_tokens(self, messages):
+        total = 0
+        cache = self._token_cache
+        for message in messages:
+            cached = cache.get(id(message))
+            if cached is None or cached[0] is not message:
+                cached = (message, estimate_message_tokens(message))
+                cache[id(message)] = cached
+            total += cached[1]
+        return total
+
+    def maybe_compact(self, history, limit):
+        """
+        Compact ``history`` if its estimated size exceeds ``threshold * limit``.
+        Returns True when the history was rewritten.
+        """
+        if not limit or self.threshold <= 0:
+            return False
+        with self._lock:
+            messages = history.get_history()
+            before = self.estimate_tokens(messages)
+            self.last_estimate, self.last_limit = before, limit
+            if before < self.threshold * limit:
+                return False
+            target_tokens = int(min(self.target, self.threshold) * limit)
+            compacted = messages
+            for strategy in self.strategies:
+                result = strategy.apply(compacted, self, target_tokens)
+                if result is not compacted:
+                    self.strategy_counts[strategy.name] = (
+                        self.strategy_counts.get(strategy.name, 0) + 1
+                    )
+                    compacted = result
+                if self.estimate_tokens(compacted) <= target_tokens:
+                    break
+            if compacted is messages:
+                return False
+            history.replace_messages(compacted)
+            after = self.estimate_tokens(compacted)
+            self._token_cache = {
+                id(m): (m, self._token_cache[id(m)][1]) for m in compacted
+            }
+            self.runs += 1
+            self.tokens_saved += max(0, before - after)
+            self.last_estimate = after
+            return True
+
+    def stats(self):
+        return {
+            "runs": self.runs,
+            "tokens_saved": self.tokens_saved,
+            "last_estimate": self.last_estimate,
+            "limit": self.last_limit,
+            "strategies": dict(self.strategy_counts),
+        }
+
+
+def get_context_limit(provider, model_name):
+    """Return the input token limit for a model from its LLMModelInfo, or None if unknown."""
+    try:
+        info = provider.get_model_info(model_name)
+    except Exception:
+        return None
+    if not isinstance(info, dict):
+        return None
+    for key in ("max_input", "context"):
+        value = info.get(key)
+        if isinstance(value, (int, float)) and value > 0:
+            return int(value)
+    return None
+
+
+def _float_setting(value, default):
+    try:
+        return float(value) if value is not None else default
+    except (TypeError, ValueError):
+        return default
+
+
+def _rewrite_tool_results(messages, compactor, target_tokens, rewrite_result):
+    """Apply ``rewrite_result`` to old tool results, oldest first, until under target."""
+    protected = max(0, len(messages) - compactor.keep_recent)
+    compacted = list(messages)
+    changed = False
+    total = compactor.estimate_tokens(compacted)
+    for index in range(protected):
+        if total <= target_tokens:
+            break
+        message = compacted[index]
+        if message.get("role") != "tool_results":
+            continue
+        results = _load_results(message.get("content"))
+        if results is None:
+            continue
+        new_results = []
+        modified = False
+        for result in results:
+            replacement = rewrite_result(result) if isinstance(result, dict) else None
+            if replacement is None:
+                new_results.append(result)
+            else:
+                new_results.append(dict(result, content=replacement))
+                modified = True
+        if not modified:
+            continue
+        new_message = dict(message, content=new_results)
+        total += compactor.estimate_tokens([new_message]) - compactor.estimate_tokens(
+            [message]
+        )
+        compacted[index] = new_message
+        changed = True
+    return compacted if changed else messages
+
+
+def _load_results(content):
+    if isinstance(content, str):
+        try:
+            content = json.loads(content)
+        except Exception:
+            return None
+    return content if isinstance(content, list) else None
+
+
+def _format_transcript(messages):
+    lines = []
+    for message in messages:
+        role = message.get("role")
+        content = message.get("content")
+        if role == "tool_calls":
+            for call in _load_results(content) or []:
+                function = call.get("function", {}) if isinstance(call, dict) else {}
+                lines.append(
+                    f"assistant called {function.get('name')}({function.get('arguments')})"
+                )
+        elif role == "tool_results":
+            for result in _load_results(content) or []:
+                if isinstance(result, dict):
+                    lines.append(f"tool {result.get('name')} returned: {result.get('content')}")
+        elif content:
+            lines.append(f"{role}: {content}")
+    return "\n".join(lines)
@@ -53,16 +53,19 @@ class LLMDriver(ABC):
     def start(self):
         """Validate tool schemas (if any) and launch the driver's background thread to process DriverInput objects."""
         # Validate all tool schemas before starting the thread
-        if self.tools_adapter is not None:
-            from janito.tools.tools_schema import ToolSchemaBase
-
-            validator = ToolSchemaBase()
-            for tool in self.tools_adapter.get_tools():
-                # Validate the tool's class (not instance)
-                validator.validate_tool_class(tool.__class__)
+        self.validate_tool_schemas()
         self._thread = threading.Thread(target=self._run, daemon=True)
         self._thread.start()
 
+    def validate_tool_schemas(self):
+        """Validate the tool schemas; they are memoized so the first request does not rebuild them."""
+        if self.tools_adapter is not None:
+            from janito.providers.openai.schema_generator import (
+                generate_tool_schemas,
+            )
+
+            generate_tool_schemas(self.tools_adapter.get_tool_classes())
+
     def _run(self):
         while True:
             driver_input = self.input_queue.get()
@@ -125,12 +128,25 @@ class LLMDriver(ABC):
             )
 
     def process_driver_input(self, driver_input: DriverInput):
+        if not self._begin_request(driver_input):
+            return
+        try:
+            result = self._call_api(driver_input)
+            self._complete_request(driver_input, result)
+        except Exception as ex:
+            self._fail_request(driver_input, ex)
 
+    def _begin_request(self, driver_input: DriverInput) -> bool:
+        """
+        Emit RequestStarted for ``driver_input``. Returns False (after emitting the
+        matching RequestFinished) when the request must not be sent.
+        Shared by the threaded and the asyncio drivers.
+        """
         config = driver_input.config
         request_id = getattr(config, "request_id", None)
         if not self.available:
             self.handle_driver_unavailable(request_id)
-            return
+            return False
         # Prepare payload for RequestStarted event
         payload = {"provider_name": self.provider_name}
         if hasattr(config, "model") and getattr(config, "model", None):
@@ -145,11 +161,7 @@ class LLMDriver(ABC):
             )
         )
         # Check for cancel_event before starting
-        if (
-            hasattr(driver_input, "cancel_event")
-            and driver_input.cancel_event is not None
-            and driver_input.cancel_event.is_set()
-        ):
+        if self._is_cancelled(driver_input):
             self.output_queue.put(
                 RequestFinished(
                     driver_name=self.__class__.__name__,
@@ -158,15 +170,15 @@ class LLMDriver(ABC):
                     reason="Canceled before start",
                 )
             )
-            return
-        try:
-            result = self._call_api(driver_input)
-            # If result is None and cancel_event is set, treat as cancelled
-            if (
-                hasattr(driver_input, "cancel_event")
-                and driver_input.cancel_event is not None
-                and driver_input.cancel_event.is_set()
-            ):
+            return False
+        return True
+
+    def _complete_request(self, driver_input: DriverInput, result):
+        """Emit ResponseReceived for an API result (or the cancellation outcome)."""
+        request_id = getattr(driver_input.config, "request_id", None)
+        if self._is_cancelled(driver_input):
+            # A None result means the driver already reported the cancellation
+            if result is not None:
                 self.output_queue.put(
                     RequestFinished(
                         driver_name=self.__class__.__name__,
@@ -175,52 +187,85 @@ class LLMDriver(ABC):
                         reason="Cancelled during processing (post-API)",
                     )
                 )
-                return
-            if (
-                result is None
-                and hasattr(driver_input, "cancel_event")
-                and driver_input.cancel_event is not None
-                and driver_input.cancel_event.is_set()
-            ):
-                # Already handled by driver
-                return
-            # Check for cancel_event after API call (subclasses should also check during long calls)
-            if (
-                hasattr(driver_input, "cancel_event")
-                and driver_input.cancel_event is not None
-                and driver_input.cancel_event.is_set()
-            ):
-                self.output_queue.put(
-                    RequestFinished(
-                        driver_name=self.__class__.__name__,
-                        request_id=request_id,
-                        status=RequestStatus.CANCELLED,
-                        reason="Canceled during processing",
-                    )
-                )
-                return
-            message = self._get_message_from_result(result)
-            parts = (
-                self._convert_completion_message_to_parts(message) if message else []
-            )
-            timestamp = getattr(result, "created", None)
-            metadata = {"usage": getattr(result, "usage", None), "raw_response": result}
-            self.emit_response_received(
-                self.__class__.__name__, request_id, result, parts, timestamp, metadata
+            return
+        message = self._get_message_from_result(result)
+        parts = self._convert_completion_message_to_parts(message) if message else []
+        timestamp = getattr(result, "created", None)
+        metadata = {"usage": getattr(result, "usage", None), "raw_response": result}
+        self.emit_response_received(
+            self.__class__.__name__, request_id, result, parts, timestamp, metadata
+        )
+
+    def _fail_request(self, driver_input: DriverInput, ex: Exception):
+        import traceback
+
+        self.output_queue.put(
+            RequestFinished(
+                driver_name=self.__class__.__name__,
+                request_id=getattr(driver_input.config, "request_id", None),
+                status=RequestStatus.ERROR,
+                error=str(ex),
+                exception=ex,
+                traceback=traceback.format_exc(),
             )
-        except Exception as ex:
-            import traceback
+        )
 
-            self.output_queue.put(
-                RequestFinished(
-                    driver_name=self.__class__.__name__,
-                    request_id=request_id,
-                    status=RequestStatus.ERROR,
-                    error=str(ex),
-                    exception=ex,
-                    traceback=traceback.format_exc(),
-                )
+    def _lookup_cached_response(self, config, api_kwargs):
+        """
+        Look the prepared request up in the response cache (``response_cache`` config key).
+        Returns (cache_key, CachedResponse or None); cache_key is None when caching is
+        off or the request opts out with ``config.use_response_cache = False``.
+        """
+        from janito.llm.response_cache import get_response_cache
+
+        if getattr(config, "use_response_cache", None) is False:
+            return None, None
+        cache = get_response_cache()
+        if cache is None:
+            return None, None
+        key = cache.make_key(
+            self.provider_name, getattr(config, "base_url", None), api_kwargs
+        )
+        try:
+            cached = cache.get(key)
+        except Exception:
+            cached = None
+        _report_response_cache(cached)
+        return key, cached
+
+    def _emit_cached_response(self, cached, request_id):
+        """Emit the RequestFinished of a replayed response; its usage is marked as cached."""
+        usage = dict(getattr(cached.result, "usage", None) or {})
+        usage["cached"] = True
+        cached.result.usage = usage
+        self.output_queue.put(
+            RequestFinished(
+                driver_name=self.__class__.__name__,
+                request_id=request_id,
+                response=cached.result,
+                status=RequestStatus.SUCCESS,
+                usage=usage,
+                details={"cache": "hit", "saved_seconds": cached.latency},
             )
+        )
+
+    def _store_cached_response(self, cache_key, result, latency):
+        if cache_key is None or result is None:
+            return
+        from janito.llm.response_cache import get_response_cache
+
+        cache = get_response_cache()
+        if cache is None:
+            return
+        try:
+            cache.put(cache_key, result, latency)
+        except Exception:
+            pass
+
+    @staticmethod
+    def _is_cancelled(driver_input: DriverInput) -> bool:
+        cancel_event = getattr(driver_input, "cancel_event", None)
+        return cancel_event is not None and cancel_event.is_set()
 
     @abstractmethod
     def _prepare_api_kwargs(self, config, conversation):
@@ -252,3 +297,14 @@ class LLMDriver(ABC):
     def _get_message_from_result(self, result):
         """Extract the message object from the provider result. Subclasses must implement this."""
         raise NotImplementedError("Subclasses must implement _get_message_from_result.")
+
+
+def _report_response_cache(cached):
+    try:
+        from janito.perf_singleton import performance_collector
+
+        performance_collector.record_cache_access("llm_response", cached is not None)
+        if cached is not None:
+            performance_collector.record_cache_saving("llm_response", cached.latency)
+    except Exception:
+        pass
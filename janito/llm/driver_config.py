@@ -24,6 +24,9 @@ class LLMDriverConfig:
     frequency_penalty: Optional[float] = None
     stop: Optional[Any] = None  # list or string, depending on backend
     reasoning_effort: Optional[str] = None
+    stream: Optional[bool] = None  # Deliver responses incrementally (ResponseDelta events)
+    use_tools: Optional[bool] = None  # False: send the request without tool schemas
+    use_response_cache: Optional[bool] = None  # False: bypass the response cache
     extra: dict = field(
         default_factory=dict
     )  # for provider-specific miscellaneous config fields
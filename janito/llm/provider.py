@@ -13,6 +13,25 @@ class LLMProvider(ABC):
             "LLMProvider subclasses must implement create_driver()."
         )
 
+    def create_async_driver(self):
+        """
+        Returns an asyncio driver (see AsyncLLMDriver) bound to the same config as create_driver().
+        Supported for providers whose driver is the plain OpenAIModelDriver.
+        """
+        from janito.drivers.openai.driver import OpenAIModelDriver
+        from janito.drivers.openai.async_driver import AsyncOpenAIModelDriver
+
+        driver = self.create_driver()
+        if type(driver) is not OpenAIModelDriver:
+            raise NotImplementedError(
+                f"Provider '{self.name}' does not support an asyncio driver."
+            )
+        async_driver = AsyncOpenAIModelDriver(
+            tools_adapter=driver.tools_adapter, provider_name=driver.provider_name
+        )
+        async_driver.config = getattr(driver, "config", None)
+        return async_driver
+
     """
     Abstract base class for Large Language Model (LLM) providers.
 
@@ -0,0 +1,213 @@
+"""
+Content-addressed cache of LLM responses.
+
+Scripted runs (``ChatScriptRunner``, ``-p`` prompts in CI) often send
+byte-identical requests: same system prompt, history, tool schemas and
+sampling parameters. When the ``response_cache`` config key is enabled,
+drivers hash the prepared API payload and replay a stored response instead
+of calling the provider.
+
+The key is the SHA-256 of the canonical JSON of the provider name, base URL
+and request kwargs (``stream``/``stream_options`` excluded, so streamed and
+non-streamed requests share entries). Entries live in a SQLite file
+(``~/.janito/cache/responses.sqlite3`` by default, ``response_cache_path``
+to override), expire after ``response_cache_ttl`` seconds and the least
+recently used entries are evicted once the store exceeds
+``response_cache_max_mb``.
+
+A replayed response is an object shaped like a chat completion
+(``result.choices[0].message``, ``result.usage`` as a dict, ``result.created``),
+the same contract the streaming accumulator follows.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from types import SimpleNamespace
+
+DEFAULT_PATH = os.path.join(
+    os.path.expanduser("~"), ".janito", "cache", "responses.sqlite3"
+)
+DEFAULT_TTL = 7 * 24 * 3600  # seconds
+DEFAULT_MAX_MB = 256
+
+# Request kwargs that do not change the response content
+_TRANSPORT_KWARGS = ("stream", "stream_options")
+
+
+def _jsonable(obj):
+    """json.dumps ``default`` hook for SDK (pydantic) and SimpleNamespace objects."""
+    if hasattr(obj, "model_dump") and callable(obj.model_dump):
+        return obj.model_dump()
+    if hasattr(obj, "__dict__"):
+        return vars(obj)
+    return str(obj)
+
+
+def _restore(value, key=None):
+    if isinstance(value, dict):
+        if key == "usage":
+            # Drivers expect usage as something dict() understands
+            return value
+        return SimpleNamespace(**{k: _restore(v, k) for k, v in value.items()})
+    if isinstance(value, list):
+        return [_restore(item) for item in value]
+    return value
+
+
+def completion_to_dict(result):
+    """Return a JSON-serializable dict for an SDK completion or completion-shaped object."""
+    return json.loads(json.dumps(result, ensure_ascii=False, default=_jsonable))
+
+
+def completion_from_dict(data):
+    """Inverse of completion_to_dict: a completion-shaped object (usage kept as a dict)."""
+    return _restore(data)
+
+
+class CachedResponse:
+    """A cache hit: the restored result and the latency of the original call."""
+
+    def __init__(self, result, latency):
+        self.result = result
+        self.latency = latency
+
+
+class ResponseCache:
+    """SQLite-backed response store with TTL expiry and size-based LRU eviction."""
+
+    def __init__(self, path=DEFAULT_PATH, ttl=DEFAULT_TTL, max_bytes=None):
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = (
+            max_bytes if max_bytes is not None else DEFAULT_MAX_MB * 1024 * 1024
+        )
+        self._lock = threading.Lock()
+        self._conn = None
+
+    def _connect(self):
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, created REAL NOT NULL, accessed REAL NOT NULL, "
+                "size INTEGER NOT NULL, latency REAL NOT NULL, payload TEXT NOT NULL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)"
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    @staticmethod
+    def make_key(provider_name, base_url, api_kwargs):
+        """Return the hex SHA-256 of the canonical request payload."""
+        kwargs = {k: v for k, v in api_kwargs.items() if k not in _TRANSPORT_KWARGS}
+        canonical = json.dumps(
+            {"provider": provider_name, "base_url": base_url, "kwargs": kwargs},
+            sort_keys=True,
+            separators=(",", ":"),
+            ensure_ascii=False,
+            default=_jsonable,
+        )
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def get(self, key):
+        """Return a CachedResponse for ``key``, or None if missing or expired."""
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT created, latency, payload FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            created, latency, payload = row
+            if self.ttl is not None and now - created > self.ttl:
+                conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                conn.commit()
+                return None
+            conn.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+            conn.commit()
+        return CachedResponse(completion_from_dict(json.loads(payload)), latency)
+
+    def put(self, key, result, latency):
+        """Store ``result`` (an SDK completion or completion-shaped object) under ``key``."""
+        payload = json.dumps(result, ensure_ascii=False, default=_jsonable)
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, created, accessed, size, latency, payload) VALUES (?, ?, ?, ?, ?, ?)",
+                (key, now, now, len(payload.encode("utf-8")), latency, payload),
+            )
+            self._evict(conn, now)
+            conn.commit()
+
+    def _evict(self, conn, now):
+        if self.ttl is not None:
+            conn.execute("DELETE FROM responses WHERE created < ?", (now - self.ttl,))
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = conn.execute("SELECT key, size FROM responses ORDER BY accessed").fetchall()
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+
+    def clear(self):
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM responses")
+            conn.commit()
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_caches = {}
+_caches_lock = threading.Lock()
+
+
+def response_cache_enabled():
+    try:
+        from janito.config import config
+
+        value = config.get("response_cache")
+    except Exception:
+        return False
+    if isinstance(value, str):
+        return value.strip().lower() in ("1", "true", "yes", "on")
+    return bool(value)
+
+
+def get_response_cache():
+    """Return the configured ResponseCache, or None when ``response_cache`` is off."""
+    if not response_cache_enabled():
+        return None
+    from janito.config import config
+
+    path = config.get("response_cache_path") or DEFAULT_PATH
+    ttl = float(config.get("response_cache_ttl") or DEFAULT_TTL)
+    max_mb = float(config.get("response_cache_max_mb") or DEFAULT_MAX_MB)
+    with _caches_lock:
+        cache = _caches.get(path)
+        if cache is None:
+            cache = _caches[path] = ResponseCache(path)
+        cache.ttl = ttl
+        cache.max_bytes = int(max_mb * 1024 * 1024)
+        return cache
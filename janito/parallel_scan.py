@@ -0,0 +1,240 @@
+"""
+Parallel scan engine shared by the file-system tools.
+
+``ordered_batch_map`` runs a per-file function over a stream of paths in a
+process (or thread) pool, in batches, and yields the results in input order,
+so callers can merge deterministically and stop early: closing the generator
+cancels the batches that were not started yet. ``threaded_walk`` lists a
+directory tree with ``os.scandir`` from a thread pool.
+
+Parallel scanning is opt-in: ``scan_workers`` (config) defaults to 1, which
+keeps the sequential code paths. ``scan_pool`` selects ``process`` (default,
+for CPU-bound content matching) or ``thread``. Pools are created lazily and
+reused across calls.
+"""
+
+import atexit
+import multiprocessing
+import os
+import threading
+from collections import deque
+from concurrent.futures import (
+    CancelledError,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+
+DEFAULT_BATCH_SIZE = 32
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def scan_workers():
+    """Return the configured number of scan workers (1 = sequential)."""
+    try:
+        from janito.config import config
+
+        value = config.get("scan_workers")
+        return max(1, int(value)) if value is not None else 1
+    except Exception:
+        return 1
+
+
+def scan_pool_kind():
+    try:
+        from janito.config import config
+
+        kind = config.get("scan_pool") or "process"
+    except Exception:
+        kind = "process"
+    return kind if kind in ("process", "thread") else "process"
+
+
+def get_pool(workers, kind="process"):
+    """Return a shared executor with ``workers`` workers."""
+    key = (kind, workers)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            if kind == "process":
+                # Never fork a process that may be running tool threads
+                methods = multiprocessing.get_all_start_methods()
+                method = "forkserver" if "forkserver" in methods else "spawn"
+                pool = ProcessPoolExecutor(
+                    max_workers=workers, mp_context=multiprocessing.get_context(method)
+                )
+            else:
+                pool = ThreadPoolExecutor(
+                    max_workers=workers, thread_name_prefix="janito-scan"
+                )
+            _pools[key] = pool
+        return pool
+
+
+def shutdown_pools():
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+atexit.register(shutdown_pools)
+
+
+def _run_batch(func, items, args):
+    return [func(item, *args) for item in items]
+
+
+def ordered_batch_map(
+    func, items, args=(), workers=1, kind="process", batch_size=DEFAULT_BATCH_SIZE
+):
+    """
+    Yield ``(item, func(item, *args))`` for every item, in input order.
+
+    With ``workers > 1`` items are grouped in batches of ``batch_size`` and
+    run in a pool; at most ``2 * workers`` batches are in flight, so a
+    consumer that stops iterating leaves little work behind. ``func`` and
+    ``args`` must be picklable for the process pool.
+    """
+    if workers <= 1:
+        for item in items:
+            yield item, func(item, *args)
+        return
+    pool = get_pool(workers, kind)
+    in_flight = deque()
+    iterator = iter(items)
+    exhausted = False
+    try:
+        while True:
+            while not exhausted and len(in_flight) < 2 * workers:
+                batch = []
+                for item in iterator:
+                    batch.append(item)
+                    if len(batch) >= batch_size:
+                        break
+                if not batch:
+                    exhausted = True
+                    break
+                in_flight.append((batch, pool.submit(_run_batch, func, batch, args)))
+            if not in_flight:
+                return
+            batch, future = in_flight.popleft()
+            yield from zip(batch, future.result())
+    finally:
+        for _, future in in_flight:
+            future.cancel()
+
+
+def _list_dir(path, on_dir):
+    """Return sorted ``(dirnames, filenames, symlinked dirnames)`` of ``path``."""
+    dirs, files, links = [], [], set()
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if not is_dir:
+                    files.append(entry.name)
+                    continue
+                dirs.append(entry.name)
+                if entry.is_symlink():
+                    links.add(entry.name)
+    except OSError:
+        pass
+    if on_dir is not None:
+        kept = on_dir(path, dirs, files)
+        if kept is not None:
+            files = kept
+    dirs.sort()
+    files.sort()
+    return dirs, files, links
+
+
+class _TreeWalk:
+    """Shared state of one ``threaded_walk``: results, pending visits, first error."""
+
+    def __init__(self, pool, on_dir, max_depth):
+        self.pool = pool
+        self.on_dir = on_dir
+        self.max_depth = max_depth
+        self.results = []
+        self.error = None
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+
+    def submit(self, path, depth):
+        with self._lock:
+            if self.error is not None:
+                return
+            self._pending += 1
+        try:
+            future = self.pool.submit(_visit_dir, self, path, depth)
+        except BaseException as e:
+            # The pool refused the visit (e.g. shut down at exit): it never runs
+            self.finish(e)
+            raise
+        future.add_done_callback(self._on_done)
+
+    def _on_done(self, future):
+        # A queued visit cancelled by shutdown_pools never runs _visit_dir
+        if future.cancelled():
+            self.finish(CancelledError("directory walk cancelled"))
+
+    def add(self, path, dirs, files):
+        with self._lock:
+            self.results.append((path, dirs, files))
+
+    def finish(self, error=None):
+        with self._lock:
+            if error is not None and self.error is None:
+                self.error = error
+            self._pending -= 1
+            if self._pending == 0:
+                self._done.set()
+
+    def wait(self):
+        self._done.wait()
+        if self.error is not None:
+            raise self.error
+        return self.results
+
+
+def _visit_dir(walk, path, depth):
+    error = None
+    try:
+        dirs, files, links = _list_dir(path, walk.on_dir)
+        walk.add(path, dirs, files)
+        if walk.max_depth is None or depth + 1 < walk.max_depth:
+            for name in dirs:
+                if name not in links:
+                    walk.submit(os.path.join(path, name), depth + 1)
+    except BaseException as e:
+        error = e
+    finally:
+        walk.finish(error)
+
+
+def threaded_walk(root, workers, on_dir=None, max_depth=None):
+    """
+    List the tree below ``root`` with ``os.scandir`` from a thread pool.
+
+    Returns ``(dirpath, dirnames, filenames)`` tuples sorted by path, like a
+    top-down ``os.walk`` (symlinked directories are listed but not followed).
+    ``on_dir(dirpath, dirnames, filenames)`` runs in the worker; it may prune
+    ``dirnames`` in place and return the filenames to keep (or None). With
+    ``max_depth`` only directories less than ``max_depth`` levels below
+    ``root`` are listed (the root itself is always listed).
+
+    The first exception raised by ``on_dir`` or by the pool is re-raised once
+    the visits already started have finished; no new ones start after it.
+    """
+    walk = _TreeWalk(get_pool(workers, "thread"), on_dir, max_depth)
+    walk.submit(root, 0)
+    results = walk.wait()
+    results.sort(key=lambda entry: entry[0].split(os.sep))
+    return results
@@ -0,0 +1,73 @@
+"""
+Fixed-memory streaming histogram for latency and throughput metrics.
+
+Values are counted in logarithmic buckets (each ``GROWTH`` times wider than
+the previous one), so a histogram holds at most a few hundred counters no
+matter how many values it has seen, and percentiles are accurate to about
+``(GROWTH - 1) / 2`` relative error. Count, sum, min and max are exact.
+"""
+
+import math
+import threading
+
+GROWTH = 1.02
+_LOG_GROWTH = math.log(GROWTH)
+QUANTILES = (0.5, 0.95, 0.99)
+
+
+class StreamingHistogram:
+    """Log-bucketed histogram of non-negative values with percentile estimates."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buckets = {}  # bucket index -> count (None: values <= 0)
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    def record(self, value):
+        value = float(value)
+        index = math.floor(math.log(value) / _LOG_GROWTH) if value > 0 else None
+        with self._lock:
+            self._buckets[index] = self._buckets.get(index, 0) + 1
+            self.count += 1
+            self.total += value
+            if self.min is None or value < self.min:
+                self.min = value
+            if self.max is None or value > self.max:
+                self.max = value
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, q):
+        """Estimated value below which a fraction ``q`` (0..1) of the values fall."""
+        with self._lock:
+            if not self.count:
+                return 0.0
+            rank = q * self.count
+            seen = self._buckets.get(None, 0)
+            if seen and seen >= rank:
+                return min(self.min, 0.0)
+            for index in sorted(i for i in self._buckets if i is not None):
+                seen += self._buckets[index]
+                if seen >= rank:
+                    # Geometric midpoint of the bucket, clamped to what was observed
+                    estimate = GROWTH ** (index + 0.5)
+                    return min(max(estimate, self.min), self.max)
+            return self.max
+
+    def summary(self):
+        """{"count", "sum", "mean", "min", "max", "p50", "p95", "p99"}."""
+        result = {
+            "count": self.count,
+            "sum": self.total,
+            "mean": self.mean,
+            "min": self.min if self.min is not None else 0.0,
+            "max": self.max if self.max is not None else 0.0,
+        }
+        for q in QUANTILES:
+            result[f"p{int(q * 100)}"] = self.percentile(q)
+        return result
@@ -1,9 +1,38 @@
-from collections import defaultdict, Counter
+from collections import defaultdict, deque, Counter
 from janito.event_bus.handler import EventHandlerBase
+from janito.perf_histogram import QUANTILES, StreamingHistogram
 import janito.driver_events as driver_events
 import janito.report_events as report_events
 import janito.tools.tool_events as tool_events
 
+# Most recent event summaries kept for reference (older ones are dropped)
+MAX_EVENTS = 1000
+# Most recent error messages/exceptions kept per list
+MAX_ERRORS = 100
+
+
+def _elapsed_seconds(start, end):
+    delta = end - start
+    if hasattr(delta, "total_seconds"):
+        return delta.total_seconds()
+    return float(delta)
+
+
+def _event_summary(event_type, event):
+    """The fields of an event kept in the recent-events ring buffer."""
+    usage = getattr(event, "usage", None)
+    return {
+        "type": event_type,
+        "timestamp": getattr(event, "timestamp", None),
+        "duration": getattr(event, "duration", None),
+        "status": getattr(event, "status", None),
+        "usage": dict(usage) if isinstance(usage, dict) else None,
+    }
+
+
+def _status_label(status):
+    return str(getattr(status, "value", status))
+
 
 class PerformanceCollector(EventHandlerBase):
     _last_request_usage = None
@@ -12,10 +41,15 @@ class PerformanceCollector(EventHandlerBase):
     Aggregates performance metrics and statistics from LLM driver and report events.
     Collects timing, token usage, status, error, turn, content part, and tool usage data.
     Also tracks request durations.
+
+    Memory is bounded: event summaries and error messages are kept in ring buffers
+    and latencies (request duration, time-to-first-token, tokens/sec, per-tool
+    latency) in fixed-size streaming histograms.
     """
 
-    def __init__(self):
-        super().__init__(driver_events, report_events, tool_events)
+    def __init__(self, max_events=MAX_EVENTS, max_errors=MAX_ERRORS):
+        # tool_events first: driver_events declares same-named classes that are never published
+        super().__init__(tool_events, driver_events, report_events)
         # Aggregated stats
         self.total_requests = 0
         self.status_counter = Counter()
@@ -23,76 +57,117 @@ class PerformanceCollector(EventHandlerBase):
             int
         )  # keys: total_tokens, prompt_tokens, completion_tokens
         self.error_count = 0
-        self.error_messages = []
-        self.error_exceptions = []
+        self.error_messages = deque(maxlen=max_errors)
+        self.error_exceptions = deque(maxlen=max_errors)
         self.total_turns = 0
         self.generation_finished_count = 0
         self.content_part_count = 0
         # Duration tracking
         self._request_start_times = dict()  # request_id -> timestamp
-        self._durations = []  # list of elapsed times (seconds)
+        self._durations = StreamingHistogram()  # request elapsed times (seconds)
+        # Streaming stats (keyed by request_id, which may be None for sequential requests)
+        self._stream_start_times = dict()  # request_id -> RequestStarted timestamp
+        self._first_token_times = dict()  # request_id -> first ResponseDelta timestamp
+        self._time_to_first_token = StreamingHistogram()  # seconds
+        self._tokens_per_second = StreamingHistogram()
         # Tool stats
         self.total_tool_events = 0
         self.tool_names_counter = Counter()
         self.tool_error_count = 0
-        self.tool_error_messages = []
+        self.tool_error_messages = deque(maxlen=max_errors)
         self.tool_action_counter = Counter()
         self.tool_subtype_counter = Counter()
-        # Raw events for reference
-        self._events = []
+        self.tool_durations = defaultdict(StreamingHistogram)  # tool_name -> seconds
+        # Cache stats: cache_name -> Counter({"hits": n, "misses": m})
+        self.cache_counters = defaultdict(Counter)
+        self.cache_saved_seconds = defaultdict(float)  # cache_name -> seconds saved
+        # Token usage of responses replayed from the response cache (not billed)
+        self.cached_token_usage = defaultdict(int)
+        # Summaries of the most recent events; the events themselves are not
+        # kept, so a RequestFinished does not pin its response in memory
+        self._events = deque(maxlen=max_events)
 
     def on_RequestStarted(self, event):
-        self._events.append(("RequestStarted", event))
-        # Store the start time if possible
-        # Assumes 'event' has a unique .request_id and a .timestamp (in seconds)
+        self._events.append(_event_summary("RequestStarted", event))
+        # Store the start time if possible; request_id is None for sequential
+        # requests of an agent, which cannot overlap
         request_id = event.request_id
         timestamp = event.timestamp
-        if request_id is not None and timestamp is not None:
+        if timestamp is not None:
             self._request_start_times[request_id] = timestamp
+        self._stream_start_times[request_id] = timestamp
+        self._first_token_times.pop(request_id, None)
+
+    def on_ResponseDelta(self, event):
+        request_id = event.request_id
+        if request_id in self._first_token_times:
+            return
+        self._first_token_times[request_id] = event.timestamp
+        start_time = self._stream_start_times.get(request_id)
+        if start_time is not None and event.timestamp is not None:
+            self._time_to_first_token.record(
+                _elapsed_seconds(start_time, event.timestamp)
+            )
 
     def on_RequestFinished(self, event):
-        self._events.append(("RequestFinished", event))
+        self._events.append(_event_summary("RequestFinished", event))
         # Calculate and record the duration if start time is available
         request_id = getattr(event, "request_id", None)
         finish_time = getattr(event, "timestamp", None)
-        if request_id is not None and finish_time is not None:
+        if finish_time is not None:
             start_time = self._request_start_times.pop(request_id, None)
             if start_time is not None:
-                delta = finish_time - start_time
-                if hasattr(delta, "total_seconds"):
-                    self._durations.append(delta.total_seconds())
-                else:
-                    self._durations.append(float(delta))
+                self._durations.record(_elapsed_seconds(start_time, finish_time))
+        self._record_tokens_per_second(request_id, finish_time, event)
         self.total_requests += 1
         self.status_counter[getattr(event, "status", None)] += 1
         usage = getattr(event, "usage", None)
         if usage:
             self._last_request_usage = usage.copy()
+            totals = self.cached_token_usage if usage.get("cached") else self.token_usage
             for k, v in usage.items():
-                if isinstance(v, (int, float)):
-                    self.token_usage[k] += v
+                if isinstance(v, (int, float)) and not isinstance(v, bool):
+                    totals[k] += v
         # Error handling
         if getattr(event, "status", None) in ("error", "cancelled"):
             self.error_count += 1
             self.error_messages.append(getattr(event, "error", None))
             self.error_exceptions.append(getattr(event, "exception", None))
 
+    def _record_tokens_per_second(self, request_id, finish_time, event):
+        self._stream_start_times.pop(request_id, None)
+        first_token_time = self._first_token_times.pop(request_id, None)
+        usage = getattr(event, "usage", None)
+        if first_token_time is None or finish_time is None or not isinstance(
+            usage, dict
+        ):
+            return
+        completion_tokens = usage.get("completion_tokens")
+        elapsed = _elapsed_seconds(first_token_time, finish_time)
+        if isinstance(completion_tokens, (int, float)) and elapsed > 0:
+            self._tokens_per_second.record(completion_tokens / elapsed)
+
     def on_GenerationFinished(self, event):
-        self._events.append(("GenerationFinished", event))
+        self._events.append(_event_summary("GenerationFinished", event))
         self.generation_finished_count += 1
         self.total_turns += event.total_turns
 
     def on_ContentPartFound(self, event):
-        self._events.append(("ContentPartFound", event))
+        self._events.append(_event_summary("ContentPartFound", event))
         self.content_part_count += 1
 
     def on_ToolCallStarted(self, event):
-        self._events.append(("ToolCallStarted", event))
+        self._events.append(_event_summary("ToolCallStarted", event))
         self.total_tool_events += 1
         self.tool_names_counter[event.tool_name] += 1
 
+    def on_ToolCallFinished(self, event):
+        duration = getattr(event, "duration", None)
+        if duration is not None:
+            self.tool_durations[event.tool_name].record(duration)
+
     def on_ReportEvent(self, event):
-        self._events.append(("ReportEvent", event))
+        self._events.append(_event_summary("ReportEvent", event))
         # Only count errors for reporting
         if event.subtype:
             self.tool_subtype_counter[str(event.subtype)] += 1
@@ -100,11 +175,28 @@ class PerformanceCollector(EventHandlerBase):
                 self.tool_error_count += 1
                 self.tool_error_messages.append(event.message)
 
+    def record_cache_access(self, cache_name, hit):
+        """
+        Record a hit or miss for a named cache (e.g. 'http_client'). Called directly by caches, not via events.
+        """
+        self.cache_counters[cache_name]["hits" if hit else "misses"] += 1
+
+    def record_cache_saving(self, cache_name, seconds):
+        """Record time saved by a cache hit (e.g. the original latency of a replayed LLM response)."""
+        if seconds:
+            self.cache_saved_seconds[cache_name] += seconds
+
     # --- Aggregated Data Accessors ---
     def get_average_duration(self):
-        if not self._durations:
-            return 0.0
-        return sum(self._durations) / len(self._durations)
+        return self._durations.mean
+
+    def get_average_time_to_first_token(self):
+        """Average seconds from RequestStarted to the first streamed token (streaming mode only)."""
+        return self._time_to_first_token.mean
+
+    def get_average_tokens_per_second(self):
+        """Average completion tokens per second after the first streamed token (streaming mode only)."""
+        return self._tokens_per_second.mean
 
     def get_total_requests(self):
         return self.total_requests
@@ -115,6 +207,9 @@ class PerformanceCollector(EventHandlerBase):
     def get_token_usage(self):
         return dict(self.token_usage)
 
+    def get_cached_token_usage(self):
+        return dict(self.cached_token_usage)
+
     def get_error_count(self):
         return self.error_count
 
@@ -151,7 +246,151 @@ class PerformanceCollector(EventHandlerBase):
     def get_tool_subtype_counter(self):
         return dict(self.tool_subtype_counter)
 
+    def get_tool_average_durations(self):
+        """Return {tool_name: average execution seconds} for finished tool calls."""
+        return {
+            name: histogram.mean
+            for name, histogram in self.tool_durations.items()
+            if histogram.count
+        }
+
+    def get_latency_stats(self):
+        """
+        Returns count/sum/mean/min/max/p50/p95/p99 summaries for "request_duration",
+        "time_to_first_token" and "tokens_per_second", and per tool under "tools".
+        """
+        return {
+            "request_duration": self._durations.summary(),
+            "time_to_first_token": self._time_to_first_token.summary(),
+            "tokens_per_second": self._tokens_per_second.summary(),
+            "tools": {
+                name: histogram.summary()
+                for name, histogram in sorted(self.tool_durations.items())
+                if histogram.count
+            },
+        }
+
+    def snapshot(self):
+        """Return a JSON-serializable dict of the aggregated statistics."""
+        return {
+            "requests": {
+                "total": self.total_requests,
+                "status": {
+                    _status_label(k): v for k, v in self.status_counter.items()
+                },
+                "errors": self.error_count,
+            },
+            "turns": {
+                "total": self.total_turns,
+                "average": self.get_average_turns(),
+            },
+            "token_usage": self.get_token_usage(),
+            "cached_token_usage": self.get_cached_token_usage(),
+            "tools": {
+                "calls": self.get_tool_names_counter(),
+                "errors": self.tool_error_count,
+            },
+            "caches": self.get_cache_stats(),
+            "latency": self.get_latency_stats(),
+        }
+
+    def to_prometheus(self, prefix="janito"):
+        """Render the statistics in the Prometheus text exposition format."""
+        lines = []
+
+        def metric(name, kind, help_text, samples):
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+            for suffix, labels, value in samples:
+                label_text = ",".join(f'{k}="{v}"' for k, v in labels.items())
+                label_text = f"{{{label_text}}}" if label_text else ""
+                lines.append(f"{prefix}_{name}{suffix}{label_text} {value}")
+
+        def summary_samples(summary, labels=None):
+            labels = labels or {}
+            samples = [
+                ("", {**labels, "quantile": str(q)}, summary[f"p{int(q * 100)}"])
+                for q in QUANTILES
+            ]
+            samples.append(("_sum", labels, summary["sum"]))
+            samples.append(("_count", labels, summary["count"]))
+            return samples
+
+        metric(
+            "requests_total",
+            "counter",
+            "LLM requests by final status.",
+            [
+                ("", {"status": _status_label(k)}, v)
+                for k, v in self.status_counter.items()
+            ]
+            or [("", {}, 0)],
+        )
+        metric(
+            "tokens_total",
+            "counter",
+            "Tokens billed by the provider.",
+            [("", {"kind": k}, v) for k, v in sorted(self.token_usage.items())]
+            or [("", {}, 0)],
+        )
+        latency = self.get_latency_stats()
+        metric(
+            "request_duration_seconds",
+            "summary",
+            "LLM request duration.",
+            summary_samples(latency["request_duration"]),
+        )
+        metric(
+            "time_to_first_token_seconds",
+            "summary",
+            "Time from request start to the first streamed token.",
+            summary_samples(latency["time_to_first_token"]),
+        )
+        metric(
+            "tokens_per_second",
+            "summary",
+            "Completion tokens per second after the first streamed token.",
+            summary_samples(latency["tokens_per_second"]),
+        )
+        tool_samples = []
+        for name, summary in latency["tools"].items():
+            tool_samples.extend(summary_samples(summary, {"tool": name}))
+        metric(
+            "tool_duration_seconds",
+            "summary",
+            "Tool call execution time.",
+            tool_samples or summary_samples(StreamingHistogram().summary()),
+        )
+        cache_samples = []
+        for name, stats in sorted(self.get_cache_stats().items()):
+            for result in ("hits", "misses"):
+                labels = {"cache": name, "result": result}
+                cache_samples.append(("", labels, stats[result]))
+        if cache_samples:
+            metric("cache_accesses_total", "counter", "Cache lookups.", cache_samples)
+        return "\n".join(lines) + "\n"
+
+    def get_cache_stats(self):
+        """
+        Returns {cache_name: {"hits": int, "misses": int, "hit_ratio": float}} for all recorded caches;
+        caches that report savings also get "saved_seconds".
+        """
+        stats = {}
+        for name, counter in self.cache_counters.items():
+            hits = counter["hits"]
+            misses = counter["misses"]
+            total = hits + misses
+            stats[name] = {
+                "hits": hits,
+                "misses": misses,
+                "hit_ratio": hits / total if total else 0.0,
+            }
+            if name in self.cache_saved_seconds:
+                stats[name]["saved_seconds"] = self.cache_saved_seconds[name]
+        return stats
+
     def get_all_events(self):
+        """Return the recent event summaries (type, timestamp, duration, status, usage)."""
         return list(self._events)
 
     def get_last_request_usage(self):
@@ -2,8 +2,6 @@
 ProviderRegistry: Handles provider listing and selection logic for janito CLI.
 """
 
-from rich.table import Table
-from janito.cli.console import shared_console
 from janito.providers.registry import LLMProviderRegistry
 from janito.llm.auth import LLMAuthManager
 import sys
@@ -25,6 +23,8 @@ class ProviderRegistry:
         return LLMProviderRegistry.list_providers()
 
     def _create_table(self):
+        from rich.table import Table
+
         table = Table(title="Supported LLM Providers")
         table.add_column("Provider", style="cyan")
         table.add_column("Maintainer", style="yellow", justify="center")
@@ -55,6 +55,8 @@ class ProviderRegistry:
         import sys
 
         if sys.stdout.isatty():
+            from janito.cli.console import shared_console
+
             # Safe to use rich's unicode output when attached to an interactive terminal.
             shared_console.print(table)
             return
@@ -72,8 +74,8 @@ class ProviderRegistry:
             print(ascii_row)
 
     def _get_provider_info(self, provider_name):
-        provider_class = LLMProviderRegistry.get(provider_name)
-        maintainer = getattr(provider_class, "MAINTAINER", "-")
+        maintainer = self._get_provider_attr(provider_name, "maintainer", "MAINTAINER")
+        maintainer = maintainer or "-"
         maintainer = f"👤 {maintainer}" if maintainer != "-" else maintainer
         model_names = self._get_model_names(provider_name)
         skip = False
@@ -81,21 +83,13 @@ class ProviderRegistry:
 
     def _get_model_names(self, provider_name):
         try:
-            provider_class = LLMProviderRegistry.get(provider_name)
-            module_parts = provider_class.__module__.split(".")
-            # Build the correct import path: janito.providers.{provider}.model_info
-            model_info_module = f"janito.providers.{provider_name}.model_info"
-            model_info_mod = __import__(model_info_module, fromlist=["MODEL_SPECS"])
-
-            # Handle different model spec variable names
-            model_specs = None
-            if hasattr(model_info_mod, "MODEL_SPECS"):
-                model_specs = model_info_mod.MODEL_SPECS
-            elif hasattr(model_info_mod, "MOONSHOTAI_MODEL_SPECS"):
-                model_specs = model_info_mod.MOONSHOTAI_MODEL_SPECS
-            
+            # Answered from the manifest: no provider module or SDK import
+            model_specs = LLMProviderRegistry.get_model_specs(provider_name)
+
             if model_specs:
-                default_model = getattr(provider_class, "DEFAULT_MODEL", None)
+                default_model = self._get_provider_attr(
+                    provider_name, "default_model", "DEFAULT_MODEL"
+                )
                 model_names = []
                 
                 for model_key in model_specs.keys():
@@ -112,6 +106,13 @@ class ProviderRegistry:
         except Exception as e:
             return "-"
 
+    def _get_provider_attr(self, provider_name, manifest_field, class_attr):
+        entry = LLMProviderRegistry.get_manifest(provider_name)
+        if entry is not None:
+            return getattr(entry, manifest_field)
+        provider_class = LLMProviderRegistry.get(provider_name)
+        return getattr(provider_class, class_attr, None)
+
     def _maintainer_sort_key(self, row):
         maint = row[1]
         is_needs_maint = "Needs maintainer" in maint
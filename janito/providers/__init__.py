@@ -1,8 +1,2 @@
-# Ensure all providers are registered by importing their modules
-import janito.providers.openai.provider
-import janito.providers.google.provider
-import janito.providers.azure_openai.provider
-import janito.providers.anthropic.provider
-import janito.providers.deepseek.provider
-import janito.providers.moonshotai.provider
-import janito.providers.alibaba.provider
+# Providers are registered lazily: LLMProviderRegistry imports a provider
+# module the first time its class is requested (see janito.providers.manifest).
@@ -1 +1,10 @@
-from .provider import GoogleProvider
+# The provider class is imported on first access so that reading
+# model_info does not pull in the LLM SDK.
+
+
+def __getattr__(attr):
+    if attr == "GoogleProvider":
+        from .provider import GoogleProvider
+
+        return GoogleProvider
+    raise AttributeError(f"module {__name__!r} has no attribute {attr!r}")
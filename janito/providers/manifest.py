@@ -0,0 +1,108 @@
+"""
+Declarative manifest of the built-in providers and drivers.
+
+Metadata queries (provider names, maintainers, default models, MODEL_SPECS)
+are answered from this table without importing provider modules, and with
+them the LLM SDKs. ``LLMProviderRegistry.get`` imports a provider module the
+first time its class is requested; ``get_driver_class`` does the same for
+driver classes.
+
+Keep the entries in sync with the provider classes (``NAME``, ``MAINTAINER``,
+``DEFAULT_MODEL``); ``tests/test_lazy_imports.py`` checks that they match.
+"""
+
+from dataclasses import dataclass
+from importlib import import_module
+
+
+@dataclass(frozen=True)
+class ProviderManifestEntry:
+    name: str
+    module: str
+    class_name: str
+    maintainer: str
+    default_model: str
+    driver: str
+    model_specs: str  # "module:attribute" holding the provider's MODEL_SPECS
+
+    def load_model_specs(self):
+        module_name, attr = self.model_specs.split(":")
+        return getattr(import_module(module_name), attr)
+
+
+_MAINTAINER = "João Pinto <janito@ikignosis.org>"
+
+PROVIDER_MANIFEST = {
+    entry.name: entry
+    for entry in (
+        ProviderManifestEntry(
+            name="openai",
+            module="janito.providers.openai.provider",
+            class_name="OpenAIProvider",
+            maintainer=_MAINTAINER,
+            default_model="gpt-4.1",
+            driver="OpenAIModelDriver",
+            model_specs="janito.providers.openai.model_info:MODEL_SPECS",
+        ),
+        ProviderManifestEntry(
+            name="google",
+            module="janito.providers.google.provider",
+            class_name="GoogleProvider",
+            maintainer=_MAINTAINER,
+            default_model="gemini-2.5-flash",
+            driver="OpenAIModelDriver",
+            model_specs="janito.providers.google.model_info:MODEL_SPECS",
+        ),
+        ProviderManifestEntry(
+            name="azure_openai",
+            module="janito.providers.azure_openai.provider",
+            class_name="AzureOpenAIProvider",
+            maintainer=_MAINTAINER,
+            default_model="azure_openai_deployment",
+            driver="AzureOpenAIModelDriver",
+            model_specs="janito.providers.azure_openai.model_info:MODEL_SPECS",
+        ),
+        ProviderManifestEntry(
+            name="anthropic",
+            module="janito.providers.anthropic.provider",
+            class_name="AnthropicProvider",
+            maintainer="Alberto Minetti <alberto.minetti@gmail.com>",
+            default_model="claude-3-7-sonnet-20250219",
+            driver="OpenAIModelDriver",
+            model_specs="janito.providers.anthropic.model_info:MODEL_SPECS",
+        ),
+        ProviderManifestEntry(
+            name="deepseek",
+            module="janito.providers.deepseek.provider",
+            class_name="DeepSeekProvider",
+            maintainer=_MAINTAINER,
+            default_model="deepseek-chat",
+            driver="OpenAIModelDriver",
+            model_specs="janito.providers.deepseek.model_info:MODEL_SPECS",
+        ),
+        ProviderManifestEntry(
+            name="moonshotai",
+            module="janito.providers.moonshotai.provider",
+            class_name="MoonshotAIProvider",
+            maintainer=_MAINTAINER,
+            default_model="kimi-k2-turbo-preview",
+            driver="OpenAIModelDriver",
+            model_specs="janito.providers.moonshotai.model_info:MOONSHOTAI_MODEL_SPECS",
+        ),
+        ProviderManifestEntry(
+            name="alibaba",
+            module="janito.providers.alibaba.provider",
+            class_name="AlibabaProvider",
+            maintainer=_MAINTAINER,
+            default_model="qwen3-coder-plus",
+            driver="OpenAIModelDriver",
+            model_specs="janito.providers.alibaba.model_info:MODEL_SPECS",
+        ),
+    )
+}
+
+# Driver name -> "module:ClassName"
+DRIVER_MANIFEST = {
+    "OpenAIModelDriver": "janito.drivers.openai.driver:OpenAIModelDriver",
+    "AzureOpenAIModelDriver": "janito.drivers.azure_openai.driver:AzureOpenAIModelDriver",
+}
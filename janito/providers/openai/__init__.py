@@ -1 +1,10 @@
-from .provider import OpenAIProvider
+# The provider class is imported on first access so that reading
+# model_info does not pull in the LLM SDK.
+
+
+def __getattr__(attr):
+    if attr == "OpenAIProvider":
+        from .provider import OpenAIProvider
+
+        return OpenAIProvider
+    raise AttributeError(f"module {__name__!r} has no attribute {attr!r}")
@@ -3,6 +3,7 @@ import typing
 from collections import OrderedDict
 from typing import List
 from janito.tools.tools_schema import ToolSchemaBase
+from janito.tools.tool_schema_cache import tool_schema_cache
 
 
 class OpenAISchemaGenerator(ToolSchemaBase):
@@ -55,9 +56,15 @@ class OpenAISchemaGenerator(ToolSchemaBase):
         }
 
 
-def generate_tool_schemas(tool_classes: List[type]):
+def _build_tool_entry(tool_class):
+    # Lazily registered tools carry their schema in the tool manifest
+    function_schema = getattr(tool_class, "function_schema", None)
+    if function_schema is not None:
+        return {"type": "function", "function": function_schema}
     generator = OpenAISchemaGenerator()
-    return [
-        {"type": "function", "function": generator.generate_schema(tool_class)}
-        for tool_class in tool_classes
-    ]
+    return {"type": "function", "function": generator.generate_schema(tool_class)}
+
+
+def generate_tool_schemas(tool_classes: List[type]):
+    """Return the OpenAI ``tools`` array for the given classes (memoized, see ToolSchemaCache)."""
+    return list(tool_schema_cache.get_payload(tool_classes, _build_tool_entry))
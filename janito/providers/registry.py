@@ -1,10 +1,16 @@
 from typing import Type, Dict
+from importlib import import_module
 from janito.llm.provider import LLMProvider
+from janito.providers.manifest import PROVIDER_MANIFEST
 
 
 class LLMProviderRegistry:
     """
     Registry for LLM provider classes.
+
+    Built-in providers are listed in ``janito.providers.manifest`` and their
+    modules are imported on the first ``get()``; metadata lookups
+    (``get_manifest``, ``get_model_specs``) never import provider modules.
     """
 
     _providers: Dict[str, Type[LLMProvider]] = {}
@@ -17,10 +23,31 @@ class LLMProviderRegistry:
 
     @classmethod
     def get(cls, name: str) -> Type[LLMProvider]:
-        if name not in cls._providers:
-            return None
-        return cls._providers[name]
+        if name not in cls._providers and name in PROVIDER_MANIFEST:
+            # Importing the provider module registers its class
+            import_module(PROVIDER_MANIFEST[name].module)
+        return cls._providers.get(name)
 
     @classmethod
     def list_providers(cls):
-        return list(cls._providers.keys())
+        names = list(PROVIDER_MANIFEST)
+        names.extend(name for name in cls._providers if name not in PROVIDER_MANIFEST)
+        return names
+
+    @classmethod
+    def get_manifest(cls, name: str):
+        """Return the ProviderManifestEntry for a built-in provider, or None."""
+        return PROVIDER_MANIFEST.get(name)
+
+    @classmethod
+    def get_model_specs(cls, name: str):
+        """Return the provider's MODEL_SPECS without importing its SDK."""
+        entry = PROVIDER_MANIFEST.get(name)
+        if entry is not None and name not in cls._providers:
+            return entry.load_model_specs()
+        provider_cls = cls.get(name)
+        return getattr(provider_cls, "MODEL_SPECS", None) if provider_cls else None
+
+    @classmethod
+    def is_loaded(cls, name: str) -> bool:
+        return name in cls._providers
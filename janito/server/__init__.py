@@ -0,0 +1,15 @@
+from janito.server.sessions import (
+    AgentSession,
+    SessionError,
+    SessionManager,
+    UnknownSessionError,
+)
+from janito.server.http_api import create_server
+
+__all__ = [
+    "AgentSession",
+    "SessionError",
+    "SessionManager",
+    "UnknownSessionError",
+    "create_server",
+]
@@ -0,0 +1,222 @@
+"""
+HTTP/JSON front end for :class:`~janito.server.sessions.SessionManager`.
+
+Endpoints (request and response bodies are JSON):
+
+``GET /health``
+    Server status and session count.
+``GET /sessions``
+    List sessions.
+``POST /sessions``
+    Create a session: ``{"workdir": "...", "permissions": "rw", "profile": ..., "role": ...}``.
+``GET /sessions/<id>``
+    Describe one session.
+``POST /sessions/<id>/chat``
+    Run one turn: ``{"prompt": "..."}`` -> ``{"status", "content", "usage"}``.
+``DELETE /sessions/<id>``
+    Cancel any running turn and drop the session.
+
+Every request must carry ``Authorization: Bearer <token>``; the token is
+generated when the server starts unless one is configured. On TCP, requests
+whose ``Host`` header does not name the bound address are rejected, so a web
+page cannot reach the API through DNS rebinding.
+
+The server listens on a TCP address (loopback by default) or on a Unix
+domain socket. Each request is handled on its own thread; chat turns run on
+the manager's event loop, so sessions make progress concurrently.
+"""
+
+import hmac
+import ipaddress
+import json
+import os
+import secrets
+import socketserver
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from janito.server.sessions import SessionError, UnknownSessionError
+
+MAX_BODY_BYTES = 16 * 1024 * 1024
+
+
+class SessionRequestHandler(BaseHTTPRequestHandler):
+    server_version = "janito-serve"
+    protocol_version = "HTTP/1.1"
+
+    @property
+    def manager(self):
+        return self.server.session_manager
+
+    # ------------------------------------------------------------------
+    # Routing
+    # ------------------------------------------------------------------
+    def do_GET(self):
+        if not self._check_access():
+            return
+        parts = self._path_parts()
+        if parts == ["health"]:
+            return self._send(
+                200, {"status": "ok", "sessions": len(self.manager.list_sessions())}
+            )
+        if parts == ["sessions"]:
+            return self._send(
+                200, {"sessions": [s.to_dict() for s in self.manager.list_sessions()]}
+            )
+        if len(parts) == 2 and parts[0] == "sessions":
+            return self._handle(lambda: self.manager.get_session(parts[1]).to_dict())
+        self._send(404, {"error": f"Not found: {self.path}"})
+
+    def do_POST(self):
+        if not self._check_access():
+            return
+        parts = self._path_parts()
+        if parts == ["sessions"]:
+            return self._handle(self._create_session, status=201)
+        if len(parts) == 3 and parts[0] == "sessions" and parts[2] == "chat":
+            return self._handle(lambda: self._chat(parts[1]))
+        self._send(404, {"error": f"Not found: {self.path}"})
+
+    def do_DELETE(self):
+        if not self._check_access():
+            return
+        parts = self._path_parts()
+        if len(parts) == 2 and parts[0] == "sessions":
+            return self._handle(
+                lambda: {"deleted": self.manager.delete_session(parts[1]).id}
+            )
+        self._send(404, {"error": f"Not found: {self.path}"})
+
+    # ------------------------------------------------------------------
+    # Actions
+    # ------------------------------------------------------------------
+    def _create_session(self):
+        body = self._read_json()
+        session = self.manager.create_session(
+            body.get("workdir"),
+            permissions=body.get("permissions"),
+            profile=body.get("profile"),
+            role=body.get("role"),
+        )
+        return session.to_dict()
+
+    def _chat(self, session_id):
+        body = self._read_json()
+        prompt = body.get("prompt")
+        if not isinstance(prompt, str) or not prompt.strip():
+            raise SessionError("'prompt' must be a non-empty string")
+        result = self.manager.chat(session_id, prompt, timeout=body.get("timeout"))
+        return {"session_id": session_id, **result}
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+    def _check_access(self):
+        """Reject requests for another Host or without the bearer token; False when rejected."""
+        allowed_hosts = self.server.allowed_hosts
+        if allowed_hosts is not None:
+            host = (self.headers.get("Host") or "").strip().lower()
+            if host not in allowed_hosts:
+                self._send(403, {"error": "Host not allowed"})
+                return False
+        scheme, _, token = (self.headers.get("Authorization") or "").partition(" ")
+        if scheme.lower() != "bearer" or not hmac.compare_digest(
+            token.strip().encode("utf-8"), self.server.auth_token.encode("utf-8")
+        ):
+            self._send(
+                401,
+                {"error": "Missing or invalid bearer token"},
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+            return False
+        return True
+
+    def _handle(self, action, status=200):
+        try:
+            payload = action()
+        except UnknownSessionError as e:
+            return self._send(404, {"error": str(e)})
+        except (SessionError, ValueError) as e:
+            return self._send(400, {"error": str(e)})
+        except Exception as e:
+            return self._send(500, {"error": f"{type(e).__name__}: {e}"})
+        self._send(status, payload)
+
+    def _path_parts(self):
+        path = self.path.split("?", 1)[0]
+        return [part for part in path.split("/") if part]
+
+    def _read_json(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > MAX_BODY_BYTES:
+            raise SessionError("Request body too large")
+        raw = self.rfile.read(length) if length else b""
+        if not raw:
+            return {}
+        body = json.loads(raw.decode("utf-8"))
+        if not isinstance(body, dict):
+            raise SessionError("Request body must be a JSON object")
+        return body
+
+    def _send(self, status, payload, headers=None):
+        data = json.dumps(payload, default=str).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def address_string(self):
+        # Unix socket peers have no (host, port) address
+        if isinstance(self.client_address, tuple) and self.client_address:
+            return str(self.client_address[0])
+        return "unix"
+
+    def log_message(self, format, *args):
+        if getattr(self.server, "verbose", False):
+            super().log_message(format, *args)
+
+
+class _UnixHTTPServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+
+def _allowed_hosts(host, port):
+    """``Host`` header values naming ``host:port`` (and ``localhost`` for loopback)."""
+    names = {host.lower()}
+    try:
+        address = ipaddress.ip_address(host)
+    except ValueError:
+        address = None
+    if address is not None and address.version == 6:
+        names = {f"[{host.lower()}]"}
+    if address is not None and address.is_loopback:
+        names.add("localhost")
+    return frozenset(f"{name}:{port}" for name in names)
+
+
+def create_server(
+    session_manager, host="127.0.0.1", port=8765, unix_socket=None, token=None
+):
+    """
+    Return an HTTP server bound to ``host:port`` or to ``unix_socket``.
+
+    Clients authenticate with ``token`` (``server.auth_token``), which is
+    generated when not given.
+    """
+    if unix_socket:
+        if os.path.exists(unix_socket):
+            os.unlink(unix_socket)
+        server = _UnixHTTPServer(unix_socket, SessionRequestHandler)
+        os.chmod(unix_socket, 0o600)
+        # No browser reaches a Unix socket; any Host header is fine
+        server.allowed_hosts = None
+    else:
+        server = ThreadingHTTPServer((host, port), SessionRequestHandler)
+        server.daemon_threads = True
+        server.allowed_hosts = _allowed_hosts(host, server.server_address[1])
+    server.session_manager = session_manager
+    server.auth_token = token or secrets.token_urlsafe(32)
+    server.verbose = False
+    return server
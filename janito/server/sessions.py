@@ -0,0 +1,238 @@
+"""
+Session management for ``janito serve``.
+
+A :class:`SessionManager` hosts many :class:`AgentSession` objects in one
+process. Every session owns an :class:`~janito.llm.async_agent.AsyncLLMAgent`
+and a :class:`~janito.tools.tool_context.ToolContext` (workdir and permission
+mask), while provider clients, compiled tool schemas, the tool registry and
+the tool thread pool are shared. All agents run on a single asyncio event loop
+owned by the manager; callers on other threads (e.g. HTTP handler threads) use
+the blocking methods, which submit coroutines to that loop.
+"""
+
+import asyncio
+import os
+import threading
+import time
+import uuid
+
+from janito.driver_events import RequestFinished, ResponseReceived
+from janito.tools.tool_base import ToolPermissions
+from janito.tools.tool_context import ToolContext, use_tool_context
+
+
+class SessionError(Exception):
+    """Raised for invalid session requests (bad workdir or permissions)."""
+
+
+class UnknownSessionError(SessionError):
+    """Raised when a session id does not exist (or was deleted)."""
+
+
+def parse_permissions(value, default=None):
+    """Convert ``"rwx"``-style strings, dicts or ToolPermissions to ToolPermissions."""
+    if value is None:
+        return default
+    if isinstance(value, ToolPermissions):
+        return value
+    if isinstance(value, str):
+        unknown = set(value) - set("rwx")
+        if unknown:
+            raise SessionError(
+                f"Invalid permissions '{value}': use a combination of 'r', 'w' and 'x'."
+            )
+        return ToolPermissions(
+            read="r" in value, write="w" in value, execute="x" in value
+        )
+    if isinstance(value, dict):
+        return ToolPermissions(
+            read=bool(value.get("read")),
+            write=bool(value.get("write")),
+            execute=bool(value.get("execute")),
+        )
+    raise SessionError(f"Invalid permissions value: {value!r}")
+
+
+def format_permissions(permissions):
+    if permissions is None:
+        return ""
+    return (
+        ("r" if permissions.read else "")
+        + ("w" if permissions.write else "")
+        + ("x" if permissions.execute else "")
+    )
+
+
+class AgentSession:
+    """One conversation: an async agent bound to its own workdir and permissions."""
+
+    def __init__(self, session_id, agent, context, profile=None, role=None):
+        self.id = session_id
+        self.agent = agent
+        self.context = context
+        self.profile = profile
+        self.role = role
+        self.created_at = time.time()
+        self.last_used = self.created_at
+        self.turns = 0
+        self._lock = asyncio.Lock()
+        self._task = None
+
+    @property
+    def busy(self):
+        return self._lock.locked()
+
+    async def chat(self, prompt):
+        """Run one chat turn in this session's tool context; turns are serialized."""
+        async with self._lock:
+            self._task = asyncio.current_task()
+            try:
+                with use_tool_context(self.context):
+                    event = await self.agent.chat(prompt)
+            finally:
+                self._task = None
+            self.turns += 1
+            self.last_used = time.time()
+            return _event_to_result(event)
+
+    def cancel(self):
+        if self._task is not None:
+            self._task.cancel()
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "workdir": self.context.workdir,
+            "permissions": format_permissions(self.context.allowed_permissions),
+            "profile": self.profile,
+            "role": self.role,
+            "turns": self.turns,
+            "busy": self.busy,
+            "created_at": self.created_at,
+            "last_used": self.last_used,
+        }
+
+
+def _event_to_result(event):
+    if isinstance(event, ResponseReceived):
+        content = "".join(
+            part.content
+            for part in event.parts or []
+            if isinstance(getattr(part, "content", None), str)
+        )
+        usage = (event.metadata or {}).get("usage")
+        if hasattr(usage, "model_dump"):
+            usage = usage.model_dump()
+        elif usage is not None and not isinstance(usage, dict):
+            usage = vars(usage)
+        return {"status": "success", "content": content, "usage": usage}
+    if isinstance(event, RequestFinished):
+        status = getattr(event.status, "value", event.status)
+        return {
+            "status": status,
+            "content": None,
+            "error": event.error or event.reason,
+        }
+    return {"status": "empty", "content": None}
+
+
+class SessionManager:
+    """
+    Creates, runs and disposes agent sessions on a shared event loop.
+
+    ``agent_factory(profile=..., role=..., allowed_permissions=...)`` must return
+    an :class:`AsyncLLMAgent`; it is invoked with the session's ToolContext bound.
+    Requested session permissions are capped by ``max_permissions``.
+    """
+
+    def __init__(
+        self,
+        agent_factory,
+        max_permissions=None,
+        default_profile=None,
+        default_role=None,
+    ):
+        self.agent_factory = agent_factory
+        self.max_permissions = max_permissions or ToolPermissions(
+            read=True, write=True, execute=True
+        )
+        self.default_profile = default_profile
+        self.default_role = default_role
+        self._sessions = {}
+        self._sessions_lock = threading.Lock()
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="janito-serve-loop", daemon=True
+        )
+        self._thread.start()
+
+    # ------------------------------------------------------------------
+    # Session lifecycle
+    # ------------------------------------------------------------------
+    def create_session(self, workdir, permissions=None, profile=None, role=None):
+        if not workdir or not os.path.isdir(workdir):
+            raise SessionError(f"Workdir does not exist: {workdir!r}")
+        requested = parse_permissions(permissions, default=self.max_permissions)
+        allowed = ToolPermissions(
+            read=requested.read and self.max_permissions.read,
+            write=requested.write and self.max_permissions.write,
+            execute=requested.execute and self.max_permissions.execute,
+        )
+        context = ToolContext(workdir=workdir, allowed_permissions=allowed)
+        profile = profile or self.default_profile
+        role = role or self.default_role
+        # Agent construction renders the system prompt and validates tool
+        # schemas, both of which depend on the session permissions.
+        with use_tool_context(context):
+            agent = self.agent_factory(
+                profile=profile, role=role, allowed_permissions=allowed
+            )
+        session = AgentSession(
+            uuid.uuid4().hex, agent, context, profile=profile, role=role
+        )
+        with self._sessions_lock:
+            self._sessions[session.id] = session
+        return session
+
+    def get_session(self, session_id):
+        with self._sessions_lock:
+            session = self._sessions.get(session_id)
+        if session is None:
+            raise UnknownSessionError(f"Unknown session: {session_id}")
+        return session
+
+    def list_sessions(self):
+        with self._sessions_lock:
+            return list(self._sessions.values())
+
+    def delete_session(self, session_id):
+        with self._sessions_lock:
+            session = self._sessions.pop(session_id, None)
+        if session is None:
+            raise UnknownSessionError(f"Unknown session: {session_id}")
+        self._loop.call_soon_threadsafe(session.cancel)
+        from janito.tools.bash_session import close_bash_session
+        from janito.tools.jobs import close_job_table
+
+        close_bash_session(id(session.context))
+        close_job_table(id(session.context))
+        return session
+
+    # ------------------------------------------------------------------
+    # Execution
+    # ------------------------------------------------------------------
+    def chat(self, session_id, prompt, timeout=None):
+        """Run a chat turn from any thread and return its result dict."""
+        session = self.get_session(session_id)
+        future = asyncio.run_coroutine_threadsafe(session.chat(prompt), self._loop)
+        return future.result(timeout)
+
+    def shutdown(self):
+        for session in self.list_sessions():
+            self._loop.call_soon_threadsafe(session.cancel)
+        with self._sessions_lock:
+            self._sessions.clear()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+        if not self._loop.is_running():
+            self._loop.close()
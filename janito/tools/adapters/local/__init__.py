@@ -1,30 +1,6 @@
 from .adapter import LocalToolsAdapter
+from .manifest import TOOL_MODULES, load_tool_manifest
 
-from .ask_user import AskUserTool
-from .copy_file import CopyFileTool
-from .create_directory import CreateDirectoryTool
-from .create_file import CreateFileTool
-from .fetch_url import FetchUrlTool
-from .find_files import FindFilesTool
-from .view_file import ViewFileTool
-from .read_files import ReadFilesTool
-from .move_file import MoveFileTool
-from .open_url import OpenUrlTool
-from .open_html_in_browser import OpenHtmlInBrowserTool
-from .python_code_run import PythonCodeRunTool
-from .python_command_run import PythonCommandRunTool
-from .python_file_run import PythonFileRunTool
-from .remove_directory import RemoveDirectoryTool
-from .remove_file import RemoveFileTool
-from .replace_text_in_file import ReplaceTextInFileTool
-from .run_bash_command import RunBashCommandTool
-from .run_powershell_command import RunPowershellCommandTool
-from .get_file_outline.core import GetFileOutlineTool
-from .get_file_outline.search_outline import SearchOutlineTool
-from .search_text.core import SearchTextTool
-from .validate_file_syntax.core import ValidateFileSyntaxTool
-
-from janito.tools.tool_base import ToolPermissions
 import os
 from janito.tools.permissions import get_global_allowed_permissions
 
@@ -36,32 +12,19 @@ def get_local_tools_adapter(workdir=None):
     return LocalToolsAdapter(workdir=workdir or os.getcwd())
 
 
-# Register tools
-for tool_class in [
-    AskUserTool,
-    CopyFileTool,
-    CreateDirectoryTool,
-    CreateFileTool,
-    FetchUrlTool,
-    FindFilesTool,
-    ViewFileTool,
-    ReadFilesTool,
-    MoveFileTool,
-    OpenUrlTool,
-    OpenHtmlInBrowserTool,
-    PythonCodeRunTool,
-    PythonCommandRunTool,
-    PythonFileRunTool,
-    RemoveDirectoryTool,
-    RemoveFileTool,
-    ReplaceTextInFileTool,
-    RunBashCommandTool,
-    RunPowershellCommandTool,
-    GetFileOutlineTool,
-    SearchOutlineTool,
-    SearchTextTool,
-    ValidateFileSyntaxTool,
-]:
-    local_tools_adapter.register_tool(tool_class)
+# Register tools from the static manifest; each tool module is imported on
+# first execution (see janito.tools.adapters.local.manifest)
+for tool_spec in load_tool_manifest():
+    local_tools_adapter.register_lazy_tool(tool_spec)
+
+_TOOL_CLASS_MODULES = {class_name: module for module, class_name in TOOL_MODULES}
+
+
+def __getattr__(name):
+    # Backward compatible access to tool classes, e.g.
+    # ``from janito.tools.adapters.local import FindFilesTool``
+    if name in _TOOL_CLASS_MODULES:
+        from importlib import import_module
 
-# DEBUG: Print registered tools at startup
+        return getattr(import_module(_TOOL_CLASS_MODULES[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
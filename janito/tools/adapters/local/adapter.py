@@ -1,5 +1,7 @@
+import threading
 from typing import Type, Dict, Any
 from janito.tools.tools_adapter import ToolsAdapterBase as ToolsAdapter
+from janito.tools.tool_schema_cache import invalidate_tool_schemas
 
 
 class LocalToolsAdapter(ToolsAdapter):
@@ -15,6 +17,12 @@ class LocalToolsAdapter(ToolsAdapter):
 
     Apart from registration/lookup helpers the class derives all execution
     logic from :class:`janito.tools.tools_adapter.ToolsAdapterBase`.
+
+    Tools registered from the static manifest (:meth:`register_lazy_tool`)
+    are listed, permission-filtered and described to the LLM from their
+    :class:`~janito.tools.adapters.local.manifest.ToolSpec`; the tool module
+    is imported and the tool instantiated on first :meth:`get_tool`, and only
+    if the current permissions allow the tool.
     """
 
     def __init__(self, tools=None, event_bus=None, workdir=None):
@@ -33,7 +41,9 @@ class LocalToolsAdapter(ToolsAdapter):
             receive security violation or execution events automatically.
         workdir : str | pathlib.Path, optional
             Base directory that path-security checks will allow.  Defaults to
-            the current working directory at the time of instantiation.
+            the current working directory at the time of instantiation.  The
+            process working directory is left untouched; sessions that need a
+            different workdir bind a :class:`janito.tools.tool_context.ToolContext`.
         """
         # Fall back to the global event bus so that ReportEvents emitted from
         # the tools adapter (for example path-security violations) are visible
@@ -45,8 +55,10 @@ class LocalToolsAdapter(ToolsAdapter):
 
         super().__init__(tools=tools, event_bus=event_bus)
 
-        # Internal registry structure: { tool_name: {"class": cls, "instance": obj, "function": obj.run} }
+        # Internal registry structure: { tool_name: {"class": cls, "instance": obj, "function": obj.run, "spec": ToolSpec|None} }
+        # Lazy entries keep class/instance/function at None until first use.
         self._tools: Dict[str, Dict[str, Any]] = {}
+        self._load_lock = threading.Lock()
 
         import os
 
@@ -54,9 +66,6 @@ class LocalToolsAdapter(ToolsAdapter):
         # Ensure *some* workdir is set – fallback to CWD.
         if not self.workdir:
             self.workdir = os.getcwd()
-        # Normalise by changing the actual process working directory for
-        # consistency with many file-system tools.
-        os.chdir(self.workdir)
 
         if tools:
             for tool in tools:
@@ -82,11 +91,45 @@ class LocalToolsAdapter(ToolsAdapter):
             "function": instance.run,
             "class": tool_class,
             "instance": instance,
+            "spec": None,
+        }
+        self._compile_validator(tool_name, instance)
+        invalidate_tool_schemas()
+
+    def register_lazy_tool(self, spec):
+        """Register a tool from its manifest ToolSpec without importing it."""
+        if spec.tool_name in self._tools:
+            raise ValueError(f"Tool '{spec.tool_name}' is already registered.")
+        self._tools[spec.tool_name] = {
+            "function": None,
+            "class": None,
+            "instance": None,
+            "spec": spec,
         }
+        invalidate_tool_schemas()
+
+    def _load_tool(self, entry):
+        """Import and instantiate a lazily registered tool (once)."""
+        with self._load_lock:
+            if entry["instance"] is None:
+                tool_class = entry["spec"].load_class()
+                instance = tool_class()
+                entry["class"] = tool_class
+                entry["function"] = instance.run
+                entry["instance"] = instance
+                self._compile_validator(entry["spec"].tool_name, instance)
+        return entry["instance"]
+
+    @staticmethod
+    def _describe(entry):
+        """Object carrying tool_name/permissions for an entry, loaded or not."""
+        return entry["instance"] if entry["instance"] is not None else entry["spec"]
 
     def unregister_tool(self, name: str):
         if name in self._tools:
             del self._tools[name]
+            self._validators.pop(name, None)
+            invalidate_tool_schemas()
 
     def disable_tool(self, name: str):
         self.unregister_tool(name)
@@ -97,37 +140,44 @@ class LocalToolsAdapter(ToolsAdapter):
     def get_tool(self, name: str):
         from janito.tools.disabled_tools import is_tool_disabled
 
-        if name in self._tools and not is_tool_disabled(name):
-            return self._tools[name]["instance"]
-        return None
-
-    def list_tools(self):
+        entry = self._tools.get(name)
+        if entry is None or is_tool_disabled(name):
+            return None
+        if entry["instance"] is None:
+            # Never import a tool the current permissions exclude
+            if not self.is_tool_allowed(entry["spec"]):
+                return None
+            return self._load_tool(entry)
+        return entry["instance"]
+
+    def _enabled_entries(self):
         from janito.tools.disabled_tools import is_tool_disabled
 
         return [
-            name
+            (name, entry)
             for name, entry in self._tools.items()
-            if self.is_tool_allowed(entry["instance"]) and not is_tool_disabled(name)
+            if self.is_tool_allowed(self._describe(entry))
+            and not is_tool_disabled(name)
         ]
 
-    def get_tool_classes(self):
-        from janito.tools.disabled_tools import is_tool_disabled
+    def list_tools(self):
+        return [name for name, _ in self._enabled_entries()]
 
+    def get_tool_classes(self):
+        """
+        Return the enabled tool classes. Manifest tools are returned as their
+        ToolSpec (loaded or not), so schemas come from the manifest and the
+        schema cache key does not change when a tool is first used.
+        """
         return [
-            entry["class"]
-            for entry in self._tools.values()
-            if self.is_tool_allowed(entry["instance"])
-            and not is_tool_disabled(entry["instance"].tool_name)
+            entry["spec"] or entry["class"] for _, entry in self._enabled_entries()
         ]
 
     def get_tools(self):
-        from janito.tools.disabled_tools import is_tool_disabled
-
+        """Return the enabled tool instances (imports lazily registered tools)."""
         return [
-            entry["instance"]
-            for entry in self._tools.values()
-            if self.is_tool_allowed(entry["instance"])
-            and not is_tool_disabled(entry["instance"].tool_name)
+            self._load_tool(entry) if entry["instance"] is None else entry["instance"]
+            for _, entry in self._enabled_entries()
         ]
 
     # ------------------------------------------------------------------
@@ -148,7 +198,9 @@ class LocalToolsAdapter(ToolsAdapter):
             "function": tool.run,
             "class": tool.__class__,
             "instance": tool,
+            "spec": None,
         }
+        self._compile_validator(tool_name, tool)
 
 
 # -------------------------------------------------------------------------
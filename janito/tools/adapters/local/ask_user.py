@@ -30,9 +30,14 @@ class AskUserTool(ToolBase):
 
     permissions = ToolPermissions(read=True)
     tool_name = "ask_user"
+    # Prompts share the terminal and stdin: never ask two questions at once
+    parallel_safe = False
 
     def run(self, question: str) -> str:
+        from janito.event_bus import event_bus
 
+        # Pending output of an asynchronous reporter goes above the question
+        event_bus.flush()
         print()  # Print an empty line before the question panel
         rich_print(Panel.fit(question, title=tr("Question"), style="cyan"))
 
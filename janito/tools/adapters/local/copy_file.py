@@ -4,8 +4,10 @@ from typing import List, Union
 from janito.tools.adapters.local.adapter import register_local_tool
 from janito.tools.tool_base import ToolBase, ToolPermissions
 from janito.tools.tool_utils import display_path
+from janito.tools.tool_context import resolve_path
 from janito.report_events import ReportAction
 from janito.i18n import tr
+from janito.tools.file_cache import invalidate_file
 
 
 @register_local_tool
@@ -24,9 +26,10 @@ class CopyFileTool(ToolBase):
 
     permissions = ToolPermissions(read=True, write=True)
     tool_name = "copy_file"
+    multi_path_arguments = ("sources",)
 
     def run(self, sources: str, target: str, overwrite: bool = False) -> str:
-        source_list = [src for src in sources.split() if src]
+        source_list = [resolve_path(src) for src in sources.split() if src]
         messages = []
         if len(source_list) > 1:
             if not os.path.isdir(target):
@@ -67,6 +70,7 @@ class CopyFileTool(ToolBase):
         try:
             os.makedirs(os.path.dirname(dst), exist_ok=True)
             shutil.copy2(src, dst)
+            invalidate_file(dst)
             note = (
                 "\n⚠️ Overwrote existing file. (recommended only after reading the file to be overwritten)"
                 if (os.path.exists(dst) and overwrite)
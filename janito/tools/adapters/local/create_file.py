@@ -8,6 +8,7 @@ from janito.i18n import tr
 
 
 from janito.tools.adapters.local.validate_file_syntax.core import validate_file_syntax
+from janito.tools.file_cache import file_cache, invalidate_file
 
 
 @register_local_tool
@@ -35,8 +36,7 @@ class CreateFileTool(ToolBase):
         path = expanded_path
         if os.path.exists(path) and not overwrite:
             try:
-                with open(path, "r", encoding="utf-8", errors="replace") as f:
-                    existing_content = f.read()
+                existing_content = file_cache.read_text(path)
             except Exception as e:
                 existing_content = f"[Error reading file: {e}]"
             return tr(
@@ -63,6 +63,7 @@ class CreateFileTool(ToolBase):
             )
         with open(path, "w", encoding="utf-8", errors="replace") as f:
             f.write(content)
+        invalidate_file(path)
         new_lines = content.count("\n") + 1 if content else 0
         self.report_success(
             tr("✅ {new_lines} lines", new_lines=new_lines), ReportAction.CREATE
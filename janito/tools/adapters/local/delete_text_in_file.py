@@ -4,6 +4,7 @@ from janito.tools.adapters.local.adapter import register_local_tool
 from janito.i18n import tr
 import shutil
 from janito.tools.adapters.local.validate_file_syntax.core import validate_file_syntax
+from janito.tools.file_cache import file_cache, invalidate_file
 
 
 @register_local_tool
@@ -70,8 +71,7 @@ class DeleteTextInFileTool(ToolBase):
             return tr("Error deleting text: {error}", error=e)
 
     def _read_file_content(self, path):
-        with open(path, "r", encoding="utf-8", errors="replace") as f:
-            return f.read()
+        return file_cache.read_text(path)
 
     def _find_marker_blocks(self, content, start_marker, end_marker):
         """Find all blocks between start_marker and end_marker, return count and starting line numbers."""
@@ -117,6 +117,7 @@ class DeleteTextInFileTool(ToolBase):
     def _write_file_content(self, path, content):
         with open(path, "w", encoding="utf-8", errors="replace") as f:
             f.write(content)
+        invalidate_file(path)
 
     def _report_success(self, match_lines):
         if match_lines:
@@ -0,0 +1,229 @@
+import os
+import stat
+import tempfile
+
+from janito.tools.tool_base import ToolBase, ToolPermissions
+from janito.report_events import ReportAction
+from janito.tools.adapters.local.adapter import register_local_tool
+from janito.tools.adapters.local.validate_file_syntax.core import validate_file_syntax
+from janito.tools.file_cache import file_cache, invalidate_file
+from janito.tools.tool_context import resolve_path
+from janito.tools.tool_utils import display_path, pluralize
+from janito.i18n import tr
+
+
+class EditError(ValueError):
+    """An edit that cannot be applied; no file is written."""
+
+
+def find_all(content, text, start=0, end=None):
+    """Offsets of the non-overlapping occurrences of ``text`` (as counted by str.count)."""
+    end = len(content) if end is None else end
+    offsets = []
+    idx = content.find(text, start, end)
+    while idx != -1:
+        offsets.append(idx)
+        idx = content.find(text, idx + len(text), end)
+    return offsets
+
+
+def line_numbers(content, offsets):
+    """1-based line numbers of ascending ``offsets``, in one pass over ``content``."""
+    numbers = []
+    line = 1
+    previous = 0
+    for offset in offsets:
+        line += content.count("\n", previous, offset)
+        numbers.append(line)
+        previous = offset
+    return numbers
+
+
+def apply_replace(content, search_text, replacement_text, replace_all=False):
+    """Return (new_content, match_lines) or raise EditError, like replace_text_in_file."""
+    if not search_text:
+        raise EditError(tr("search_text is empty"))
+    offsets = find_all(content, search_text)
+    if not offsets:
+        raise EditError(tr("search text not found"))
+    if len(offsets) > 1 and not replace_all:
+        raise EditError(
+            tr(
+                "search text is not unique ({count} matches); add surrounding lines or set replace_all",
+                count=len(offsets),
+            )
+        )
+    return (
+        content.replace(search_text, replacement_text),
+        line_numbers(content, offsets),
+    )
+
+
+def apply_delete(content, start_marker, end_marker):
+    """Delete every block from start_marker to end_marker (inclusive), like delete_text_in_file."""
+    if not start_marker or not end_marker:
+        raise EditError(tr("start_marker and end_marker must not be empty"))
+    parts = []
+    starts = []
+    pos = 0
+    while True:
+        start = content.find(start_marker, pos)
+        if start == -1:
+            break
+        end = content.find(end_marker, start + len(start_marker))
+        if end == -1:
+            break
+        parts.append(content[pos:start])
+        starts.append(start)
+        pos = end + len(end_marker)
+    if not starts:
+        raise EditError(tr("no blocks found between markers"))
+    parts.append(content[pos:])
+    return "".join(parts), line_numbers(content, starts)
+
+
+def apply_edit(content, edit):
+    """Apply one edit object (see EditFilesTool) to ``content``."""
+    if "search_text" in edit:
+        return apply_replace(
+            content,
+            edit["search_text"],
+            edit.get("replacement_text", ""),
+            bool(edit.get("replace_all", False)),
+        )
+    if "start_marker" in edit or "end_marker" in edit:
+        return apply_delete(
+            content, edit.get("start_marker"), edit.get("end_marker")
+        )
+    raise EditError(tr("expected search_text or start_marker/end_marker"))
+
+
+def write_atomic(path, content):
+    """
+    Write ``content`` to a temporary file next to ``path`` and rename it over ``path``.
+
+    A symlink is resolved first, so the target file is replaced and the link kept.
+    """
+    target = os.path.realpath(path)
+    directory = os.path.dirname(target)
+    mode = stat.S_IMODE(os.stat(target).st_mode)
+    fd, tmp_path = tempfile.mkstemp(
+        prefix=f".{os.path.basename(target)}.", suffix=".tmp", dir=directory
+    )
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", errors="replace") as f:
+            f.write(content)
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, target)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    finally:
+        invalidate_file(path)
+        if target != path:
+            invalidate_file(target)
+
+
+@register_local_tool
+class EditFilesTool(ToolBase):
+    """
+    Apply an ordered batch of replace and delete edits to one or more files; each file is read once, written once (atomically) and validated once. If any edit fails, no file is changed.
+
+    Args:
+        edits (list[dict]): Edits applied in order; later edits to a file see the result of earlier ones. A replace edit is {"path", "search_text", "replacement_text", "replace_all" (optional, default false)}; without replace_all the search text must occur exactly once. A delete edit is {"path", "start_marker", "end_marker"} and removes every block from start_marker to end_marker, inclusive. Search text and markers are exact strings, including indentation.
+
+    Returns:
+        str: One status line per file with the lines where edits matched and the net line change, followed by its syntax validation result, or the failing edit when nothing was written.
+    """
+
+    permissions = ToolPermissions(read=True, write=True)
+    tool_name = "edit_files"
+
+    def run(self, edits: list[dict]) -> str:
+        if not edits:
+            return tr("❗ No edits given.")
+        # Edits are grouped per file, whatever spelling of its path they use:
+        # real path -> the first spelling, which names the file in the output
+        file_paths = {}
+        edit_paths = []
+        for edit in edits:
+            path = edit.get("path") if isinstance(edit, dict) else None
+            if not path or not isinstance(path, str):
+                return tr("❗ Every edit needs a path.")
+            real_path = os.path.realpath(resolve_path(path))
+            edit_paths.append(file_paths.setdefault(real_path, path))
+        paths = list(file_paths.values())
+        self.report_action(
+            tr(
+                "📝 Edit {files} ({count} {edit_word})",
+                files=", ".join(display_path(path) for path in paths),
+                count=len(edits),
+                edit_word=pluralize("edit", len(edits)),
+            ),
+            ReportAction.UPDATE,
+        )
+        try:
+            originals = {
+                path: file_cache.read_text(resolve_path(path)) for path in paths
+            }
+        except OSError as e:
+            self.report_error(tr(" ❌ {error}", error=e), ReportAction.UPDATE)
+            return tr("❗ No files were changed: {error}", error=e)
+
+        contents = dict(originals)
+        matches = {path: [] for path in paths}
+        for index, (edit, path) in enumerate(zip(edits, edit_paths), 1):
+            try:
+                contents[path], lines = apply_edit(contents[path], edit)
+            except (EditError, TypeError) as e:
+                self.report_error(
+                    tr(" ❌ edit {index}: {error}", index=index, error=e),
+                    ReportAction.UPDATE,
+                )
+                return tr(
+                    "❗ No files were changed: edit {index} ({disp_path}): {error}",
+                    index=index,
+                    disp_path=display_path(path),
+                    error=e,
+                )
+            matches[path].append(lines)
+
+        changed = [path for path in paths if contents[path] != originals[path]]
+        try:
+            for path in changed:
+                write_atomic(resolve_path(path), contents[path])
+        except OSError as e:
+            self.report_error(tr(" ❌ {error}", error=e), ReportAction.UPDATE)
+            return tr("Error writing {path}: {error}", path=path, error=e)
+
+        self.report_success(
+            tr(
+                " ✅ {count} {file_word} changed",
+                count=len(changed),
+                file_word=pluralize("file", len(changed)),
+            ),
+            ReportAction.UPDATE,
+        )
+        return "\n".join(
+            self._file_summary(path, originals[path], contents[path], matches[path])
+            for path in paths
+        )
+
+    def _file_summary(self, path, original, content, matches):
+        delta = content.count("\n") - original.count("\n")
+        lines = "; ".join(", ".join(str(line) for line in edit) for edit in matches)
+        summary = tr(
+            "✅ {path}: {count} {edit_word} at lines {lines} ({delta:+d} lines).",
+            path=path,
+            count=len(matches),
+            edit_word=pluralize("edit", len(matches)),
+            lines=lines,
+            delta=delta,
+        )
+        if content == original:
+            return summary + " " + tr("No changes made.")
+        validation_result = validate_file_syntax(resolve_path(path))
+        return summary + (f"\n{validation_result}" if validation_result else "")
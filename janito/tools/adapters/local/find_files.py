@@ -2,7 +2,9 @@ from janito.tools.tool_base import ToolBase, ToolPermissions
 from janito.report_events import ReportAction
 from janito.tools.adapters.local.adapter import register_local_tool
 from janito.tools.tool_utils import pluralize, display_path
+from janito.tools.tool_context import resolve_path
 from janito.dir_walk_utils import walk_dir_with_gitignore
+from janito.parallel_scan import scan_workers
 from janito.i18n import tr
 import fnmatch
 import os
@@ -29,6 +31,7 @@ class FindFilesTool(ToolBase):
 
     permissions = ToolPermissions(read=True)
     tool_name = "find_files"
+    multi_path_arguments = ("paths",)
 
     def _match_directories(self, root, dirs, pat):
         dir_output = set()
@@ -69,6 +72,7 @@ class FindFilesTool(ToolBase):
             directory,
             max_depth=max_depth,
             include_gitignored=include_gitignored,
+            workers=scan_workers(),
         ):
             for pat in patterns:
                 if pat.endswith("/") or pat.endswith("\\"):
@@ -119,7 +123,7 @@ class FindFilesTool(ToolBase):
             return tr("Warning: Empty file pattern provided. Operation skipped.")
         patterns = pattern.split()
         results = []
-        for directory in paths.split():
+        for directory in map(resolve_path, paths.split()):
             disp_path = display_path(directory)
             depth_msg = (
                 tr(" (max depth: {max_depth})", max_depth=max_depth)
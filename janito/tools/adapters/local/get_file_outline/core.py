@@ -7,6 +7,7 @@ import os
 from janito.tools.tool_base import ToolBase, ToolPermissions
 from janito.report_events import ReportAction
 from janito.tools.tool_utils import display_path, pluralize
+from janito.tools.line_index import count_lines, read_line_range
 from janito.i18n import tr
 
 from janito.tools.adapters.local.adapter import register_local_tool as register_tool
@@ -34,8 +35,10 @@ class GetFileOutlineTool(ToolBase):
                 ReportAction.READ,
             )
             ext = os.path.splitext(path)[1].lower()
-            with open(path, "r", encoding="utf-8", errors="replace") as f:
-                lines = f.readlines()
+            if ext not in (".py", ".md", ".java"):
+                # Only the line count is needed: use the line index, no decoding
+                return self._outline_default(count_lines(path))
+            lines, _ = read_line_range(path)
             return self._outline_by_extension(ext, lines)
         except Exception as e:
             self.report_error(
@@ -106,13 +109,16 @@ class GetFileOutlineTool(ToolBase):
                 + table
             )
         else:
-            outline_type = "default"
-            self.report_success(
-                tr("✅ Outlined {count} items", count=len(lines)),
-                ReportAction.READ,
-            )
-            return tr(
-                "Outline: {count} lines ({outline_type})\nFile has {count} lines.",
-                count=len(lines),
-                outline_type=outline_type,
-            )
+            return self._outline_default(len(lines))
+
+    def _outline_default(self, line_count):
+        outline_type = "default"
+        self.report_success(
+            tr("✅ Outlined {count} items", count=line_count),
+            ReportAction.READ,
+        )
+        return tr(
+            "Outline: {count} lines ({outline_type})\nFile has {count} lines.",
+            count=line_count,
+            outline_type=outline_type,
+        )
@@ -0,0 +1,42 @@
+from janito.tools.tool_base import ToolBase, ToolPermissions
+from janito.report_events import ReportAction
+from janito.tools.adapters.local.adapter import register_local_tool
+from janito.tools.jobs import JobError, get_job_table
+from janito.i18n import tr
+
+
+@register_local_tool
+class JobStatusTool(ToolBase):
+    """
+    Show the state and resource usage of background jobs started with run_bash_command(background=True).
+
+    Args:
+        job_id (int, optional): Job to show. If omitted, all jobs of this session are listed.
+
+    Returns:
+        str: One line per job with its state (running, exit code), run time, output size, CPU time and peak memory once finished, and command.
+    """
+
+    permissions = ToolPermissions(execute=True)
+    tool_name = "job_status"
+    parallel_safe = True
+
+    def run(self, job_id: int = None) -> str:
+        table = get_job_table()
+        if job_id is None:
+            jobs = table.jobs()
+        else:
+            try:
+                jobs = [table.get(job_id)]
+            except JobError as e:
+                self.report_error(tr("❌ {error}", error=e), ReportAction.READ)
+                return tr("❗ {error}", error=e)
+        self.report_action(tr("📋 Background jobs"), ReportAction.READ)
+        if not jobs:
+            self.report_success(tr(" ✅ none"), ReportAction.READ)
+            return tr("No background jobs.")
+        running = sum(job.running for job in jobs)
+        self.report_success(
+            tr(" ✅ {running} running", running=running), ReportAction.READ
+        )
+        return "\n".join(job.describe() for job in jobs)
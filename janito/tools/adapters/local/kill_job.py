@@ -0,0 +1,39 @@
+from janito.tools.tool_base import ToolBase, ToolPermissions
+from janito.report_events import ReportAction
+from janito.tools.adapters.local.adapter import register_local_tool
+from janito.tools.jobs import JobError, get_job_table
+from janito.i18n import tr
+
+
+@register_local_tool
+class KillJobTool(ToolBase):
+    """
+    Stop a background job: its process group gets SIGTERM and, if still running after 3 seconds, SIGKILL.
+
+    Args:
+        job_id (int): Job id returned by run_bash_command(background=True).
+
+    Returns:
+        str: The job status line after stopping it.
+    """
+
+    permissions = ToolPermissions(execute=True)
+    tool_name = "kill_job"
+
+    def run(self, job_id: int) -> str:
+        try:
+            job = get_job_table().get(job_id)
+        except JobError as e:
+            self.report_error(tr("❌ {error}", error=e), ReportAction.EXECUTE)
+            return tr("❗ {error}", error=e)
+        self.report_action(
+            tr("🛑 Kill job {job_id}", job_id=job_id), ReportAction.EXECUTE
+        )
+        if not job.running:
+            self.report_warning(tr(" ℹ️ already finished"), ReportAction.EXECUTE)
+            return tr("Job already finished: {status}", status=job.describe())
+        job.kill()
+        self.report_success(
+            tr(" ✅ {status}", status=job.status()), ReportAction.EXECUTE
+        )
+        return job.describe()
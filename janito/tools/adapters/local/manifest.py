@@ -0,0 +1,132 @@
+"""
+Static manifest of the built-in local tools.
+
+``tool_manifest.json`` records, for every tool, the module and class that
+implement it, its registration name, permissions, scheduling hints and the
+function schema sent to the LLM. The local adapter registers the tools from
+this manifest and only imports a tool module when the tool is first executed
+(and never when the session's permissions exclude it), so starting a session
+does not pay for ``requests``, ``bs4``, ``prompt_toolkit`` and the other
+dependencies of tools that may never run.
+
+After adding a tool or changing a tool's signature, docstring or permissions,
+regenerate the manifest::
+
+    python tools/update_tool_manifest.py
+
+``tests/test_lazy_tools.py`` fails when the manifest is out of date.
+"""
+
+import json
+import os
+from importlib import import_module
+
+from janito.tools.tool_base import ToolPermissions
+
+MANIFEST_PATH = os.path.join(os.path.dirname(__file__), "tool_manifest.json")
+
+# (module, class name) of every built-in tool, in registration order
+TOOL_MODULES = [
+    ("janito.tools.adapters.local.ask_user", "AskUserTool"),
+    ("janito.tools.adapters.local.copy_file", "CopyFileTool"),
+    ("janito.tools.adapters.local.create_directory", "CreateDirectoryTool"),
+    ("janito.tools.adapters.local.create_file", "CreateFileTool"),
+    ("janito.tools.adapters.local.edit_files", "EditFilesTool"),
+    ("janito.tools.adapters.local.fetch_url", "FetchUrlTool"),
+    ("janito.tools.adapters.local.find_files", "FindFilesTool"),
+    ("janito.tools.adapters.local.job_status", "JobStatusTool"),
+    ("janito.tools.adapters.local.kill_job", "KillJobTool"),
+    ("janito.tools.adapters.local.view_file", "ViewFileTool"),
+    ("janito.tools.adapters.local.read_files", "ReadFilesTool"),
+    ("janito.tools.adapters.local.move_file", "MoveFileTool"),
+    ("janito.tools.adapters.local.open_url", "OpenUrlTool"),
+    ("janito.tools.adapters.local.open_html_in_browser", "OpenHtmlInBrowserTool"),
+    ("janito.tools.adapters.local.python_code_run", "PythonCodeRunTool"),
+    ("janito.tools.adapters.local.read_job_output", "ReadJobOutputTool"),
+    ("janito.tools.adapters.local.python_command_run", "PythonCommandRunTool"),
+    ("janito.tools.adapters.local.python_file_run", "PythonFileRunTool"),
+    ("janito.tools.adapters.local.remove_directory", "RemoveDirectoryTool"),
+    ("janito.tools.adapters.local.remove_file", "RemoveFileTool"),
+    ("janito.tools.adapters.local.replace_text_in_file", "ReplaceTextInFileTool"),
+    ("janito.tools.adapters.local.run_bash_command", "RunBashCommandTool"),
+    (
+        "janito.tools.adapters.local.run_powershell_command",
+        "RunPowershellCommandTool",
+    ),
+    ("janito.tools.adapters.local.get_file_outline.core", "GetFileOutlineTool"),
+    (
+        "janito.tools.adapters.local.get_file_outline.search_outline",
+        "SearchOutlineTool",
+    ),
+    ("janito.tools.adapters.local.search_text.core", "SearchTextTool"),
+    ("janito.tools.adapters.local.validate_file_syntax.core", "ValidateFileSyntaxTool"),
+    ("janito.tools.adapters.local.wait_for_job", "WaitForJobTool"),
+]
+
+
+class ToolSpec:
+    """
+    Stand-in for a tool class that has not been imported yet.
+
+    Exposes what the adapter and the schema cache need without importing the
+    tool module: ``tool_name``, ``permissions``, ``parallel_safe``,
+    ``multi_path_arguments`` and the function ``schema``.
+    """
+
+    def __init__(self, data):
+        self.module = data["module"]
+        self.class_name = data["class_name"]
+        self.__name__ = data["class_name"]
+        self.tool_name = data["tool_name"]
+        self.permissions = ToolPermissions(**data["permissions"])
+        self.parallel_safe = data.get("parallel_safe")
+        self.multi_path_arguments = tuple(data.get("multi_path_arguments") or ())
+        self.function_schema = data["schema"]
+
+    def load_class(self):
+        return getattr(import_module(self.module), self.class_name)
+
+    def __repr__(self):
+        return f"ToolSpec({self.tool_name!r}, {self.module}:{self.class_name})"
+
+
+_specs = None
+
+
+def load_tool_manifest():
+    """Return the ToolSpec list read from ``tool_manifest.json``."""
+    global _specs
+    if _specs is None:
+        with open(MANIFEST_PATH, "r", encoding="utf-8") as f:
+            _specs = [ToolSpec(entry) for entry in json.load(f)["tools"]]
+    return _specs
+
+
+def build_tool_manifest():
+    """Import every tool in TOOL_MODULES and describe it (used to regenerate the manifest)."""
+    from janito.providers.openai.schema_generator import OpenAISchemaGenerator
+
+    generator = OpenAISchemaGenerator()
+    tools = []
+    for module_name, class_name in TOOL_MODULES:
+        tool_class = getattr(import_module(module_name), class_name)
+        tools.append(
+            {
+                "tool_name": tool_class.tool_name,
+                "module": module_name,
+                "class_name": class_name,
+                "permissions": tool_class.permissions._asdict(),
+                "parallel_safe": tool_class.parallel_safe,
+                "multi_path_arguments": list(tool_class.multi_path_arguments),
+                "schema": generator.generate_schema(tool_class),
+            }
+        )
+    return {"tools": tools}
+
+
+def write_tool_manifest(path=MANIFEST_PATH):
+    data = build_tool_manifest()
+    with open(path, "w", encoding="utf-8", newline="\n") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+    return data
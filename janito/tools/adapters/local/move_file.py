@@ -5,6 +5,7 @@ from janito.tools.tool_utils import display_path
 from janito.tools.tool_base import ToolBase, ToolPermissions
 from janito.report_events import ReportAction
 from janito.i18n import tr
+from janito.tools.file_cache import invalidate_tree
 
 
 @register_local_tool
@@ -58,7 +59,9 @@ class MoveFileTool(ToolBase):
                 ),
                 ReportAction.UPDATE,
             )
+            invalidate_tree(src)
             shutil.move(src, dest)
+            invalidate_tree(dest)
             self.report_success(tr("✅ Move complete."))
             msg = tr("✅ Move complete.")
 
@@ -1,11 +1,13 @@
 import subprocess
 import os
 import sys
-import tempfile
 import threading
 from janito.tools.tool_base import ToolBase, ToolPermissions
 from janito.report_events import ReportAction
 from janito.tools.adapters.local.adapter import register_local_tool
+from janito.tools.tool_context import get_workdir
+from janito.tools.output_capture import CommandCapture
+from janito.tools.python_worker_pool import get_python_worker_pool, run_python_job
 from janito.i18n import tr
 
 
@@ -19,7 +21,7 @@ class PythonFileRunTool(ToolBase):
         timeout (int): Timeout in seconds for the command. Defaults to 60.
 
     Returns:
-        str: Output and status message, or file paths/line counts if output is large.
+        str: Return code and output; for large output, its head and tail plus file paths and line counts of the full stdout and stderr.
     """
 
     permissions = ToolPermissions(execute=True)
@@ -32,133 +34,96 @@ class PythonFileRunTool(ToolBase):
         )
         self.report_stdout("\n")
         try:
-            with (
-                tempfile.NamedTemporaryFile(
-                    mode="w+",
-                    prefix="python_file_stdout_",
-                    delete=False,
-                    encoding="utf-8",
-                ) as stdout_file,
-                tempfile.NamedTemporaryFile(
-                    mode="w+",
-                    prefix="python_file_stderr_",
-                    delete=False,
-                    encoding="utf-8",
-                ) as stderr_file,
-            ):
-                process = subprocess.Popen(
-                    [sys.executable, path],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
-                    bufsize=1,
-                    universal_newlines=True,
-                    encoding="utf-8",
-                    env={**os.environ, "PYTHONIOENCODING": "utf-8"},
-                )
-                stdout_lines, stderr_lines = self._stream_process_output(
-                    process, stdout_file, stderr_file
-                )
-                return_code = self._wait_for_process(process, timeout)
-                if return_code is None:
-                    return tr(
-                        "Code timed out after {timeout} seconds.", timeout=timeout
+            capture = CommandCapture(
+                "python_file_",
+                lambda chunk: self.report_stdout(chunk, ReportAction.EXECUTE),
+                lambda chunk: self.report_stderr(chunk, ReportAction.EXECUTE),
+            )
+            with capture:
+                pool = get_python_worker_pool()
+                if pool is not None:
+                    return_code = run_python_job(
+                        pool, {"mode": "file", "path": path}, timeout, capture
                     )
-                stdout_file.flush()
-                stderr_file.flush()
-                self.report_success(
-                    tr("✅ Return code {return_code}", return_code=return_code),
+                else:
+                    process = subprocess.Popen(
+                        [sys.executable, path],
+                        stdout=subprocess.PIPE,
+                        stderr=subprocess.PIPE,
+                        text=True,
+                        bufsize=1,
+                        universal_newlines=True,
+                        encoding="utf-8",
+                        env={**os.environ, "PYTHONIOENCODING": "utf-8"},
+                        cwd=get_workdir(),
+                    )
+                    threads = self._stream_process_output(process, capture)
+                    return_code = self._wait_for_process(process, timeout, threads)
+            if return_code is None:
+                self.report_error(
+                    tr("❌ Timed out after {timeout} seconds.", timeout=timeout),
                     ReportAction.EXECUTE,
                 )
-                return self._format_result(
-                    stdout_file.name, stderr_file.name, return_code
-                )
+                return tr("Code timed out after {timeout} seconds.", timeout=timeout)
+            self.report_success(
+                tr("✅ Return code {return_code}", return_code=return_code),
+                ReportAction.EXECUTE,
+            )
+            return self._format_result(capture, return_code)
         except Exception as e:
             self.report_error(tr("❌ Error: {error}", error=e), ReportAction.EXECUTE)
             return tr("Error running file: {error}", error=e)
 
-    def _stream_process_output(self, process, stdout_file, stderr_file):
-        stdout_lines = 0
-        stderr_lines = 0
-
-        def stream_output(stream, file_obj, report_func, count_func):
-            nonlocal stdout_lines, stderr_lines
+    def _stream_process_output(self, process, capture):
+        def stream_output(stream, sink):
             for line in stream:
-                file_obj.write(line)
-                file_obj.flush()
-                # Always supply a default action for stdout/stderr reporting
-                from janito.report_events import ReportAction
-
-                report_func(line.rstrip("\r\n"), ReportAction.EXECUTE)
-                if count_func == "stdout":
-                    stdout_lines += 1
-                else:
-                    stderr_lines += 1
+                sink(line)
 
-        stdout_thread = threading.Thread(
-            target=stream_output,
-            args=(process.stdout, stdout_file, self.report_stdout, "stdout"),
-        )
-        stderr_thread = threading.Thread(
-            target=stream_output,
-            args=(process.stderr, stderr_file, self.report_stderr, "stderr"),
-        )
-        stdout_thread.start()
-        stderr_thread.start()
-        stdout_thread.join()
-        stderr_thread.join()
-        return stdout_lines, stderr_lines
+        threads = [
+            threading.Thread(
+                target=stream_output, args=(process.stdout, capture.stdout.write)
+            ),
+            threading.Thread(
+                target=stream_output, args=(process.stderr, capture.stderr.write)
+            ),
+        ]
+        for thread in threads:
+            thread.start()
+        return threads
 
-    def _wait_for_process(self, process, timeout):
+    def _wait_for_process(self, process, timeout, threads):
         try:
-            return process.wait(timeout=timeout)
+            return_code = process.wait(timeout=timeout)
         except subprocess.TimeoutExpired:
             process.kill()
-            self.report_error(
-                tr("❌ Timed out after {timeout} seconds.", timeout=timeout),
-                ReportAction.EXECUTE,
-            )
             return None
+        for thread in threads:
+            thread.join()
+        return return_code
 
-    def _format_result(self, stdout_file_name, stderr_file_name, return_code):
-        with open(stdout_file_name, "r", encoding="utf-8", errors="replace") as out_f:
-            stdout_content = out_f.read()
-        with open(stderr_file_name, "r", encoding="utf-8", errors="replace") as err_f:
-            stderr_content = err_f.read()
-        max_lines = 100
-        stdout_lines = stdout_content.count("\n")
-        stderr_lines = stderr_content.count("\n")
-
-        def head_tail(text, n=10):
-            lines = text.splitlines()
-            if len(lines) <= 2 * n:
-                return "\n".join(lines)
-            return "\n".join(
-                lines[:n]
-                + ["... ({} lines omitted) ...".format(len(lines) - 2 * n)]
-                + lines[-n:]
-            )
-
-        if stdout_lines <= max_lines and stderr_lines <= max_lines:
+    def _format_result(self, capture, return_code):
+        stdout_content = capture.stdout.text()
+        stderr_content = capture.stderr.text()
+        if not capture.spilled:
             result = f"Return code: {return_code}\n--- python_file_run: STDOUT ---\n{stdout_content}"
             if stderr_content.strip():
                 result += f"\n--- python_file_run: STDERR ---\n{stderr_content}"
             return result
-        else:
-            result = f"stdout_file: {stdout_file_name} (lines: {stdout_lines})\n"
-            if stderr_lines > 0 and stderr_content.strip():
-                result += f"stderr_file: {stderr_file_name} (lines: {stderr_lines})\n"
-            result += f"returncode: {return_code}\n"
+        result = ""
+        for label, stream in (("stdout", capture.stdout), ("stderr", capture.stderr)):
+            if stream.spilled:
+                result += f"{label}_file: {stream.spill_path} (lines: {stream.lines})\n"
+        result += f"returncode: {return_code}\n"
+        result += (
+            "--- python_file_run: STDOUT (head/tail) ---\n"
+            + stdout_content.rstrip("\n")
+            + "\n"
+        )
+        if stderr_content.strip():
             result += (
-                "--- python_file_run: STDOUT (head/tail) ---\n"
-                + head_tail(stdout_content)
+                "--- python_file_run: STDERR (head/tail) ---\n"
+                + stderr_content.rstrip("\n")
                 + "\n"
             )
-            if stderr_content.strip():
-                result += (
-                    "--- python_file_run: STDERR (head/tail) ---\n"
-                    + head_tail(stderr_content)
-                    + "\n"
-                )
-            result += "Use the view_file tool to inspect the contents of these files when needed."
-            return result
+        result += "Use the view_file tool to inspect the contents of these files when needed."
+        return result
@@ -22,6 +22,7 @@ class ReadFilesTool(ToolBase):
 
     def run(self, paths: list[str]) -> str:
         from janito.tools.tool_utils import display_path
+        from janito.tools.line_index import read_text
         import os
 
         results = []
@@ -37,8 +38,8 @@ class ReadFilesTool(ToolBase):
                 results.append(f"--- File: {disp_path} (not found) ---\n")
                 continue
             try:
-                with open(path, "r", encoding="utf-8", errors="replace") as f:
-                    content = f.read()
+                # Also indexes the file's lines for later view_file ranges
+                content = read_text(path)
                 results.append(f"--- File: {disp_path} ---\n{content}\n")
                 self.report_success(tr("✅ Read {disp_path}", disp_path=disp_path))
             except Exception as e:
@@ -0,0 +1,52 @@
+from janito.tools.tool_base import ToolBase, ToolPermissions
+from janito.report_events import ReportAction
+from janito.tools.adapters.local.adapter import register_local_tool
+from janito.tools.jobs import JobError, get_job_table
+from janito.i18n import tr
+
+
+@register_local_tool
+class ReadJobOutputTool(ToolBase):
+    """
+    Read the combined stdout/stderr of a background job from a byte offset. Pass the returned next offset to the following call to read only new output.
+
+    Args:
+        job_id (int): Job id returned by run_bash_command(background=True).
+        offset (int, optional): Byte offset to read from. Defaults to 0 (the start of the output).
+        max_bytes (int, optional): Maximum number of bytes to return. Defaults to 16384.
+
+    Returns:
+        str: The job status line, the byte range returned and the next offset, followed by the output.
+    """
+
+    permissions = ToolPermissions(execute=True)
+    tool_name = "read_job_output"
+    parallel_safe = True
+
+    def run(self, job_id: int, offset: int = 0, max_bytes: int = 16384) -> str:
+        try:
+            job = get_job_table().get(job_id)
+        except JobError as e:
+            self.report_error(tr("❌ {error}", error=e), ReportAction.READ)
+            return tr("❗ {error}", error=e)
+        self.report_action(
+            tr(
+                "📖 Read output of job {job_id} from byte {offset}",
+                job_id=job_id,
+                offset=offset,
+            ),
+            ReportAction.READ,
+        )
+        text, next_offset = job.read(offset, max(max_bytes, 1))
+        size = job.output_size
+        self.report_success(
+            tr(" ✅ {count} bytes", count=next_offset - offset), ReportAction.READ
+        )
+        return tr(
+            "{status}\nbytes {start}-{end} of {size}; next offset: {end}\n--- OUTPUT ---\n{text}",
+            status=job.describe(),
+            start=offset,
+            end=next_offset,
+            size=size,
+            text=text,
+        )
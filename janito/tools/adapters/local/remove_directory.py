@@ -3,6 +3,7 @@ from janito.report_events import ReportAction
 from janito.tools.adapters.local.adapter import register_local_tool
 from janito.tools.tool_utils import pluralize, display_path
 from janito.i18n import tr
+from janito.tools.file_cache import invalidate_tree
 import shutil
 import os
 import zipfile
@@ -38,6 +39,7 @@ class RemoveDirectoryTool(ToolBase):
                 shutil.rmtree(path)
             else:
                 os.rmdir(path)
+            invalidate_tree(path)
             self.report_success(
                 tr("✅ 1 {dir_word}", dir_word=pluralize("directory", 1)),
                 ReportAction.DELETE,
@@ -6,6 +6,7 @@ from janito.tools.tool_utils import display_path
 from janito.tools.tool_base import ToolBase, ToolPermissions
 from janito.report_events import ReportAction
 from janito.i18n import tr
+from janito.tools.file_cache import invalidate_file
 
 
 @register_local_tool
@@ -44,6 +45,7 @@ class RemoveFileTool(ToolBase):
         try:
 
             os.remove(path)
+            invalidate_file(path)
             self.report_success(tr("✅ File removed"), ReportAction.DELETE)
             msg = tr(
                 "✅ Successfully removed the file at '{disp_path}'.",
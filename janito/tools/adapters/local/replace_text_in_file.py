@@ -5,6 +5,7 @@ from janito.i18n import tr
 import shutil
 import re
 from janito.tools.adapters.local.validate_file_syntax.core import validate_file_syntax
+from janito.tools.file_cache import file_cache, invalidate_file
 
 
 @register_local_tool
@@ -95,24 +96,16 @@ class ReplaceTextInFileTool(ToolBase):
 
     def _read_file_content(self, path):
         """Read the entire content of the file."""
-        with open(path, "r", encoding="utf-8", errors="replace") as f:
-            return f.read()
+        return file_cache.read_text(path)
 
     def _find_match_lines(self, content, search_text):
         """Find all line numbers where search_text occurs in content."""
-        lines = content.splitlines(keepends=True)
-        joined = "".join(lines)
-        match_lines = []
-        idx = 0
-        while True:
-            idx = joined.find(search_text, idx)
-            if idx == -1:
-                break
-            upto = joined[:idx]
-            line_no = upto.count("\n") + 1
-            match_lines.append(line_no)
-            idx += 1 if not search_text else len(search_text)
-        return match_lines
+        from janito.tools.adapters.local.edit_files import find_all, line_numbers
+
+        if not search_text:
+            # An empty search text matches at every position
+            return line_numbers(content, range(len(content) + 1))
+        return line_numbers(content, find_all(content, search_text))
 
     def _replace_content(
         self, content, search_text, replacement_text, replace_all, occurrences
@@ -136,6 +129,7 @@ class ReplaceTextInFileTool(ToolBase):
         """Write content to the file."""
         with open(path, "w", encoding="utf-8", errors="replace") as f:
             f.write(content)
+        invalidate_file(path)
 
     def _handle_warnings(self, replaced_count, file_changed, occurrences):
         """Handle and return warnings and concise warnings if needed."""
@@ -202,8 +196,7 @@ class ReplaceTextInFileTool(ToolBase):
             )
         else:
             try:
-                with open(path, "r", encoding="utf-8", errors="replace") as f:
-                    _content = f.read()
+                _content = file_cache.read_text(path)
                 _new_content = _content.replace(
                     search_text, replacement_text, -1 if action else 1
                 )
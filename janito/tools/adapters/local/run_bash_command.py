@@ -1,14 +1,24 @@
 from janito.tools.tool_base import ToolBase, ToolPermissions
 from janito.report_events import ReportAction
 from janito.tools.adapters.local.adapter import register_local_tool
+from janito.tools.tool_context import get_workdir
+from janito.tools.bash_session import (
+    get_bash_session,
+    persistent_shell_enabled,
+    shell_environment,
+)
 from janito.i18n import tr
+from janito.tools.jobs import JobError, start_job
+from janito.tools.output_capture import CommandCapture
 import subprocess
-import tempfile
 import sys
-import os
 import threading
 
 
+def _end_line(text):
+    return text if not text or text.endswith("\n") else text + "\n"
+
+
 @register_local_tool
 class RunBashCommandTool(ToolBase):
     """
@@ -20,23 +30,78 @@ class RunBashCommandTool(ToolBase):
         timeout (int): Timeout in seconds for the command. Defaults to 60.
         require_confirmation (bool): If True, require user confirmation before running. Defaults to False.
         requires_user_input (bool): If True, warns that the command may require user input and might hang. Defaults to False. Non-interactive commands are preferred for automation and reliability.
+        background (bool): If True, start the command as a background job and return its job id at once, without a timeout; follow it with job_status, read_job_output, wait_for_job and kill_job. Use for builds, long test suites and servers. Defaults to False.
 
     Returns:
-        str: File paths and line counts for stdout and stderr.
+        str: Return code and output (or the job id of a background command); for large output, its head and tail plus file paths and line counts of the full stdout and stderr.
     """
 
     permissions = ToolPermissions(execute=True)
     tool_name = "run_bash_command"
 
-    def _stream_output(self, stream, file_obj, report_func, count_func, counter):
+    def _stream_output(self, stream, sink):
         for line in stream:
-            file_obj.write(line)
-            file_obj.flush()
-            report_func(line.rstrip("\r\n"), ReportAction.EXECUTE)
-            if count_func == "stdout":
-                counter["stdout"] += 1
-            else:
-                counter["stderr"] += 1
+            sink(line)
+
+    def _run_process(self, command, timeout, capture):
+        """Run ``command`` in a fresh ``bash -c`` and return its exit code."""
+        process = subprocess.Popen(
+            ["bash", "-c", command],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            encoding="utf-8",
+            bufsize=1,
+            env=shell_environment(),
+            cwd=get_workdir(),
+        )
+        stdout_thread = threading.Thread(
+            target=self._stream_output, args=(process.stdout, capture.stdout.write)
+        )
+        stderr_thread = threading.Thread(
+            target=self._stream_output, args=(process.stderr, capture.stderr.write)
+        )
+        stdout_thread.start()
+        stderr_thread.start()
+        try:
+            return_code = process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            raise
+        stdout_thread.join()
+        stderr_thread.join()
+        return return_code
+
+    def _run_in_session(self, command, timeout, capture):
+        """Run ``command`` in the persistent shell of this session (``persistent_shell``)."""
+        return get_bash_session().run(
+            command,
+            timeout=timeout,
+            on_stdout=capture.stdout.write,
+            on_stderr=capture.stderr.write,
+        )
+
+    def _start_background(self, command):
+        self.report_action(
+            tr("🖥️  Start background job: {command}\n", command=command),
+            ReportAction.EXECUTE,
+        )
+        try:
+            job = start_job(command)
+        except (JobError, OSError) as e:
+            self.report_error(tr(" ❌ {error}", error=e), ReportAction.EXECUTE)
+            return tr("Error starting background job: {error}", error=e)
+        self.report_success(
+            tr(" ✅ job {job_id} (pid {pid})", job_id=job.id, pid=job.pid),
+            ReportAction.EXECUTE,
+        )
+        return tr(
+            "Started background job {job_id} (pid {pid}).\n"
+            "Use read_job_output(job_id={job_id}, offset=...) to read new output, "
+            "wait_for_job to wait for it, job_status to check it and kill_job to stop it.",
+            job_id=job.id,
+            pid=job.pid,
+        )
 
     def run(
         self,
@@ -44,10 +109,13 @@ class RunBashCommandTool(ToolBase):
         timeout: int = 60,
         require_confirmation: bool = False,
         requires_user_input: bool = False,
+        background: bool = False,
     ) -> str:
         if not command.strip():
             self.report_warning(tr("ℹ️ Empty command provided."), ReportAction.EXECUTE)
             return tr("Warning: Empty command provided. Operation skipped.")
+        if background:
+            return self._start_background(command)
         self.report_action(
             tr("🖥️  Run bash command: {command} ...\n", command=command),
             ReportAction.EXECUTE,
@@ -61,117 +129,85 @@ class RunBashCommandTool(ToolBase):
             )
             sys.stdout.flush()
         try:
-            with (
-                tempfile.NamedTemporaryFile(
-                    mode="w+", prefix="run_bash_stdout_", delete=False, encoding="utf-8"
-                ) as stdout_file,
-                tempfile.NamedTemporaryFile(
-                    mode="w+", prefix="run_bash_stderr_", delete=False, encoding="utf-8"
-                ) as stderr_file,
-            ):
-                env = os.environ.copy()
-                env["PYTHONIOENCODING"] = "utf-8"
-                env["LC_ALL"] = "C.UTF-8"
-                env["LANG"] = "C.UTF-8"
-                process = subprocess.Popen(
-                    ["bash", "-c", command],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
-                    encoding="utf-8",
-                    bufsize=1,
-                    env=env,
-                )
-                counter = {"stdout": 0, "stderr": 0}
-                stdout_thread = threading.Thread(
-                    target=self._stream_output,
-                    args=(
-                        process.stdout,
-                        stdout_file,
-                        self.report_stdout,
-                        "stdout",
-                        counter,
-                    ),
-                )
-                stderr_thread = threading.Thread(
-                    target=self._stream_output,
-                    args=(
-                        process.stderr,
-                        stderr_file,
-                        self.report_stderr,
-                        "stderr",
-                        counter,
-                    ),
-                )
-                stdout_thread.start()
-                stderr_thread.start()
+            capture = CommandCapture(
+                "run_bash_",
+                lambda chunk: self.report_stdout(chunk, ReportAction.EXECUTE),
+                lambda chunk: self.report_stderr(chunk, ReportAction.EXECUTE),
+            )
+            # Commands that may read the terminal keep the one-shot shell
+            run = (
+                self._run_in_session
+                if persistent_shell_enabled() and not requires_user_input
+                else self._run_process
+            )
+            with capture:
                 try:
-                    return_code = process.wait(timeout=timeout)
+                    return_code = run(command, timeout, capture)
                 except subprocess.TimeoutExpired:
-                    process.kill()
-                    self.report_error(
-                        tr(
-                            " ❌ Timed out after {timeout} seconds.",
-                            timeout=timeout,
-                        ),
-                        ReportAction.EXECUTE,
-                    )
-                    return tr(
-                        "Command timed out after {timeout} seconds.", timeout=timeout
-                    )
-                stdout_thread.join()
-                stderr_thread.join()
-                stdout_file.flush()
-                stderr_file.flush()
-                self.report_success(
+                    return_code = None
+            if return_code is None:
+                self.report_error(
                     tr(
-                        " ✅ return code {return_code}",
-                        return_code=return_code,
+                        " ❌ Timed out after {timeout} seconds.",
+                        timeout=timeout,
                     ),
                     ReportAction.EXECUTE,
                 )
-                max_lines = 100
-                # Read back the output for summary
-                stdout_file.seek(0)
-                stderr_file.seek(0)
-                stdout_content = stdout_file.read()
-                stderr_content = stderr_file.read()
-                stdout_lines = counter["stdout"]
-                stderr_lines = counter["stderr"]
-                warning_msg = ""
-                if requires_user_input:
-                    warning_msg = tr(
-                        "⚠️  Warning: This command might be interactive, require user input, and might hang.\n"
-                    )
-                if stdout_lines <= max_lines and stderr_lines <= max_lines:
-                    result = warning_msg + tr(
-                        "Return code: {return_code}\n--- STDOUT ---\n{stdout_content}",
-                        return_code=return_code,
-                        stdout_content=stdout_content,
-                    )
-                    if stderr_content.strip():
-                        result += tr(
-                            "\n--- STDERR ---\n{stderr_content}",
-                            stderr_content=stderr_content,
-                        )
-                    return result
-                else:
-                    result = warning_msg + tr(
-                        "[LARGE OUTPUT]\nstdout_file: {stdout_file} (lines: {stdout_lines})\n",
-                        stdout_file=stdout_file.name,
-                        stdout_lines=stdout_lines,
-                    )
-                    if stderr_lines > 0:
-                        result += tr(
-                            "stderr_file: {stderr_file} (lines: {stderr_lines})\n",
-                            stderr_file=stderr_file.name,
-                            stderr_lines=stderr_lines,
-                        )
-                    result += tr(
-                        "returncode: {return_code}\nUse the view_file tool to inspect the contents of these files when needed.",
-                        return_code=return_code,
-                    )
-                    return result
+                return tr(
+                    "Command timed out after {timeout} seconds.", timeout=timeout
+                )
+            self.report_success(
+                tr(
+                    " ✅ return code {return_code}",
+                    return_code=return_code,
+                ),
+                ReportAction.EXECUTE,
+            )
+            warning_msg = ""
+            if requires_user_input:
+                warning_msg = tr(
+                    "⚠️  Warning: This command might be interactive, require user input, and might hang.\n"
+                )
+            return warning_msg + self._format_result(capture, return_code)
         except Exception as e:
             self.report_error(tr(" ❌ Error: {error}", error=e), ReportAction.EXECUTE)
             return tr("Error running command: {error}", error=e)
+
+    def _format_result(self, capture, return_code):
+        stdout_content = capture.stdout.text()
+        stderr_content = capture.stderr.text()
+        if not capture.spilled:
+            result = tr(
+                "Return code: {return_code}\n--- STDOUT ---\n{stdout_content}",
+                return_code=return_code,
+                stdout_content=stdout_content,
+            )
+            if stderr_content.strip():
+                result += tr(
+                    "\n--- STDERR ---\n{stderr_content}",
+                    stderr_content=stderr_content,
+                )
+            return result
+        result = tr("[LARGE OUTPUT]\n")
+        for label, stream in (("stdout", capture.stdout), ("stderr", capture.stderr)):
+            if stream.spilled:
+                result += tr(
+                    "{label}_file: {path} (lines: {lines})\n",
+                    label=label,
+                    path=stream.spill_path,
+                    lines=stream.lines,
+                )
+        result += tr("returncode: {return_code}\n", return_code=return_code)
+        result += tr(
+            "--- STDOUT (head/tail) ---\n{stdout_content}",
+            stdout_content=_end_line(stdout_content),
+        )
+        if stderr_content.strip():
+            result += tr(
+                "--- STDERR (head/tail) ---\n{stderr_content}",
+                stderr_content=_end_line(stderr_content),
+            )
+        result += tr(
+            "Use the view_file tool to inspect the contents of these files when needed."
+        )
+        return result
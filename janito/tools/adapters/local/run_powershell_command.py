@@ -1,6 +1,7 @@
 from janito.tools.tool_base import ToolBase, ToolPermissions
 from janito.report_events import ReportAction
 from janito.tools.adapters.local.adapter import register_local_tool
+from janito.tools.tool_context import get_workdir
 from janito.i18n import tr
 import subprocess
 import os
@@ -71,6 +72,7 @@ class RunPowershellCommandTool(ToolBase):
             universal_newlines=True,
             encoding="utf-8",
             env=env,
+            cwd=get_workdir(),
         )
 
     def _stream_output(self, stream, file_obj, report_func, count_func, counter):
@@ -2,6 +2,7 @@ from janito.tools.tool_base import ToolBase, ToolPermissions
 from janito.report_events import ReportAction
 from janito.tools.adapters.local.adapter import register_local_tool
 from janito.tools.tool_utils import pluralize, display_path
+from janito.tools.tool_context import resolve_path
 from janito.i18n import tr
 import os
 from .pattern_utils import prepare_pattern, format_result, summarize_total
@@ -32,6 +33,7 @@ class SearchTextTool(ToolBase):
 
     permissions = ToolPermissions(read=True)
     tool_name = "search_text"
+    multi_path_arguments = ("paths",)
 
     def _handle_file(
         self,
@@ -167,7 +169,7 @@ class SearchTextTool(ToolBase):
         )
         if error_msg:
             return error_msg
-        paths_list = paths.split()
+        paths_list = [resolve_path(path) for path in paths.split()]
         results = []
         all_per_file_counts = []
         for search_path in paths_list:
@@ -1,23 +1,30 @@
 import re
+from contextlib import nullcontext
 from janito.gitignore_utils import GitignoreFilter
+from janito.tools.file_cache import file_cache
+from janito.tools.line_index import split_lines
 import os
 
 
+TEXT_CHARACTERS = bytes(
+    bytearray({7, 8, 9, 10, 12, 13, 27} | set(range(0x20, 0x100)))
+)
+
+
+def is_binary_chunk(chunk):
+    """Return True if the leading bytes of a file look binary."""
+    if b"\0" in chunk:
+        return True
+    nontext = chunk.translate(None, TEXT_CHARACTERS)
+    return len(nontext) / max(1, len(chunk)) > 0.3
+
+
 def is_binary_file(path, blocksize=1024):
     try:
         with open(path, "rb") as f:
-            chunk = f.read(blocksize)
-            if b"\0" in chunk:
-                return True
-            text_characters = bytearray(
-                {7, 8, 9, 10, 12, 13, 27} | set(range(0x20, 0x100))
-            )
-            nontext = chunk.translate(None, text_characters)
-            if len(nontext) / max(1, len(chunk)) > 0.3:
-                return True
+            return is_binary_chunk(f.read(blocksize))
     except Exception:
         return True
-    return False
 
 
 def match_line(line, query, regex, use_regex, case_sensitive):
@@ -35,6 +42,26 @@ def should_limit(max_results, total_results, match_count, count_only, dir_output
     return False
 
 
+def _cached_lines(path):
+    """
+    Lines of ``path`` from the shared file cache: [] for binary or unreadable
+    files, None when the file must be streamed instead (too large to cache, or
+    invalid UTF-8, where the matches before the bad line are still reported).
+    """
+    try:
+        entry = file_cache.get(path)
+    except OSError:
+        return []
+    if entry is None:
+        return None
+    if is_binary_chunk(entry.data[:1024]):
+        return []
+    try:
+        return split_lines(entry.text("strict"))
+    except UnicodeDecodeError:
+        return None
+
+
 def read_file_lines(
     path,
     query,
@@ -44,24 +71,27 @@ def read_file_lines(
     count_only,
     max_results,
     total_results,
+    use_cache=True,
 ):
     dir_output = []
     dir_limit_reached = False
     match_count = 0
-    if not is_binary_file(path):
-        try:
-            open_kwargs = {"mode": "r", "encoding": "utf-8"}
-            with open(path, **open_kwargs) as f:
-                for lineno, line in enumerate(f, 1):
-                    if match_line(line, query, regex, use_regex, case_sensitive):
-                        match_count += 1
-                        if not count_only:
-                            dir_output.append(f"{path}:{lineno}: {line.rstrip()}")
-                    if should_limit(
-                        max_results, total_results, match_count, count_only, dir_output
-                    ):
-                        dir_limit_reached = True
-                        break
-        except Exception:
-            pass
+    lines = _cached_lines(path) if use_cache else None
+    if lines is None and is_binary_file(path):
+        lines = []
+    try:
+        open_kwargs = {"mode": "r", "encoding": "utf-8"}
+        with (open(path, **open_kwargs) if lines is None else nullcontext(lines)) as f:
+            for lineno, line in enumerate(f, 1):
+                if match_line(line, query, regex, use_regex, case_sensitive):
+                    match_count += 1
+                    if not count_only:
+                        dir_output.append(f"{path}:{lineno}: {line.rstrip()}")
+                if should_limit(
+                    max_results, total_results, match_count, count_only, dir_output
+                ):
+                    dir_limit_reached = True
+                    break
+    except Exception:
+        pass
     return match_count, dir_limit_reached, dir_output
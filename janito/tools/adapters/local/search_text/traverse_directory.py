@@ -1,6 +1,8 @@
 import os
 from janito.gitignore_utils import GitignoreFilter
+from janito.parallel_scan import ordered_batch_map, scan_pool_kind, scan_workers
 from .match_lines import match_line, should_limit, read_file_lines
+from .trigram_index import indexed_candidates
 
 
 def walk_directory(search_path, max_depth):
@@ -16,11 +18,10 @@ def walk_directory(search_path, max_depth):
 
 def filter_dirs(dirs, root, gitignore_filter):
     # Always exclude directories named .git, regardless of gitignore
-    return [
-        d
-        for d in dirs
-        if d != ".git" and not gitignore_filter.is_ignored(os.path.join(root, d))
-    ]
+    matcher = gitignore_filter.matcher_for(root)
+    if matcher is None:
+        return [d for d in dirs if d != ".git"]
+    return [d for d in dirs if not matcher.is_ignored(d, True)]
 
 
 def process_file_count_only(
@@ -84,6 +85,131 @@ def should_limit_depth(root, search_path, max_depth, dirs):
                 del dirs[:]
 
 
+def iter_scan_files(root, max_depth, gitignore_filter, depth=0):
+    """
+    Yield the files below ``root`` in sorted top-down order.
+
+    Applies the same .git/.gitignore filtering and max_depth rules as the
+    ``os.walk`` based traversal, so the parallel scan sees the same files.
+    """
+    try:
+        with os.scandir(root) as it:
+            entries = sorted(it, key=lambda entry: entry.name)
+    except OSError:
+        return
+    matcher = gitignore_filter.matcher_for(root, [entry.name for entry in entries])
+    dirs = []
+    links = set()
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+        if is_dir:
+            dirs.append(entry.name)
+            if entry.is_symlink():
+                links.add(entry.name)
+            continue
+        if matcher is None or not matcher.is_ignored(entry.name):
+            yield os.path.join(root, entry.name)
+    if max_depth == 1 or (max_depth > 0 and depth >= max_depth):
+        return
+    for d in filter_dirs(dirs, root, gitignore_filter):
+        if d not in links:
+            yield from iter_scan_files(
+                os.path.join(root, d), max_depth, gitignore_filter, depth + 1
+            )
+
+
+def scan_file(path, cwd, query, regex, use_regex, case_sensitive, count_only, limit):
+    """
+    Pool worker: match one file (``cwd`` keeps relative paths valid in processes,
+    where the file cache is not shared with janito and is not used).
+    """
+    if cwd is not None and os.getcwd() != cwd:
+        os.chdir(cwd)
+    return read_file_lines(
+        path,
+        query,
+        regex,
+        use_regex,
+        case_sensitive,
+        count_only,
+        limit,
+        0,
+        use_cache=cwd is None,
+    )
+
+
+def traverse_directory_parallel(
+    paths,
+    query,
+    regex,
+    use_regex,
+    case_sensitive,
+    max_results,
+    total_results,
+    count_only,
+    workers,
+):
+    """
+    Match ``paths`` in a worker pool and merge the results in path order.
+
+    Each file is matched independently with the remaining result budget as
+    its limit; the merge then trims the file that crosses ``max_results``
+    and stops, which cancels the batches that were not started yet.
+    """
+    kind = scan_pool_kind()
+    cwd = os.getcwd() if kind == "process" else None
+    limit = max(max_results - total_results, 0) if max_results > 0 else 0
+    args = (cwd, query, regex, use_regex, case_sensitive, count_only, limit)
+    dir_output = []
+    per_file_counts = []
+    dir_limit_reached = False
+    matched = total_results
+    results = ordered_batch_map(scan_file, paths, args, workers=workers, kind=kind)
+    try:
+        for path, (match_count, _, lines) in results:
+            if match_count == 0:
+                continue
+            if max_results > 0 and matched + match_count >= max_results:
+                match_count = max_results - matched
+                lines = lines[:match_count]
+                dir_limit_reached = True
+            per_file_counts.append((path, match_count))
+            dir_output.extend(lines)
+            matched += match_count
+            if dir_limit_reached:
+                break
+    finally:
+        results.close()
+    if count_only:
+        return per_file_counts, dir_limit_reached, []
+    return dir_output, dir_limit_reached, per_file_counts
+
+
+def parallel_candidates(search_path, max_depth, candidates):
+    """Files for the parallel scan: the index candidates, else a filtered walk."""
+    if candidates is not None:
+        return candidates
+    return iter_scan_files(search_path, max_depth, GitignoreFilter(search_path))
+
+
+def sequential_files(search_path, max_depth, candidates):
+    """Yield the files for the sequential scan in walk order."""
+    if candidates is not None:
+        # The trigram index already applied .gitignore and max_depth, and its
+        # paths already start with search_path
+        yield from candidates
+        return
+    gitignore_filter = GitignoreFilter(search_path)
+    for root, dirs, files in walk_directory(search_path, max_depth):
+        dirs, files = gitignore_filter.filter_ignored(root, dirs, files)
+        for file in files:
+            yield os.path.join(root, file)
+        should_limit_depth(root, search_path, max_depth, dirs)
+
+
 def traverse_directory(
     search_path,
     query,
@@ -98,47 +224,47 @@ def traverse_directory(
     dir_output = []
     dir_limit_reached = False
     per_file_counts = []
-    walker = walk_directory(search_path, max_depth)
-    gitignore_filter = GitignoreFilter(search_path)
-
-    for root, dirs, files in walker:
-        dirs[:] = filter_dirs(dirs, root, gitignore_filter)
-        for file in files:
-            path = os.path.join(root, file)
-            if gitignore_filter.is_ignored(path):
-                continue
-            if count_only:
-                file_limit_reached = process_file_count_only(
-                    path,
-                    per_file_counts,
-                    query,
-                    regex,
-                    use_regex,
-                    case_sensitive,
-                    max_results,
-                    total_results,
-                )
-                if file_limit_reached:
-                    dir_limit_reached = True
-                    break
-            else:
-                file_limit_reached = process_file_collect(
-                    path,
-                    dir_output,
-                    per_file_counts,
-                    query,
-                    regex,
-                    use_regex,
-                    case_sensitive,
-                    max_results,
-                    total_results,
-                )
-                if file_limit_reached:
-                    dir_limit_reached = True
-                    break
-        if dir_limit_reached:
+    candidates = indexed_candidates(search_path, query, regex, use_regex, max_depth)
+    workers = scan_workers()
+    if workers > 1:
+        return traverse_directory_parallel(
+            parallel_candidates(search_path, max_depth, candidates),
+            query,
+            regex,
+            use_regex,
+            case_sensitive,
+            max_results,
+            total_results,
+            count_only,
+            workers,
+        )
+    for path in sequential_files(search_path, max_depth, candidates):
+        if count_only:
+            file_limit_reached = process_file_count_only(
+                path,
+                per_file_counts,
+                query,
+                regex,
+                use_regex,
+                case_sensitive,
+                max_results,
+                total_results,
+            )
+        else:
+            file_limit_reached = process_file_collect(
+                path,
+                dir_output,
+                per_file_counts,
+                query,
+                regex,
+                use_regex,
+                case_sensitive,
+                max_results,
+                total_results,
+            )
+        if file_limit_reached:
+            dir_limit_reached = True
             break
-        should_limit_depth(root, search_path, max_depth, dirs)
     if count_only:
         return per_file_counts, dir_limit_reached, []
     else:
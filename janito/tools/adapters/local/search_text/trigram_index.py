@@ -0,0 +1,451 @@
+"""
+Persistent trigram index used by ``search_text`` to narrow candidate files.
+
+The index lives in ``<workdir>/.janito/index/trigrams.sqlite3`` and maps every
+trigram of the lowercased file contents to the ids of the files containing it. Before a
+search the file list is re-walked with the same ``GitignoreFilter`` rules as
+``traverse_directory`` and only files whose mtime or size changed are re-read,
+so the index stays current without re-reading the tree. A query is reduced to
+the trigrams every match must contain (the query itself for plain text, the
+required literal runs for regular expressions); only files holding all of them
+are scanned. The index is therefore a pure pre-filter: it may return extra
+candidates, never fewer, and results are always confirmed line by line.
+
+Re-indexed files only add postings; stale postings are harmless and the
+postings table is rebuilt once they exceed ``REBUILD_STALE_RATIO``.
+
+The index is optional and enabled with the ``search_index`` config key.
+"""
+
+import os
+import re
+import sqlite3
+import threading
+from array import array
+
+try:  # Python 3.11+
+    import re._parser as sre_parse
+    from re._constants import (
+        LITERAL,
+        MAX_REPEAT,
+        MIN_REPEAT,
+        SUBPATTERN,
+    )
+except ImportError:  # pragma: no cover - older interpreters
+    import sre_parse
+    from sre_constants import LITERAL, MAX_REPEAT, MIN_REPEAT, SUBPATTERN
+
+from janito.gitignore_utils import GitignoreFilter
+from .match_lines import is_binary_chunk
+
+INDEX_DIR = os.path.join(".janito", "index")
+INDEX_FILENAME = "trigrams.sqlite3"
+SCHEMA_VERSION = 1
+
+# Files larger than this are not tokenized and are always scanned
+MAX_INDEXED_FILE_SIZE = 4 * 1024 * 1024
+# Pending postings are flushed to SQLite every this many indexed files
+FLUSH_EVERY_FILES = 2000
+# Rebuild postings once re-indexed/deleted files exceed this share of all files
+REBUILD_STALE_RATIO = 0.25
+REBUILD_STALE_MIN = 1000
+
+STATE_TEXT = 0  # tokenized; candidate only if it holds all query trigrams
+STATE_BINARY = 1  # never a candidate (search_text skips binary files)
+STATE_UNINDEXED = 2  # too large or unreadable; always a candidate
+
+
+def index_enabled():
+    try:
+        from janito.config import config
+
+        value = config.get("search_index")
+    except Exception:
+        return False
+    if isinstance(value, str):
+        return value.strip().lower() in ("1", "true", "yes", "on")
+    return bool(value)
+
+
+# ---------------------------------------------------------------------------
+# Trigram extraction
+# ---------------------------------------------------------------------------
+
+
+def text_trigrams(data):
+    """Return the set of trigram keys (ints) of the lowercased file content ``data`` (bytes)."""
+    if data.isascii():
+        data = data.lower()
+    else:
+        # Same lowercasing as match_line (str.lower) for non-ASCII text
+        data = data.decode("utf-8", "ignore").lower().encode("utf-8")
+    chunks = {data[i : i + 3] for i in range(len(data) - 2)}
+    return {int.from_bytes(chunk, "big") for chunk in chunks}
+
+
+def literal_trigrams(literals, exclude=""):
+    """
+    Return the trigram keys every line matching all ``literals`` must contain.
+
+    Only all-ASCII trigrams are used, so the result holds for both case
+    sensitive and insensitive matching. Trigrams containing a character
+    from ``exclude`` are skipped.
+    """
+    trigrams = set()
+    for literal in literals:
+        for i in range(len(literal) - 2):
+            chunk = literal[i : i + 3]
+            if not chunk.isascii() or "\n" in chunk:
+                continue
+            chunk = chunk.lower()
+            if exclude and any(char in exclude for char in chunk):
+                continue
+            trigrams.add(int.from_bytes(chunk.encode("ascii"), "big"))
+    return trigrams
+
+
+def regex_literals(pattern):
+    """Return literal substrings every match of the regex ``pattern`` must contain."""
+    try:
+        parsed = sre_parse.parse(pattern)
+    except Exception:
+        return []
+    literals = []
+    _collect_literal_runs(parsed, literals)
+    return literals
+
+
+def _collect_literal_runs(parsed, literals):
+    run = []
+
+    def flush():
+        if len(run) >= 3:
+            literals.append("".join(run))
+        run.clear()
+
+    for op, av in parsed:
+        if op is LITERAL:
+            run.append(chr(av))
+            continue
+        flush()
+        if op is SUBPATTERN:
+            _collect_literal_runs(av[-1], literals)
+        elif op in (MAX_REPEAT, MIN_REPEAT) and av[0] >= 1:
+            _collect_literal_runs(av[2], literals)
+        # Alternations, classes, anchors, optional items etc. add no requirement
+    flush()
+
+
+def query_trigrams(query, regex=None, use_regex=False):
+    if use_regex:
+        if regex is None:
+            regex = re.compile(query)
+        # Case-insensitive regexes also match 'ı' for 'i' and 'ſ' for 's',
+        # which str.lower() does not fold: leave those letters out.
+        exclude = "is" if regex.flags & re.IGNORECASE else ""
+        return literal_trigrams(regex_literals(regex.pattern), exclude=exclude)
+    return literal_trigrams([query])
+
+
+# ---------------------------------------------------------------------------
+# Index
+# ---------------------------------------------------------------------------
+
+
+class TrigramIndex:
+    """On-disk trigram index for the files below ``root``."""
+
+    def __init__(self, root):
+        self.root = os.path.abspath(root)
+        self.index_dir = os.path.join(self.root, INDEX_DIR)
+        self.db_path = os.path.join(self.index_dir, INDEX_FILENAME)
+        self.ignore_root = GitignoreFilter.find_ignore_root(self.root)
+        self._lock = threading.Lock()
+
+    # -- storage ----------------------------------------------------------
+    def _connect(self):
+        os.makedirs(self.index_dir, exist_ok=True)
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER);
+            CREATE TABLE IF NOT EXISTS files (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                path TEXT UNIQUE NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                state INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS postings (
+                trigram INTEGER PRIMARY KEY,
+                ids BLOB NOT NULL
+            );
+            """
+        )
+        version = self._get_meta(conn, "schema_version")
+        if version != SCHEMA_VERSION:
+            conn.executescript("DELETE FROM files; DELETE FROM postings;")
+            self._set_meta(conn, "schema_version", SCHEMA_VERSION)
+            self._set_meta(conn, "stale", 0)
+            conn.commit()
+        return conn
+
+    @staticmethod
+    def _get_meta(conn, key):
+        row = conn.execute("SELECT value FROM meta WHERE key=?", (key,)).fetchone()
+        return row[0] if row else None
+
+    @staticmethod
+    def _set_meta(conn, key, value):
+        conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value)
+        )
+
+    # -- file walk --------------------------------------------------------
+    def iter_files(self):
+        """Yield (relative path, stat) for every non-ignored file below the root."""
+        gitignore = GitignoreFilter(self.root)
+        index_dir = self.index_dir
+        stack = [self.root]
+        while stack:
+            directory = stack.pop()
+            try:
+                entries = list(os.scandir(directory))
+            except OSError:
+                continue
+            matcher = gitignore.matcher_for(directory, [e.name for e in entries])
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.path == index_dir or matcher.is_ignored(
+                            entry.name, True
+                        ):
+                            continue
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        if matcher.is_ignored(entry.name):
+                            continue
+                        yield os.path.relpath(entry.path, self.root), entry.stat()
+                except OSError:
+                    continue
+
+    # -- update -----------------------------------------------------------
+    def refresh(self):
+        """Bring the index up to date with the files on disk; return the number re-indexed."""
+        with self._lock:
+            conn = self._connect()
+            try:
+                return self._refresh(conn)
+            finally:
+                conn.close()
+
+    def _refresh(self, conn):
+        known = {
+            path: (file_id, mtime_ns, size)
+            for file_id, path, mtime_ns, size in conn.execute(
+                "SELECT id, path, mtime_ns, size FROM files"
+            )
+        }
+        stale = self._get_meta(conn, "stale") or 0
+        seen = {}
+        changed = []
+        for path, st in self.iter_files():
+            seen[path] = st
+            row = known.get(path)
+            if row is None or row[1] != st.st_mtime_ns or row[2] != st.st_size:
+                changed.append((path, st, row))
+        deleted = [row[0] for path, row in known.items() if path not in seen]
+        stale += len(deleted) + sum(1 for _, _, row in changed if row is not None)
+        total = len(seen)
+        if stale > max(REBUILD_STALE_MIN, REBUILD_STALE_RATIO * total):
+            # Too many stale postings: re-tokenize everything from scratch
+            conn.executescript("DELETE FROM files; DELETE FROM postings;")
+            changed = [(path, st, None) for path, st in seen.items()]
+            deleted = []
+            stale = 0
+        if deleted:
+            conn.executemany("DELETE FROM files WHERE id=?", [(i,) for i in deleted])
+        pending = {}
+        pending_files = 0
+        for path, st, row in changed:
+            state, trigrams = self._tokenize(os.path.join(self.root, path), st)
+            if row is None:
+                cursor = conn.execute(
+                    "INSERT INTO files (path, mtime_ns, size, state) VALUES (?, ?, ?, ?)",
+                    (path, st.st_mtime_ns, st.st_size, state),
+                )
+                file_id = cursor.lastrowid
+            else:
+                file_id = row[0]
+                conn.execute(
+                    "UPDATE files SET mtime_ns=?, size=?, state=? WHERE id=?",
+                    (st.st_mtime_ns, st.st_size, state, file_id),
+                )
+            for trigram in trigrams:
+                ids = pending.get(trigram)
+                if ids is None:
+                    ids = pending[trigram] = array("I")
+                ids.append(file_id)
+            pending_files += 1
+            if pending_files >= FLUSH_EVERY_FILES:
+                self._flush_postings(conn, pending)
+                pending_files = 0
+        self._flush_postings(conn, pending)
+        self._set_meta(conn, "stale", stale)
+        conn.commit()
+        return len(changed)
+
+    @staticmethod
+    def _tokenize(path, st):
+        if st.st_size > MAX_INDEXED_FILE_SIZE:
+            return STATE_UNINDEXED, ()
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return STATE_UNINDEXED, ()
+        if is_binary_chunk(data[:1024]):
+            return STATE_BINARY, ()
+        return STATE_TEXT, text_trigrams(data)
+
+    @staticmethod
+    def _flush_postings(conn, pending):
+        if not pending:
+            return
+        keys = list(pending)
+        for start in range(0, len(keys), 500):
+            chunk = keys[start : start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            for trigram, blob in conn.execute(
+                f"SELECT trigram, ids FROM postings WHERE trigram IN ({placeholders})",
+                chunk,
+            ):
+                existing = array("I")
+                existing.frombytes(blob)
+                existing.extend(pending[trigram])
+                pending[trigram] = existing
+        conn.executemany(
+            "INSERT OR REPLACE INTO postings (trigram, ids) VALUES (?, ?)",
+            ((trigram, ids.tobytes()) for trigram, ids in pending.items()),
+        )
+        pending.clear()
+
+    # -- query ------------------------------------------------------------
+    def candidates(self, search_path, trigrams):
+        """
+        Return the sorted absolute paths below ``search_path`` that may contain
+        a line holding all ``trigrams`` (refreshing the index first).
+        """
+        self.refresh()
+        with self._lock:
+            conn = self._connect()
+            try:
+                ids = self._matching_ids(conn, trigrams)
+                rows = self._rows_for_ids(conn, ids)
+                rows.extend(
+                    conn.execute(
+                        "SELECT path FROM files WHERE state=?", (STATE_UNINDEXED,)
+                    ).fetchall()
+                )
+            finally:
+                conn.close()
+        prefix = os.path.relpath(os.path.abspath(search_path), self.root)
+        paths = []
+        for (path,) in rows:
+            if prefix == "." or path == prefix or path.startswith(prefix + os.sep):
+                paths.append(os.path.join(self.root, path))
+        return sorted(set(paths))
+
+    @staticmethod
+    def _matching_ids(conn, trigrams):
+        postings = []
+        for trigram in trigrams:
+            row = conn.execute(
+                "SELECT ids FROM postings WHERE trigram=?", (trigram,)
+            ).fetchone()
+            if row is None:
+                return set()
+            ids = array("I")
+            ids.frombytes(row[0])
+            postings.append(ids)
+        postings.sort(key=len)
+        result = set(postings[0])
+        for ids in postings[1:]:
+            result.intersection_update(ids)
+            if not result:
+                break
+        return result
+
+    @staticmethod
+    def _rows_for_ids(conn, ids):
+        rows = []
+        ids = list(ids)
+        for start in range(0, len(ids), 500):
+            chunk = ids[start : start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            rows.extend(
+                conn.execute(
+                    f"SELECT path FROM files WHERE state={STATE_TEXT} AND id IN ({placeholders})",
+                    chunk,
+                ).fetchall()
+            )
+        return rows
+
+
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+
+def get_trigram_index(root):
+    root = os.path.abspath(root)
+    with _indexes_lock:
+        index = _indexes.get(root)
+        if index is None:
+            index = _indexes[root] = TrigramIndex(root)
+        return index
+
+
+def indexed_candidates(search_path, query, regex, use_regex, max_depth):
+    """
+    Return candidate files for a directory search, or None when the index is
+    disabled or cannot narrow this query (the caller then walks the tree).
+    """
+    if not index_enabled():
+        return None
+    trigrams = query_trigrams(query, regex, use_regex)
+    if not trigrams:
+        return None
+    from janito.tools.tool_context import get_workdir
+
+    root = os.path.abspath(get_workdir())
+    display_root = search_path
+    search_path = os.path.abspath(search_path)
+    if search_path != root and not search_path.startswith(root + os.sep):
+        return None
+    index = get_trigram_index(root)
+    # traverse_directory anchors the .gitignore rules at the ignore root above
+    # the search path; the index can stand in for it only when that is the root's.
+    if GitignoreFilter.find_ignore_root(search_path) != index.ignore_root:
+        return None
+    try:
+        paths = index.candidates(search_path, trigrams)
+    except sqlite3.Error:
+        return None
+    if max_depth and max_depth > 0:
+        # Same depth semantics as traverse_directory (max_depth=1: top level only)
+        allowed_depth = 0 if max_depth == 1 else max_depth
+        paths = [
+            path for path in paths if _dir_depth(path, search_path) <= allowed_depth
+        ]
+    # Report paths the way a directory walk from the given search path would
+    return [
+        os.path.join(display_root, os.path.relpath(path, search_path))
+        for path in paths
+    ]
+
+
+def _dir_depth(path, search_path):
+    rel_dir = os.path.relpath(os.path.dirname(path), search_path)
+    return 0 if rel_dir == "." else rel_dir.count(os.sep) + 1
@@ -1,4 +1,6 @@
 from janito.i18n import tr
+from janito.tools.file_cache import file_cache
+import io
 import re
 
 try:
@@ -16,8 +18,7 @@ def validate_html(path: str) -> str:
 
 
 def _read_html_content(path):
-    with open(path, "r", encoding="utf-8") as f:
-        return f.read()
+    return file_cache.read_text(path, errors="strict")
 
 
 def _find_js_outside_script(html_content):
@@ -57,8 +58,7 @@ def _parse_html_and_collect_errors(path):
         return lxml_error
     try:
         parser = etree.HTMLParser(recover=False)
-        with open(path, "rb") as f:
-            etree.parse(f, parser=parser)
+        etree.parse(io.BytesIO(file_cache.read_bytes(path)), parser=parser)
         error_log = parser.error_log
         syntax_errors = []
         for e in error_log:
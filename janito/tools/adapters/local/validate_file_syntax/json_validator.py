@@ -1,6 +1,6 @@
 def validate_json(path: str) -> str:
     import json
+    from janito.tools.file_cache import file_cache
 
-    with open(path, "r", encoding="utf-8") as f:
-        json.load(f)
+    json.loads(file_cache.read_text(path, errors="strict"))
     return "✅ OK"
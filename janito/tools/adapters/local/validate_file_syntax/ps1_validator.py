@@ -1,10 +1,10 @@
 from janito.i18n import tr
+from janito.tools.file_cache import file_cache
 import re
 
 
 def validate_ps1(path: str) -> str:
-    with open(path, "r", encoding="utf-8") as f:
-        content = f.read()
+    content = file_cache.read_text(path, errors="strict")
     errors = []
     # Unmatched curly braces
     if content.count("{") != content.count("}"):
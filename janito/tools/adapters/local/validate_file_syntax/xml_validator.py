@@ -1,4 +1,7 @@
+import io
+
 from janito.i18n import tr
+from janito.tools.file_cache import file_cache
 
 
 def validate_xml(path: str) -> str:
@@ -6,6 +9,5 @@ def validate_xml(path: str) -> str:
         from lxml import etree
     except ImportError:
         return tr("⚠️ lxml not installed. Cannot validate XML.")
-    with open(path, "rb") as f:
-        etree.parse(f)
+    etree.parse(io.BytesIO(file_cache.read_bytes(path)))
     return "✅ OK"
@@ -1,6 +1,6 @@
 def validate_yaml(path: str) -> str:
     import yaml
+    from janito.tools.file_cache import file_cache
 
-    with open(path, "r", encoding="utf-8") as f:
-        yaml.safe_load(f)
+    yaml.safe_load(file_cache.read_text(path, errors="strict"))
     return "✅ OK"
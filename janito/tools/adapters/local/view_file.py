@@ -40,9 +40,8 @@ class ViewFileTool(ToolBase):
         try:
             if os.path.isdir(path):
                 return self._list_directory(path, disp_path)
-            lines = self._read_file_lines(path)
-            selected, selected_len, total_lines = self._select_lines(
-                lines, from_line, to_line
+            selected, selected_len, total_lines = self._read_selected_lines(
+                path, from_line, to_line
             )
             self._report_success(selected_len, from_line, to_line, total_lines)
             header = self._format_header(
@@ -80,10 +79,22 @@ class ViewFileTool(ToolBase):
             self.report_error(tr(" ❌ Error listing directory: {error}", error=e))
             return tr("Error listing directory: {error}", error=e)
 
+    def _read_selected_lines(self, path, from_line, to_line):
+        """Read only the requested lines, through the cached line-offset index."""
+        from janito.tools.line_index import read_line_range
+
+        if (from_line or 0) < 0 or (to_line or 0) < 0:
+            # Negative numbers keep their slice semantics, which need the whole file
+            return self._select_lines(self._read_file_lines(path), from_line, to_line)
+        selected, total_lines = read_line_range(path, from_line or None, to_line or None)
+        return selected, len(selected), total_lines
+
     def _read_file_lines(self, path):
         """Read all lines from the file."""
-        with open(path, "r", encoding="utf-8", errors="replace") as f:
-            return f.readlines()
+        from janito.tools.file_cache import file_cache
+        from janito.tools.line_index import split_lines
+
+        return split_lines(file_cache.read_text(path))
 
     def _select_lines(self, lines, from_line, to_line):
         """Select the requested lines and return them with their count and total lines."""
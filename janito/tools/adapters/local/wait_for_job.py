@@ -0,0 +1,49 @@
+from janito.tools.tool_base import ToolBase, ToolPermissions
+from janito.report_events import ReportAction
+from janito.tools.adapters.local.adapter import register_local_tool
+from janito.tools.jobs import JobError, get_job_table
+from janito.i18n import tr
+
+
+@register_local_tool
+class WaitForJobTool(ToolBase):
+    """
+    Wait until a background job finishes or the timeout expires; the job keeps running after a timeout.
+
+    Args:
+        job_id (int): Job id returned by run_bash_command(background=True).
+        timeout (int, optional): Maximum number of seconds to wait. Defaults to 60.
+
+    Returns:
+        str: The job status line, followed by the last 20 lines of its output.
+    """
+
+    permissions = ToolPermissions(execute=True)
+    tool_name = "wait_for_job"
+    parallel_safe = True
+
+    def run(self, job_id: int, timeout: int = 60) -> str:
+        try:
+            job = get_job_table().get(job_id)
+        except JobError as e:
+            self.report_error(tr("❌ {error}", error=e), ReportAction.EXECUTE)
+            return tr("❗ {error}", error=e)
+        self.report_action(
+            tr(
+                "⏳ Wait for job {job_id} (up to {timeout} s)",
+                job_id=job_id,
+                timeout=timeout,
+            ),
+            ReportAction.EXECUTE,
+        )
+        if job.wait(max(timeout, 0)):
+            self.report_success(
+                tr(" ✅ {status}", status=job.status()), ReportAction.EXECUTE
+            )
+        else:
+            self.report_warning(tr(" ⏳ still running"), ReportAction.EXECUTE)
+        return tr(
+            "{status}\n--- OUTPUT (last lines) ---\n{tail}",
+            status=job.describe(),
+            tail=job.tail(),
+        )
@@ -0,0 +1,170 @@
+"""
+Per-tool argument validators, compiled once instead of on every tool call.
+
+A :class:`CompiledValidator` holds what ``ToolsAdapterBase.execute_by_name``
+used to re-derive for each call from the tool's callable and JSON schema:
+the accepted, required and path parameters (``inspect.signature``), the
+schema's required keys and type checkers, and the parameters whose relative
+paths are resolved against the session workdir. Validating a call is then a
+few set and dict lookups; the workspace and temp directory roots for the
+path checks are cached in :mod:`janito.tools.path_security`.
+"""
+
+import inspect
+from collections.abc import Mapping
+
+from janito.tools.path_security import (
+    _extract_path_keys_from_schema,
+    _looks_like_path_key,
+    _validate_argument_value,
+    validate_paths_in_arguments,
+)
+
+# JSON schema type -> Python type(s) accepted for it
+SCHEMA_TYPES = {
+    "string": str,
+    "integer": int,
+    "number": (int, float),
+    "boolean": bool,
+    "array": list,
+    "object": dict,
+}
+
+
+def tool_callable(tool):
+    """The primary callable of a tool instance (itself, ``execute`` or ``run``)."""
+    if callable(tool):
+        return tool
+    if hasattr(tool, "execute") and callable(getattr(tool, "execute")):
+        return getattr(tool, "execute")
+    if hasattr(tool, "run") and callable(getattr(tool, "run")):
+        return getattr(tool, "run")
+    raise ValueError("Provided tool is not executable.")
+
+
+class CompiledValidator:
+    """Argument checks for one tool, derived from its callable and schema."""
+
+    __slots__ = (
+        "tool",
+        "func",
+        "accepts_kwargs",
+        "parameters",
+        "required",
+        "schema_required",
+        "type_checks",
+        "path_keys",
+        "path_flags",
+        "skipped",
+        "resolve_parameters",
+    )
+
+    def __init__(self, tool, schema=None):
+        self.tool = tool
+        self.func = tool_callable(tool)
+        params = inspect.signature(self.func).parameters
+        self.accepts_kwargs = any(
+            p.kind == inspect.Parameter.VAR_KEYWORD for p in params.values()
+        )
+        self.parameters = frozenset(params)
+        self.required = tuple(
+            sorted(
+                name
+                for name, p in params.items()
+                if p.kind
+                in (
+                    inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                    inspect.Parameter.KEYWORD_ONLY,
+                )
+                and p.default is inspect.Parameter.empty
+                and name != "self"
+            )
+        )
+        self.schema_required = tuple(schema.get("required", [])) if schema else ()
+        self.type_checks = {}
+        if schema:
+            for key, spec in schema.get("properties", {}).items():
+                expected = spec.get("type")
+                if expected in SCHEMA_TYPES:
+                    self.type_checks[key] = (expected, SCHEMA_TYPES[expected])
+        self.path_keys = (
+            frozenset(_extract_path_keys_from_schema(schema)) if schema else frozenset()
+        )
+        # Whether each parameter (and each schema property) names a path
+        self.path_flags = {
+            key: key in self.path_keys or _looks_like_path_key(key)
+            for key in (*params, *(schema or {}).get("properties", {}))
+        }
+        self.skipped = frozenset(getattr(tool, "multi_path_arguments", ()) or ())
+        self.resolve_parameters = tuple(
+            name
+            for name in params
+            if self.path_flags[name] and name not in self.skipped
+        )
+
+    def is_path_key(self, key):
+        flag = self.path_flags.get(key)
+        if flag is None:
+            # An argument only a **kwargs tool accepts
+            return key in self.path_keys or _looks_like_path_key(key)
+        return flag
+
+    def check(self, arguments):
+        """Return an error message for ``arguments``, or None when they are valid."""
+        if arguments is None:
+            arguments = {}
+        if not isinstance(arguments, dict):
+            return "Tool arguments should be provided as an object / mapping"
+        if not self.accepts_kwargs:
+            unexpected = [key for key in arguments if key not in self.parameters]
+            if unexpected:
+                return "Unexpected argument(s): " + ", ".join(sorted(unexpected))
+        missing = [name for name in self.required if name not in arguments]
+        if missing:
+            return "Missing required argument(s): " + ", ".join(missing)
+        return None
+
+    def check_schema(self, arguments):
+        """Return an error message when ``arguments`` do not match the schema."""
+        missing = [key for key in self.schema_required if key not in arguments]
+        if missing:
+            return f"Missing required argument(s): {', '.join(missing)}"
+        type_checks = self.type_checks
+        if not type_checks:
+            return None
+        for key, value in arguments.items():
+            check = type_checks.get(key)
+            if check is not None and not isinstance(value, check[1]):
+                return f"Argument '{key}' should be of type '{check[0]}', got '{type(value).__name__}'"
+        return None
+
+    def check_paths(self, arguments, workdir):
+        """Raise PathSecurityError when a path argument leaves ``workdir``."""
+        if not workdir or not arguments:
+            return
+        for key, value in arguments.items():
+            if isinstance(value, list):
+                # Objects in list arguments (e.g. the ``edits`` of edit_files) name their own paths
+                for item in value:
+                    if isinstance(item, Mapping):
+                        validate_paths_in_arguments(item, workdir)
+            if self.is_path_key(key):
+                _validate_argument_value(key, value, workdir)
+
+    def resolve_paths(self, arguments, resolve):
+        """Copy of ``arguments`` with the path parameters passed through ``resolve``."""
+        keys = self.resolve_parameters
+        if self.accepts_kwargs:
+            keys = [
+                key
+                for key in arguments
+                if key not in self.skipped and self.is_path_key(key)
+            ]
+        resolved = dict(arguments)
+        for key in keys:
+            value = arguments.get(key)
+            if isinstance(value, str):
+                resolved[key] = resolve(value)
+            elif isinstance(value, list):
+                resolved[key] = [resolve(item) for item in value]
+        return resolved
@@ -0,0 +1,199 @@
+"""
+Persistent bash sessions for ``run_bash_command``.
+
+Spawning ``bash -c`` for every command costs a process start-up and loses the
+shell state between commands (working directory, activated virtualenvs,
+exported variables). With ``persistent_shell`` enabled, each janito session
+(one per :class:`~janito.tools.tool_context.ToolContext`, or one for the CLI)
+keeps a long-lived ``bash`` process and sends it one command at a time.
+
+A command is read from a quoted here-document and ``eval``-ed in the
+shell itself (so ``cd`` and ``export`` persist) with stdin from ``/dev/null``.
+It is followed by a per-command random sentinel line on stdout (carrying the
+exit status) and on stderr, read by :mod:`janito.tools.framed_output`
+streams that deliver every line before the sentinel to the caller.
+
+On timeout the whole process group of the shell is killed, as a fresh
+``bash -c`` would be, and the next command starts a new shell; a shell that
+exits (``exit`` in a command, or a crash) is restarted the same way.
+"""
+
+import atexit
+import os
+import signal
+import subprocess
+import threading
+import uuid
+import weakref
+
+from janito.tools.framed_output import FramedStream, wait_framed
+from janito.tools.tool_context import get_tool_context, get_workdir
+
+_SENTINEL = "__janito_done_"
+
+
+def persistent_shell_enabled():
+    """True when the ``persistent_shell`` config key is set."""
+    try:
+        from janito.config import config
+
+        value = config.get("persistent_shell")
+    except Exception:
+        return False
+    if isinstance(value, str):
+        return value.strip().lower() in ("1", "true", "yes", "on")
+    return bool(value)
+
+
+def shell_environment():
+    """Environment for bash commands: the process one with UTF-8 forced."""
+    env = os.environ.copy()
+    env["PYTHONIOENCODING"] = "utf-8"
+    env["LC_ALL"] = "C.UTF-8"
+    env["LANG"] = "C.UTF-8"
+    return env
+
+
+def _parse_status(trailer):
+    try:
+        return int(trailer)
+    except (TypeError, ValueError):
+        return None
+
+
+class BashSession:
+    """A long-lived ``bash`` process running one framed command at a time."""
+
+    def __init__(self, cwd=None, env=None):
+        self.cwd = cwd
+        self.env = env
+        self.process = None
+        self._lock = threading.Lock()
+        self._stdout = self._stderr = None
+        self.starts = 0
+
+    @property
+    def alive(self):
+        return (
+            self.process is not None
+            and self.process.poll() is None
+            and not (self._stdout.eof or self._stderr.eof)
+        )
+
+    def _start(self):
+        self.close()
+        self.process = subprocess.Popen(
+            ["bash", "--noprofile", "--norc"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+            bufsize=1,
+            env=self.env if self.env is not None else shell_environment(),
+            cwd=self.cwd,
+            start_new_session=os.name == "posix",
+        )
+        self.starts += 1
+        self._stdout = FramedStream(self.process.stdout, "bash-stdout")
+        self._stderr = FramedStream(self.process.stderr, "bash-stderr")
+
+    def run(self, command, timeout=None, on_stdout=None, on_stderr=None):
+        """
+        Run ``command`` and return its exit code, calling ``on_stdout`` /
+        ``on_stderr`` with every output line (newline included) as it arrives.
+        Raises subprocess.TimeoutExpired after killing the shell.
+        """
+        with self._lock:
+            if not self.alive:
+                self._start()
+            token = uuid.uuid4().hex
+            marker = f"{_SENTINEL}{token}"
+            self._stdout.expect(marker, on_stdout)
+            self._stderr.expect(marker, on_stderr)
+            script = (
+                f"IFS= read -r -d '' __janito_cmd <<'__JANITO_CMD_{token}'\n"
+                f"{command}\n__JANITO_CMD_{token}\n"
+                f"eval \"$__janito_cmd\" </dev/null\n"
+                f"printf '\\n{marker} %d\\n' \"$?\"\n"
+                f"printf '\\n{marker}\\n' >&2\n"
+            )
+            try:
+                self.process.stdin.write(script)
+                self.process.stdin.flush()
+            except (BrokenPipeError, OSError):
+                # The shell died between two commands: start a new one and retry
+                self._start()
+                self._stdout.expect(marker, on_stdout)
+                self._stderr.expect(marker, on_stderr)
+                self.process.stdin.write(script)
+                self.process.stdin.flush()
+            if not wait_framed((self._stdout, self._stderr), timeout):
+                self.close()
+                raise subprocess.TimeoutExpired(command, timeout)
+            if self._stdout.eof or self._stderr.eof:
+                # ``exit`` or a crash: report the shell's own exit status
+                status = self.process.wait()
+                self.close()
+                return status
+            return _parse_status(self._stdout.trailer)
+
+    def close(self):
+        """Kill the shell and every process it started."""
+        process, self.process = self.process, None
+        if process is None:
+            return
+        if process.poll() is None:
+            try:
+                if os.name == "posix":
+                    os.killpg(process.pid, signal.SIGKILL)
+                else:
+                    process.kill()
+            except OSError:
+                pass
+        try:
+            process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            pass
+        for pipe in (process.stdin, process.stdout, process.stderr):
+            try:
+                pipe.close()
+            except OSError:
+                pass
+
+
+_sessions = {}  # id(ToolContext) or None (the CLI) -> BashSession
+_sessions_lock = threading.Lock()
+
+
+def get_bash_session():
+    """Return the BashSession of the current janito session, creating it on first use."""
+    context = get_tool_context()
+    key = id(context) if context is not None else None
+    with _sessions_lock:
+        session = _sessions.get(key)
+        if session is None:
+            session = _sessions[key] = BashSession(cwd=get_workdir())
+            if context is not None:
+                weakref.finalize(context, close_bash_session, key)
+        return session
+
+
+def close_bash_session(key=None):
+    """Close the shell of one session (``id`` of its ToolContext, None for the CLI)."""
+    with _sessions_lock:
+        session = _sessions.pop(key, None)
+    if session is not None:
+        session.close()
+
+
+def close_all_bash_sessions():
+    with _sessions_lock:
+        sessions = list(_sessions.values())
+        _sessions.clear()
+    for session in sessions:
+        session.close()
+
+
+atexit.register(close_all_bash_sessions)
@@ -25,6 +25,7 @@ class DisabledToolsState:
                 name.strip() for name in tool_names.split(",") if name.strip()
             ]
         cls._disabled_tools = set(tool_names)
+        _invalidate_tool_schemas()
 
     @classmethod
     def is_tool_disabled(cls, tool_name):
@@ -35,11 +36,19 @@ class DisabledToolsState:
     def disable_tool(cls, tool_name):
         """Add a tool to the disabled list."""
         cls._disabled_tools.add(tool_name)
+        _invalidate_tool_schemas()
 
     @classmethod
     def enable_tool(cls, tool_name):
         """Remove a tool from the disabled list."""
         cls._disabled_tools.discard(tool_name)
+        _invalidate_tool_schemas()
+
+
+def _invalidate_tool_schemas():
+    from janito.tools.tool_schema_cache import invalidate_tool_schemas
+
+    invalidate_tool_schemas()
 
 
 # Convenience functions
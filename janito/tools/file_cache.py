@@ -0,0 +1,213 @@
+"""
+Process-wide cache of file contents shared by the local read tools.
+
+Within one agent turn the same files are typically read several times:
+``search_text`` scans them, ``view_file`` pages through the matches,
+``replace_text_in_file`` re-reads before editing and ``validate_file_syntax``
+checks the result. :class:`FileContentCache` keeps the raw bytes of recently
+read files, keyed by real path and validated against ``mtime_ns`` and size on
+every lookup (one ``stat`` instead of an open, read and decode), with the
+decoded text memoized alongside.
+
+Memory is bounded by ``file_cache_max_mb`` (default 64, ``0`` disables the
+cache); the least recently used files are evicted first, and a single file
+larger than a quarter of the budget is never cached. janito's own write tools
+call :func:`invalidate_file` / :func:`invalidate_tree` after changing a path
+(which also drops its line index, see :mod:`janito.tools.line_index`),
+so edits are seen even when the filesystem's mtime resolution is too coarse to
+notice them. Hits and misses are reported to the performance collector as the
+``file_content`` cache.
+"""
+
+import os
+import threading
+
+DEFAULT_MAX_MB = 64
+CACHE_NAME = "file_content"
+# Files larger than budget / MAX_FILE_FRACTION are read directly, never cached
+MAX_FILE_FRACTION = 4
+
+
+def normalize_newlines(text):
+    """Universal newlines, as text-mode ``read()``."""
+    return text.replace("\r\n", "\n").replace("\r", "\n") if "\r" in text else text
+
+
+class CachedFile:
+    """The bytes of one version of a file, with its decoded text memoized."""
+
+    __slots__ = ("path", "stat", "data", "_text", "_owner")
+
+    def __init__(self, path, stat, data, owner=None):
+        self.path = path
+        self.stat = stat
+        self.data = data
+        self._text = None
+        self._owner = owner
+
+    @property
+    def cost(self):
+        return len(self.data) + (len(self._text) if self._text is not None else 0)
+
+    def matches(self, st):
+        return st.st_mtime_ns == self.stat.st_mtime_ns and st.st_size == self.stat.st_size
+
+    def text(self, errors="replace"):
+        """
+        Decoded UTF-8 text with universal newlines, like ``open(path).read()``;
+        ``errors="strict"`` raises UnicodeDecodeError as text-mode reads do.
+        """
+        if errors != "replace":
+            return normalize_newlines(self.data.decode("utf-8", errors=errors))
+        if self._text is None:
+            text = normalize_newlines(self.data.decode("utf-8", errors="replace"))
+            if self._owner is None:
+                self._text = text
+            else:
+                self._owner._store_text(self, text)
+        return self._text
+
+
+class FileContentCache:
+    """Thread-safe LRU of CachedFile entries within a byte budget."""
+
+    def __init__(self, max_bytes=None):
+        self._lock = threading.Lock()
+        self._entries = {}  # realpath -> CachedFile, least recently used first
+        self._used = 0
+        self._max_bytes = max_bytes
+
+    @property
+    def max_bytes(self):
+        if self._max_bytes is not None:
+            return self._max_bytes
+        try:
+            from janito.config import config
+
+            value = config.get("file_cache_max_mb")
+            max_mb = DEFAULT_MAX_MB if value in (None, "") else float(value)
+        except Exception:
+            max_mb = DEFAULT_MAX_MB
+        return int(max_mb * 1024 * 1024)
+
+    @property
+    def used_bytes(self):
+        return self._used
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, path):
+        """
+        Return the CachedFile for the current version of ``path``, reading it on
+        a miss, or None when the file is too large to cache or caching is off
+        (callers then read the file themselves). Raises OSError like ``open``.
+        """
+        key = os.path.realpath(path)
+        st = os.stat(key)
+        max_bytes = self.max_bytes
+        if max_bytes <= 0 or st.st_size > max_bytes // MAX_FILE_FRACTION:
+            return None
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                if entry.matches(st):
+                    self._entries[key] = entry
+                    _report(True)
+                    return entry
+                self._used -= entry.cost
+        _report(False)
+        with open(key, "rb") as f:
+            st = os.fstat(f.fileno())
+            data = f.read()
+        if len(data) > max_bytes // MAX_FILE_FRACTION:
+            return CachedFile(key, st, data)
+        entry = CachedFile(key, st, data, owner=self)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._used -= previous.cost
+            self._entries[key] = entry
+            self._used += entry.cost
+            self._evict(max_bytes)
+        return entry
+
+    def read_bytes(self, path):
+        entry = self.get(path)
+        if entry is not None:
+            return entry.data
+        with open(path, "rb") as f:
+            return f.read()
+
+    def read_text(self, path, errors="replace"):
+        """``open(path, encoding="utf-8", errors=errors).read()``, from the cache."""
+        entry = self.get(path)
+        if entry is not None:
+            return entry.text(errors)
+        with open(path, "r", encoding="utf-8", errors=errors) as f:
+            return f.read()
+
+    def invalidate(self, path):
+        """Forget ``path`` (after janito wrote, moved or removed it)."""
+        key = os.path.realpath(path)
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._used -= entry.cost
+
+    def invalidate_tree(self, path):
+        """Forget ``path`` and every cached file below it."""
+        key = os.path.realpath(path)
+        prefix = key.rstrip(os.sep) + os.sep
+        with self._lock:
+            for cached in [k for k in self._entries if k == key or k.startswith(prefix)]:
+                self._used -= self._entries.pop(cached).cost
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._used = 0
+
+    def _store_text(self, entry, text):
+        max_bytes = self.max_bytes
+        with self._lock:
+            if entry._text is not None:
+                return
+            entry._text = text
+            if self._entries.get(entry.path) is entry:
+                self._used += len(text)
+                self._evict(max_bytes)
+
+    def _evict(self, max_bytes):
+        while self._used > max_bytes and self._entries:
+            key = next(iter(self._entries))
+            self._used -= self._entries.pop(key).cost
+
+
+def _report(hit):
+    try:
+        from janito.perf_singleton import performance_collector
+
+        performance_collector.record_cache_access(CACHE_NAME, hit)
+    except Exception:
+        pass
+
+
+# Singleton instance shared by all local tools
+file_cache = FileContentCache()
+
+
+def invalidate_file(path):
+    """Forget the cached contents and line index of ``path`` after janito changed it."""
+    from janito.tools.line_index import forget_line_index
+
+    file_cache.invalidate(path)
+    forget_line_index(path)
+
+
+def invalidate_tree(path):
+    """Forget cached contents and line indexes of ``path`` and everything below it."""
+    from janito.tools.line_index import forget_line_index
+
+    file_cache.invalidate_tree(path)
+    forget_line_index(path, tree=True)
@@ -0,0 +1,76 @@
+"""
+Sentinel-framed output of long-lived processes (bash sessions, Python workers).
+
+A process that runs one job after another writes, after each job, a newline
+followed by a per-job marker line on stdout and on stderr. A
+:class:`FramedStream` reads one of those pipes on a daemon thread, hands every
+line before the marker to the current job's sink and signals when the marker
+arrived. The newline written before the marker makes sure it starts a line;
+the empty line this adds after complete output is dropped (a final line
+without a newline is delivered with one).
+"""
+
+import threading
+import time
+
+
+class FramedStream:
+    """Reader thread for one output pipe of a long-lived process."""
+
+    def __init__(self, pipe, name, marker=None):
+        self.pipe = pipe
+        self.name = name
+        self.sink = None
+        self.marker = marker  # set before the thread starts, e.g. a start-up marker
+        self.trailer = None  # the rest of the marker line (e.g. an exit status)
+        self.held = None  # an empty line, dropped if the marker follows it
+        self.eof = False
+        self.done = threading.Event()
+        self.thread = threading.Thread(
+            target=self._read, name=f"janito-{name}", daemon=True
+        )
+        self.thread.start()
+
+    def expect(self, marker, sink):
+        """Deliver lines to ``sink`` until ``marker`` starts a line."""
+        self.marker = marker
+        self.sink = sink
+        self.trailer = None
+        self.held = None
+        self.done.clear()
+
+    def _deliver(self, line):
+        if self.sink is not None:
+            self.sink(line)
+
+    def _read(self):
+        for line in self.pipe:
+            if self.marker is not None and line.startswith(self.marker):
+                self.held = None
+                self.trailer = line[len(self.marker) :].strip()
+                self.marker = None
+                self.done.set()
+                continue
+            if self.held is not None:
+                self._deliver(self.held)
+                self.held = None
+            if line == "\n":
+                self.held = line
+            else:
+                self._deliver(line)
+        # The process exited: flush what it printed and release the waiter
+        if self.held is not None:
+            self._deliver(self.held)
+            self.held = None
+        self.eof = True
+        self.done.set()
+
+
+def wait_framed(streams, timeout=None):
+    """Wait until every stream saw its marker (or EOF); False on timeout."""
+    deadline = None if timeout is None else time.monotonic() + timeout
+    for stream in streams:
+        remaining = None if deadline is None else max(deadline - time.monotonic(), 0)
+        if not stream.done.wait(remaining):
+            return False
+    return True
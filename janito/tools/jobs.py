@@ -0,0 +1,304 @@
+"""
+Background jobs for long-running commands.
+
+``run_bash_command`` with ``background=True`` starts the command as a job and
+returns at once, so builds, test suites and dev servers neither block the
+agent loop nor hit the command timeout. The job tools (``job_status``,
+``read_job_output``, ``wait_for_job``, ``kill_job``) then poll it, read its
+output incrementally by byte offset, wait for it with a timeout or kill it.
+
+Jobs belong to a janito session (one :class:`JobTable` per
+:class:`~janito.tools.tool_context.ToolContext`, or one for the CLI) and are
+numbered from 1 within it. A job runs ``bash -c`` in its own process group
+with stdin from ``/dev/null``; stdout and stderr go straight to one log file,
+so no thread copies the output while the job runs. A waiter thread reaps the
+process and records its resource usage (CPU time and peak memory, including
+the children it waited for). At most ``max_background_jobs`` jobs run at once
+per session; the logs of the oldest finished jobs are deleted beyond
+``KEEP_FINISHED``, and all jobs are killed when their session ends.
+"""
+
+import atexit
+import os
+import shutil
+import signal
+import subprocess
+import tempfile
+import threading
+import time
+import weakref
+
+from janito.tools.tool_context import get_tool_context, get_workdir
+
+DEFAULT_MAX_JOBS = 8
+KEEP_FINISHED = 20
+KILL_GRACE = 3.0
+
+
+class JobError(ValueError):
+    """An unknown job id or a job that cannot be started."""
+
+
+def max_background_jobs():
+    try:
+        from janito.config import config
+
+        value = config.get("max_background_jobs")
+        return int(value) if value not in (None, "") else DEFAULT_MAX_JOBS
+    except Exception:
+        return DEFAULT_MAX_JOBS
+
+
+_log_dir = None
+_log_dir_lock = threading.Lock()
+
+
+def _new_log_path(job_id):
+    global _log_dir
+    with _log_dir_lock:
+        if _log_dir is None or not os.path.isdir(_log_dir):
+            _log_dir = tempfile.mkdtemp(prefix="janito-jobs-")
+        fd, path = tempfile.mkstemp(
+            prefix=f"job_{job_id}_", suffix=".log", dir=_log_dir
+        )
+    os.close(fd)
+    return path
+
+
+def _format_bytes(size):
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+class Job:
+    """One background command, its log file and its resource usage."""
+
+    def __init__(self, job_id, command, cwd=None, env=None):
+        from janito.tools.bash_session import shell_environment
+
+        self.id = job_id
+        self.command = command
+        self.cwd = cwd
+        self.log_path = _new_log_path(job_id)
+        self.started = time.monotonic()
+        self.ended = None
+        self.return_code = None
+        self.killed = False
+        self.cpu_seconds = None
+        self.max_rss_kb = None
+        self.finished = threading.Event()
+        with open(self.log_path, "wb") as log:
+            self.process = subprocess.Popen(
+                ["bash", "-c", command],
+                stdin=subprocess.DEVNULL,
+                stdout=log,
+                stderr=subprocess.STDOUT,
+                env=env if env is not None else shell_environment(),
+                cwd=cwd,
+                start_new_session=os.name == "posix",
+            )
+        self.pid = self.process.pid
+        threading.Thread(
+            target=self._reap, name=f"janito-job-{job_id}", daemon=True
+        ).start()
+
+    def _reap(self):
+        if hasattr(os, "wait4"):
+            try:
+                _, status, usage = os.wait4(self.pid, 0)
+            except ChildProcessError:
+                self.return_code = self.process.wait()
+            else:
+                self.return_code = self.process.returncode = (
+                    os.waitstatus_to_exitcode(status)
+                )
+                self.cpu_seconds = usage.ru_utime + usage.ru_stime
+                self.max_rss_kb = usage.ru_maxrss
+        else:
+            self.return_code = self.process.wait()
+        self.ended = time.monotonic()
+        self.finished.set()
+
+    @property
+    def running(self):
+        return not self.finished.is_set()
+
+    @property
+    def elapsed(self):
+        return (self.ended or time.monotonic()) - self.started
+
+    @property
+    def output_size(self):
+        try:
+            return os.path.getsize(self.log_path)
+        except OSError:
+            return 0
+
+    def wait(self, timeout=None):
+        """Wait until the job ends; False on timeout."""
+        return self.finished.wait(timeout)
+
+    def kill(self):
+        """Terminate the job's process group, then kill it after KILL_GRACE seconds."""
+        if not self.running:
+            return
+        self.killed = True
+        for sig, grace in ((signal.SIGTERM, KILL_GRACE), (signal.SIGKILL, None)):
+            try:
+                if os.name == "posix":
+                    os.killpg(self.pid, sig)
+                else:
+                    self.process.kill()
+            except OSError:
+                pass
+            if grace is None or self.wait(grace):
+                break
+        self.wait(5)
+
+    def read(self, offset=0, max_bytes=16384):
+        """
+        Return ``(text, next_offset)`` for up to ``max_bytes`` of output from
+        byte ``offset``. While more output follows, the chunk ends at a line
+        break when it contains one.
+        """
+        offset = max(offset, 0)
+        try:
+            with open(self.log_path, "rb") as log:
+                log.seek(offset)
+                data = log.read(max_bytes + 1)
+        except OSError:
+            return "", offset
+        more = len(data) > max_bytes
+        data = data[:max_bytes]
+        if (more or self.running) and b"\n" in data:
+            data = data[: data.rindex(b"\n") + 1]
+        return data.decode("utf-8", errors="replace"), offset + len(data)
+
+    def tail(self, lines=20, max_bytes=16384):
+        """The last ``lines`` lines of output (read from the last ``max_bytes``)."""
+        size = self.output_size
+        text, _ = self.read(max(size - max_bytes, 0), max_bytes)
+        return "".join(text.splitlines(keepends=True)[-lines:])
+
+    def status(self):
+        if self.running:
+            return "running"
+        if self.killed:
+            return f"killed (return code {self.return_code})"
+        return f"exited with return code {self.return_code}"
+
+    def describe(self):
+        """One-line summary: state, run time, resource usage and output size."""
+        usage = [f"{self.elapsed:.1f} s", f"output {_format_bytes(self.output_size)}"]
+        if self.cpu_seconds is not None:
+            usage.append(f"cpu {self.cpu_seconds:.1f} s")
+        if self.max_rss_kb:
+            usage.append(f"peak memory {_format_bytes(self.max_rss_kb * 1024)}")
+        return (
+            f"job {self.id} (pid {self.pid}) {self.status()}, {', '.join(usage)}: "
+            f"{self.command}"
+        )
+
+    def discard(self):
+        """Kill the job if needed and delete its log."""
+        self.kill()
+        try:
+            os.remove(self.log_path)
+        except OSError:
+            pass
+
+
+class JobTable:
+    """The background jobs of one session."""
+
+    def __init__(self):
+        self._jobs = {}
+        self._next_id = 1
+        self._lock = threading.Lock()
+
+    def start(self, command, cwd=None, env=None):
+        limit = max_background_jobs()
+        with self._lock:
+            running = sum(job.running for job in self._jobs.values())
+            if limit > 0 and running >= limit:
+                raise JobError(
+                    f"{running} background jobs are already running "
+                    f"(max_background_jobs={limit}); wait for or kill one first"
+                )
+            job_id = self._next_id
+            self._next_id += 1
+            job = self._jobs[job_id] = Job(job_id, command, cwd=cwd, env=env)
+            finished = [j for j in self._jobs.values() if not j.running]
+            expired = finished[: max(len(finished) - KEEP_FINISHED, 0)]
+            for old in expired:
+                del self._jobs[old.id]
+        for old in expired:
+            old.discard()
+        return job
+
+    def get(self, job_id):
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is None:
+            raise JobError(f"Unknown job id: {job_id}")
+        return job
+
+    def jobs(self):
+        with self._lock:
+            return list(self._jobs.values())
+
+    def close(self):
+        with self._lock:
+            jobs = list(self._jobs.values())
+            self._jobs.clear()
+        for job in jobs:
+            job.discard()
+
+
+_tables = {}  # id(ToolContext) or None (the CLI) -> JobTable
+_tables_lock = threading.Lock()
+
+
+def get_job_table():
+    """Return the JobTable of the current janito session, creating it on first use."""
+    context = get_tool_context()
+    key = id(context) if context is not None else None
+    with _tables_lock:
+        table = _tables.get(key)
+        if table is None:
+            table = _tables[key] = JobTable()
+            if context is not None:
+                weakref.finalize(context, close_job_table, key)
+        return table
+
+
+def start_job(command):
+    """Start ``command`` as a background job of the current session."""
+    return get_job_table().start(command, cwd=get_workdir())
+
+
+def close_job_table(key=None):
+    """Kill the jobs of one session (``id`` of its ToolContext, None for the CLI)."""
+    with _tables_lock:
+        table = _tables.pop(key, None)
+    if table is not None:
+        table.close()
+
+
+def close_all_job_tables():
+    global _log_dir
+    with _tables_lock:
+        tables = list(_tables.values())
+        _tables.clear()
+    for table in tables:
+        table.close()
+    with _log_dir_lock:
+        log_dir, _log_dir = _log_dir, None
+    if log_dir is not None:
+        shutil.rmtree(log_dir, ignore_errors=True)
+
+
+atexit.register(close_all_job_tables)
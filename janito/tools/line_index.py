@@ -0,0 +1,218 @@
+"""
+Line-offset index for serving line ranges of large files.
+
+``view_file`` pages through files a few dozen lines at a time; re-reading
+and decoding the whole file for every page is O(file) per call. A
+:class:`LineIndex` records the byte offset of every ``STRIDE``-th line,
+found with a single newline scan over an ``mmap`` of the file, and is cached
+by (path, mtime_ns, size). A range is then served by seeking to the nearest
+checkpoint, skipping at most ``STRIDE - 1`` lines and decoding only the
+requested bytes, so the cost is O(range) and memory stays at 8 bytes per
+``STRIDE`` lines. Files that fit the shared file cache
+(:mod:`janito.tools.file_cache`) are served from its bytes; larger ones are
+never loaded, so files larger than RAM work.
+
+Lines end at ``"\\n"``; ``"\\r\\n"`` is returned as ``"\\n"`` like text-mode
+``readlines()`` does. Unlike ``readlines()``, a lone ``"\\r"`` is kept as-is
+rather than treated as a line break, so line numbers match the index.
+"""
+
+import mmap
+import os
+import re
+import threading
+from array import array
+
+from janito.tools.file_cache import file_cache, normalize_newlines
+
+STRIDE = 64
+MAX_CACHED_INDEXES = 256
+
+# Exactly STRIDE lines; matched repeatedly from the previous end, so the scan is linear
+_STRIDE_LINES = re.compile(rb"(?:[^\n]*\n){%d}" % STRIDE)
+
+
+def split_lines(text):
+    """Split like readlines(): keep "\\n", no empty trailing line."""
+    parts = text.split("\n")
+    lines = [part + "\n" for part in parts[:-1]]
+    if parts[-1]:
+        lines.append(parts[-1])
+    return lines
+
+
+class LineIndex:
+    """Byte offsets of every STRIDE-th line of one version of a file."""
+
+    __slots__ = ("path", "mtime_ns", "size", "line_count", "_checkpoints")
+
+    def __init__(self, path, mtime_ns, size, checkpoints, line_count):
+        self.path = path
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self.line_count = line_count
+        self._checkpoints = checkpoints
+
+    @classmethod
+    def scan(cls, path, st, buffer):
+        """Build the index of ``path`` (stat ``st``) from its contents (bytes or mmap)."""
+        checkpoints = array("q", [0])
+        match = _STRIDE_LINES.match(buffer, 0)
+        pos = 0
+        while match:
+            pos = match.end()
+            checkpoints.append(pos)
+            match = _STRIDE_LINES.match(buffer, pos)
+        newlines = (len(checkpoints) - 1) * STRIDE
+        size = len(buffer)
+        while True:
+            pos = buffer.find(b"\n", pos) + 1
+            if not pos:
+                break
+            newlines += 1
+        line_count = newlines + (1 if size and buffer[size - 1 : size] != b"\n" else 0)
+        return cls(path, st.st_mtime_ns, st.st_size, checkpoints, line_count)
+
+    def matches(self, st):
+        return st.st_mtime_ns == self.mtime_ns and st.st_size == self.size
+
+    def _offset(self, buffer, line):
+        """Byte offset where 0-based ``line`` starts (``size`` past the last line)."""
+        if line >= self.line_count:
+            return self.size
+        checkpoint = line // STRIDE
+        pos = self._checkpoints[checkpoint]
+        for _ in range(line - checkpoint * STRIDE):
+            pos = buffer.find(b"\n", pos) + 1
+        return pos
+
+    def read_range(self, buffer, from_line=None, to_line=None):
+        """Lines ``from_line``..``to_line`` (1-based, inclusive; None: first/last)."""
+        first = max((from_line or 1) - 1, 0)
+        last = self.line_count if to_line is None else min(to_line, self.line_count)
+        if first >= last:
+            return []
+        start = self._offset(buffer, first)
+        end = self._offset(buffer, last)
+        text = bytes(buffer[start:end]).decode("utf-8", errors="replace")
+        if "\r" in text:
+            text = text.replace("\r\n", "\n")
+        return split_lines(text)
+
+
+_cache = {}
+_cache_lock = threading.Lock()
+
+
+def _cached(key, st):
+    with _cache_lock:
+        index = _cache.get(key)
+        if index is not None and index.matches(st):
+            # Move to the end: the oldest entries are evicted first
+            _cache[key] = _cache.pop(key)
+            return index
+    return None
+
+
+def _remember(key, index):
+    with _cache_lock:
+        _cache.pop(key, None)
+        if len(_cache) >= MAX_CACHED_INDEXES:
+            _cache.pop(next(iter(_cache)))
+        _cache[key] = index
+
+
+def forget_line_index(path, tree=False):
+    """Drop the index of ``path`` (and, with ``tree``, of every file below it)."""
+    key = os.path.realpath(path)
+    prefix = key.rstrip(os.sep) + os.sep
+    with _cache_lock:
+        for cached in [k for k in _cache if k == key or (tree and k.startswith(prefix))]:
+            del _cache[cached]
+
+
+def clear_line_index_cache():
+    with _cache_lock:
+        _cache.clear()
+
+
+class _MappedFile:
+    """
+    Contents of a file: the shared file cache entry when the file fits in it,
+    else a read-only mmap (empty files map to b"").
+    """
+
+    def __init__(self, path):
+        self._file = None
+        self.entry = file_cache.get(path)
+        if self.entry is not None:
+            self.stat, self.buffer = self.entry.stat, self.entry.data
+            return
+        self._file = open(path, "rb")
+        try:
+            self.stat = os.fstat(self._file.fileno())
+            self.buffer = (
+                mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+                if self.stat.st_size
+                else b""
+            )
+        except Exception:
+            self._file.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        if isinstance(self.buffer, mmap.mmap):
+            self.buffer.close()
+        if self._file is not None:
+            self._file.close()
+
+
+def get_line_index(path, mapped=None):
+    """Return the (cached) LineIndex of ``path``."""
+    key = os.path.realpath(path)
+    if mapped is not None:
+        st = mapped.stat
+    else:
+        st = os.stat(path)
+    index = _cached(key, st)
+    if index is not None:
+        return index
+    if mapped is None:
+        with _MappedFile(path) as mapped:
+            return get_line_index(path, mapped)
+    index = LineIndex.scan(key, st, mapped.buffer)
+    _remember(key, index)
+    return index
+
+
+def read_line_range(path, from_line=None, to_line=None):
+    """
+    Return (lines, total_lines) for lines ``from_line``..``to_line`` of ``path``
+    (1-based, inclusive, None for the first/last line).
+    """
+    with _MappedFile(path) as mapped:
+        index = get_line_index(path, mapped)
+        return index.read_range(mapped.buffer, from_line, to_line), index.line_count
+
+
+def count_lines(path):
+    """Number of lines in ``path``, without decoding it."""
+    return get_line_index(path).line_count
+
+
+def read_text(path):
+    """
+    Return the whole text of ``path`` (decoded like text-mode ``read()``),
+    indexing it from the same bytes so later range reads skip the scan.
+    """
+    with _MappedFile(path) as mapped:
+        data = bytes(mapped.buffer)
+        key = os.path.realpath(path)
+        if _cached(key, mapped.stat) is None:
+            _remember(key, LineIndex.scan(key, mapped.stat, data))
+        if mapped.entry is not None:
+            return mapped.entry.text()
+    return normalize_newlines(data.decode("utf-8", errors="replace"))
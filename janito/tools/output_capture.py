@@ -0,0 +1,245 @@
+"""
+Bounded capture of command output for ``run_bash_command`` and the python run tools.
+
+Each output stream goes through a :class:`StreamCapture`, which
+
+- batches lines for display: they are reported as one ``ReportEvent`` per
+  chunk of up to ``CHUNK_BYTES``, or whatever arrived within
+  ``CHUNK_INTERVAL`` seconds, instead of one event (and console flush) per line.
+  At most ``DISPLAY_LINES`` lines are shown per interval; the others are
+  replaced by a count, so a flood of output cannot stall on the terminal;
+- keeps the first ``output_head_lines`` and the last ``output_tail_lines``
+  lines in memory for the tool result, with over-long lines shortened;
+- spills the full stream to a file only once the buffers can no longer hold
+  all of it. Small outputs never touch the disk.
+
+Spill files live in one temporary directory per process, which keeps the
+``SPILL_KEEP`` most recent files (older ones are deleted as new ones are
+created) and is removed at exit.
+"""
+
+import atexit
+import os
+import shutil
+import tempfile
+import threading
+from collections import deque
+
+DEFAULT_HEAD_LINES = 50
+DEFAULT_TAIL_LINES = 50
+CHUNK_BYTES = 64 * 1024
+CHUNK_INTERVAL = 0.1
+DISPLAY_LINES = 200
+MAX_LINE_CHARS = 4000
+SPILL_KEEP = 20
+
+
+def _config_lines(key, default):
+    try:
+        from janito.config import config
+
+        value = config.get(key)
+    except Exception:
+        return default
+    try:
+        return max(int(value), 0) if value not in (None, "") else default
+    except (TypeError, ValueError):
+        return default
+
+
+def _shorten(line):
+    """``line`` cut to MAX_LINE_CHARS (keeping its newline), for display and the result."""
+    if len(line) <= MAX_LINE_CHARS:
+        return line
+    omitted = len(line.rstrip("\r\n")) - MAX_LINE_CHARS
+    return f"{line[:MAX_LINE_CHARS]} ... ({omitted} more characters)\n"
+
+
+class SpillFiles:
+    """The spill directory of this process, keeping the ``keep`` newest files."""
+
+    def __init__(self, keep=SPILL_KEEP):
+        self.keep = keep
+        self.directory = None
+        self._paths = deque()
+        self._lock = threading.Lock()
+
+    def create(self, prefix):
+        """Create a new, empty spill file and return its path."""
+        with self._lock:
+            if self.directory is None or not os.path.isdir(self.directory):
+                self.directory = tempfile.mkdtemp(prefix="janito-output-")
+            fd, path = tempfile.mkstemp(
+                prefix=prefix, suffix=".log", dir=self.directory
+            )
+            self._paths.append(path)
+            while len(self._paths) > self.keep:
+                try:
+                    os.remove(self._paths.popleft())
+                except OSError:
+                    pass
+        os.close(fd)
+        return path
+
+    def cleanup(self):
+        with self._lock:
+            directory, self.directory = self.directory, None
+            self._paths.clear()
+        if directory is not None:
+            shutil.rmtree(directory, ignore_errors=True)
+
+
+spill_files = SpillFiles()
+atexit.register(spill_files.cleanup)
+
+
+class StreamCapture:
+    """Head/tail buffers, display chunks and an on-demand spill file for one stream."""
+
+    def __init__(self, report, spill_prefix, head_lines=None, tail_lines=None):
+        self.report = report
+        self.spill_prefix = spill_prefix
+        self.head_lines = (
+            _config_lines("output_head_lines", DEFAULT_HEAD_LINES)
+            if head_lines is None
+            else head_lines
+        )
+        tail_lines = (
+            _config_lines("output_tail_lines", DEFAULT_TAIL_LINES)
+            if tail_lines is None
+            else tail_lines
+        )
+        self.lines = 0
+        self.head = []
+        self.tail = deque(maxlen=tail_lines)
+        self.spill_path = None
+        self._spill = None
+        self._pending = []
+        self._pending_bytes = 0
+        self._shown = 0  # lines displayed in the current interval
+        self._hidden = 0
+        self._closed = False
+        self._lock = threading.Lock()
+
+    @property
+    def spilled(self):
+        """True when the output did not fit the buffers (see ``spill_path``)."""
+        return self.spill_path is not None
+
+    def _start_spill(self):
+        # Until now the buffers hold every line in full
+        self.spill_path = spill_files.create(self.spill_prefix)
+        self._spill = open(self.spill_path, "w", encoding="utf-8", errors="replace")
+        self._spill.writelines(self.head)
+        self._spill.writelines(self.tail)
+
+    def write(self, line):
+        """Record one line of output (with its newline, if any)."""
+        with self._lock:
+            if self._closed:
+                return  # late output of a command that timed out
+            self.lines += 1
+            short = _shorten(line)
+            if len(self.head) < self.head_lines:
+                if self._spill is None and short is not line:
+                    self._start_spill()
+                self.head.append(short)
+            else:
+                if self._spill is None and (
+                    short is not line or len(self.tail) == self.tail.maxlen
+                ):
+                    self._start_spill()
+                self.tail.append(short)
+            if self._spill is not None:
+                self._spill.write(line)
+            if self._shown >= DISPLAY_LINES:
+                self._hidden += 1
+                return
+            self._shown += 1
+            text = short.rstrip("\r\n")
+            self._pending.append(text)
+            self._pending_bytes += len(text) + 1
+            if self._pending_bytes >= CHUNK_BYTES:
+                self._flush_chunk()
+
+    def _flush_chunk(self, end_interval=False):
+        if end_interval:
+            if self._hidden:
+                self._pending.append(f"... ({self._hidden} more lines) ...")
+            self._shown = self._hidden = 0
+        if not self._pending:
+            return
+        chunk = "\n".join(self._pending)
+        self._pending = []
+        self._pending_bytes = 0
+        if chunk.strip("\n"):
+            self.report(chunk)
+
+    def flush(self):
+        """Report the lines waiting for display and start a new interval."""
+        with self._lock:
+            self._flush_chunk(end_interval=True)
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+            self._flush_chunk(end_interval=True)
+            if self._spill is not None:
+                self._spill.close()
+                self._spill = None
+
+    def text(self):
+        """The whole output, or its head and tail around an omission note once spilled."""
+        with self._lock:
+            if self.spill_path is None:
+                return "".join(self.head) + "".join(self.tail)
+            omitted = self.lines - len(self.head) - len(self.tail)
+            if not omitted:
+                # Spilled for an over-long line: every line is there, shortened
+                return "".join(self.head) + "".join(self.tail)
+            return (
+                "".join(self.head)
+                + f"... ({omitted} lines omitted) ...\n"
+                + "".join(self.tail)
+            )
+
+
+class CommandCapture:
+    """
+    Capture of a command's stdout and stderr. Used as a context manager: a
+    ticker thread reports pending display chunks every ``CHUNK_INTERVAL``
+    seconds, and leaving the block reports the rest and closes spill files.
+    """
+
+    def __init__(self, spill_prefix, report_stdout, report_stderr):
+        self.stdout = StreamCapture(report_stdout, f"{spill_prefix}stdout_")
+        self.stderr = StreamCapture(report_stderr, f"{spill_prefix}stderr_")
+        self._closed = threading.Event()
+        self._ticker = threading.Thread(
+            target=self._tick, name="janito-output-capture", daemon=True
+        )
+
+    def _tick(self):
+        while not self._closed.wait(CHUNK_INTERVAL):
+            self.stdout.flush()
+            self.stderr.flush()
+
+    def __enter__(self):
+        self._ticker.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+        return False
+
+    def close(self):
+        if not self._closed.is_set():
+            self._closed.set()
+            if self._ticker.is_alive():
+                self._ticker.join()
+        self.stdout.close()
+        self.stderr.close()
+
+    @property
+    def spilled(self):
+        return self.stdout.spilled or self.stderr.spilled
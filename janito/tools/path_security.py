@@ -24,6 +24,8 @@ workspace.
 from __future__ import annotations
 
 import os
+import tempfile
+from functools import lru_cache
 from typing import Any, Mapping
 
 __all__ = [
@@ -61,16 +63,16 @@ def is_path_within_workdir(
 
     Implementation details
     ----------------------
-    The function converts both *workdir* and *path* to absolute paths and then
-    uses :func:`os.path.commonpath` to determine the longest common sub-path.  A
-    path is considered *inside* the workspace when that common part equals the
-    workspace directory itself.
+    The function converts *path* to an absolute path and checks that it equals
+    the (absolute) workspace directory or starts with it followed by a path
+    separator.  The absolute workspace and temp directory roots are computed
+    once per directory, as every tool call checks its paths against them.
     """
     if not workdir:
         # No workdir configured – everything is implicitly allowed.
         return True
 
-    abs_workdir = os.path.abspath(workdir)
+    abs_workdir = _absolute_root(workdir)
 
     # Resolve *path* – if it is *relative* we interpret it **relative to the
     # workspace** (and *not* to the current working directory!) so that a value
@@ -80,25 +82,11 @@ def is_path_within_workdir(
     else:
         abs_path = os.path.abspath(os.path.join(abs_workdir, path))
 
-    try:
-        common_part = os.path.commonpath([abs_workdir, abs_path])
-    except ValueError:
-        # On Windows different drive letters cause ValueError → definitely
-        # outside the workspace.
-        return False
-
     # Additionally allow files located inside the system temporary directory.
-    import tempfile
-
-    abs_tempdir = os.path.abspath(tempfile.gettempdir())
-    try:
-        common_temp = os.path.commonpath([abs_tempdir, abs_path])
-    except ValueError:
-        common_temp = None
-    if common_temp == abs_tempdir:
+    if _is_within(abs_path, _absolute_root(tempfile.gettempdir())):
         return True
 
-    return common_part == abs_workdir
+    return _is_within(abs_path, abs_workdir)
 
 
 # ---------------------------------------------------------------------------
@@ -184,6 +172,11 @@ def validate_paths_in_arguments(
     path_keys = _extract_path_keys_from_schema(schema) if schema is not None else set()
 
     for key, value in arguments.items():
+        if isinstance(value, list):
+            # Objects in list arguments (e.g. the ``edits`` of edit_files) name their own paths
+            for item in value:
+                if isinstance(item, Mapping):
+                    validate_paths_in_arguments(item, workdir)
         key_is_path = key in path_keys or _looks_like_path_key(key)
         if not key_is_path:
             continue
@@ -195,6 +188,36 @@ def validate_paths_in_arguments(
 # ---------------------------------------------------------------------------
 
 
+def _absolute_root(directory: str) -> str:
+    """Absolute form of *directory*, cached unless it depends on the CWD."""
+    if os.path.isabs(directory):
+        return _cached_abspath(directory)
+    return os.path.abspath(directory)
+
+
+@lru_cache(maxsize=64)
+def _cached_abspath(directory: str) -> str:
+    return os.path.abspath(directory)
+
+
+@lru_cache(maxsize=64)
+def _root_prefixes(abs_root: str) -> tuple[str, str]:
+    """Case-normalised *abs_root* and the prefix of every path below it."""
+    root = os.path.normcase(abs_root)
+    return root, root if root.endswith(os.sep) else root + os.sep
+
+
+def _is_within(abs_path: str, abs_root: str) -> bool:
+    """Return *True* if the absolute *abs_path* equals or lies below *abs_root*.
+
+    Paths on another drive (Windows) never share the prefix, so they are
+    outside.
+    """
+    root, prefix = _root_prefixes(abs_root)
+    path = os.path.normcase(abs_path)
+    return path == root or path.startswith(prefix)
+
+
 def _raise_outside_workspace_error(
     key: str, path: str, workdir: str
 ) -> None:  # noqa: D401
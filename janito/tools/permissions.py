@@ -20,6 +20,9 @@ class AllowedPermissionsState:
         if not isinstance(permissions, ToolPermissions):
             raise ValueError("permissions must be a ToolPermissions instance")
         cls._permissions = permissions
+        from janito.tools.tool_schema_cache import invalidate_tool_schemas
+
+        invalidate_tool_schemas()
 
     @classmethod
     def set_default_permissions(cls, permissions):
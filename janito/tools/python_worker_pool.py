@@ -0,0 +1,397 @@
+"""
+Pre-started Python worker processes for the ``python_*_run`` tools.
+
+Each ``python_code_run`` / ``python_command_run`` / ``python_file_run`` call
+normally starts a new interpreter and re-imports whatever the snippet needs,
+which for pandas or numpy dominates the run time of small snippets. With
+``python_workers`` set, the tools instead send the code to one of a pool of
+idle interpreters that were started ahead of time (optionally importing the
+``python_preload`` modules first).
+
+A job runs in a fresh ``__main__`` module, with the tool's working directory,
+``sys.argv`` and ``sys.path[0]`` set as the interpreter would set them, stdin
+reading from ``/dev/null``, and ``os.environ``, ``sys.path`` and the modules
+imported from the working directory restored afterwards. Output is framed
+like the persistent bash session (:mod:`janito.tools.framed_output`), so it
+streams line by line to the tool's reporters.
+
+Workers are recycled after ``python_worker_max_runs`` jobs, when their
+resident memory grew by more than ``python_worker_max_growth_mb``, or when a job left
+threads running; a job that times out kills only its own worker (and the
+processes it started). A replacement is started as soon as a worker retires.
+"""
+
+import atexit
+import json
+import os
+import signal
+import subprocess
+import sys
+import threading
+import time
+import uuid
+
+from janito.tools.framed_output import FramedStream, wait_framed
+from janito.tools.tool_context import get_workdir
+
+_SENTINEL = "__janito_py_done_"
+
+DEFAULT_MAX_RUNS = 50
+DEFAULT_MAX_GROWTH_MB = 256
+
+# Runs in the worker with ``python -u -c``; argv: ready marker, preload modules
+WORKER_SOURCE = r'''
+import json, os, sys, threading, traceback, types
+
+
+def rss_kb():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return 0
+    # No /proc: fall back to the peak resident size
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def frame(marker, trailer=None):
+    for stream in (sys.stdout, sys.stderr):
+        try:
+            stream.flush()
+        except Exception:
+            pass
+    sys.stdout, sys.stderr, sys.stdin = sys.__stdout__, sys.__stderr__, sys.__stdin__
+    status = f"{marker} {trailer}" if trailer is not None else marker
+    os.write(1, f"\n{status}\n".encode())
+    os.write(2, f"\n{marker}\n".encode())
+
+
+def exit_code(exc):
+    if exc.code is None:
+        return 0
+    if isinstance(exc.code, int):
+        return exc.code
+    print(exc.code, file=sys.stderr)
+    return 1
+
+
+def run(job, main):
+    if job["mode"] == "file":
+        path = os.path.abspath(job["path"])
+        try:
+            with open(path, "rb") as f:
+                source = f.read()
+        except OSError as e:
+            print(f"{sys.executable}: can't open file {path!r}: [Errno {e.errno}] {e.strerror}", file=sys.stderr)
+            return 2
+        filename = main.__file__ = path
+        sys.argv = [job["path"]]
+        sys.path[0] = os.path.dirname(path)
+    else:
+        source = job["code"]
+        filename = "<string>" if job["mode"] == "command" else "<stdin>"
+        sys.argv = ["-c" if job["mode"] == "command" else ""]
+        sys.path[0] = ""
+    sys.modules["__main__"] = main
+    try:
+        exec(compile(source, filename, "exec"), main.__dict__)
+        return 0
+    except SystemExit as e:
+        return exit_code(e)
+    except BaseException:
+        etype, value, tb = sys.exc_info()
+        traceback.print_exception(etype, value, tb.tb_next)
+        return 1
+
+
+def forget_local_modules(known, roots):
+    for name in set(sys.modules) - known:
+        filename = getattr(sys.modules[name], "__file__", None) or ""
+        if any(os.path.realpath(filename).startswith(root) for root in roots):
+            del sys.modules[name]
+
+
+def main():
+    for name in sys.argv[2:]:
+        try:
+            __import__(name)
+        except Exception as e:
+            print(f"python_preload: cannot import {name}: {e}", file=sys.stderr)
+    protocol = os.fdopen(os.dup(0), "r", encoding="utf-8")
+    devnull = os.open(os.devnull, os.O_RDONLY)
+    os.dup2(devnull, 0)
+    os.close(devnull)
+    main_module = sys.modules["__main__"]
+    environ, path, argv = dict(os.environ), list(sys.path), list(sys.argv)
+    baseline = rss_kb()
+    frame(sys.argv[1])
+    for line in protocol:
+        job = json.loads(line)
+        threads = threading.active_count()
+        known = set(sys.modules)
+        os.chdir(job["cwd"])
+        roots = [os.path.join(os.path.realpath(job["cwd"]), "")]
+        if job["mode"] == "file":
+            roots.append(os.path.join(os.path.dirname(os.path.realpath(job["path"])), ""))
+        status = run(job, types.ModuleType("__main__"))
+        sys.modules["__main__"] = main_module
+        sys.path[:], sys.argv = path, list(argv)
+        if os.environ != environ:
+            os.environ.clear()
+            os.environ.update(environ)
+        forget_local_modules(known, roots)
+        retire = threading.active_count() > threads
+        frame(job["marker"], f"{status} {rss_kb() - baseline} {int(retire)}")
+        if retire:
+            break
+
+
+main()
+'''
+
+
+def _config_value(key, cast, default):
+    try:
+        from janito.config import config
+
+        value = config.get(key)
+    except Exception:
+        return default
+    if value in (None, ""):
+        return default
+    try:
+        return cast(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _parse_modules(value):
+    if isinstance(value, str):
+        value = value.split(",")
+    return tuple(name.strip() for name in value or () if str(name).strip())
+
+
+def pool_settings():
+    """(size, preload, max_runs, max_growth_mb) from the config, or None when the pool is off."""
+    size = _config_value("python_workers", int, 0)
+    if size <= 0:
+        return None
+    return (
+        size,
+        _config_value("python_preload", _parse_modules, ()),
+        _config_value("python_worker_max_runs", int, DEFAULT_MAX_RUNS),
+        _config_value("python_worker_max_growth_mb", float, DEFAULT_MAX_GROWTH_MB),
+    )
+
+
+class PythonWorker:
+    """A pre-started interpreter running one framed job at a time."""
+
+    def __init__(self, preload=()):
+        self.runs = 0
+        self.growth_kb = 0
+        self.retire = False
+        ready = f"{_SENTINEL}{uuid.uuid4().hex}"
+        self.process = subprocess.Popen(
+            [sys.executable, "-u", "-c", WORKER_SOURCE, ready, *preload],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+            bufsize=1,
+            env={**os.environ, "PYTHONIOENCODING": "utf-8"},
+            start_new_session=os.name == "posix",
+        )
+        # Output before the ready markers (failed preloads) goes nowhere
+        self._stdout = FramedStream(self.process.stdout, "python-stdout", ready)
+        self._stderr = FramedStream(self.process.stderr, "python-stderr", ready)
+
+    @property
+    def alive(self):
+        return (
+            self.process.poll() is None
+            and not self._stdout.eof
+            and not self._stderr.eof
+        )
+
+    def run(self, job, timeout=None, on_stdout=None, on_stderr=None):
+        """
+        Run ``job`` ({"mode": "code"|"command"|"file", "code"|"path", "cwd"})
+        and return its exit code, calling ``on_stdout`` / ``on_stderr`` with
+        every output line as it arrives. Waiting for a worker that is still
+        starting counts against ``timeout``. Raises subprocess.TimeoutExpired
+        after killing the worker.
+        """
+        streams = (self._stdout, self._stderr)
+        marker = f"{_SENTINEL}{uuid.uuid4().hex}"
+        started = time.monotonic()
+        if not wait_framed(streams, timeout):
+            self.kill()
+            raise subprocess.TimeoutExpired(job.get("mode"), timeout)
+        self._stdout.expect(marker, on_stdout)
+        self._stderr.expect(marker, on_stderr)
+        self.runs += 1
+        try:
+            self.process.stdin.write(json.dumps({**job, "marker": marker}) + "\n")
+            self.process.stdin.flush()
+        except (BrokenPipeError, OSError):
+            pass  # the worker died; EOF on its pipes releases the wait below
+        if timeout is not None:
+            timeout = max(timeout - (time.monotonic() - started), 0)
+        if not wait_framed(streams, timeout):
+            self.kill()
+            raise subprocess.TimeoutExpired(job.get("mode"), timeout)
+        if self._stdout.eof or self._stderr.eof:
+            # os._exit() in the job or a crash: report the process exit status
+            status = self.process.wait()
+            self.kill()
+            return status
+        status, growth_kb, retire = self._stdout.trailer.split()
+        self.growth_kb = int(growth_kb)
+        self.retire = retire == "1"
+        return int(status)
+
+    def kill(self):
+        """Kill the worker and every process it started."""
+        self.retire = True
+        if self.process.poll() is None:
+            try:
+                if os.name == "posix":
+                    os.killpg(self.process.pid, signal.SIGKILL)
+                else:
+                    self.process.kill()
+            except OSError:
+                pass
+        try:
+            self.process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            pass
+        for pipe in (self.process.stdin, self.process.stdout, self.process.stderr):
+            try:
+                pipe.close()
+            except OSError:
+                pass
+
+
+class PythonWorkerPool:
+    """Keeps ``size`` idle workers; busy callers beyond that get a temporary one."""
+
+    def __init__(
+        self,
+        size,
+        preload=(),
+        max_runs=DEFAULT_MAX_RUNS,
+        max_growth_mb=DEFAULT_MAX_GROWTH_MB,
+    ):
+        self.size = size
+        self.preload = tuple(preload)
+        self.max_runs = max_runs
+        self.max_growth_mb = max_growth_mb
+        self.started = 0
+        self._idle = []
+        self._lock = threading.Lock()
+        self._closed = False
+        for _ in range(size):
+            self._idle.append(self._spawn())
+
+    def _spawn(self):
+        self.started += 1
+        return PythonWorker(self.preload)
+
+    def _expired(self, worker):
+        return (
+            worker.retire
+            or not worker.alive
+            or (self.max_runs > 0 and worker.runs >= self.max_runs)
+            or (
+                self.max_growth_mb > 0
+                and worker.growth_kb > self.max_growth_mb * 1024
+            )
+        )
+
+    def acquire(self):
+        with self._lock:
+            while self._idle:
+                worker = self._idle.pop()
+                if worker.alive:
+                    return worker
+                worker.kill()
+            return self._spawn()
+
+    def release(self, worker):
+        expired = self._expired(worker)
+        if expired:
+            worker.kill()
+        with self._lock:
+            if self._closed or len(self._idle) >= self.size:
+                if not expired:
+                    worker.kill()
+                return
+            # Start the replacement now so it is warm by the next job
+            self._idle.append(self._spawn() if expired else worker)
+
+    def run(self, job, timeout=None, on_stdout=None, on_stderr=None):
+        worker = self.acquire()
+        try:
+            return worker.run(job, timeout, on_stdout, on_stderr)
+        except BaseException:
+            worker.kill()
+            raise
+        finally:
+            self.release(worker)
+
+    def shutdown(self):
+        with self._lock:
+            self._closed = True
+            workers, self._idle = self._idle, []
+        for worker in workers:
+            worker.kill()
+
+
+_pool = None
+_pool_settings = None
+_pool_lock = threading.Lock()
+
+
+def get_python_worker_pool():
+    """Return the shared pool for the current settings, or None when ``python_workers`` is off."""
+    global _pool, _pool_settings
+    settings = pool_settings()
+    with _pool_lock:
+        if settings != _pool_settings:
+            if _pool is not None:
+                _pool.shutdown()
+            _pool = PythonWorkerPool(*settings) if settings else None
+            _pool_settings = settings
+        return _pool
+
+
+def shutdown_python_worker_pool():
+    global _pool, _pool_settings
+    with _pool_lock:
+        pool, _pool, _pool_settings = _pool, None, None
+    if pool is not None:
+        pool.shutdown()
+
+
+atexit.register(shutdown_python_worker_pool)
+
+
+def run_python_job(pool, job, timeout, capture):
+    """
+    Run ``job`` in a worker of ``pool``, recording its output in ``capture``
+    (a :class:`~janito.tools.output_capture.CommandCapture`). Returns the exit
+    code, or None if the job timed out (its worker is killed).
+    """
+    job = {"cwd": os.path.abspath(get_workdir() or os.getcwd()), **job}
+    try:
+        return pool.run(job, timeout, capture.stdout.write, capture.stderr.write)
+    except subprocess.TimeoutExpired:
+        return None
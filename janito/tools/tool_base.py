@@ -22,6 +22,12 @@ class ToolBase:
     """
 
     permissions: "ToolPermissions" = None  # Required: must be set by subclasses
+    # Whether calls may run concurrently with other calls in the same turn.
+    # None: inferred from permissions (read-only tools are parallel safe).
+    parallel_safe: bool = None
+    # Arguments holding whitespace-separated path lists. The adapter leaves
+    # them untouched; the tool resolves each entry with tool_context.resolve_path.
+    multi_path_arguments: tuple = ()
 
     def __init__(self, name=None, event_bus=None):
         if self.permissions is None or not isinstance(
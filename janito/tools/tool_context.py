@@ -0,0 +1,81 @@
+"""
+ToolContext: per-session working directory and permission mask for tool execution.
+
+The CLI runs a single workspace per process and keeps using the process
+working directory and the global ``AllowedPermissionsState``. Hosts that serve
+several sessions from one process (see ``janito.server``) instead bind a
+``ToolContext`` with :func:`use_tool_context`. The binding lives in a
+``contextvars.ContextVar``, so it follows asyncio tasks, ``asyncio.to_thread``
+and the tool executor pool, and concurrent sessions never observe each
+other's workdir or permissions.
+
+Tools and adapters should call :func:`get_workdir` / :func:`get_allowed_permissions`
+(or :func:`resolve_path`) instead of ``os.getcwd()`` and the global state.
+"""
+
+import contextvars
+import os
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Optional
+
+from janito.tools.tool_base import ToolPermissions
+
+
+@dataclass(frozen=True)
+class ToolContext:
+    """Workdir and (optional) permission override for one session."""
+
+    workdir: str
+    allowed_permissions: Optional[ToolPermissions] = None
+
+    def __post_init__(self):
+        object.__setattr__(self, "workdir", os.path.abspath(self.workdir))
+
+
+_current_context: contextvars.ContextVar = contextvars.ContextVar(
+    "janito_tool_context", default=None
+)
+
+
+def get_tool_context():
+    """Return the ToolContext bound to the current context, or None."""
+    return _current_context.get()
+
+
+@contextmanager
+def use_tool_context(context: ToolContext):
+    """Bind ``context`` for the duration of the ``with`` block."""
+    token = _current_context.set(context)
+    try:
+        yield context
+    finally:
+        _current_context.reset(token)
+
+
+def get_workdir():
+    """Return the session workdir, falling back to the process working directory."""
+    context = _current_context.get()
+    if context is not None:
+        return context.workdir
+    return os.getcwd()
+
+
+def get_allowed_permissions():
+    """Return the session permission mask, falling back to the global one."""
+    context = _current_context.get()
+    if context is not None and context.allowed_permissions is not None:
+        return context.allowed_permissions
+    from janito.tools.permissions import get_global_allowed_permissions
+
+    return get_global_allowed_permissions()
+
+
+def resolve_path(path):
+    """Return ``path`` made absolute against the session workdir (when one is bound)."""
+    if not isinstance(path, str) or not path or os.path.isabs(path):
+        return path
+    context = _current_context.get()
+    if context is None:
+        return path
+    return os.path.normpath(os.path.join(context.workdir, path))
@@ -29,10 +29,11 @@ class ToolCallStarted(ToolEvent):
 class ToolCallFinished(ToolEvent):
     """
     Event indicating that a tool call has finished.
-    Contains the result returned by the tool.
+    Contains the result returned by the tool and the wall-clock execution time in seconds.
     """
 
     result: Any
+    duration: float = None
 
 
 @attr.s(auto_attribs=True, kw_only=True)
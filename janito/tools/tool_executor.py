@@ -0,0 +1,153 @@
+"""
+ConcurrentToolExecutor: runs the tool calls of a single LLM turn in a bounded thread pool.
+
+Consecutive read-only calls run in parallel. A call that writes or executes
+is a barrier: it starts once every earlier call of the turn has finished, and
+later calls start only after it, so a read always sees the effect of the
+writes and commands issued before it (a command may create the file the next
+call views). Results are always returned in the order the calls were issued,
+so the ``tool_results`` history message matches the ``tool_calls`` message.
+"""
+
+import contextvars
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+DEFAULT_MAX_WORKERS = 8
+
+
+def _config_max_workers():
+    try:
+        from janito.config import config
+
+        value = config.get("tool_max_workers")
+        return int(value) if value is not None else DEFAULT_MAX_WORKERS
+    except Exception:
+        return DEFAULT_MAX_WORKERS
+
+
+class ConcurrentToolExecutor:
+    """
+    Execute FunctionCallMessageParts through a tools adapter, concurrently where safe.
+
+    Tools can override the default policy with a ``parallel_safe`` class
+    attribute: True runs in parallel with its neighbouring read calls, False
+    always runs as a barrier. When unset, read-only tools
+    (``ToolPermissions(read=True)``) are considered parallel safe.
+    """
+
+    def __init__(self, tools_adapter, max_workers=None):
+        self.tools_adapter = tools_adapter
+        self.max_workers = max_workers
+        self._pool = None
+        self._pool_lock = threading.Lock()
+
+    def execute_all(self, parts):
+        """
+        Execute all parts and return their results in the same order.
+        If a call raises, no later batch is started: the first exception (in
+        call order) is re-raised once the calls of its batch have completed,
+        like the serial loop that stops at the first failing call.
+        """
+        parts = list(parts)
+        if not parts:
+            return []
+        max_workers = self._max_workers()
+        if len(parts) == 1 or max_workers <= 1:
+            return [self._run(part) for part in parts]
+        outcomes = []
+        for batch in self._batches(parts):
+            batch_outcomes = self._run_batch(batch, max_workers)
+            outcomes.extend(batch_outcomes)
+            if any(error is not None for _, error in batch_outcomes):
+                break
+        results = []
+        for result, error in outcomes:
+            if error is not None:
+                raise error
+            results.append(result)
+        return results
+
+    def shutdown(self):
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
+
+    def _max_workers(self):
+        if self.max_workers is not None:
+            return max(1, int(self.max_workers))
+        return max(1, _config_max_workers())
+
+    def _get_pool(self, max_workers):
+        with self._pool_lock:
+            if self._pool is None or self._pool._max_workers != max_workers:
+                if self._pool is not None:
+                    self._pool.shutdown(wait=False)
+                self._pool = ThreadPoolExecutor(
+                    max_workers=max_workers, thread_name_prefix="janito-tool"
+                )
+            return self._pool
+
+    def _run_batch(self, batch, max_workers):
+        if len(batch) == 1:
+            return [self._run_captured(batch[0])]
+        pool = self._get_pool(max_workers)
+        # Each call runs in a copy of the caller's context so a bound
+        # ToolContext (session workdir and permissions) reaches the workers.
+        futures = [
+            pool.submit(contextvars.copy_context().run, self._run_captured, part)
+            for part in batch
+        ]
+        return [future.result() for future in futures]
+
+    def _run_captured(self, part):
+        try:
+            return self._run(part), None
+        except BaseException as e:
+            return None, e
+
+    def _run(self, part):
+        return self.tools_adapter.execute_function_call_message_part(part)
+
+    def _batches(self, parts):
+        """
+        Split ``parts`` in call order into runs of parallel-safe calls and
+        single barrier calls; batches run one after the other.
+        """
+        batch = []
+        for part in parts:
+            function = getattr(part, "function", None)
+            tool = self._lookup_tool(getattr(function, "name", None))
+            if self._is_parallel_safe(tool):
+                batch.append(part)
+                continue
+            if batch:
+                yield batch
+                batch = []
+            yield [part]
+        if batch:
+            yield batch
+
+    def _lookup_tool(self, tool_name):
+        if not tool_name:
+            return None
+        try:
+            return self.tools_adapter.get_tool(tool_name)
+        except Exception:
+            return None
+
+    @staticmethod
+    def _is_parallel_safe(tool):
+        if tool is None:
+            return False
+        parallel_safe = getattr(tool, "parallel_safe", None)
+        if parallel_safe is not None:
+            return bool(parallel_safe)
+        permissions = getattr(tool, "permissions", None)
+        if permissions is None:
+            return False
+        return bool(
+            permissions.read and not permissions.write and not permissions.execute
+        )
+
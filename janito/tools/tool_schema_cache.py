@@ -0,0 +1,89 @@
+"""
+ToolSchemaCache: memoized tool schemas and tool lists.
+
+Building a tool schema parses the class docstring and inspects the ``run``
+signature, which is wasted work when it is repeated on every API call.
+Schemas are cached per tool class, and the complete ``tools`` list is cached
+per (tool classes, permission mask, disabled-tool set); the permission mask is
+the session one when a ``ToolContext`` is bound. Repeated turns therefore
+reuse the very same schema objects.
+
+The payload cache is cleared whenever the registry, the global permission mask
+or the disabled-tool set changes (see ``invalidate_tool_schemas``).
+"""
+
+import threading
+
+
+class ToolSchemaCache:
+    """Thread-safe cache of per-class schemas and per-toolset payloads."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._class_schemas = {}  # tool class -> schema dict
+        self._payloads = {}  # payload key -> schemas list
+
+    def get_class_schema(self, tool_class, build):
+        """Return the schema for ``tool_class``, calling ``build(tool_class)`` on a miss."""
+        with self._lock:
+            schema = self._class_schemas.get(tool_class)
+        if schema is not None:
+            return schema
+        schema = build(tool_class)
+        with self._lock:
+            return self._class_schemas.setdefault(tool_class, schema)
+
+    def get_payload(self, tool_classes, build):
+        """
+        Return the list of schemas for the given tool classes.
+
+        ``build(tool_class)`` creates a single schema entry on a miss.
+        """
+        key = self._payload_key(tool_classes)
+        with self._lock:
+            payload = self._payloads.get(key)
+        _report(payload is not None)
+        if payload is not None:
+            return payload
+        schemas = [self.get_class_schema(cls, build) for cls in tool_classes]
+        with self._lock:
+            return self._payloads.setdefault(key, schemas)
+
+    def invalidate(self):
+        """Drop cached payloads (per-class schemas remain valid)."""
+        with self._lock:
+            self._payloads.clear()
+
+    def clear(self):
+        with self._lock:
+            self._payloads.clear()
+            self._class_schemas.clear()
+
+    @staticmethod
+    def _payload_key(tool_classes):
+        from janito.tools.tool_context import get_allowed_permissions
+        from janito.tools.disabled_tools import get_disabled_tools
+
+        return (
+            tuple(tool_classes),
+            tuple(get_allowed_permissions()),
+            frozenset(get_disabled_tools()),
+        )
+
+
+def _report(hit):
+    try:
+        from janito.perf_singleton import performance_collector
+
+        performance_collector.record_cache_access("tool_schemas", hit)
+    except Exception:
+        pass
+
+
+# Singleton instance shared by all drivers
+tool_schema_cache = ToolSchemaCache()
+
+
+def invalidate_tool_schemas():
+    """Invalidate cached tool payloads after a registry, permission or disabled-tool change."""
+    tool_schema_cache.invalidate()
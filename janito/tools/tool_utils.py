@@ -6,6 +6,8 @@ Add your shared helper functions here.
 import os
 import urllib.parse
 
+from janito.tools.tool_context import get_workdir
+
 
 def example_utility_function(x):
     """A simple example utility function."""
@@ -23,7 +25,7 @@ def display_path(path):
 
     port = 8088
     if os.path.isabs(path):
-        cwd = os.path.abspath(os.getcwd())
+        cwd = os.path.abspath(get_workdir())
         abs_path = os.path.abspath(path)
         # Check if the absolute path is within the current working directory
         if abs_path.startswith(cwd + os.sep):
@@ -31,7 +33,7 @@ def display_path(path):
         else:
             disp = path
     else:
-        disp = os.path.relpath(path)
+        disp = os.path.relpath(path, get_workdir())
     # URL injection removed; just return display path
     return disp
 
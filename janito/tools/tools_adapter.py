@@ -1,3 +1,5 @@
+import time
+
 from janito.tools.tool_base import ToolBase
 from janito.tools.tool_events import ToolCallStarted, ToolCallFinished, ToolCallError
 from janito.exceptions import ToolCallException
@@ -16,6 +18,8 @@ class ToolsAdapterBase:
         self._tools = tools or []
         self._event_bus = event_bus  # event bus can be set on all adapters
         self.verbose_tools = False
+        # tool_name -> CompiledValidator for the registered tool instance
+        self._validators = {}
 
     def set_verbose_tools(self, value: bool):
         self.verbose_tools = value
@@ -29,10 +33,10 @@ class ToolsAdapterBase:
         self._event_bus = bus
 
     def is_tool_allowed(self, tool):
-        """Check if a tool is allowed based on current global AllowedPermissionsState."""
-        from janito.tools.permissions import get_global_allowed_permissions
+        """Check if a tool is allowed by the session (or global) permission mask."""
+        from janito.tools.tool_context import get_allowed_permissions
 
-        allowed_permissions = get_global_allowed_permissions()
+        allowed_permissions = get_allowed_permissions()
         perms = tool.permissions  # permissions are mandatory and type-checked
         # If all permissions are False, block all tools
         if not (
@@ -69,28 +73,20 @@ class ToolsAdapterBase:
 
 
 
-    def _validate_arguments_against_schema(self, arguments: dict, schema: dict):
-        properties = schema.get("properties", {})
-        required = schema.get("required", [])
-        missing = [field for field in required if field not in arguments]
-        if missing:
-            return f"Missing required argument(s): {', '.join(missing)}"
-        type_map = {
-            "string": str,
-            "integer": int,
-            "number": (int, float),
-            "boolean": bool,
-            "array": list,
-            "object": dict,
-        }
-        for key, value in arguments.items():
-            if key not in properties:
-                continue
-            expected_type = properties[key].get("type")
-            if expected_type and expected_type in type_map:
-                if not isinstance(value, type_map[expected_type]):
-                    return f"Argument '{key}' should be of type '{expected_type}', got '{type(value).__name__}'"
-        return None
+    def _compile_validator(self, tool_name, tool):
+        """Build (once) the argument validator of a registered tool instance."""
+        from janito.tools.argument_validator import CompiledValidator
+
+        validator = self._validators[tool_name] = CompiledValidator(
+            tool, getattr(tool, "schema", None)
+        )
+        return validator
+
+    def _get_validator(self, tool_name, tool):
+        validator = self._validators.get(tool_name)
+        if validator is None or validator.tool is not tool:
+            validator = self._compile_validator(tool_name, tool)
+        return validator
 
     def execute(self, tool, *args, **kwargs):
 
@@ -112,89 +108,27 @@ class ToolsAdapterBase:
 
         return result
 
-    def _get_tool_callable(self, tool):
-        """Helper to retrieve the primary callable of a tool instance."""
-        if callable(tool):
-            return tool
-        if hasattr(tool, "execute") and callable(getattr(tool, "execute")):
-            return getattr(tool, "execute")
-        if hasattr(tool, "run") and callable(getattr(tool, "run")):
-            return getattr(tool, "run")
-        raise ValueError("Provided tool is not executable.")
-
-    def _validate_arguments_against_signature(self, func, arguments: dict):
-        """Validate provided arguments against a callable signature.
-
-        Returns an error string if validation fails, otherwise ``None``.
-        """
-        import inspect
-
-        if arguments is None:
-            arguments = {}
-        # Ensure the input is a dict to avoid breaking the inspect-based logic
-        if not isinstance(arguments, dict):
-            return "Tool arguments should be provided as an object / mapping"
-
-        sig = inspect.signature(func)
-        params = sig.parameters
-
-        # Check for unexpected arguments (unless **kwargs is accepted)
-        accepts_kwargs = any(
-            p.kind == inspect.Parameter.VAR_KEYWORD for p in params.values()
-        )
-        if not accepts_kwargs:
-            unexpected = [k for k in arguments.keys() if k not in params]
-            if unexpected:
-                return "Unexpected argument(s): " + ", ".join(sorted(unexpected))
-
-        # Check for missing required arguments (ignoring *args / **kwargs / self)
-        required_params = [
-            name
-            for name, p in params.items()
-            if p.kind
-            in (
-                inspect.Parameter.POSITIONAL_OR_KEYWORD,
-                inspect.Parameter.KEYWORD_ONLY,
-            )
-            and p.default is inspect._empty
-            and name != "self"
-        ]
-        missing = [name for name in required_params if name not in arguments]
-        if missing:
-            return "Missing required argument(s): " + ", ".join(sorted(missing))
-
-        return None
-
     def execute_by_name(
         self, tool_name: str, *args, request_id=None, arguments=None, **kwargs
     ):
         self._check_tool_permissions(tool_name, request_id, arguments)
         tool = self.get_tool(tool_name)
         self._ensure_tool_exists(tool, tool_name, request_id, arguments)
-        func = self._get_tool_callable(tool)
+        validator = self._get_validator(tool_name, tool)
 
         validation_error = self._validate_tool_arguments(
-            tool, func, arguments, tool_name, request_id
+            validator, arguments, tool_name, request_id
         )
         if validation_error:
             return validation_error
 
         # --- SECURITY: Path restriction enforcement ---
         if not getattr(self, "unrestricted_paths", False):
-            workdir = getattr(self, "workdir", None)
-            # Ensure workdir is always set; default to current working directory.
-            if not workdir:
-                import os
-
-                workdir = os.getcwd()
-            from janito.tools.path_security import (
-                validate_paths_in_arguments,
-                PathSecurityError,
-            )
+            workdir = self._effective_workdir()
+            from janito.tools.path_security import PathSecurityError
 
-            schema = getattr(tool, "schema", None)
             try:
-                validate_paths_in_arguments(arguments, workdir, schema=schema)
+                validator.check_paths(arguments, workdir)
             except PathSecurityError as sec_err:
                 # Publish both a ToolCallError and a user-facing ReportEvent for path security errors
                 self._publish_tool_call_error(
@@ -223,26 +157,52 @@ class ToolsAdapterBase:
         self._print_verbose(
             f"[tools-adapter] Executing tool: {tool_name} with arguments: {arguments}"
         )
+        start_time = time.perf_counter()
         try:
-            result = self.execute(tool, **(arguments or {}), **kwargs)
+            call_arguments = self._resolve_path_arguments(validator, arguments)
+            result = self.execute(tool, **(call_arguments or {}), **kwargs)
         except Exception as e:
             self._handle_execution_error(tool_name, request_id, e, arguments)
+        duration = time.perf_counter() - start_time
         self._print_verbose(
             f"[tools-adapter] Tool execution finished: {tool_name} -> {result}"
         )
-        self._publish_tool_call_finished(tool_name, request_id, result)
+        self._publish_tool_call_finished(tool_name, request_id, result, duration)
         return result
 
-    def _validate_tool_arguments(self, tool, func, arguments, tool_name, request_id):
-        sig_error = self._validate_arguments_against_signature(func, arguments)
+    def _effective_workdir(self):
+        """Workdir of the bound ToolContext, else the adapter's, else the process CWD."""
+        from janito.tools.tool_context import get_tool_context
+
+        context = get_tool_context()
+        if context is not None:
+            return context.workdir
+        workdir = getattr(self, "workdir", None)
+        if not workdir:
+            import os
+
+            workdir = os.getcwd()
+        return workdir
+
+    def _resolve_path_arguments(self, validator, arguments):
+        """
+        Make relative path arguments absolute against the session workdir so
+        tools never depend on the process working directory. A no-op when no
+        ToolContext is bound (the CLI keeps relying on its working directory).
+        """
+        from janito.tools.tool_context import get_tool_context, resolve_path
+
+        if not arguments or get_tool_context() is None:
+            return arguments
+        return validator.resolve_paths(arguments, resolve_path)
+
+    def _validate_tool_arguments(self, validator, arguments, tool_name, request_id):
+        sig_error = validator.check(arguments)
         if sig_error:
             self._publish_tool_call_error(tool_name, request_id, sig_error, arguments)
             return sig_error
-        schema = getattr(tool, "schema", None)
-        if schema and arguments is not None:
-            validation_error = self._validate_arguments_against_schema(
-                arguments, schema
-            )
+        if arguments is not None:
+            validation_error = validator.check_schema(arguments)
             if validation_error:
                 self._publish_tool_call_error(
                     tool_name, request_id, validation_error, arguments
@@ -269,11 +229,14 @@ class ToolsAdapterBase:
                 )
             )
 
-    def _publish_tool_call_finished(self, tool_name, request_id, result):
+    def _publish_tool_call_finished(self, tool_name, request_id, result, duration=None):
         if self._event_bus:
             self._event_bus.publish(
                 ToolCallFinished(
-                    tool_name=tool_name, request_id=request_id, result=result
+                    tool_name=tool_name,
+                    request_id=request_id,
+                    result=result,
+                    duration=duration,
                 )
             )
 
@@ -309,6 +272,26 @@ class ToolsAdapterBase:
             tool_name, request_id=tool_call_id, arguments=arguments
         )
 
+    def execute_function_call_message_parts(self, function_call_message_parts):
+        """
+        Execute several FunctionCallMessageParts from the same LLM turn, running
+        independent calls concurrently. Results are returned in call order.
+        """
+        executor = getattr(self, "_tool_executor", None)
+        if executor is None:
+            from janito.tools.tool_executor import ConcurrentToolExecutor
+
+            executor = self._tool_executor = ConcurrentToolExecutor(self)
+        return executor.execute_all(function_call_message_parts)
+
+    async def execute_function_call_message_parts_async(self, function_call_message_parts):
+        """Async variant of execute_function_call_message_parts; tools run off the event loop."""
+        import asyncio
+
+        return await asyncio.to_thread(
+            self.execute_function_call_message_parts, function_call_message_parts
+        )
+
     def _check_tool_permissions(self, tool_name, request_id, arguments):
         # No enabled_tools check anymore; permission checks are handled by is_tool_allowed
         pass
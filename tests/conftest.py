@@ -0,0 +1,43 @@
+"""Shared test helpers."""
+
+import pytest
+
+from janito.tools.tool_base import ToolBase, ToolPermissions
+
+SYNTHETIC_DOC = """
+    Synthetic tool {tool_name}.
+
+    Args:
+        path (str): File or directory to operate on.
+        pattern (str): Pattern to look for.
+        max_results (int, optional): Maximum number of results. Defaults to 10.
+    Returns:
+        str: A summary string.
+    """
+
+
+def _synthetic_run(self, path: str, pattern: str, max_results: int = 10) -> str:
+    return path
+
+
+@pytest.fixture
+def synthetic_tool():
+    """
+    Return a factory for read-only tool classes named ``tool_name``. By default
+    ``run(path, pattern, max_results=10)`` returns ``path`` and is documented;
+    pass ``run`` (and ``doc``, or None) to use another signature.
+    """
+
+    def make(tool_name, run=_synthetic_run, doc=SYNTHETIC_DOC):
+        return type(
+            "SyntheticTool",
+            (ToolBase,),
+            {
+                "__doc__": doc.format(tool_name=tool_name) if doc else None,
+                "tool_name": tool_name,
+                "permissions": ToolPermissions(read=True),
+                "run": run,
+            },
+        )
+
+    return make
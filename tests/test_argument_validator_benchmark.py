@@ -0,0 +1,82 @@
+"""Compiled argument validation: error messages, path checks and a 10k dispatch benchmark."""
+
+import time
+
+import pytest
+
+from janito.event_bus.bus import EventBus
+from janito.tools.adapters.local.adapter import LocalToolsAdapter
+from janito.tools.path_security import _cached_abspath, _root_prefixes
+from janito.tools.tool_context import ToolContext, use_tool_context
+
+DISPATCHES = 10_000
+
+
+def _run(self, path: str, pattern: str, max_results: int = 10, edits: list = None) -> str:
+    return path
+
+
+@pytest.fixture
+def adapter(tmp_path, synthetic_tool):
+    adapter = LocalToolsAdapter(workdir=str(tmp_path), event_bus=EventBus())
+    adapter.register_tool(synthetic_tool("synthetic_dispatch", run=_run, doc=None))
+    return adapter
+
+
+def test_compiled_validation_errors(adapter, tmp_path):
+    call = adapter.execute_by_name
+    assert adapter._validators["synthetic_dispatch"].resolve_parameters == ("path",)
+
+    assert call("synthetic_dispatch", arguments={"pattern": "x"}) == (
+        "Missing required argument(s): path"
+    )
+    assert call("synthetic_dispatch", arguments={"path": "a", "pattern": "x", "z": 1, "y": 2}) == (
+        "Unexpected argument(s): y, z"
+    )
+    assert call("synthetic_dispatch", arguments=["a"]) == (
+        "Tool arguments should be provided as an object / mapping"
+    )
+    denied = call("synthetic_dispatch", arguments={"path": "/etc/passwd", "pattern": "x"})
+    assert denied.startswith("Security error: Argument 'path' path '/etc/passwd'")
+    nested = call(
+        "synthetic_dispatch",
+        arguments={"path": "a", "pattern": "x", "edits": [{"path": "/etc/hosts"}]},
+    )
+    assert nested.startswith("Security error: Argument 'path' path '/etc/hosts'")
+
+    with use_tool_context(ToolContext(workdir=str(tmp_path))):
+        assert call("synthetic_dispatch", arguments={"path": "a", "pattern": "x"}) == str(
+            tmp_path / "a"
+        )
+
+    adapter.unregister_tool("synthetic_dispatch")
+    assert "synthetic_dispatch" not in adapter._validators
+
+
+def _dispatch(adapter, arguments, compiled):
+    for _ in range(DISPATCHES):
+        if not compiled:
+            # What every call used to re-derive: signature, path keys and roots
+            adapter._validators.clear()
+            _cached_abspath.cache_clear()
+            _root_prefixes.cache_clear()
+        adapter.execute_by_name("synthetic_dispatch", arguments=arguments)
+
+
+@pytest.mark.benchmark
+def test_dispatch_benchmark(adapter, tmp_path):
+    arguments = {"path": "src/module.py", "pattern": "TODO", "max_results": 5}
+    with use_tool_context(ToolContext(workdir=str(tmp_path))):
+        t0 = time.perf_counter()
+        _dispatch(adapter, arguments, compiled=False)
+        uncompiled = time.perf_counter() - t0
+
+        adapter._compile_validator("synthetic_dispatch", adapter.get_tool("synthetic_dispatch"))
+        t0 = time.perf_counter()
+        _dispatch(adapter, arguments, compiled=True)
+        compiled = time.perf_counter() - t0
+
+    assert compiled < uncompiled, (
+        f"{DISPATCHES} dispatches: compiled validator {compiled * 1e3:.0f} ms, "
+        f"per-call validation {uncompiled * 1e3:.0f} ms"
+    )
@@ -0,0 +1,104 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+from janito.driver_events import RequestFinished, RequestStarted, ResponseReceived
+from janito.drivers.openai.async_driver import AsyncOpenAIModelDriver
+from janito.llm.async_agent import AsyncLLMAgent
+from janito.llm.driver_config import LLMDriverConfig
+
+
+def _completion(content=None, tool_calls=None):
+    message = SimpleNamespace(role="assistant", content=content, tool_calls=tool_calls)
+    return SimpleNamespace(
+        choices=[SimpleNamespace(message=message, finish_reason="stop")],
+        usage=None,
+        created=0,
+    )
+
+
+class FakeCompletions:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    async def create(self, **kwargs):
+        self.requests.append(kwargs)
+        await asyncio.sleep(0)
+        return self.responses.pop(0)
+
+
+class FakeAsyncDriver(AsyncOpenAIModelDriver):
+    def __init__(self, responses):
+        super().__init__(provider_name="fake")
+        self.completions = FakeCompletions(responses)
+
+    def _instantiate_async_openai_client(self, config):
+        return SimpleNamespace(chat=SimpleNamespace(completions=self.completions))
+
+
+class FakeToolsAdapter:
+    def __init__(self):
+        self.calls = []
+
+    def execute_function_call_message_parts(self, parts):
+        self.calls.extend(parts)
+        return [f"ran {part.function.name}" for part in parts]
+
+    async def execute_function_call_message_parts_async(self, parts):
+        return self.execute_function_call_message_parts(parts)
+
+
+class FakeProvider:
+    name = "fake"
+    driver_config = LLMDriverConfig(model="fake-model", api_key="key")
+
+    def get_model_info(self, model_name):
+        return None
+
+
+def test_async_chat_runs_tool_round_trip():
+    tool_call = SimpleNamespace(
+        id="call_1",
+        type="function",
+        function=SimpleNamespace(name="view_file", arguments=json.dumps({"path": "a"})),
+    )
+    driver = FakeAsyncDriver(
+        [_completion(tool_calls=[tool_call]), _completion(content="done")]
+    )
+    tools = FakeToolsAdapter()
+    agent = AsyncLLMAgent(FakeProvider(), tools, driver=driver)
+    agent.publish_events = False
+
+    async def run():
+        seen = []
+        async for event in agent.events("read a"):
+            seen.append(type(event))
+        return seen
+
+    seen = asyncio.run(run())
+    assert seen.count(RequestStarted) == 2
+    assert seen.count(ResponseReceived) == 2
+    assert seen.count(RequestFinished) == 2
+    assert [part.function.name for part in tools.calls] == ["view_file"]
+    second_request = driver.completions.requests[1]["messages"]
+    assert second_request[-1] == {
+        "role": "tool",
+        "content": "ran view_file",
+        "name": "view_file",
+        "tool_call_id": "call_1",
+    }
+
+
+def test_concurrent_async_sessions():
+    async def run_session(index):
+        driver = FakeAsyncDriver([_completion(content=f"answer {index}")])
+        agent = AsyncLLMAgent(FakeProvider(), None, driver=driver)
+        agent.publish_events = False
+        result = await agent.chat(f"question {index}")
+        return result.parts[0].content
+
+    async def run():
+        return await asyncio.gather(*(run_session(i) for i in range(10)))
+
+    assert asyncio.run(run()) == [f"answer {i}" for i in range(10)]
@@ -0,0 +1,95 @@
+"""Persistent bash session: state between commands, framing, timeout/crash restart and a benchmark."""
+
+import shutil
+import subprocess
+import time
+
+import pytest
+
+from janito.config import config
+from janito.tools.adapters.local.run_bash_command import RunBashCommandTool
+from janito.tools.bash_session import BashSession, close_bash_session
+
+pytestmark = pytest.mark.skipif(shutil.which("bash") is None, reason="bash required")
+
+COMMANDS = 100
+
+
+def _run(session, command, timeout=10):
+    out, err = [], []
+    status = session.run(command, timeout, out.append, err.append)
+    return status, "".join(out), "".join(err)
+
+
+def test_state_framing_and_restart(tmp_path):
+    session = BashSession(cwd=str(tmp_path))
+    try:
+        assert _run(session, "mkdir sub && cd sub; export JANITO_X=1; echo ok") == (
+            0,
+            "ok\n",
+            "",
+        )
+        status, out, err = _run(
+            session, "pwd; echo \"$JANITO_X\"; echo err >&2; echo; printf tail"
+        )
+        assert status == 0
+        assert out == f"{tmp_path / 'sub'}\n1\n\ntail\n"
+        assert err == "err\n"
+        assert _run(session, "cat; (exit 3)")[0] == 3
+        assert session.starts == 1
+
+        with pytest.raises(subprocess.TimeoutExpired):
+            session.run("sleep 30", timeout=0.5)
+        assert not session.alive
+        assert _run(session, "echo $JANITO_X; pwd") == (0, f"\n{tmp_path}\n", "")
+        assert session.starts == 2
+
+        assert _run(session, "echo bye; exit 5") == (5, "bye\n", "")
+        assert _run(session, "echo back") == (0, "back\n", "")
+        assert session.starts == 3
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def persistent_shell():
+    config.runtime_set("persistent_shell", True)
+    yield
+    config.runtime_set("persistent_shell", False)
+    close_bash_session()
+
+
+def test_run_bash_command_keeps_shell_state(tmp_path, monkeypatch, persistent_shell):
+    monkeypatch.chdir(tmp_path)
+    tool = RunBashCommandTool()
+    assert "Return code: 0" in tool.run("cd /; export JANITO_Y=2")
+    assert "--- STDOUT ---\n/ 2\n" in tool.run('echo "$PWD" "$JANITO_Y"')
+    assert "timed out" in tool.run("sleep 30", timeout=1)
+    assert "Return code: 0\n--- STDOUT ---\nhi\n" in tool.run("echo hi")
+
+
+def _per_command(tool):
+    t0 = time.perf_counter()
+    for _ in range(COMMANDS):
+        assert "Return code: 0" in tool.run("echo hi")
+    return (time.perf_counter() - t0) / COMMANDS
+
+
+@pytest.mark.benchmark
+def test_run_bash_command_benchmark(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    tool = RunBashCommandTool()
+    one_shot = _per_command(tool)
+
+    config.runtime_set("persistent_shell", True)
+    try:
+        tool.run("true")  # start the shell outside the timing
+        persistent = _per_command(tool)
+    finally:
+        config.runtime_set("persistent_shell", False)
+        close_bash_session()
+
+    assert persistent < one_shot, (
+        f"run_bash_command per command: persistent shell {persistent * 1e3:.2f} ms, "
+        f"bash -c {one_shot * 1e3:.2f} ms"
+    )
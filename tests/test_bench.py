@@ -0,0 +1,71 @@
+"""Record/replay cassettes, the mock OpenAI server and the janito bench suite."""
+
+import pytest
+
+from janito.bench.mock_server import MockOpenAIServer
+from janito.bench.suite import format_report, run_bench
+from janito.conversation_history import LLMConversationHistory
+from janito.driver_events import RequestFinished, ResponseDelta, ResponseReceived
+from janito.drivers.cassette.driver import Cassette, CassetteDriver, CassetteError
+from janito.llm.driver_config import LLMDriverConfig
+from janito.llm.driver_input import DriverInput
+
+SCRIPT = [
+    {"tool_calls": [{"name": "view_file", "arguments": {"path": "README.md"}}]},
+    {"content": "The README describes the project."},
+]
+
+
+def _request(driver, prompt, stream=False, base_url=None):
+    history = LLMConversationHistory()
+    history.add_message("user", prompt)
+    config = LLMDriverConfig(
+        model="janito-mock", api_key="test", base_url=base_url, stream=stream
+    )
+    driver.process_driver_input(DriverInput(config=config, conversation_history=history))
+    events = []
+    while not driver.output_queue.empty():
+        events.append(driver.output_queue.get())
+    received = [e for e in events if isinstance(e, ResponseReceived)]
+    assert len(received) == 1, events
+    return received[0], events
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_record_then_replay(tmp_path, stream):
+    path = str(tmp_path / "session.jsonl")
+    with MockOpenAIServer(script=SCRIPT) as server:
+        recorder = CassetteDriver(Cassette(path, mode="record"), provider_name="mock")
+        first, _ = _request(recorder, "read it", stream, server.base_url)
+        second, _ = _request(recorder, "and then?", stream, server.base_url)
+        assert server.request_count == 2
+    assert first.parts[0].function.name == "view_file"
+    assert second.parts[0].content == "The README describes the project."
+
+    # Replay: the server is gone, responses come from the cassette
+    cassette = Cassette(path, mode="replay", latency=0)
+    assert len(cassette) == 2
+    player = CassetteDriver(cassette, provider_name="mock")
+    replayed, events = _request(player, "and then?", stream)
+    assert replayed.parts[0].content == "The README describes the project."
+    finished = [e for e in events if isinstance(e, RequestFinished)]
+    assert finished[0].usage["total_tokens"] > 0
+    if stream:
+        assert any(isinstance(e, ResponseDelta) for e in events)
+    replayed, _ = _request(player, "read it", stream)
+    assert replayed.parts[0].function.name == "view_file"
+    with pytest.raises(CassetteError):
+        player.cassette.next_response({"messages": [{"role": "user", "content": "new"}]})
+
+
+def test_bench_reports_overhead(tmp_path):
+    report = run_bench(turns=3, latency=0.005, workdir=str(tmp_path / "work"))
+    text = format_report(report)
+    for name in ("http", "replay"):
+        result = report["scenarios"][name]
+        assert result["requests"] == 6  # tool call + answer per turn
+        assert result["turn_ms"]["p50"] >= 2 * 5
+        assert "find_files" in result["tool_ms"]
+    assert report["memory"]["replay_peak_kib"] > 0
+    assert text.startswith("janito bench: 3 turns")
+    assert "tool find_files (replay)" in text
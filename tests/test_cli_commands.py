@@ -0,0 +1,35 @@
+import sys
+
+import pytest
+
+from janito.cli.main_cli import JanitoCLI, RunMode
+
+
+def _cli(monkeypatch, *argv):
+    monkeypatch.setattr(sys, "argv", ["janito", *argv])
+    monkeypatch.setattr(sys.stdin, "isatty", lambda: True, raising=False)
+    return JanitoCLI()
+
+
+@pytest.mark.parametrize(
+    "argv, mode",
+    [
+        (["serve"], RunMode.SERVE),
+        (["serve", "-r", "-w", "--port", "9000"], RunMode.SERVE),
+        (["bench", "--bench-turns", "3"], RunMode.BENCH),
+    ],
+)
+def test_command_words(monkeypatch, argv, mode):
+    cli = _cli(monkeypatch, *argv)
+    assert cli.classify() == mode
+    assert not cli.args.user_prompt
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [["serve", "the", "static", "files"], ["bench", "results"], ["-r", "serve", "it"]],
+)
+def test_command_words_in_prompts(monkeypatch, argv):
+    cli = _cli(monkeypatch, *argv)
+    assert cli.classify() == RunMode.RUN
+    assert " ".join(cli.args.user_prompt).endswith(" ".join(argv[-2:]))
@@ -0,0 +1,75 @@
+"""ClientPool: construction outside the lock, leases and deferred close."""
+
+import threading
+
+from janito.drivers.client_pool import ClientPool
+
+
+class _Client:
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def test_slow_construction_does_not_block_other_keys():
+    pool = ClientPool(idle_timeout=0)
+    building = threading.Event()
+    finish = threading.Event()
+
+    def slow_factory(http_client):
+        building.set()
+        finish.wait(5)
+        return _Client()
+
+    thread = threading.Thread(target=pool.get, args=("slow", slow_factory))
+    thread.start()
+    assert building.wait(5)
+    # Another key is served while the first client is still being built
+    other = pool.get("fast", lambda http_client: _Client())
+    assert not finish.is_set()
+    finish.set()
+    thread.join(5)
+    assert pool.stats()["size"] == 2
+    pool.release(other)
+
+
+def test_concurrent_misses_keep_one_client():
+    pool = ClientPool(idle_timeout=0)
+    built = []
+    start = threading.Barrier(4)
+
+    def factory(http_client):
+        start.wait(5)
+        built.append(_Client())
+        return built[-1]
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(pool.get("key", factory)))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+    assert len({id(client) for client in results}) == 1
+    assert sum(client.closed for client in built) == 3
+
+
+def test_leased_clients_are_not_evicted_or_closed():
+    pool = ClientPool(idle_timeout=0.01)
+    busy = pool.get("busy", lambda http_client: _Client())
+    idle = pool.get("idle", lambda http_client: _Client())
+    pool.release(idle)
+    threading.Event().wait(0.05)
+    pool.evict_idle()
+    assert idle.closed and not busy.closed
+    assert pool.stats()["size"] == 1
+
+    pool.discard("busy")
+    assert not busy.closed
+    pool.release(busy)
+    assert busy.closed
+    pool.release(_Client())  # not from the pool: ignored
@@ -0,0 +1,60 @@
+from janito.conversation_history import LLMConversationHistory
+from janito.drivers.openai.driver import OpenAIModelDriver
+
+
+class CountingDriver(OpenAIModelDriver):
+    def __init__(self):
+        super().__init__()
+        self.converted = 0
+
+    def _append_api_message(self, api_messages, msg):
+        self.converted += 1
+        super()._append_api_message(api_messages, msg)
+
+
+def test_only_new_messages_are_converted():
+    driver = CountingDriver()
+    history = LLMConversationHistory()
+    history.add_message("user", "list files")
+    history.add_message(
+        "tool_calls",
+        [{"id": "c1", "type": "function", "function": {"name": "find_files", "arguments": "{}"}}],
+    )
+    history.add_message(
+        "tool_results", [{"name": "find_files", "content": "a.py", "tool_call_id": "c1"}]
+    )
+    first = driver.convert_history_to_api_messages(history)
+    assert driver.converted == 3
+    assert first[1]["tool_calls"][0]["id"] == "c1"
+    assert first[2] == {
+        "role": "tool",
+        "content": "a.py",
+        "name": "find_files",
+        "tool_call_id": "c1",
+    }
+
+    history.add_message("user", "thanks")
+    second = driver.convert_history_to_api_messages(history)
+    assert driver.converted == 4
+    assert second[:3] == first and second[3]["content"] == "thanks"
+
+
+def test_rewrite_triggers_full_conversion():
+    driver = CountingDriver()
+    history = LLMConversationHistory()
+    history.add_message("user", "hello")
+    driver.convert_history_to_api_messages(history)
+    history.insert_system_message("system prompt")
+    messages = driver.convert_history_to_api_messages(history)
+    assert driver.converted == 3
+    assert [m["role"] for m in messages] == ["system", "user"]
+
+
+def test_legacy_json_string_tool_messages_are_accepted():
+    driver = OpenAIModelDriver()
+    history = LLMConversationHistory()
+    history.add_message(
+        "tool_results", '[{"name": "x", "content": "ok", "tool_call_id": "1"}]'
+    )
+    messages = driver.convert_history_to_api_messages(history)
+    assert messages == [{"role": "tool", "content": "ok", "name": "x", "tool_call_id": "1"}]
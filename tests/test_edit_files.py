@@ -0,0 +1,154 @@
+"""edit_files: batched in-memory edits, all-or-nothing writes and a 15-edit benchmark."""
+
+import os
+import time
+
+from janito.tools.adapters.local.edit_files import EditFilesTool, line_numbers
+from janito.tools.adapters.local.replace_text_in_file import ReplaceTextInFileTool
+from janito.tools.path_security import PathSecurityError, validate_paths_in_arguments
+from janito.tools.tool_executor import ConcurrentToolExecutor
+
+import pytest
+
+EDITS = 15
+FUNCTIONS = 2000
+
+
+def _write(path, text):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+
+def _read(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def test_line_numbers_single_pass():
+    content = "a\nb\n\nc\nd"
+    offsets = [i for i, ch in enumerate(content) if ch in "abcd"]
+    assert line_numbers(content, offsets) == [1, 2, 4, 5]
+
+
+def test_batch_applies_in_order_and_is_atomic(tmp_path):
+    first = str(tmp_path / "first.py")
+    second = str(tmp_path / "second.md")
+    _write(first, "x = 1\ny = 2\n# BEGIN\ndrop = True\n# END\nz = x\n")
+    _write(second, "# Title\n\ntext text\n")
+    os.chmod(first, 0o640)
+    tool = EditFilesTool()
+
+    result = tool.run(
+        [
+            {"path": first, "search_text": "x = 1", "replacement_text": "x = 10"},
+            {"path": second, "search_text": "text", "replacement_text": "word", "replace_all": True},
+            {"path": first, "start_marker": "# BEGIN", "end_marker": "# END\n"},
+            {"path": first, "search_text": "x = 10\n", "replacement_text": "x = 10\nw = 0\n"},
+        ]
+    )
+    assert _read(first) == "x = 10\nw = 0\ny = 2\nz = x\n"
+    assert _read(second) == "# Title\n\nword word\n"
+    assert oct(os.stat(first).st_mode & 0o777) == oct(0o640)
+    assert "3 edits at lines 1; 3; 1 (-2 lines)" in result
+    assert "1 edit at lines 3, 3 (+0 lines)" in result
+    assert [name for name in os.listdir(tmp_path) if name.endswith(".tmp")] == []
+
+    # A failing edit leaves every file untouched
+    before = _read(first), _read(second)
+    result = tool.run(
+        [
+            {"path": second, "search_text": "Title", "replacement_text": "Other"},
+            {"path": first, "search_text": "missing", "replacement_text": ""},
+        ]
+    )
+    assert result.startswith("❗ No files were changed: edit 2")
+    assert (_read(first), _read(second)) == before
+    result = tool.run([{"path": first, "search_text": "x", "replacement_text": "q"}])
+    assert "not unique" in result and _read(first) == before[0]
+
+
+def test_edit_through_symlink_replaces_the_target(tmp_path):
+    real_dir = tmp_path / "real"
+    real_dir.mkdir()
+    target = str(real_dir / "module.py")
+    link = str(tmp_path / "link.py")
+    _write(target, "value = 1\n")
+    os.symlink(target, link)
+
+    result = EditFilesTool().run(
+        [{"path": link, "search_text": "value = 1", "replacement_text": "value = 2"}]
+    )
+    assert "1 edit" in result
+    assert os.path.islink(link) and os.path.realpath(link) == os.path.realpath(target)
+    assert _read(target) == "value = 2\n"
+    for directory in (tmp_path, real_dir):
+        assert [name for name in os.listdir(directory) if name.endswith(".tmp")] == []
+
+
+def test_spellings_of_one_path_are_edited_together(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    _write("a.py", "x = 1\ny = 2\n")
+    result = EditFilesTool().run(
+        [
+            {"path": "a.py", "search_text": "x = 1", "replacement_text": "x = 10"},
+            {"path": "./a.py", "search_text": "y = 2", "replacement_text": "y = 20"},
+            {"path": str(tmp_path / "a.py"), "search_text": "x = 10", "replacement_text": "x = 11"},
+        ]
+    )
+    assert _read("a.py") == "x = 11\ny = 20\n"
+    assert "a.py: 3 edits" in result and result.count(": 3 edits") == 1 and "edit at" not in result
+
+
+def test_nested_paths_are_checked_and_edits_are_barriers(tmp_path):
+    outside = os.path.abspath(os.sep + os.path.join("etc", "outside.py"))
+    arguments = {"edits": [{"path": outside, "search_text": "a"}]}
+    with pytest.raises(PathSecurityError):
+        validate_paths_in_arguments(arguments, str(tmp_path))
+    assert not ConcurrentToolExecutor._is_parallel_safe(EditFilesTool())
+
+
+def _edit_both(tmp_path):
+    """Apply the same edits with one replace_text_in_file call each and one edit_files batch."""
+    source = "".join(
+        f"def function_{i}(value):\n    return value + {i}\n\n\n" for i in range(FUNCTIONS)
+    )
+    targets = [FUNCTIONS * k // EDITS for k in range(EDITS)]
+    edits = [
+        (f"    return value + {i}\n", f"    return value * {i}\n") for i in targets
+    ]
+    sequential = str(tmp_path / "sequential.py")
+    batched = str(tmp_path / "batched.py")
+    _write(sequential, source)
+    _write(batched, source)
+
+    replace = ReplaceTextInFileTool()
+    t0 = time.perf_counter()
+    for search, replacement in edits:
+        assert "Error" not in replace.run(sequential, search, replacement)
+    sequential_time = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    result = EditFilesTool().run(
+        [
+            {"path": batched, "search_text": search, "replacement_text": replacement}
+            for search, replacement in edits
+        ]
+    )
+    batched_time = time.perf_counter() - t0
+    return sequential, batched, result, sequential_time, batched_time
+
+
+def test_batch_matches_sequential_edits(tmp_path):
+    sequential, batched, result, _, _ = _edit_both(tmp_path)
+    assert _read(batched) == _read(sequential)
+    assert f"{EDITS} edits" in result
+
+
+@pytest.mark.benchmark
+def test_batch_edit_benchmark(tmp_path):
+    _, _, _, sequential_time, batched_time = _edit_both(tmp_path)
+    assert batched_time < sequential_time, (
+        f"{EDITS} edits to a {FUNCTIONS * 4}-line file: "
+        f"edit_files {batched_time * 1e3:.1f} ms, "
+        f"replace_text_in_file x{EDITS} {sequential_time * 1e3:.1f} ms"
+    )
@@ -0,0 +1,175 @@
+"""EventBus dispatch table, asynchronous delivery and a publish throughput benchmark."""
+
+import itertools
+import threading
+import time
+from bisect import insort
+from collections import defaultdict
+
+import pytest
+
+from janito.driver_events import RequestFinished, ResponseDelta
+from janito.event_bus.bus import EventBus
+from janito.event_bus.event import Event
+from janito.report_events import ReportEvent, ReportSubtype
+from janito.tools.tool_events import ToolCallFinished, ToolCallStarted, ToolEvent
+
+EVENTS = 50_000
+
+
+def _stdout_event(n=0):
+    return ReportEvent(subtype=ReportSubtype.STDOUT, message=f"line {n}")
+
+
+def test_dispatch_follows_mro_priority_and_invalidation():
+    bus = EventBus()
+    calls = []
+    bus.subscribe(Event, lambda e: calls.append("event"), priority=200)
+    bus.subscribe(ToolEvent, lambda e: calls.append("tool"))
+    bus.subscribe(ToolCallStarted, lambda e: calls.append("started"), priority=10)
+
+    bus.publish(ToolCallStarted(tool_name="t", request_id="r", arguments={}))
+    assert calls == ["started", "tool", "event"]
+
+    calls.clear()
+    bus.publish(ToolCallFinished(tool_name="t", request_id="r", result=None))
+    assert calls == ["tool", "event"]
+
+    # subscribe/unsubscribe invalidate the cached dispatch entries
+    late = lambda e: calls.append("late")  # noqa: E731
+    bus.subscribe(ToolCallFinished, late, priority=0)
+    calls.clear()
+    bus.publish(ToolCallFinished(tool_name="t", request_id="r", result=None))
+    assert calls == ["late", "tool", "event"]
+    bus.unsubscribe(ToolCallFinished, late)
+    calls.clear()
+    bus.publish(ToolCallFinished(tool_name="t", request_id="r", result=None))
+    assert calls == ["tool", "event"]
+
+    # A callback subscribed for several matching types runs once per event
+    calls.clear()
+    once = lambda e: calls.append("once")  # noqa: E731
+    bus.subscribe(Event, once)
+    bus.subscribe(ReportEvent, once)
+    bus.publish(_stdout_event())
+    assert calls == ["once", "event"]
+
+
+def test_async_subscribers_run_on_consumer_thread_in_order():
+    bus = EventBus()
+    received, threads = [], set()
+    publisher = threading.current_thread()
+
+    def slow(event):
+        time.sleep(0.001)
+        threads.add(threading.current_thread())
+        received.append(event.message)
+
+    bus.subscribe(ReportEvent, slow, asynchronous=True)
+    sync_calls = []
+    bus.subscribe(ReportEvent, lambda e: sync_calls.append(e.message))
+    for n in range(50):
+        bus.publish(_stdout_event(n))
+    assert len(sync_calls) == 50
+    assert bus.flush(timeout=10)
+    assert received == [f"line {n}" for n in range(50)]
+    assert publisher not in threads and len(threads) == 1
+
+
+class _LegacyEventBus:
+    """The previous publish: lock, isinstance scan, de-duplication and sort per event."""
+
+    def __init__(self):
+        self._subscribers = defaultdict(list)
+        self._seq_counter = itertools.count()
+        self._lock = threading.Lock()
+
+    def subscribe(self, event_type, callback, priority=100):
+        with self._lock:
+            insort(
+                self._subscribers[event_type],
+                (priority, next(self._seq_counter), callback),
+            )
+
+    def publish(self, event):
+        with self._lock:
+            matching_handlers = []
+            for event_type, callbacks in self._subscribers.items():
+                if isinstance(event, event_type):
+                    matching_handlers.extend(callbacks)
+            seen = set()
+            unique_handlers = []
+            for prio, seq, cb in matching_handlers:
+                if cb not in seen:
+                    unique_handlers.append((prio, seq, cb))
+                    seen.add(cb)
+            unique_handlers.sort()
+        for priority, seq, callback in unique_handlers:
+            callback(event)
+
+
+def _subscribe_like_cli(bus):
+    """Roughly the CLI's subscriptions: reporter and performance collector handlers."""
+    counter = [0]
+
+    def handler(event):
+        counter[0] += 1
+
+    types = [
+        ReportEvent,
+        ResponseDelta,
+        RequestFinished,
+        ToolCallStarted,
+        ToolCallFinished,
+        ToolEvent,
+        Event,
+    ]
+    for index, event_type in enumerate(types * 2):
+        bus.subscribe(event_type, lambda e, h=handler: h(e), priority=100 + index)
+    return counter
+
+
+def _throughput(bus, events):
+    start = time.perf_counter()
+    for event in events:
+        bus.publish(event)
+    return len(events) / (time.perf_counter() - start)
+
+
+def test_dispatch_table_delivers_like_the_legacy_bus():
+    events = [_stdout_event(n) for n in range(100)]
+    legacy = _LegacyEventBus()
+    legacy_count = _subscribe_like_cli(legacy)
+    bus = EventBus()
+    bus_count = _subscribe_like_cli(bus)
+    for event in events:
+        legacy.publish(event)
+        bus.publish(event)
+    assert legacy_count[0] == bus_count[0] == 4 * len(events)  # ReportEvent + Event, twice
+
+
+@pytest.mark.benchmark
+def test_event_bus_publish_throughput_benchmark():
+    events = [_stdout_event(n) for n in range(EVENTS)]
+    legacy = _LegacyEventBus()
+    _subscribe_like_cli(legacy)
+    bus = EventBus()
+    _subscribe_like_cli(bus)
+    legacy_rate = _throughput(legacy, events)
+    bus_rate = _throughput(bus, events)
+
+    # A slow subscriber (1 ms per event, e.g. terminal rendering) moved off the publisher
+    slow_events = events[:200]
+    slow = EventBus()
+    slow.subscribe(ReportEvent, lambda e: time.sleep(0.001))
+    sync_rate = _throughput(slow, slow_events)
+    deferred = EventBus()
+    deferred.subscribe(ReportEvent, lambda e: time.sleep(0.001), asynchronous=True)
+    async_rate = _throughput(deferred, slow_events)
+    assert deferred.flush(timeout=30)
+    assert bus_rate > legacy_rate, (
+        f"dispatch table {bus_rate:,.0f} events/s, old {legacy_rate:,.0f} events/s"
+    )
+    assert async_rate > sync_rate, (
+        f"slow subscriber: async {async_rate:,.0f} events/s, sync {sync_rate:,.0f} events/s"
+    )
@@ -0,0 +1,85 @@
+"""Shared file-content cache: LRU budget, write-tool invalidation and read tool routing."""
+
+import os
+
+from janito.performance_collector import PerformanceCollector
+from janito.tools.adapters.local.create_file import CreateFileTool
+from janito.tools.adapters.local.move_file import MoveFileTool
+from janito.tools.adapters.local.read_files import ReadFilesTool
+from janito.tools.adapters.local.replace_text_in_file import ReplaceTextInFileTool
+from janito.tools.adapters.local.search_text.core import SearchTextTool
+from janito.tools.adapters.local.view_file import ViewFileTool
+from janito.tools.file_cache import CACHE_NAME, FileContentCache, file_cache
+
+
+def _write(path, text):
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        f.write(text)
+
+
+def test_lru_budget_and_validation(tmp_path):
+    cache = FileContentCache(max_bytes=4000)
+    paths = []
+    for index in range(5):
+        path = str(tmp_path / f"f{index}.txt")
+        _write(path, str(index) * 900)
+        paths.append(path)
+        cache.get(path)
+    # 4 x 900 bytes fit, the oldest file was evicted
+    assert len(cache) == 4 and cache.used_bytes == 3600
+    cache.get(paths[1])
+    cache.get(paths[0])
+    assert os.path.realpath(paths[2]) not in cache._entries
+    assert os.path.realpath(paths[1]) in cache._entries
+
+    # Decoded text counts against the budget too
+    assert cache.read_text(paths[1]) == "1" * 900
+    assert cache.used_bytes <= 4000
+
+    # Files above a quarter of the budget are read but never cached
+    big = str(tmp_path / "big.txt")
+    _write(big, "b" * 1500)
+    assert cache.read_bytes(big) == b"b" * 1500
+    assert os.path.realpath(big) not in cache._entries
+
+    # A changed size is noticed without invalidation; text is read like text mode
+    _write(paths[1], "new\r\ncontent\r")
+    assert cache.read_text(paths[1]) == "new\ncontent\n"
+
+    cache.invalidate_tree(str(tmp_path))
+    assert len(cache) == 0 and cache.used_bytes == 0
+    assert FileContentCache(max_bytes=0).get(paths[0]) is None
+
+
+def test_read_tools_share_cache_and_writes_invalidate(tmp_path, monkeypatch):
+    collector = PerformanceCollector()
+    monkeypatch.setattr("janito.perf_singleton.performance_collector", collector)
+    file_cache.clear()
+    path = str(tmp_path / "module.py")
+    _write(path, "def alpha():\n    return 1\n")
+
+    assert "alpha" in SearchTextTool().run(str(tmp_path), "alpha")
+    assert "def alpha" in ViewFileTool().run(path)
+    assert "def alpha" in ReadFilesTool().run([path])
+    stats = collector.get_cache_stats()[CACHE_NAME]
+    assert stats["misses"] == 1 and stats["hits"] >= 2
+
+    # Same size and mtime: only the tool's invalidation reveals the edit
+    st = os.stat(path)
+    ReplaceTextInFileTool().run(path, "alpha():\n    return", "gamma():  \n  return")
+    assert os.stat(path).st_size == st.st_size
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert "\n  return 1\n" in ViewFileTool().run(path, 2, 2)
+    assert "gamma" in SearchTextTool().run(str(tmp_path), "gamma")
+
+    CreateFileTool().run(path, "def delta():\n    return 1\n", overwrite=True)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert "def delta" in ReadFilesTool().run([path])
+
+    moved = str(tmp_path / "other.py")
+    _write(moved, "def omega():\n    return 1\n")
+    os.utime(moved, ns=(st.st_atime_ns, st.st_mtime_ns))
+    ViewFileTool().run(moved)
+    os.remove(path)
+    MoveFileTool().run(moved, path)
+    assert "def omega" in ViewFileTool().run(path)
@@ -0,0 +1,179 @@
+"""Hierarchical .gitignore matching: nested rules, 100k paths and a filter benchmark."""
+
+import os
+import time
+
+import pathspec
+import pytest
+
+from janito.dir_walk_utils import walk_dir_with_gitignore
+from janito.gitignore_utils import GitignoreFilter, clear_rules_cache
+from janito.tools.adapters.local.search_text.traverse_directory import iter_scan_files
+
+TOP_DIRS = 50
+SUB_DIRS = 20
+FILES_PER_DIR = 100  # 50 * 20 * 100 = 100k paths
+
+ROOT_RULES = "*.log\nbuild/\n__pycache__/\n*.tmp\n/dist\ncoverage/\n"
+NESTED_RULES = "!keep.log\nlocal/\n"
+
+
+def _touch(path, text=""):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+
+def test_nested_gitignore_and_info_exclude(tmp_path):
+    root = str(tmp_path)
+    _touch(os.path.join(root, ".gitignore"), "*.log\nbuild/\n")
+    _touch(os.path.join(root, ".git", "info", "exclude"), "secret.txt\n")
+    _touch(os.path.join(root, "sub", ".gitignore"), NESTED_RULES)
+    for rel in (
+        "a.py",
+        "a.log",
+        "secret.txt",
+        "build/out.py",
+        "local/kept.py",
+        "sub/keep.log",
+        "sub/other.log",
+        "sub/local/skipped.py",
+        "sub/deep/keep.log",
+        "sub/build/.gitignore",
+    ):
+        _touch(os.path.join(root, rel))
+
+    walked = sorted(
+        os.path.relpath(os.path.join(r, f), root).replace(os.sep, "/")
+        for r, _, files in walk_dir_with_gitignore(root)
+        for f in files
+    )
+    assert walked == [
+        ".gitignore",
+        "a.py",
+        "local/kept.py",
+        "sub/.gitignore",
+        "sub/deep/keep.log",
+        "sub/keep.log",
+    ]
+    threaded = sorted(
+        os.path.relpath(os.path.join(r, f), root).replace(os.sep, "/")
+        for r, _, files in walk_dir_with_gitignore(root, workers=2)
+        for f in files
+    )
+    assert threaded == walked
+    scanned = sorted(
+        os.path.relpath(p, root).replace(os.sep, "/")
+        for p in iter_scan_files(root, 0, GitignoreFilter(root))
+    )
+    assert scanned == walked
+
+    # Filters built below the repository root are anchored at it
+    gitignore = GitignoreFilter(os.path.join(root, "sub"))
+    assert gitignore.base_dir == root
+    assert gitignore.is_ignored(os.path.join(root, "sub", "other.log"))
+    assert not gitignore.is_ignored(os.path.join(root, "sub", "keep.log"))
+    assert gitignore.is_ignored(os.path.join(root, "sub", "local"))
+    assert not gitignore.is_ignored(os.path.join(root, "local"))
+    assert gitignore.is_ignored(os.path.join(root, "build", "out.py"))
+
+    # Compiled rules are reloaded when the file changes
+    _touch(os.path.join(root, "sub", ".gitignore"), "local/\n")
+    os.utime(os.path.join(root, "sub", ".gitignore"), ns=(1, 1))
+    assert GitignoreFilter(root).is_ignored(os.path.join(root, "sub", "keep.log"))
+
+
+def _synthetic_walk(root):
+    """(dirpath, dirnames, filenames) for a 100k-path tree, top-down like os.walk."""
+    for t in range(TOP_DIRS):
+        top = os.path.join(root, f"pkg{t:02d}")
+        yield top, [f"mod{s:02d}" for s in range(SUB_DIRS)] + ["build"], [".gitignore"]
+        for s in range(SUB_DIRS):
+            files = [f"file{f:03d}.py" for f in range(FILES_PER_DIR - 4)]
+            files += ["debug.log", "keep.log", "scratch.tmp", "README.md"]
+            yield os.path.join(top, f"mod{s:02d}"), ["__pycache__", "local"], files
+
+
+class _SingleFileFilter:
+    """The previous implementation: one .gitignore, abspath/relpath per entry."""
+
+    def __init__(self, gitignore_path):
+        self.base_dir = os.path.dirname(gitignore_path)
+        with open(gitignore_path, "r", encoding="utf-8") as f:
+            lines = f.readlines()
+        self._spec = pathspec.PathSpec.from_lines("gitwildmatch", lines)
+        self.dir_patterns = [l.strip() for l in lines if l.strip().endswith("/")]
+
+    def _rel(self, root, name):
+        path = os.path.abspath(os.path.join(root, name))
+        return os.path.relpath(path, self.base_dir).replace(os.sep, "/")
+
+    def filter_ignored(self, root, dirs, files):
+        def dir_is_ignored(d):
+            rel_path = self._rel(root, d)
+            for pat in self.dir_patterns:
+                pat_clean = pat.rstrip("/")
+                if rel_path == pat_clean or rel_path.startswith(pat_clean + "/"):
+                    return True
+            return self._spec.match_file(rel_path)
+
+        dirs[:] = [d for d in dirs if not dir_is_ignored(d)]
+        files = [f for f in files if not self._spec.match_file(self._rel(root, f))]
+        return dirs, files
+
+
+def _filter_walk(gitignore, root):
+    kept = 0
+    pruned = set()
+    for dirpath, dirs, files in _synthetic_walk(root):
+        if os.path.dirname(dirpath) in pruned:
+            continue
+        before = set(dirs)
+        dirs, files = gitignore.filter_ignored(dirpath, list(dirs), files)
+        pruned.update(os.path.join(dirpath, d) for d in before - set(dirs))
+        kept += len(files)
+    return kept
+
+
+@pytest.fixture
+def rules_root(tmp_path):
+    root = str(tmp_path)
+    _touch(os.path.join(root, ".gitignore"), ROOT_RULES)
+    for t in range(TOP_DIRS):
+        _touch(os.path.join(root, f"pkg{t:02d}", ".gitignore"), NESTED_RULES)
+    return root
+
+
+def test_gitignore_filter_100k_paths(rules_root):
+    root = rules_root
+    paths = sum(len(d) + len(f) for _, d, f in _synthetic_walk(root))
+    assert paths >= 100_000
+
+    legacy_kept = _filter_walk(_SingleFileFilter(os.path.join(root, ".gitignore")), root)
+    clear_rules_cache()
+    cold_kept = _filter_walk(GitignoreFilter(root), root)
+    warm_kept = _filter_walk(GitignoreFilter(root), root)
+
+    # The nested !keep.log re-includes one file per directory the old filter dropped
+    per_dir = FILES_PER_DIR - 2  # debug.log and scratch.tmp
+    assert cold_kept == warm_kept == TOP_DIRS * (1 + SUB_DIRS * per_dir)
+    assert legacy_kept == TOP_DIRS * (1 + SUB_DIRS * (per_dir - 1))
+
+
+@pytest.mark.benchmark
+def test_gitignore_filter_benchmark_100k_paths(rules_root):
+    root = rules_root
+    start = time.perf_counter()
+    _filter_walk(_SingleFileFilter(os.path.join(root, ".gitignore")), root)
+    legacy = time.perf_counter() - start
+
+    clear_rules_cache()
+    _filter_walk(GitignoreFilter(root), root)
+    start = time.perf_counter()
+    _filter_walk(GitignoreFilter(root), root)
+    warm = time.perf_counter() - start
+
+    assert warm < legacy, (
+        f"hierarchical (warm) {warm * 1e3:.0f} ms, "
+        f"single .gitignore (old) {legacy * 1e3:.0f} ms"
+    )
@@ -0,0 +1,124 @@
+from janito.conversation_history import LLMConversationHistory
+from janito.llm.compaction import HistoryCompactor, SUMMARY_PREFIX
+
+
+def _tool_turn(history, index, tool_name, output):
+    call_id = f"call_{index}"
+    history.add_message("user", f"question {index}")
+    history.add_message(
+        "tool_calls",
+        [{"id": call_id, "type": "function", "function": {"name": tool_name, "arguments": "{}"}}],
+    )
+    history.add_message(
+        "tool_results", [{"name": tool_name, "content": output, "tool_call_id": call_id}]
+    )
+
+
+def _build_history():
+    history = LLMConversationHistory()
+    history.add_message("system", "system prompt")
+    for index in range(6):
+        _tool_turn(history, index, "view_file", "x" * 8000)
+    for index in range(6, 8):
+        _tool_turn(history, index, "search_text", "y" * 4000)
+    return history
+
+
+def test_below_threshold_is_untouched():
+    history = _build_history()
+    compactor = HistoryCompactor(threshold=0.8)
+    assert not compactor.maybe_compact(history, limit=1_000_000)
+    assert compactor.stats()["runs"] == 0
+
+
+def test_old_file_dumps_are_dropped_and_pairs_kept():
+    history = _build_history()
+    before = history.generation
+    compactor = HistoryCompactor(threshold=0.5, target=0.5, keep_recent=6)
+    assert compactor.maybe_compact(history, limit=10_000)
+    messages = history.get_history()
+    assert history.generation > before
+    assert "drop_file_dumps" in compactor.stats()["strategies"]
+    old_result = messages[3]["content"][0]
+    assert old_result["tool_call_id"] == "call_0"
+    assert "removed by context compaction" in old_result["content"]
+    # Recent messages are never rewritten
+    assert messages[-1]["content"][0]["content"] == "y" * 4000
+    assert [m["role"] for m in messages] == [
+        m["role"] for m in _build_history().get_history()
+    ]
+    assert compactor.stats()["tokens_saved"] > 0
+
+
+def test_summarize_replaces_oldest_turns_at_user_boundary():
+    history = _build_history()
+    transcripts = []
+
+    def summarize(text):
+        transcripts.append(text)
+        return "earlier work summarized"
+
+    compactor = HistoryCompactor(
+        threshold=0.1,
+        target=0.01,
+        keep_recent=3,
+        strategies=["summarize_turns"],
+        summarize=summarize,
+    )
+    assert compactor.maybe_compact(history, limit=10_000)
+    messages = history.get_history()
+    assert messages[0]["content"] == "system prompt"
+    assert messages[1]["content"] == SUMMARY_PREFIX + "earlier work summarized"
+    assert messages[2] == {"role": "user", "content": "question 7"}
+    assert "called view_file" in transcripts[0]
+
+
+def test_summary_request_has_no_tools_and_skips_response_cache(tmp_path):
+    from types import SimpleNamespace
+
+    from janito.config import config as janito_config
+    from janito.drivers.openai.driver import OpenAIModelDriver
+    from janito.llm.agent import LLMAgent
+    from janito.llm.driver_config import LLMDriverConfig
+    from janito.tools.adapters.local.adapter import LocalToolsAdapter
+    from janito.tools.adapters.local.view_file import ViewFileTool
+    from janito.tools.permissions import (
+        get_global_allowed_permissions,
+        set_global_allowed_permissions,
+    )
+    from janito.tools.tool_base import ToolPermissions
+
+    requests = []
+
+    def create(**kwargs):
+        requests.append(kwargs)
+        message = SimpleNamespace(role="assistant", content="summary", tool_calls=None)
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=message, finish_reason="stop")],
+            usage=None,
+        )
+
+    class FakeDriver(OpenAIModelDriver):
+        def _instantiate_openai_client(self, config):
+            return SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+
+    tools_adapter = LocalToolsAdapter(workdir=str(tmp_path))
+    tools_adapter.register_tool(ViewFileTool)
+    driver = FakeDriver(tools_adapter=tools_adapter, provider_name="fake")
+    agent = LLMAgent.__new__(LLMAgent)
+    config = LLMDriverConfig(model="fake-model", api_key="key", stream=True)
+    previous = get_global_allowed_permissions()
+    set_global_allowed_permissions(ToolPermissions(read=True))
+    janito_config.runtime_set("response_cache", True)
+    janito_config.runtime_set("response_cache_path", str(tmp_path / "cache.sqlite3"))
+    try:
+        assert "tools" in driver._prepare_api_kwargs(config, [])
+        for _ in range(2):
+            assert agent._summarize_for_compaction("transcript", config, driver) == "summary"
+    finally:
+        janito_config.runtime_set("response_cache", None)
+        janito_config.runtime_set("response_cache_path", None)
+        set_global_allowed_permissions(previous)
+    assert len(requests) == 2  # neither served from nor stored in the cache
+    assert all("tools" not in request and not request["stream"] for request in requests)
+    assert config.stream and config.use_tools is None
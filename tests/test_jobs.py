@@ -0,0 +1,89 @@
+"""Background jobs: start without blocking, incremental output, wait/kill, per-session tables and limits."""
+
+import os
+import shutil
+import time
+
+import pytest
+
+from janito.config import config
+from janito.tools.adapters.local.job_status import JobStatusTool
+from janito.tools.adapters.local.kill_job import KillJobTool
+from janito.tools.adapters.local.read_job_output import ReadJobOutputTool
+from janito.tools.adapters.local.run_bash_command import RunBashCommandTool
+from janito.tools.adapters.local.wait_for_job import WaitForJobTool
+from janito.tools.jobs import close_job_table, get_job_table
+from janito.tools.tool_context import ToolContext, use_tool_context
+
+pytestmark = pytest.mark.skipif(
+    shutil.which("bash") is None or os.name != "posix", reason="bash required"
+)
+
+SUITE = "for i in 1 2 3; do echo \"test $i ok\"; sleep 0.3; done; echo fail >&2; exit 3"
+
+
+def _next_offset(result):
+    return int(result.split("next offset: ")[1].split("\n")[0])
+
+
+def test_background_job_lifecycle(tmp_path):
+    context = ToolContext(workdir=str(tmp_path))
+    with use_tool_context(context):
+        t0 = time.perf_counter()
+        started = RunBashCommandTool().run(SUITE, background=True)
+        assert time.perf_counter() - t0 < 0.5
+        assert started.startswith("Started background job 1 ")
+
+        # The agent keeps working while the job runs
+        assert "Return code: 0\n--- STDOUT ---\nbusy\n" in RunBashCommandTool().run(
+            "echo busy"
+        )
+        status = JobStatusTool().run()
+        assert status.startswith("job 1 (pid ") and " running, " in status
+
+        reader = ReadJobOutputTool()
+        time.sleep(0.1)
+        first = reader.run(1)
+        assert "--- OUTPUT ---\ntest 1 ok\n" in first
+        waited = WaitForJobTool().run(1, timeout=0)
+        assert " running, " in waited
+
+        waited = WaitForJobTool().run(1, timeout=10)
+        assert "exited with return code 3" in waited and "cpu " in waited
+        assert waited.endswith("test 3 ok\nfail\n")
+        rest = reader.run(1, offset=_next_offset(first))
+        assert rest.endswith("--- OUTPUT ---\n" + "test 2 ok\ntest 3 ok\nfail\n")
+        assert _next_offset(rest) == get_job_table().get(1).output_size
+        assert "Job already finished" in KillJobTool().run(1)
+        assert "Unknown job id: 7" in reader.run(7)
+
+        RunBashCommandTool().run("pwd > where.txt; exec sleep 30", background=True)
+        time.sleep(0.3)
+        t0 = time.perf_counter()
+        assert "killed" in KillJobTool().run(2)
+        assert time.perf_counter() - t0 < 2
+        assert (tmp_path / "where.txt").read_text() == f"{tmp_path}\n"
+
+    with use_tool_context(ToolContext(workdir=str(tmp_path))):
+        assert JobStatusTool().run() == "No background jobs."
+
+    with use_tool_context(context):
+        logs = [job.log_path for job in get_job_table().jobs()]
+    close_job_table(id(context))
+    assert not any(os.path.exists(path) for path in logs)
+
+
+def test_running_job_limit(tmp_path):
+    context = ToolContext(workdir=str(tmp_path))
+    config.runtime_set("max_background_jobs", 1)
+    try:
+        with use_tool_context(context):
+            tool = RunBashCommandTool()
+            assert tool.run("sleep 30", background=True).startswith("Started")
+            refused = tool.run("sleep 30", background=True)
+            assert "max_background_jobs=1" in refused
+            job = get_job_table().get(1)
+    finally:
+        config.runtime_set("max_background_jobs", None)
+        close_job_table(id(context))
+    assert not job.running and job.killed
@@ -0,0 +1,72 @@
+"""Import-time regression checks for CLI metadata commands (python -X importtime)."""
+
+import re
+import subprocess
+import sys
+
+import pytest
+
+from janito.drivers.driver_registry import get_driver_class
+from janito.providers.manifest import DRIVER_MANIFEST, PROVIDER_MANIFEST
+from janito.providers.registry import LLMProviderRegistry
+
+HEAVY_MODULES = ("openai", "jinja2", "janito.tools")
+IMPORT_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def _imported_modules(*cli_args):
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "janito", *cli_args],
+        stdin=subprocess.DEVNULL,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    modules = {}
+    for line in proc.stderr.splitlines():
+        match = IMPORT_LINE.match(line)
+        if match:
+            modules[match.group(4)] = int(match.group(2))
+    return proc, modules
+
+
+@pytest.mark.parametrize(
+    "cli_args,forbidden",
+    [
+        (["--version"], HEAVY_MODULES + ("rich",)),
+        (["--list-providers"], HEAVY_MODULES),
+    ],
+)
+def test_metadata_commands_do_not_import_sdks(cli_args, forbidden):
+    proc, modules = _imported_modules(*cli_args)
+    assert proc.returncode == 0, proc.stderr[-2000:]
+    loaded = [name for name in forbidden if name in modules]
+    provider_modules = [
+        name for name in modules if re.match(r"janito\.providers\.\w+\.provider$", name)
+    ]
+    assert loaded == [] and provider_modules == []
+
+
+def test_list_providers_reads_manifest():
+    proc = subprocess.run(
+        [sys.executable, "-m", "janito", "--list-providers"],
+        stdin=subprocess.DEVNULL,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    for name in PROVIDER_MANIFEST:
+        assert name in proc.stdout
+    assert "gpt-4.1" in proc.stdout and "kimi-k2-turbo-preview" in proc.stdout
+
+
+def test_manifest_matches_provider_classes():
+    for name, entry in PROVIDER_MANIFEST.items():
+        provider_cls = LLMProviderRegistry.get(name)
+        assert provider_cls.__name__ == entry.class_name
+        assert provider_cls.NAME == name
+        assert provider_cls.MAINTAINER == entry.maintainer
+        assert provider_cls.DEFAULT_MODEL == entry.default_model
+        assert provider_cls.MODEL_SPECS is entry.load_model_specs()
+    for name in DRIVER_MANIFEST:
+        assert get_driver_class(name).__name__ == name
@@ -0,0 +1,92 @@
+"""Lazy, manifest-driven loading of the local tools."""
+
+import json
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+from janito.tools.adapters.local.manifest import (
+    MANIFEST_PATH,
+    TOOL_MODULES,
+    build_tool_manifest,
+)
+
+
+def test_tool_manifest_is_up_to_date():
+    with open(MANIFEST_PATH, encoding="utf-8") as f:
+        stored = json.load(f)
+    current = json.loads(json.dumps(build_tool_manifest()))
+    assert stored == current, "Run: python tools/update_tool_manifest.py"
+
+
+def _run(code):
+    proc = subprocess.run(
+        [sys.executable, "-c", textwrap.dedent(code)],
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert proc.returncode == 0, proc.stderr[-2000:]
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def test_read_only_session_imports_only_executed_tools(tmp_path):
+    (tmp_path / "notes.txt").write_text("hello\n")
+    result = _run(
+        f"""
+        import json, sys
+        import janito.tools
+        from janito.tools import local_tools_adapter as adapter
+        from janito.tools.permissions import set_global_allowed_permissions
+        from janito.tools.tool_base import ToolPermissions
+        from janito.providers.openai.schema_generator import generate_tool_schemas
+
+        def loaded():
+            return sorted(m for m, _ in {TOOL_MODULES!r} if m in sys.modules)
+
+        set_global_allowed_permissions(ToolPermissions(read=True))
+        names = adapter.list_tools()
+        schemas = generate_tool_schemas(adapter.get_tool_classes())
+        after_schemas = loaded()
+        output = adapter.execute_by_name(
+            "find_files", arguments={{"paths": {str(tmp_path)!r}, "pattern": "*.txt"}}
+        )
+        denied = adapter.get_tool("run_bash_command")
+        print(json.dumps({{
+            "names": names,
+            "schemas": [s["function"]["name"] for s in schemas],
+            "after_schemas": after_schemas,
+            "output": output,
+            "denied": denied is None,
+            "final": loaded(),
+        }}))
+        """
+    )
+    assert "find_files" in result["names"] and "run_bash_command" not in result["names"]
+    assert result["schemas"] == result["names"]
+    assert result["after_schemas"] == []
+    assert result["output"].endswith("notes.txt")
+    assert result["denied"]
+    assert result["final"] == ["janito.tools.adapters.local.find_files"]
+
+
+@pytest.mark.benchmark
+def test_lazy_registration_startup_savings(record_property):
+    result = _run(
+        """
+        import json, time
+        start = time.perf_counter()
+        import janito.tools
+        lazy = time.perf_counter() - start
+        from janito.tools.adapters.local.manifest import load_tool_manifest
+        start = time.perf_counter()
+        for spec in load_tool_manifest():
+            spec.load_class()
+        print(json.dumps({"lazy": lazy, "tool_modules": time.perf_counter() - start}))
+        """
+    )
+    record_property("import_janito_tools_ms", round(result["lazy"] * 1e3, 1))
+    record_property("all_tool_modules_ms", round(result["tool_modules"] * 1e3, 1))
+    assert result["tool_modules"] > 0
@@ -0,0 +1,132 @@
+"""Line-offset index: range reads match readlines(), invalidation and a paging benchmark."""
+
+import os
+import time
+
+import pytest
+
+from janito.tools import line_index
+from janito.tools.adapters.local.view_file import ViewFileTool
+from janito.tools.line_index import (
+    STRIDE,
+    clear_line_index_cache,
+    count_lines,
+    get_line_index,
+    read_line_range,
+    read_text,
+)
+
+BENCH_LINES = 500_000
+PAGE = 50
+PAGES = 200
+
+
+def _write(path, data):
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def _readlines(path):
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        return f.readlines()
+
+
+def test_ranges_match_readlines(tmp_path):
+    clear_line_index_cache()
+    cases = {
+        "empty": b"",
+        "one": b"single line without newline",
+        "newline": b"\n",
+        "crlf": b"".join(b"line %d \xc3\xa9\r\n" % i for i in range(STRIDE * 3 + 5)),
+        "no_trailing": b"\n".join(b"x" * (i % 7) for i in range(STRIDE * 4 + 1)),
+        "exact": b"a\n" * (STRIDE * 2),
+    }
+    for name, data in cases.items():
+        path = str(tmp_path / name)
+        _write(path, data)
+        expected = _readlines(path)
+        assert count_lines(path) == len(expected), name
+        assert read_line_range(path) == (expected, len(expected)), name
+        bounds = (1, 2, STRIDE - 1, STRIDE, STRIDE + 1, 2 * STRIDE + 3, len(expected) + 5)
+        for first in bounds:
+            for last in bounds:
+                lines, total = read_line_range(path, first, last)
+                assert lines == expected[first - 1 : last], (name, first, last)
+                assert total == len(expected)
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            assert read_text(path) == f.read()
+
+
+def test_index_is_cached_and_invalidated(tmp_path):
+    clear_line_index_cache()
+    path = str(tmp_path / "file.txt")
+    _write(path, b"one\ntwo\n")
+    index = get_line_index(path)
+    assert get_line_index(path) is index
+    assert count_lines(path) == 2
+
+    _write(path, b"one\ntwo\nthree\n")
+    assert count_lines(path) == 3
+    assert read_line_range(path, 3, 3) == (["three\n"], 3)
+
+    # Same size, new mtime
+    _write(path, b"ONE\nTWO\nTHR\n")
+    os.utime(path, ns=(1, 1))
+    assert read_line_range(path, 2, 2) == (["TWO\n"], 3)
+
+    assert len(line_index._cache) == 1
+
+
+@pytest.fixture
+def big_log(tmp_path):
+    path = str(tmp_path / "big.log")
+    _write(
+        path,
+        b"".join(
+            b"%08d some log message with a little padding\n" % i
+            for i in range(BENCH_LINES)
+        ),
+    )
+    starts = [
+        1 + (i * 7919 * PAGE) % (BENCH_LINES - PAGE) for i in range(PAGES)
+    ]
+    return path, starts
+
+
+def _legacy_page(path, start):
+    lines = _readlines(path)
+    return lines[start - 1 : start + PAGE - 1], len(lines)
+
+
+def test_view_file_pages_match_readlines(big_log):
+    path, starts = big_log
+    clear_line_index_cache()
+    tool = ViewFileTool()
+    for start in starts[:20]:
+        lines, total = _legacy_page(path, start)
+        output = tool.run(path, start, start + PAGE - 1)
+        assert total == BENCH_LINES
+        assert output.endswith("".join(lines))
+        assert f"{start}-{start + PAGE - 1} (of {BENCH_LINES})" in output
+
+
+@pytest.mark.benchmark
+def test_view_file_paging_benchmark(big_log):
+    path, starts = big_log
+    t0 = time.perf_counter()
+    for start in starts[:20]:
+        _legacy_page(path, start)
+    legacy_time = (time.perf_counter() - t0) / 20
+
+    clear_line_index_cache()
+    tool = ViewFileTool()
+    t0 = time.perf_counter()
+    for start in starts:
+        tool.run(path, start, start + PAGE - 1)
+    indexed_time = (time.perf_counter() - t0) / PAGES
+
+    assert indexed_time < legacy_time, (
+        f"page of {PAGE} lines from a {BENCH_LINES}-line file: "
+        f"line index {indexed_time * 1e3:.2f} ms (first call includes the scan), "
+        f"readlines {legacy_time * 1e3:.2f} ms"
+    )
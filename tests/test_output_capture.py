@@ -0,0 +1,149 @@
+"""Output capture: head/tail buffers, spill files, display chunks and a high-volume output benchmark."""
+
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import pytest
+from rich.console import Console
+from rich.text import Text
+
+from janito.event_bus.bus import EventBus
+from janito.report_events import ReportEvent, ReportSubtype
+from janito.tools.adapters.local.run_bash_command import RunBashCommandTool
+from janito.tools.output_capture import (
+    MAX_LINE_CHARS,
+    CommandCapture,
+    SpillFiles,
+    StreamCapture,
+)
+
+LINES = 20_000
+GENERATOR = "import sys\nfor i in range(int(sys.argv[1])): print(f'build step {i}: compiling module_{i}.c')"
+
+
+def _read(path):
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+def test_head_tail_and_spill():
+    reported = []
+    small = StreamCapture(reported.append, "test_", head_lines=2, tail_lines=2)
+    for line in ("a\n", "b\n", "c\n", "d"):
+        small.write(line)
+    small.close()
+    assert (small.spilled, small.text(), small.lines) == (False, "a\nb\nc\nd", 4)
+    assert reported == ["a\nb\nc\nd"]
+
+    big = StreamCapture(lambda chunk: None, "test_", head_lines=2, tail_lines=2)
+    lines = [f"{i}\n" for i in range(10)]
+    for line in lines:
+        big.write(line)
+    big.write("x" * (MAX_LINE_CHARS + 5) + "\n")
+    big.close()
+    assert big.spilled and big.lines == 11
+    assert _read(big.spill_path) == "".join(lines) + "x" * (MAX_LINE_CHARS + 5) + "\n"
+    text = big.text()
+    assert text.startswith("0\n1\n... (7 lines omitted) ...\n9\n")
+    assert text.endswith(" ... (5 more characters)\n")
+    big.write("late\n")
+    assert big.lines == 11
+
+
+def test_spill_files_are_rotated_and_cleaned_up():
+    spills = SpillFiles(keep=2)
+    paths = []
+    for _ in range(3):
+        paths.append(spills.create("test_"))
+    assert [os.path.exists(path) for path in paths] == [False, True, True]
+    directory = spills.directory
+    spills.cleanup()
+    assert not os.path.exists(directory)
+
+
+def test_run_bash_command_bounds_large_output():
+    bus = EventBus()
+    chunks = []
+    bus.subscribe(ReportEvent, lambda event: chunks.append(event))
+    tool = RunBashCommandTool(event_bus=bus)
+    result = tool.run("seq 1 200000; echo done >&2")
+    assert result.startswith("[LARGE OUTPUT]\nstdout_file: ")
+    assert "(lines: 200000)" in result and "stderr_file" not in result
+    assert "... (199900 lines omitted) ...\n" in result
+    assert result.count("\n") < 120
+    spill_path = result.split("stdout_file: ")[1].split(" (lines")[0]
+    assert _read(spill_path) == "".join(f"{i}\n" for i in range(1, 200001))
+    shown = "\n".join(e.message for e in chunks if e.subtype == ReportSubtype.STDOUT)
+    assert shown.startswith("1\n2\n") and " more lines) ..." in shown
+    assert shown.count("\n") < 200000 and len(chunks) < 200
+    assert "--- STDERR (head/tail) ---\ndone\n" in result
+
+
+def _rendering_bus():
+    """An event bus rendering stdout events like the terminal reporter does."""
+    console = Console(file=io.StringIO(), force_terminal=True, width=120)
+    bus = EventBus()
+
+    def render(event):
+        console.print(Text(event.message, style="on dark_green"))
+        console.file.flush()
+
+    bus.subscribe(ReportEvent, render)
+    return bus
+
+
+def _report(bus):
+    return lambda message: bus.publish(
+        ReportEvent(subtype=ReportSubtype.STDOUT, message=message)
+    )
+
+
+def _generate(sink):
+    process = subprocess.Popen(
+        [sys.executable, "-c", GENERATOR, str(LINES)],
+        stdout=subprocess.PIPE,
+        text=True,
+        encoding="utf-8",
+    )
+    for line in process.stdout:
+        sink(line)
+    assert process.wait() == 0
+
+
+def test_high_volume_output_is_counted_and_spilled():
+    report = _report(_rendering_bus())
+    with CommandCapture("bench_", report, report) as capture:
+        _generate(capture.stdout.write)
+    assert capture.stdout.lines == LINES and capture.stdout.spilled
+
+
+@pytest.mark.benchmark
+def test_high_volume_output_benchmark():
+    # Previous behaviour: every line written and flushed to a temp file, then
+    # published (and rendered) as its own event
+    report = _report(_rendering_bus())
+    with tempfile.NamedTemporaryFile("w+", encoding="utf-8") as file_obj:
+
+        def per_line(line):
+            file_obj.write(line)
+            file_obj.flush()
+            report(line.rstrip("\r\n"))
+
+        t0 = time.perf_counter()
+        _generate(per_line)
+        per_line_time = time.perf_counter() - t0
+
+    report = _report(_rendering_bus())
+    t0 = time.perf_counter()
+    with CommandCapture("bench_", report, report) as capture:
+        _generate(capture.stdout.write)
+    captured_time = time.perf_counter() - t0
+
+    assert captured_time < per_line_time, (
+        f"{LINES} output lines: chunked capture {captured_time * 1e3:.0f} ms, "
+        f"per-line events {per_line_time * 1e3:.0f} ms"
+    )
@@ -0,0 +1,67 @@
+import os
+import threading
+
+import pytest
+
+from janito.parallel_scan import get_pool, shutdown_pools, threaded_walk
+
+
+@pytest.fixture
+def tree(tmp_path):
+    for path in ("a/b/c", "a/d", "e"):
+        (tmp_path / path).mkdir(parents=True)
+        (tmp_path / path / "f.txt").write_text("x")
+    yield tmp_path
+    shutdown_pools()
+
+
+def _walk_with_timeout(*args, timeout=5):
+    outcome = {}
+
+    def target():
+        try:
+            outcome["result"] = threaded_walk(*args)
+        except BaseException as e:
+            outcome["error"] = e
+
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    assert not thread.is_alive(), "threaded_walk did not return"
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["result"]
+
+
+def test_threaded_walk_matches_os_walk(tree):
+    expected = sorted(
+        ((root, sorted(dirs), sorted(files)) for root, dirs, files in os.walk(tree)),
+        key=lambda entry: entry[0].split(os.sep),
+    )
+    assert threaded_walk(str(tree), 4) == expected
+
+
+def test_threaded_walk_raises_on_dir_errors(tree):
+    def on_dir(path, dirs, files):
+        if path.endswith("d"):
+            raise ValueError(path)
+        return None
+
+    with pytest.raises(ValueError, match="d$"):
+        _walk_with_timeout(str(tree), 4, on_dir)
+
+
+def test_threaded_walk_does_not_hang_when_the_pool_is_shut_down(tree):
+    get_pool(2, "thread").shutdown()
+    with pytest.raises(RuntimeError):
+        _walk_with_timeout(str(tree), 2)
+
+
+def test_threaded_walk_raises_when_the_pool_shuts_down_mid_walk(tree):
+    def on_dir(path, dirs, files):
+        if path == str(tree):
+            shutdown_pools()
+        return None
+
+    with pytest.raises(RuntimeError):
+        _walk_with_timeout(str(tree), 3, on_dir)
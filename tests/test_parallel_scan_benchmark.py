@@ -0,0 +1,111 @@
+"""search_text / find_files over a synthetic tree with 1, 4 and 16 scan workers, plus a timing benchmark."""
+
+import time
+
+import pytest
+
+from janito.config import config
+from janito.parallel_scan import ordered_batch_map, shutdown_pools
+from janito.tools.adapters.local.find_files import FindFilesTool
+from janito.tools.adapters.local.search_text.core import SearchTextTool
+from janito.tools.tool_context import ToolContext, use_tool_context
+
+DIRS = 20
+FILES_PER_DIR = 30
+LINES_PER_FILE = 200
+WORKER_COUNTS = (1, 4, 16)
+
+
+@pytest.fixture(scope="module")
+def tree(tmp_path_factory):
+    root = tmp_path_factory.mktemp("scan_tree")
+    (root / ".gitignore").write_text("ignored/\n")
+    for d in range(DIRS):
+        sub = root / f"pkg{d:02d}" / "nested"
+        sub.mkdir(parents=True)
+        for f in range(FILES_PER_DIR):
+            lines = [f"value_{n} = compute({n})" for n in range(LINES_PER_FILE)]
+            if f % 7 == 0:
+                lines[f] = f"def needle_{d}_{f}(): return {f}"
+            target = sub if f % 2 else sub.parent
+            (target / f"mod{f:02d}.py").write_text("\n".join(lines) + "\n")
+    (root / "ignored").mkdir()
+    (root / "ignored" / "skip.py").write_text("def needle_ignored(): pass\n")
+    return root
+
+
+@pytest.fixture
+def scan_config():
+    previous = {key: config.get(key) for key in ("scan_workers", "scan_pool")}
+
+    def apply(workers, pool="process"):
+        config.runtime_set("scan_workers", workers)
+        config.runtime_set("scan_pool", pool)
+
+    yield apply
+    for key, value in previous.items():
+        config.runtime_set(key, value)
+    shutdown_pools()
+
+
+def _timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def test_ordered_batch_map_preserves_order_and_stops_early():
+    items = list(range(1000))
+    results = ordered_batch_map(divmod, items, (7,), workers=4, kind="thread")
+    assert [item for item, _ in results] == items
+    results = ordered_batch_map(divmod, items, (7,), workers=4, kind="thread")
+    first = [next(results) for _ in range(3)]
+    results.close()
+    assert first == [(0, (0, 0)), (1, (0, 1)), (2, (0, 2))]
+
+
+@pytest.mark.parametrize("pool", ["process", "thread"])
+def test_parallel_scan_matches_sequential(tree, scan_config, pool):
+    search = SearchTextTool()
+    find = FindFilesTool()
+    outputs = {}
+    with use_tool_context(ToolContext(str(tree))):
+        for workers in WORKER_COUNTS:
+            scan_config(workers, pool)
+            found = search.run(".", r"def needle_\d+", use_regex=True, max_results=0)
+            counted = search.run(".", "needle_", count_only=True, max_results=0)
+            limited = search.run(".", "needle_", max_results=5)
+            files = find.run(".", "*.py")
+            outputs[workers] = (found, counted, limited, files)
+
+    expected_matches = DIRS * len(range(0, FILES_PER_DIR, 7))
+    for workers in WORKER_COUNTS:
+        found, counted, limited, files = outputs[workers]
+        assert found.count(": def needle_") == expected_matches
+        assert "needle_ignored" not in found and "skip.py" not in files
+        assert f"Grand total matches: {expected_matches}" in counted
+        assert limited.count(": def needle_") == 5 and "Max results" in limited
+        assert len(files.splitlines()) == DIRS * FILES_PER_DIR
+    # Parallel runs merge in path order, so they are identical to each other
+    # and contain exactly the lines of the sequential scan
+    assert outputs[4] == outputs[16]
+    assert sorted(outputs[1][0].splitlines()) == sorted(outputs[4][0].splitlines())
+    assert outputs[1][3] == outputs[4][3]
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("pool", ["process", "thread"])
+def test_parallel_scan_benchmark(tree, scan_config, pool, record_property):
+    search = SearchTextTool()
+    find = FindFilesTool()
+    with use_tool_context(ToolContext(str(tree))):
+        for workers in WORKER_COUNTS:
+            scan_config(workers, pool)
+            # Warm the pool so the timing covers the scan, not worker start-up
+            search.run(".", "needle_", max_results=1)
+            _, t_search = _timed(
+                lambda: search.run(".", r"def needle_\d+", use_regex=True, max_results=0)
+            )
+            _, t_find = _timed(lambda: find.run(".", "*.py"))
+            record_property(f"{pool}_{workers}_search_text_ms", round(t_search * 1e3, 1))
+            record_property(f"{pool}_{workers}_find_files_ms", round(t_find * 1e3, 1))
@@ -0,0 +1,97 @@
+"""Bounded PerformanceCollector: ring buffers, latency histograms and report export."""
+
+import json
+import random
+from datetime import datetime, timedelta, timezone
+
+from janito.cli.perf_report import write_perf_report
+from janito.driver_events import RequestFinished, RequestStarted, ResponseDelta
+from janito.event_bus.bus import EventBus
+from janito.perf_histogram import StreamingHistogram
+from janito.performance_collector import PerformanceCollector
+from janito.tools.tool_events import ToolCallFinished
+
+START = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def test_histogram_percentiles_within_bucket_error():
+    rng = random.Random(7)
+    values = [rng.lognormvariate(0, 1) for _ in range(20_000)]
+    histogram = StreamingHistogram()
+    for value in values:
+        histogram.record(value)
+    values.sort()
+    for q in (0.5, 0.95, 0.99):
+        exact = values[int(q * len(values)) - 1]
+        assert abs(histogram.percentile(q) - exact) / exact < 0.02
+    summary = histogram.summary()
+    assert summary["count"] == len(values)
+    assert summary["max"] == values[-1] and summary["min"] == values[0]
+    assert len(histogram._buckets) < 1000
+
+
+def _publish_request(bus, index, ms, tokens=50, stream=True):
+    request_id = f"req-{index}"
+    started = START + timedelta(seconds=index)
+    bus.publish(RequestStarted(driver_name="d", request_id=request_id, payload={}, timestamp=started))
+    if stream:
+        bus.publish(
+            ResponseDelta(
+                driver_name="d",
+                request_id=request_id,
+                content="x",
+                timestamp=started + timedelta(milliseconds=ms / 2),
+            )
+        )
+    bus.publish(
+        RequestFinished(
+            driver_name="d",
+            request_id=request_id,
+            status="success",
+            usage={"prompt_tokens": 100, "completion_tokens": tokens},
+            response={"raw_response": "x" * 10_000},
+            timestamp=started + timedelta(milliseconds=ms),
+        )
+    )
+
+
+def test_collector_memory_is_bounded_and_exports(tmp_path, monkeypatch):
+    bus = EventBus()
+    monkeypatch.setattr("janito.event_bus.handler.event_bus", bus)
+    collector = PerformanceCollector(max_events=50, max_errors=5)
+    for index in range(1000):
+        _publish_request(bus, index, ms=100 + index % 100)
+        bus.publish(
+            ToolCallFinished(
+                tool_name="view_file", request_id="r", result="ok", duration=0.01
+            )
+        )
+    events = collector.get_all_events()
+    assert len(events) == 50
+    # Only summaries are kept: the 10 kB responses are not retained
+    finished = [e for e in events if e["type"] == "RequestFinished"]
+    assert finished and all("response" not in e for e in finished)
+    assert finished[-1]["status"] == "success"
+    assert finished[-1]["usage"] == {"prompt_tokens": 100, "completion_tokens": 50}
+    assert collector.get_total_requests() == 1000
+
+    latency = collector.get_latency_stats()
+    duration = latency["request_duration"]
+    assert duration["count"] == 1000
+    assert 0.14 < duration["p50"] < 0.16 and 0.19 < duration["p99"] <= 0.2
+    assert latency["time_to_first_token"]["count"] == 1000
+    assert latency["tokens_per_second"]["p50"] > 0
+    assert latency["tools"]["view_file"]["count"] == 1000
+
+    json_path = tmp_path / "perf.json"
+    write_perf_report(str(json_path), collector=collector)
+    snapshot = json.loads(json_path.read_text())
+    assert snapshot["requests"]["total"] == 1000
+    assert snapshot["token_usage"]["completion_tokens"] == 50 * 1000
+
+    prom_path = tmp_path / "perf.prom"
+    write_perf_report(str(prom_path), collector=collector)
+    text = prom_path.read_text()
+    assert '# TYPE janito_request_duration_seconds summary' in text
+    assert 'janito_request_duration_seconds_count 1000' in text
+    assert 'janito_tool_duration_seconds{tool="view_file",quantile="0.95"}' in text
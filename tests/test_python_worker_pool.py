@@ -0,0 +1,143 @@
+"""Python worker pool: per-job isolation, recycling, timeouts and a snippet latency benchmark."""
+
+import os
+import subprocess
+import time
+
+import pytest
+
+from janito.config import config
+from janito.tools.adapters.local.python_code_run import PythonCodeRunTool
+from janito.tools.adapters.local.python_command_run import PythonCommandRunTool
+from janito.tools.adapters.local.python_file_run import PythonFileRunTool
+from janito.tools.python_worker_pool import (
+    PythonWorkerPool,
+    shutdown_python_worker_pool,
+)
+
+pytestmark = pytest.mark.skipif(os.name != "posix", reason="POSIX process groups")
+
+SNIPPETS = 30
+
+
+def _run(pool, cwd, code, mode="command", timeout=10):
+    out, err = [], []
+    status = pool.run(
+        {"mode": mode, "code": code, "cwd": str(cwd)}, timeout, out.append, err.append
+    )
+    return status, "".join(out), "".join(err)
+
+
+def test_jobs_are_isolated(tmp_path):
+    (tmp_path / "helper.py").write_text("VALUE = 1\n")
+    pool = PythonWorkerPool(1, preload=("json",), max_runs=0)
+    try:
+        status, out, err = _run(
+            pool,
+            tmp_path,
+            "import os, sys, helper\n"
+            "os.environ['JANITO_POOL'] = '1'; sys.path.append('/nowhere'); x = 1\n"
+            "print(os.getcwd(), sys.argv, __name__, helper.VALUE, end='')",
+        )
+        assert (status, out, err) == (0, f"{tmp_path} ['-c'] __main__ 1\n", "")
+
+        (tmp_path / "helper.py").write_text("VALUE = 2\n")
+        status, out, _ = _run(
+            pool,
+            tmp_path,
+            "import os, sys, helper\n"
+            "print('x' in globals(), os.environ.get('JANITO_POOL'), "
+            "'/nowhere' in sys.path, helper.VALUE, 'json' in sys.modules)",
+        )
+        assert out == "False None False 2 True\n"
+        assert _run(pool, tmp_path, "raise SystemExit(3)")[0] == 3
+        status, _, err = _run(pool, tmp_path, "1/0")
+        assert status == 1
+        assert err.startswith('Traceback (most recent call last):\n  File "<string>"')
+        assert _run(pool, tmp_path, "import os; os._exit(4)")[0] == 4
+        assert pool.started == 2
+    finally:
+        pool.shutdown()
+
+
+def test_recycling_and_timeouts(tmp_path):
+    pool = PythonWorkerPool(2, max_runs=3, max_growth_mb=20)
+    try:
+        first = pool.acquire()
+        second = pool.acquire()
+        with pytest.raises(subprocess.TimeoutExpired):
+            first.run(
+                {"mode": "command", "code": "import time; time.sleep(30)", "cwd": "/"},
+                timeout=0.5,
+            )
+        assert not first.alive and second.alive
+        assert second.run({"mode": "command", "code": "pass", "cwd": "/"}) == 0
+        pool.release(first)
+        pool.release(second)
+        assert pool.started == 3
+
+        for _ in range(3):
+            assert _run(pool, tmp_path, "pass")[0] == 0
+        assert pool.started == 4  # one worker reached max_runs
+
+        started = pool.started
+        assert _run(pool, tmp_path, "import sys; sys.kept = 'x' * (64 << 20)")[0] == 0
+        assert pool.started == started + 1  # memory growth
+        leak = "import threading, time\nthreading.Thread(target=time.sleep, args=(5,)).start()"
+        assert _run(pool, tmp_path, leak)[0] == 0
+        assert pool.started == started + 2  # threads left running
+    finally:
+        pool.shutdown()
+
+
+SNIPPET = "import decimal, json\nprint(json.dumps({'x': 1}))"
+
+
+@pytest.fixture
+def worker_pool():
+    config.runtime_set("python_workers", 2)
+    config.runtime_set("python_preload", "decimal,json")
+    yield
+    config.runtime_set("python_workers", 0)
+    config.runtime_set("python_preload", "")
+    shutdown_python_worker_pool()
+
+
+def test_tools_use_the_pool(tmp_path, monkeypatch, worker_pool):
+    monkeypatch.chdir(tmp_path)
+    script = tmp_path / "script.py"
+    script.write_text("import sys\nprint(sys.argv[0], __file__ == %r)\n" % str(script))
+    tool = PythonCommandRunTool()
+    assert "script.py True" in PythonFileRunTool().run("script.py")
+    assert "Return code: 0" in PythonCodeRunTool().run("import sys; print(sys.stdin.read())")
+    assert "timed out" in tool.run("import time; time.sleep(30)", timeout=1)
+    assert 'Return code: 0\n--- python_command_run: STDOUT ---\n{"x": 1}\n' in tool.run(SNIPPET)
+
+
+def _per_snippet(tool):
+    t0 = time.perf_counter()
+    for _ in range(SNIPPETS):
+        assert '{"x": 1}' in tool.run(SNIPPET)
+    return (time.perf_counter() - t0) / SNIPPETS
+
+
+@pytest.mark.benchmark
+def test_snippet_latency_benchmark(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    tool = PythonCommandRunTool()
+    one_shot = _per_snippet(tool)
+
+    config.runtime_set("python_workers", 2)
+    config.runtime_set("python_preload", "decimal,json")
+    try:
+        tool.run("pass")  # start the workers outside the timing
+        pooled = _per_snippet(tool)
+    finally:
+        config.runtime_set("python_workers", 0)
+        config.runtime_set("python_preload", "")
+        shutdown_python_worker_pool()
+
+    assert pooled < one_shot, (
+        f"python_command_run per snippet: worker pool {pooled * 1e3:.1f} ms, "
+        f"new interpreter {one_shot * 1e3:.1f} ms"
+    )
@@ -0,0 +1,126 @@
+"""Response cache: identical requests are replayed from the store, not re-sent."""
+
+import time
+from types import SimpleNamespace
+
+import pytest
+from openai.types.chat import ChatCompletion
+
+from janito.config import config
+from janito.conversation_history import LLMConversationHistory
+from janito.driver_events import RequestFinished, ResponseReceived
+from janito.drivers.openai.driver import OpenAIModelDriver
+from janito.llm.driver_config import LLMDriverConfig
+from janito.llm.driver_input import DriverInput
+from janito.llm.response_cache import ResponseCache
+from janito.perf_singleton import performance_collector
+
+API_LATENCY = 0.05
+
+
+def _completion(text):
+    return ChatCompletion.model_validate(
+        {
+            "id": "chatcmpl-1",
+            "object": "chat.completion",
+            "created": 1700000000,
+            "model": "gpt-test",
+            "choices": [
+                {
+                    "index": 0,
+                    "finish_reason": "stop",
+                    "message": {"role": "assistant", "content": text},
+                }
+            ],
+            "usage": {"prompt_tokens": 12, "completion_tokens": 3, "total_tokens": 15},
+        }
+    )
+
+
+class FakeClientDriver(OpenAIModelDriver):
+    def __init__(self):
+        super().__init__(provider_name="openai")
+        self.calls = []
+        self.client = SimpleNamespace(
+            chat=SimpleNamespace(completions=SimpleNamespace(create=self._create))
+        )
+
+    def _create(self, **kwargs):
+        self.calls.append(kwargs)
+        time.sleep(API_LATENCY)
+        return _completion(f"answer {len(self.calls)}")
+
+    def _instantiate_openai_client(self, config):
+        return self.client
+
+
+@pytest.fixture
+def cache_config(tmp_path):
+    previous = {
+        key: config.get(key) for key in ("response_cache", "response_cache_path")
+    }
+    config.runtime_set("response_cache", True)
+    config.runtime_set("response_cache_path", str(tmp_path / "responses.sqlite3"))
+    yield
+    for key, value in previous.items():
+        config.runtime_set(key, value)
+
+
+def _run(driver, prompt, temperature=0):
+    history = LLMConversationHistory()
+    history.add_message("system", "You are a test.")
+    history.add_message("user", prompt)
+    driver_config = LLMDriverConfig(
+        model="gpt-test", api_key="sk-test", temperature=temperature
+    )
+    driver.process_driver_input(DriverInput(config=driver_config, conversation_history=history))
+    events = []
+    while not driver.output_queue.empty():
+        events.append(driver.output_queue.get())
+    finished = [e for e in events if isinstance(e, RequestFinished)]
+    received = [e for e in events if isinstance(e, ResponseReceived)]
+    assert len(finished) == 1 and len(received) == 1
+    return finished[0], received[0]
+
+
+def test_identical_request_is_replayed(cache_config):
+    driver = FakeClientDriver()
+    before = performance_collector.get_cache_stats().get(
+        "llm_response", {"hits": 0, "misses": 0}
+    )
+
+    finished, received = _run(driver, "hello")
+    assert "cached" not in finished.usage
+    assert received.parts[0].content == "answer 1"
+
+    finished, received = _run(FakeClientDriver(), "hello")
+    assert finished.usage["cached"] is True
+    assert finished.usage["total_tokens"] == 15
+    assert finished.details["cache"] == "hit"
+    assert received.parts[0].content == "answer 1"
+    assert received.metadata["usage"]["cached"] is True
+
+    # A different prompt or sampling setting is a different key
+    _run(driver, "hello", temperature=0.7)
+    _run(driver, "bye")
+    assert len(driver.calls) == 3
+
+    stats = performance_collector.get_cache_stats()["llm_response"]
+    assert stats["hits"] - before["hits"] == 1
+    assert stats["misses"] - before["misses"] == 3
+    assert stats["saved_seconds"] >= API_LATENCY
+
+
+def test_expiry_and_lru_eviction(tmp_path):
+    cache = ResponseCache(str(tmp_path / "r.sqlite3"), ttl=60, max_bytes=2500)
+    for name in ("a", "b", "c"):
+        cache.put(name, _completion(name * 200), 0.1)
+        time.sleep(0.01)
+    cache.get("a")  # most recently used now
+    cache.put("d", _completion("d" * 200), 0.1)
+    assert cache.get("a") is not None and cache.get("d") is not None
+    assert cache.get("b") is None
+
+    cache.ttl = 0
+    time.sleep(0.01)
+    assert cache.get("a") is None
@@ -0,0 +1,79 @@
+import os
+
+import pytest
+
+from janito.config import config
+from janito.tools.adapters.local.search_text.core import SearchTextTool
+from janito.tools.adapters.local.search_text.trigram_index import (
+    INDEX_DIR,
+    get_trigram_index,
+    query_trigrams,
+    regex_literals,
+)
+from janito.tools.tool_context import ToolContext, use_tool_context
+
+
+@pytest.fixture
+def indexed_tree(tmp_path):
+    (tmp_path / ".gitignore").write_text("build/\n*.log\n")
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "app.py").write_text("def handle_request():\n    return 1\n")
+    (tmp_path / "src" / "util.py").write_text("def helper():\n    pass\n")
+    (tmp_path / "build").mkdir()
+    (tmp_path / "build" / "app.py").write_text("def handle_request(): ...\n")
+    (tmp_path / "debug.log").write_text("handle_request failed\n")
+    previous = config.get("search_index")
+    config.runtime_set("search_index", True)
+    yield tmp_path
+    config.runtime_set("search_index", previous)
+
+
+@pytest.fixture
+def workspace(indexed_tree):
+    with use_tool_context(ToolContext(str(indexed_tree))):
+        yield indexed_tree
+
+
+def _search(path, query, **kwargs):
+    return SearchTextTool().run(str(path), query, **kwargs)
+
+
+def test_regex_literals():
+    assert regex_literals(r"def\s+handle_request\(") == ["def", "handle_request("]
+    assert regex_literals(r"(foo|bar)baz") == ["baz"]
+    assert query_trigrams("ab") == set()
+
+
+def test_index_narrows_candidates_and_respects_gitignore(workspace):
+    index = get_trigram_index(str(workspace))
+    candidates = index.candidates(str(workspace), query_trigrams("handle_request"))
+    assert candidates == [str(workspace / "src" / "app.py")]
+    assert os.path.isdir(workspace / INDEX_DIR)
+
+    result = _search(workspace, "HANDLE_REQUEST")
+    assert "src/app.py:1: def handle_request():" in result.replace(os.sep, "/")
+    assert "build" not in result and "debug.log" not in result
+
+    regex_result = _search(workspace, r"def\s+help\w+", use_regex=True)
+    assert "util.py:1: def helper():" in regex_result
+
+
+def test_relative_search_paths_match_the_walk(indexed_tree, monkeypatch):
+    # No ToolContext: relative paths are searched from the working directory
+    monkeypatch.chdir(indexed_tree)
+    for path, expected in (("src", "src/app.py"), (".", "./src/app.py")):
+        indexed = _search(path, "handle_request")
+        config.runtime_set("search_index", False)
+        walked = _search(path, "handle_request")
+        config.runtime_set("search_index", True)
+        assert indexed == walked, path
+        assert f"{expected}:1: def handle_request():" in indexed.replace(os.sep, "/")
+
+
+def test_index_updates_incrementally(workspace):
+    assert "No matches found" in _search(workspace, "brand_new_symbol")
+    (workspace / "src" / "util.py").write_text("brand_new_symbol = 1\n")
+    (workspace / "src" / "app.py").unlink()
+    assert "util.py:1: brand_new_symbol = 1" in _search(workspace, "brand_new_symbol")
+    assert "No matches found" in _search(workspace, "handle_request")
+    assert get_trigram_index(str(workspace)).refresh() == 0
@@ -0,0 +1,156 @@
+import asyncio
+import json
+import os
+import threading
+import urllib.error
+import urllib.request
+from types import SimpleNamespace
+
+from janito.drivers.openai.async_driver import AsyncOpenAIModelDriver
+from janito.llm.async_agent import AsyncLLMAgent
+from janito.llm.driver_config import LLMDriverConfig
+from janito.server import SessionManager, create_server
+from janito.tools import local_tools_adapter
+from janito.tools.tool_base import ToolPermissions
+from janito.tools.tool_context import ToolContext, use_tool_context
+
+
+def _completion(content=None, tool_calls=None):
+    message = SimpleNamespace(role="assistant", content=content, tool_calls=tool_calls)
+    return SimpleNamespace(
+        choices=[SimpleNamespace(message=message, finish_reason="stop")],
+        usage=None,
+        created=0,
+    )
+
+
+class FakeAsyncDriver(AsyncOpenAIModelDriver):
+    def __init__(self, responses):
+        super().__init__(provider_name="fake")
+        self.responses = list(responses)
+
+    async def _create(self, **kwargs):
+        await asyncio.sleep(0.01)
+        return self.responses.pop(0)
+
+    def _instantiate_async_openai_client(self, config):
+        return SimpleNamespace(
+            chat=SimpleNamespace(completions=SimpleNamespace(create=self._create))
+        )
+
+
+class FakeProvider:
+    name = "fake"
+    driver_config = LLMDriverConfig(model="fake-model", api_key="key")
+
+    def get_model_info(self, model_name):
+        return None
+
+
+def _create_file_call(path, content):
+    return SimpleNamespace(
+        id="call_1",
+        type="function",
+        function=SimpleNamespace(
+            name="create_file",
+            arguments=json.dumps({"path": path, "content": content}),
+        ),
+    )
+
+
+def _agent_factory(content):
+    def factory(profile=None, role=None, allowed_permissions=None):
+        driver = FakeAsyncDriver(
+            [
+                _completion(tool_calls=[_create_file_call("note.txt", content)]),
+                _completion(content=f"wrote {content}"),
+            ]
+        )
+        agent = AsyncLLMAgent(FakeProvider(), local_tools_adapter, driver=driver)
+        agent.publish_events = False
+        return agent
+
+    return factory
+
+
+def test_sessions_use_their_own_workdir(tmp_path):
+    cwd = os.getcwd()
+    manager = SessionManager(_agent_factory("unused"))
+    try:
+        sessions = []
+        for name in ("a", "b"):
+            workdir = tmp_path / name
+            workdir.mkdir()
+            manager.agent_factory = _agent_factory(name)
+            sessions.append(manager.create_session(str(workdir), permissions="rw"))
+        results = [None, None]
+
+        def run(index):
+            results[index] = manager.chat(sessions[index].id, "write", timeout=30)
+
+        threads = [threading.Thread(target=run, args=(i,)) for i in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert [r["content"] for r in results] == ["wrote a", "wrote b"]
+        assert (tmp_path / "a" / "note.txt").read_text() == "a"
+        assert (tmp_path / "b" / "note.txt").read_text() == "b"
+        assert os.getcwd() == cwd
+    finally:
+        manager.shutdown()
+
+
+def test_tool_context_overrides_permissions(tmp_path):
+    read_only = ToolContext(str(tmp_path), ToolPermissions(read=True))
+    with use_tool_context(read_only):
+        tools = set(local_tools_adapter.list_tools())
+    assert "view_file" in tools
+    assert "create_file" not in tools
+
+
+def test_http_api_round_trip(tmp_path):
+    manager = SessionManager(_agent_factory("http"))
+    server = create_server(manager, port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+
+    def call(method, path, body=None, token=server.auth_token, host=None):
+        data = json.dumps(body).encode() if body is not None else None
+        request = urllib.request.Request(base + path, data=data, method=method)
+        if token:
+            request.add_header("Authorization", f"Bearer {token}")
+        if host:
+            request.add_header("Host", host)
+        with urllib.request.urlopen(request, timeout=30) as response:
+            return json.loads(response.read())
+
+    def rejected(method, path, **kwargs):
+        try:
+            call(method, path, {"workdir": str(tmp_path), "permissions": "rw"}, **kwargs)
+        except urllib.error.HTTPError as e:
+            return e.code
+        return None
+
+    try:
+        assert rejected("POST", "/sessions", token=None) == 401
+        assert rejected("POST", "/sessions", token="wrong") == 401
+        # DNS rebinding: a page on another name reaching the loopback port
+        assert rejected("POST", "/sessions", host="attacker.example") == 403
+        assert manager.list_sessions() == []
+        assert call("GET", "/health", host=f"localhost:{server.server_address[1]}")
+        session = call(
+            "POST", "/sessions", {"workdir": str(tmp_path), "permissions": "rw"}
+        )
+        assert session["permissions"] == "rw"
+        reply = call("POST", f"/sessions/{session['id']}/chat", {"prompt": "go"})
+        assert reply["content"] == "wrote http"
+        assert (tmp_path / "note.txt").read_text() == "http"
+        assert call("GET", "/health")["sessions"] == 1
+        call("DELETE", f"/sessions/{session['id']}")
+        assert call("GET", "/sessions")["sessions"] == []
+    finally:
+        server.shutdown()
+        server.server_close()
+        manager.shutdown()
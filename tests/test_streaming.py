@@ -0,0 +1,203 @@
+"""Streaming responses: chunk assembly, ResponseDelta events, TTFT stats and terminal rendering."""
+
+import io
+import json
+import time
+from types import SimpleNamespace
+
+from openai.types.chat import ChatCompletionChunk
+from rich.console import Console
+
+from janito.conversation_history import LLMConversationHistory
+from janito.driver_events import (
+    RequestFinished,
+    RequestStarted,
+    RequestStatus,
+    ResponseDelta,
+    ResponseReceived,
+)
+from janito.drivers.openai.driver import OpenAIModelDriver
+from janito.drivers.openai.streaming import StreamAccumulator
+from janito.event_bus.bus import EventBus
+from janito.llm.driver_config import LLMDriverConfig
+from janito.llm.driver_input import DriverInput
+from janito.llm.message_parts import FunctionCallMessagePart, TextMessagePart
+from janito.performance_collector import PerformanceCollector
+
+ARGUMENTS = {"path": "src/app.py", "from_line": 1, "to_line": 20}
+ENCODED = json.dumps(ARGUMENTS)
+THIRD = len(ENCODED) // 3
+
+
+def _chunk(delta=None, finish_reason=None, usage=None):
+    choices = []
+    if delta is not None or finish_reason is not None:
+        choices.append(
+            {"index": 0, "delta": delta or {}, "finish_reason": finish_reason}
+        )
+    return ChatCompletionChunk.model_validate(
+        {
+            "id": "chatcmpl-1",
+            "object": "chat.completion.chunk",
+            "created": 1700000000,
+            "model": "gpt-test",
+            "choices": choices,
+            "usage": usage,
+        }
+    )
+
+
+def _tool_delta(index, arguments, call_id=None, name=None):
+    function = {"arguments": arguments}
+    if name:
+        function["name"] = name
+    call = {"index": index, "function": function}
+    if call_id:
+        call.update(id=call_id, type="function")
+    return {"tool_calls": [call]}
+
+
+def _chunks():
+    """A text reply followed by two tool calls whose arguments arrive in fragments."""
+    return [
+        _chunk({"role": "assistant", "content": "Let me "}),
+        _chunk({"content": "look."}),
+        _chunk(_tool_delta(0, "", "call_a", "view_file")),
+        _chunk(_tool_delta(0, ENCODED[:THIRD])),
+        _chunk(_tool_delta(1, '{"paths": ', "call_b", "find_files")),
+        _chunk(_tool_delta(0, ENCODED[THIRD : 2 * THIRD])),
+        _chunk(_tool_delta(1, '"."}')),
+        _chunk(_tool_delta(0, ENCODED[2 * THIRD :])),
+        _chunk(finish_reason="tool_calls"),
+        _chunk(usage={"prompt_tokens": 30, "completion_tokens": 12, "total_tokens": 42}),
+    ]
+
+
+def test_accumulator_assembles_split_tool_calls():
+    accumulator = StreamAccumulator()
+    deltas = [accumulator.add_chunk(chunk) for chunk in _chunks()]
+    assert [text for text, _ in deltas if text] == ["Let me ", "look."]
+    assert deltas[3][1] == [
+        {"index": 0, "id": "call_a", "name": None, "arguments": ENCODED[:THIRD]}
+    ]
+
+    completion = accumulator.to_completion()
+    message = completion.choices[0].message
+    assert message.content == "Let me look."
+    assert [(c.id, c.function.name) for c in message.tool_calls] == [
+        ("call_a", "view_file"),
+        ("call_b", "find_files"),
+    ]
+    assert json.loads(message.tool_calls[0].function.arguments) == ARGUMENTS
+    assert json.loads(message.tool_calls[1].function.arguments) == {"paths": "."}
+    assert completion.choices[0].finish_reason == "tool_calls"
+    assert completion.usage.completion_tokens == 12
+    assert completion.created == 1700000000
+
+
+class FakeStreamDriver(OpenAIModelDriver):
+    def __init__(self):
+        super().__init__(provider_name="openai")
+        self.calls = []
+        self.client = SimpleNamespace(
+            chat=SimpleNamespace(completions=SimpleNamespace(create=self._create))
+        )
+
+    def _create(self, **kwargs):
+        self.calls.append(kwargs)
+
+        def stream():
+            for chunk in _chunks():
+                time.sleep(0.001)
+                yield chunk
+
+        return stream()
+
+    def _instantiate_openai_client(self, config):
+        return self.client
+
+
+def _stream_events():
+    driver = FakeStreamDriver()
+    history = LLMConversationHistory()
+    history.add_message("user", "show me the app")
+    config = LLMDriverConfig(model="gpt-test", api_key="sk-test", stream=True)
+    driver.process_driver_input(DriverInput(config=config, conversation_history=history))
+    events = []
+    while not driver.output_queue.empty():
+        events.append(driver.output_queue.get())
+    return driver, events
+
+
+def test_driver_publishes_deltas_and_assembled_parts():
+    driver, events = _stream_events()
+    assert driver.calls[0]["stream"] is True
+    assert driver.calls[0]["stream_options"] == {"include_usage": True}
+
+    deltas = [e for e in events if isinstance(e, ResponseDelta)]
+    assert "".join(e.content for e in deltas if e.content) == "Let me look."
+    fragments = {}
+    for event in deltas:
+        for call in event.tool_calls or []:
+            fragments.setdefault(call["index"], []).append(call["arguments"] or "")
+    assert json.loads("".join(fragments[0])) == ARGUMENTS
+
+    received = [e for e in events if isinstance(e, ResponseReceived)]
+    assert len(received) == 1
+    parts = received[0].parts
+    assert [p.content for p in parts if isinstance(p, TextMessagePart)] == ["Let me look."]
+    calls = [p for p in parts if isinstance(p, FunctionCallMessagePart)]
+    assert [(c.tool_call_id, c.function.name) for c in calls] == [
+        ("call_a", "view_file"),
+        ("call_b", "find_files"),
+    ]
+    assert json.loads(calls[0].function.arguments) == ARGUMENTS
+
+    finished = [e for e in events if isinstance(e, RequestFinished)]
+    assert finished[0].status == RequestStatus.SUCCESS
+    assert finished[0].usage["completion_tokens"] == 12
+    # The first delta follows RequestStarted and precedes the final response
+    kinds = [type(e) for e in events]
+    assert kinds.index(RequestStarted) < kinds.index(ResponseDelta)
+    assert kinds.index(ResponseDelta) < kinds.index(ResponseReceived)
+
+
+def test_collector_records_time_to_first_token(monkeypatch):
+    bus = EventBus()
+    monkeypatch.setattr("janito.event_bus.handler.event_bus", bus)
+    collector = PerformanceCollector()
+    _, events = _stream_events()
+    for event in events:
+        bus.publish(event)
+    latency = collector.get_latency_stats()
+    assert latency["time_to_first_token"]["count"] == 1
+    assert latency["time_to_first_token"]["max"] > 0
+    assert latency["tokens_per_second"]["count"] == 1
+
+
+def _reporter(monkeypatch):
+    from janito.cli.rich_terminal_reporter import RichTerminalReporter
+
+    monkeypatch.setattr("janito.event_bus.handler.event_bus", EventBus())
+    reporter = RichTerminalReporter()
+    reporter.console = Console(file=io.StringIO(), width=80)
+    return reporter
+
+
+def test_reporter_does_not_render_streamed_text_twice(monkeypatch):
+    reporter = _reporter(monkeypatch)
+    reporter.on_ResponseDelta(ResponseDelta(content="Hello "))
+    reporter.on_ResponseDelta(ResponseDelta(tool_calls=[{"index": 0}]))
+    reporter.on_ResponseDelta(ResponseDelta(content="world"))
+    reporter.on_ResponseReceived(
+        ResponseReceived(parts=[TextMessagePart(content="Hello world")])
+    )
+    reporter.on_RequestFinished(RequestFinished(status=RequestStatus.SUCCESS))
+    output = reporter.console.file.getvalue()
+    assert output.count("Hello") == 1 and "Hello world\n" in output
+
+    # A later non-streamed response is rendered from its parts again
+    reporter.on_ResponseReceived(
+        ResponseReceived(parts=[TextMessagePart(content="Second answer")])
+    )
+    assert "Second answer" in reporter.console.file.getvalue()
@@ -0,0 +1,156 @@
+import json
+import threading
+import time
+from types import SimpleNamespace
+
+from janito.tools.tool_base import ToolPermissions
+from janito.tools.tool_executor import ConcurrentToolExecutor
+
+
+class FakeAdapter:
+    """Minimal adapter: every tool sleeps and records how many calls overlap."""
+
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.tools = {
+            "read": SimpleNamespace(permissions=ToolPermissions(read=True)),
+            "write": SimpleNamespace(permissions=ToolPermissions(write=True)),
+            "execute": SimpleNamespace(permissions=ToolPermissions(execute=True)),
+        }
+        self._lock = threading.Lock()
+        self.active = 0
+        self.max_active = 0
+        self.spans = []  # (index, start, end) per call
+
+    def get_tool(self, name):
+        return self.tools.get(name)
+
+    def execute_function_call_message_part(self, part):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        start = time.perf_counter()
+        time.sleep(self.delay)
+        arguments = json.loads(part.function.arguments)
+        with self._lock:
+            self.active -= 1
+            self.spans.append((arguments.get("index"), start, time.perf_counter()))
+        if arguments.get("fail"):
+            raise RuntimeError("boom")
+        return f"{part.function.name}:{arguments['path']}"
+
+
+def _part(name, **arguments):
+    return SimpleNamespace(
+        function=SimpleNamespace(name=name, arguments=json.dumps(arguments))
+    )
+
+
+def test_read_only_calls_run_concurrently_and_keep_order():
+    adapter = FakeAdapter()
+    executor = ConcurrentToolExecutor(adapter, max_workers=8)
+    parts = [_part("read", path=f"f{i}.txt") for i in range(8)]
+    results = executor.execute_all(parts)
+    executor.shutdown()
+    assert results == [f"read:f{i}.txt" for i in range(8)]
+    assert adapter.max_active > 1
+
+
+def test_writes_to_same_path_are_serialized():
+    adapter = FakeAdapter(delay=0.02)
+    executor = ConcurrentToolExecutor(adapter, max_workers=8)
+    parts = [_part("write", path="same.txt") for _ in range(4)]
+    results = executor.execute_all(parts)
+    executor.shutdown()
+    assert results == ["write:same.txt"] * 4
+    assert adapter.max_active == 1
+
+
+def test_write_and_execute_calls_are_barriers():
+    adapter = FakeAdapter(delay=0.03)
+    executor = ConcurrentToolExecutor(adapter, max_workers=8)
+    names = ["read", "read", "execute", "read", "read", "write", "read"]
+    parts = [_part(name, path=f"f{i}", index=i) for i, name in enumerate(names)]
+    results = executor.execute_all(parts)
+    executor.shutdown()
+    assert results == [f"{name}:f{i}" for i, name in enumerate(names)]
+    spans = {index: (start, end) for index, start, end in adapter.spans}
+    for barrier in (2, 5):
+        start, end = spans[barrier]
+        # Every earlier call has finished and no later call has started
+        assert all(spans[i][1] <= start for i in range(barrier))
+        assert all(spans[i][0] >= end for i in range(barrier + 1, len(names)))
+    # Reads between barriers still overlap
+    assert spans[1][0] < spans[0][1] and spans[4][0] < spans[3][1]
+
+
+def test_read_sees_file_created_by_earlier_command(tmp_path):
+    from janito.tools.adapters.local.adapter import LocalToolsAdapter
+    from janito.tools.adapters.local.run_bash_command import RunBashCommandTool
+    from janito.tools.adapters.local.view_file import ViewFileTool
+    from janito.tools.permissions import (
+        get_global_allowed_permissions,
+        set_global_allowed_permissions,
+    )
+    from janito.tools.tool_context import ToolContext, use_tool_context
+
+    previous = get_global_allowed_permissions()
+    set_global_allowed_permissions(ToolPermissions(read=True, execute=True))
+    adapter = LocalToolsAdapter(workdir=str(tmp_path))
+    adapter.register_tool(RunBashCommandTool)
+    adapter.register_tool(ViewFileTool)
+    executor = ConcurrentToolExecutor(adapter, max_workers=8)
+    parts = [
+        _part("run_bash_command", command="sleep 0.3; echo generated > gen.txt"),
+        _part("view_file", path="gen.txt"),
+    ]
+    try:
+        with use_tool_context(ToolContext(workdir=str(tmp_path))):
+            results = executor.execute_all(parts)
+    finally:
+        executor.shutdown()
+        set_global_allowed_permissions(previous)
+    assert "generated" in results[1] and "Error" not in results[1]
+
+
+def test_ask_user_is_never_run_in_parallel():
+    from janito.tools.adapters.local.ask_user import AskUserTool
+    from janito.tools.adapters.local.manifest import load_tool_manifest
+
+    assert not ConcurrentToolExecutor._is_parallel_safe(AskUserTool())
+    spec = next(s for s in load_tool_manifest() if s.tool_name == "ask_user")
+    assert not ConcurrentToolExecutor._is_parallel_safe(spec)
+
+
+def test_calls_after_a_failing_barrier_are_not_run():
+    adapter = FakeAdapter(delay=0.01)
+    executor = ConcurrentToolExecutor(adapter, max_workers=4)
+    parts = [
+        _part("read", path="a", index=0),
+        _part("write", path="b", index=1, fail=True),
+        _part("write", path="c", index=2),
+        _part("read", path="d", index=3),
+    ]
+    try:
+        executor.execute_all(parts)
+    except RuntimeError as e:
+        assert str(e) == "boom"
+    else:
+        raise AssertionError("expected RuntimeError")
+    finally:
+        executor.shutdown()
+    assert sorted(index for index, _, _ in adapter.spans) == [0, 1]
+
+
+def test_first_error_is_raised_after_its_batch_completes():
+    adapter = FakeAdapter(delay=0.01)
+    executor = ConcurrentToolExecutor(adapter, max_workers=4)
+    parts = [_part("read", path="a"), _part("read", path="b", fail=True)]
+    try:
+        executor.execute_all(parts)
+    except RuntimeError as e:
+        assert str(e) == "boom"
+    else:
+        raise AssertionError("expected RuntimeError")
+    finally:
+        executor.shutdown()
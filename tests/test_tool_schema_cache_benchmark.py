@@ -0,0 +1,80 @@
+"""Tool schema cache with 25+ registered tools, plus a per-turn preparation-cost benchmark."""
+
+import os
+import time
+
+import pytest
+
+from janito.drivers.openai.driver import OpenAIModelDriver
+from janito.llm.driver_config import LLMDriverConfig
+from janito.tools.adapters.local.adapter import LocalToolsAdapter
+from janito.tools.adapters.local.manifest import load_tool_manifest
+from janito.tools.permissions import (
+    get_global_allowed_permissions,
+    set_global_allowed_permissions,
+)
+from janito.tools.tool_base import ToolPermissions
+from janito.tools.tool_schema_cache import tool_schema_cache
+
+TURNS = 50
+
+
+def _build_adapter(synthetic_tool):
+    adapter = LocalToolsAdapter(workdir=os.getcwd())
+    # Register the real classes so the uncached path parses docstrings
+    for spec in load_tool_manifest():
+        adapter.register_tool(spec.load_class())
+    for index in range(10):
+        adapter.register_tool(synthetic_tool(f"synthetic_tool_{index}"))
+    return adapter
+
+
+def _prepare(driver, config):
+    return driver._prepare_api_kwargs(config, [{"role": "user", "content": "hi"}])
+
+
+@pytest.fixture
+def prepared(synthetic_tool):
+    previous_permissions = get_global_allowed_permissions()
+    set_global_allowed_permissions(
+        ToolPermissions(read=True, write=True, execute=True)
+    )
+    try:
+        adapter = _build_adapter(synthetic_tool)
+        assert len(adapter.get_tool_classes()) >= 25
+        driver = OpenAIModelDriver(tools_adapter=adapter)
+        yield adapter, driver, LLMDriverConfig(model="bench-model")
+    finally:
+        set_global_allowed_permissions(previous_permissions)
+
+
+def test_tool_schema_cache_reuses_and_invalidates(prepared):
+    adapter, driver, config = prepared
+    tool_schema_cache.clear()
+    cold_kwargs = _prepare(driver, config)
+    warm_kwargs = _prepare(driver, config)
+    assert warm_kwargs["tools"] == cold_kwargs["tools"]
+    assert all(a is b for a, b in zip(warm_kwargs["tools"], cold_kwargs["tools"]))
+
+    # Disabling a tool invalidates the cached payload
+    adapter.unregister_tool("synthetic_tool_0")
+    assert len(_prepare(driver, config)["tools"]) == len(warm_kwargs["tools"]) - 1
+
+
+@pytest.mark.benchmark
+def test_tool_schema_prepare_benchmark(prepared):
+    _, driver, config = prepared
+    start = time.perf_counter()
+    for _ in range(TURNS):
+        tool_schema_cache.clear()
+        _prepare(driver, config)
+    cold = (time.perf_counter() - start) / TURNS
+
+    start = time.perf_counter()
+    for _ in range(TURNS):
+        _prepare(driver, config)
+    warm = (time.perf_counter() - start) / TURNS
+
+    assert warm < cold, (
+        f"cached {warm * 1e3:.3f} ms/turn, uncached {cold * 1e3:.3f} ms/turn"
+    )
@@ -0,0 +1,12 @@
+#!/usr/bin/env python3
+"""Regenerate janito/tools/adapters/local/tool_manifest.json from the tool classes."""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from janito.tools.adapters.local.manifest import MANIFEST_PATH, write_tool_manifest
+
+if __name__ == "__main__":
+    data = write_tool_manifest()
+    print(f"Wrote {len(data['tools'])} tools to {MANIFEST_PATH}")